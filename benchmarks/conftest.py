@@ -0,0 +1,39 @@
+"""ベンチマーク用のフィクスチャ"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer
+
+MiB = 1024 * 1024
+
+
+@pytest.fixture(scope="session")
+def fake_youtube() -> Iterator[FakeYoutubeServer]:
+    """セッション全体で共有するフェイクサーバー"""
+    with FakeYoutubeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_server(fake_youtube: FakeYoutubeServer) -> FakeYoutubeServer:
+    """テストごとに状態と通信状況をリセットしたフェイクサーバー"""
+    fake_youtube.reset()
+    return fake_youtube
+
+
+@pytest.fixture(scope="session")
+def video_files(tmp_path_factory: pytest.TempPathFactory) -> dict[int, Path]:
+    """ペイロードのサイズ (MiB) ごとのダミー動画ファイル"""
+    directory = tmp_path_factory.mktemp("videos")
+    block = os.urandom(MiB)
+    files = {}
+    for size_mib in (8, 32, 64):
+        path = directory / f"video_{size_mib}mib.mp4"
+        with path.open("wb") as f:
+            for _ in range(size_mib):
+                f.write(block)
+        files[size_mib] = path
+    return files
@@ -0,0 +1,694 @@
+"""fake_youtube
+
+YouTube Data API の再開可能アップロードを模した、ベンチマーク用のローカルHTTPサーバー
+
+実際の YouTube に接続せずにアップロードの性能を測定するため、次の処理を実装する。
+
+- videos.insert / thumbnails.set の再開可能アップロードのセッション開始
+  (thumbnails.set は uploadType=media の1回のリクエストにも対応)
+  (uploadType=resumable の POST に、Location ヘッダーでセッションURIを返す)
+- Content-Range 付きのチャンクの受信と、未完了時の 308 (Range ヘッダー付き)
+- `bytes */合計` による受信済みバイト数の問い合わせ
+- playlistItems.insert / videos.update をまとめたバッチリクエスト
+  (/batch への multipart/mixed の POST)
+- 応答の遅延、受信帯域の制限、5xx エラーと切断の注入 (ServerConditions)
+
+受信したデータは保持せずにバイト数だけを数えるため、大きな動画でも
+サーバーのメモリ使用量は増えない。
+
+    with FakeYoutubeServer(ServerConditions(latency=0.02)) as server:
+        uploader = YoutubeUploader(auth_dir, deduplicate=False)
+        attach(uploader, server.http())
+        uploader.upload_video(config, chunksize=8 * 1024 * 1024)
+
+単独のサーバーとして起動することもできる。
+
+    python benchmarks/fake_youtube.py --port 8080 --latency 0.05 --error-rate 0.1
+"""
+
+import argparse
+import email.parser
+import email.policy
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, Field
+
+from youtube_uploader import YoutubeUploader
+
+# 受信時に1回で読み込むバイト数
+READ_BLOCK_SIZE = 64 * 1024
+
+# フェイクサーバーへ転送する Google API のホスト
+GOOGLE_API_HOST = re.compile(r"^https://[^/]*googleapis\.com")
+
+CONTENT_RANGE = re.compile(r"bytes (?:(\d+)-(\d+)|\*)/(\d+|\*)")
+
+
+class ServerConditions(BaseModel):
+    """フェイクサーバーの通信状況
+
+    Args:
+        latency (float, optional): 各レスポンスを返す前に待つ秒数 (往復の遅延)
+        bandwidth (float | None, optional): 接続ごとの受信帯域 (バイト/秒)
+            Noneの場合は制限しない
+        error_rate (float, optional): チャンクの受信後に error_status を返す確率
+        error_status (int, optional): 注入するエラーのHTTPステータス
+        disconnect_rate (float, optional): チャンクの受信途中で切断する確率
+        seed (int | None, optional): エラーと切断の注入に使う乱数のシード
+    """
+
+    latency: float = Field(default=0.0, ge=0, description="レスポンスの遅延秒数")
+    bandwidth: float | None = Field(
+        default=None, gt=0, description="接続ごとの受信帯域 (バイト/秒)"
+    )
+    error_rate: float = Field(default=0.0, ge=0, le=1, description="エラーの確率")
+    error_status: int = Field(default=503, ge=400, description="エラーのステータス")
+    disconnect_rate: float = Field(default=0.0, ge=0, le=1, description="切断の確率")
+    seed: int | None = Field(default=None, description="注入に使う乱数のシード")
+
+
+class ServerStats(BaseModel):
+    """フェイクサーバーが処理したリクエストの集計
+
+    Args:
+        requests (int): 受け付けたリクエストの数
+        sessions (int): 開始されたアップロードセッションの数
+        chunks (int): 受信を完了したチャンクの数
+        bytes_received (int): 受信を完了したチャンクのバイト数の合計
+        injected_errors (int): 注入したエラーレスポンスの数
+        injected_disconnects (int): 注入した切断の数
+        batches (int): 受け付けたバッチリクエストの数
+        batch_calls (int): バッチリクエストに含まれていたAPI呼び出しの数
+    """
+
+    requests: int = Field(default=0, description="リクエストの数")
+    sessions: int = Field(default=0, description="アップロードセッションの数")
+    chunks: int = Field(default=0, description="受信したチャンクの数")
+    bytes_received: int = Field(default=0, description="受信したバイト数")
+    injected_errors: int = Field(default=0, description="注入したエラーの数")
+    injected_disconnects: int = Field(default=0, description="注入した切断の数")
+    batches: int = Field(default=0, description="バッチリクエストの数")
+    batch_calls: int = Field(default=0, description="バッチ内のAPI呼び出しの数")
+
+
+class ChunkTiming(BaseModel):
+    """クライアント側で測定した、1チャンクの送信の記録
+
+    Args:
+        nbytes (int): チャンクのバイト数
+        seconds (float): 送信を始めてからレスポンスを受け取るまでの秒数
+        status (int | None): HTTPステータス (通信エラーの場合はNone)
+    """
+
+    nbytes: int = Field(..., description="チャンクのバイト数")
+    seconds: float = Field(..., description="レスポンスまでの秒数")
+    status: int | None = Field(default=None, description="HTTPステータス")
+
+
+class _UploadSession:
+    """1件の再開可能アップロードの状態"""
+
+    __slots__ = ("kind", "target", "metadata", "total", "received", "response")
+
+    def __init__(self, kind: str, target: str | None, metadata: dict, total: int):
+        self.kind = kind
+        self.target = target
+        self.metadata = metadata
+        self.total = total
+        self.received = 0
+        self.response: dict | None = None
+
+
+class FakeYoutubeServer:
+    """再開可能アップロードを受け付ける、スレッドで動作するローカルHTTPサーバー
+
+    通信状況は conditions 属性を置き換えることで、実行中にも変更できる。
+    """
+
+    def __init__(
+        self,
+        conditions: ServerConditions | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            conditions (ServerConditions | None, optional): 通信状況
+                Noneの場合は遅延・制限・障害なし
+            host (str, optional): 待ち受けるアドレス
+            port (int, optional): 待ち受けるポート (0の場合は空いているポート)
+        """
+        self._lock = threading.Lock()
+        self._sessions: dict[str, _UploadSession] = {}
+        self._videos: dict[str, dict] = {}
+        self._thumbnails: dict[str, int] = {}
+        self._playlists: dict[str, list[str]] = {}
+        self._ids = itertools.count(1)
+        self._stats = ServerStats()
+        self._random = random.Random()
+        self.conditions = conditions or ServerConditions()
+
+        handler = type("_BoundHandler", (_FakeYoutubeHandler,), {"fake": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def conditions(self) -> ServerConditions:
+        """現在の通信状況"""
+        return self._conditions
+
+    @conditions.setter
+    def conditions(self, conditions: ServerConditions) -> None:
+        with self._lock:
+            self._conditions = conditions
+            self._random.seed(conditions.seed)
+
+    @property
+    def url(self) -> str:
+        """サーバーのベースURL (例: http://127.0.0.1:50000)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> ServerStats:
+        """処理したリクエストの集計 (コピー)"""
+        with self._lock:
+            return self._stats.model_copy()
+
+    @property
+    def videos(self) -> dict[str, dict]:
+        """アップロードが完了した動画のリソース (動画IDがキー)"""
+        with self._lock:
+            return dict(self._videos)
+
+    @property
+    def thumbnails(self) -> dict[str, int]:
+        """設定されたサムネイルのバイト数 (動画IDがキー)"""
+        with self._lock:
+            return dict(self._thumbnails)
+
+    @property
+    def playlists(self) -> dict[str, list[str]]:
+        """再生リストに追加された動画IDのリスト (再生リストのIDがキー)"""
+        with self._lock:
+            return {key: list(value) for key, value in self._playlists.items()}
+
+    def start(self) -> "FakeYoutubeServer":
+        """バックグラウンドのスレッドでリクエストの受け付けを始める"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="fake-youtube", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """リクエストの受け付けを止め、ソケットを閉じる"""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeYoutubeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def reset(self, conditions: ServerConditions | None = None) -> None:
+        """セッション・動画・集計を消去し、通信状況を設定し直す
+
+        Args:
+            conditions (ServerConditions | None, optional): 新しい通信状況
+                Noneの場合は遅延・制限・障害なし
+        """
+        with self._lock:
+            self._sessions.clear()
+            self._videos.clear()
+            self._thumbnails.clear()
+            self._playlists.clear()
+            self._stats = ServerStats()
+        self.conditions = conditions or ServerConditions()
+
+    def http(self) -> "FakeYoutubeHttp":
+        """このサーバーへリクエストを転送する、googleapiclient 用のクライアントを返す"""
+        return FakeYoutubeHttp(self.url)
+
+    # ---- リクエストハンドラーから呼ばれる処理 ----
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def _inject(self, rate: float) -> bool:
+        """指定された確率で True を返す (シードに従い再現可能)"""
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def _open_session(
+        self, kind: str, target: str | None, metadata: dict, total: int
+    ) -> str:
+        with self._lock:
+            session_id = f"session-{next(self._ids)}"
+            self._sessions[session_id] = _UploadSession(kind, target, metadata, total)
+            self._stats.sessions += 1
+        return session_id
+
+    def _session(self, session_id: str) -> _UploadSession | None:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def _video_exists(self, video_id: str) -> bool:
+        with self._lock:
+            return video_id in self._videos
+
+    def _complete(self, session: _UploadSession) -> dict:
+        """受信を終えたセッションのレスポンスを作り、動画やサムネイルを登録する"""
+        with self._lock:
+            if session.response is not None:
+                return session.response
+            if session.kind == "video":
+                video_id = f"FAKE{next(self._ids):07d}"
+                session.response = {
+                    "kind": "youtube#video",
+                    "id": video_id,
+                    "snippet": session.metadata.get("snippet", {}),
+                    "status": {
+                        "uploadStatus": "uploaded",
+                        **session.metadata.get("status", {}),
+                    },
+                }
+                self._videos[video_id] = session.response
+            else:
+                assert session.target is not None
+                self._thumbnails[session.target] = session.total
+                session.response = {
+                    "kind": "youtube#thumbnailSetResponse",
+                    "items": [
+                        {"default": {"url": f"{self.url}/vi/{session.target}.jpg"}}
+                    ],
+                }
+            return session.response
+
+    def _call(self, method: str, path: str, body: dict) -> tuple[int, dict]:
+        """バッチリクエスト内の1件のAPI呼び出しを処理する"""
+        if method != "POST" and method != "PUT":
+            return 405, _error_body(405, "methodNotAllowed", f"未対応です: {method}")
+        if self._inject(self.conditions.error_rate):
+            self._count(injected_errors=1)
+            return 503, _error_body(503, "backendError", "Backend Error")
+
+        with self._lock:
+            if path == "/youtube/v3/playlistItems":
+                snippet = body.get("snippet", {})
+                video_id = snippet.get("resourceId", {}).get("videoId", "")
+                if video_id not in self._videos:
+                    return 404, _error_body(
+                        404, "videoNotFound", f"動画が見つかりません: {video_id}"
+                    )
+                items = self._playlists.setdefault(snippet.get("playlistId", ""), [])
+                position = snippet.get("position", len(items))
+                items.insert(position, video_id)
+                return 200, {
+                    "kind": "youtube#playlistItem",
+                    "id": f"ITEM{next(self._ids):07d}",
+                    "snippet": {**snippet, "position": position},
+                }
+            if path == "/youtube/v3/videos":
+                video = self._videos.get(body.get("id", ""))
+                if video is None:
+                    return 404, _error_body(
+                        404, "videoNotFound", "動画が見つかりません"
+                    )
+                if "defaultLanguage" not in video.get("snippet", {}):
+                    return 400, _error_body(
+                        400,
+                        "defaultLanguageNotSet",
+                        "翻訳を設定するには、動画の言語が必要です",
+                    )
+                video["localizations"] = body.get("localizations", {})
+                return 200, {
+                    "kind": "youtube#video",
+                    "id": video["id"],
+                    "localizations": video["localizations"],
+                }
+        return 404, _error_body(404, "notFound", f"未対応のパスです: {path}")
+
+
+def _error_body(status: int, reason: str, message: str) -> dict:
+    """Google API と同じ形式のエラーレスポンスの本文"""
+    return {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [{"reason": reason, "message": message}],
+        }
+    }
+
+
+class _FakeYoutubeHandler(BaseHTTPRequestHandler):
+    """FakeYoutubeServer のリクエストを処理するハンドラー"""
+
+    # keep-alive で接続を使い回せるようにする
+    protocol_version = "HTTP/1.1"
+    fake: FakeYoutubeServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    # ---- 受信と送信 ----
+
+    def _content_length(self) -> int:
+        return int(self.headers.get("Content-Length", 0))
+
+    def _read_body(self) -> bytes:
+        """メタデータなどの小さなリクエストボディを読み込む"""
+        return self.rfile.read(self._content_length())
+
+    def _drain_body(self, limit: int | None = None) -> int:
+        """リクエストボディを、内容を保持せずに受信帯域の制限に従って読み捨てる
+
+        Args:
+            limit (int | None, optional): 読み込む最大バイト数
+                Noneの場合はボディ全体
+
+        Returns:
+            int: 読み込んだバイト数
+        """
+        length = self._content_length()
+        target = length if limit is None else min(length, limit)
+        bandwidth = self.fake.conditions.bandwidth
+        started = time.monotonic()
+        received = 0
+        while received < target:
+            block = self.rfile.read(min(READ_BLOCK_SIZE, target - received))
+            if not block:
+                break
+            received += len(block)
+            if bandwidth is not None:
+                # 受信帯域を超えた分だけ待ち、TCP のフロー制御で送信側を遅らせる
+                delay = received / bandwidth - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+        return received
+
+    def _respond(
+        self,
+        status: int,
+        body: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        latency = self.fake.conditions.latency
+        if latency > 0:
+            time.sleep(latency)
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status: int, reason: str, message: str) -> None:
+        """Google API と同じ形式のエラーレスポンスを返す"""
+        self._respond(status, _error_body(status, reason, message))
+
+    # ---- HTTPメソッド ----
+
+    def do_POST(self) -> None:
+        self.fake._count(requests=1)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        body = self._read_body()
+
+        if url.path in ("/batch", "/batch/youtube/v3"):
+            self._batch(body)
+            return
+
+        if url.path == "/upload/youtube/v3/thumbnails/set" and query.get(
+            "uploadType"
+        ) == ["media"]:
+            self._set_thumbnail(query.get("videoId", [""])[0], len(body))
+            return
+
+        if query.get("uploadType") != ["resumable"]:
+            self._error(400, "badRequest", "再開可能アップロードのみ対応しています")
+            return
+
+        if url.path == "/upload/youtube/v3/videos":
+            kind, target = "video", None
+        elif url.path == "/upload/youtube/v3/thumbnails/set":
+            kind, target = "thumbnail", query.get("videoId", [""])[0]
+            if not self.fake._video_exists(target):
+                self._error(404, "videoNotFound", f"動画が見つかりません: {target}")
+                return
+        else:
+            self._error(404, "notFound", f"未対応のパスです: {url.path}")
+            return
+
+        total = int(self.headers.get("X-Upload-Content-Length", -1))
+        if total < 0:
+            self._error(400, "badRequest", "X-Upload-Content-Length が必要です")
+            return
+        metadata = json.loads(body) if body else {}
+        session_id = self.fake._open_session(kind, target, metadata, total)
+        location = (
+            f"{self.fake.url}{url.path}?uploadType=resumable&upload_id={session_id}"
+        )
+        self._respond(200, headers={"Location": location})
+
+    def _set_thumbnail(self, video_id: str, size: int) -> None:
+        """1回のリクエストで送られたサムネイル (uploadType=media) を登録する"""
+        if not self.fake._video_exists(video_id):
+            self._error(404, "videoNotFound", f"動画が見つかりません: {video_id}")
+            return
+        response = self.fake._complete(_UploadSession("thumbnail", video_id, {}, size))
+        self._respond(200, response)
+
+    def _batch(self, body: bytes) -> None:
+        """multipart/mixed のバッチリクエストを1件ずつ処理し、まとめて返す"""
+        content_type = self.headers.get("Content-Type", "")
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for part in message.iter_parts():
+            request = part.get_payload(decode=True) or b""
+            head, _, payload = request.partition(b"\r\n\r\n")
+            if not payload:
+                head, _, payload = request.partition(b"\n\n")
+            method, target, _ = head.split(b"\r\n", 1)[0].decode().split(" ", 2)
+            status, response = self.fake._call(
+                method, urlsplit(target).path, json.loads(payload) if payload else {}
+            )
+            content_id = str(part.get("Content-ID", "")).strip("<>")
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(response)}\r\n"
+            )
+        self.fake._count(batches=1, batch_calls=len(parts))
+
+        payload = ("".join(parts) + f"--{boundary}--\r\n").encode()
+        latency = self.fake.conditions.latency
+        if latency > 0:
+            time.sleep(latency)
+        self.send_response(200)
+        self.send_header("Content-Type", f"multipart/mixed; boundary={boundary}")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_PUT(self) -> None:
+        self.fake._count(requests=1)
+        query = parse_qs(urlsplit(self.path).query)
+        session = self.fake._session(query.get("upload_id", [""])[0])
+        if session is None:
+            self._drain_body()
+            self._error(404, "notFound", "アップロードセッションが見つかりません")
+            return
+
+        match = CONTENT_RANGE.fullmatch(self.headers.get("Content-Range", ""))
+        if match is None:
+            self._drain_body()
+            self._error(400, "badRequest", "Content-Range が不正です")
+            return
+        start, end, _ = match.groups()
+
+        if start is None:
+            # 受信済みバイト数の問い合わせ
+            self._drain_body()
+        elif not self._receive_chunk(session, int(start), int(end)):
+            return
+
+        if session.received >= session.total:
+            self._respond(200, self.fake._complete(session))
+            return
+        headers = {}
+        if session.received > 0:
+            headers["Range"] = f"bytes=0-{session.received - 1}"
+        self._respond(308, headers=headers)
+
+    def _receive_chunk(self, session: _UploadSession, start: int, end: int) -> bool:
+        """チャンクを受信し、障害を注入しなければ受信済みバイト数を進める
+
+        Returns:
+            bool: 続けてレスポンスを返す場合はTrue (切断した場合はFalse)
+        """
+        conditions = self.fake.conditions
+
+        if self.fake._inject(conditions.disconnect_rate):
+            # チャンクの途中まで受信して切断する
+            self._drain_body(self._content_length() // 2)
+            self.fake._count(injected_disconnects=1)
+            self.close_connection = True
+            return False
+
+        received = self._drain_body()
+        if self.fake._inject(conditions.error_rate):
+            self.fake._count(injected_errors=1)
+            self._error(conditions.error_status, "backendError", "Backend Error")
+            return False
+
+        # 受信済みの位置と一致するチャンクだけを受け付ける (それ以外は捨てる)
+        if start == session.received and received == end - start + 1:
+            session.received = end + 1
+            self.fake._count(chunks=1, bytes_received=received)
+        return True
+
+
+class FakeYoutubeHttp:
+    """Google API へのリクエストを FakeYoutubeServer へ転送する HTTP クライアント
+
+    googleapiclient に httplib2.Http の代わりに渡す。スレッドごとに
+    httplib2 の接続を持ち、チャンクの送信 (Content-Range 付きの PUT) ごとに
+    レスポンスまでの時間を記録する。
+    """
+
+    def __init__(self, base_url: str):
+        """
+        Args:
+            base_url (str): 転送先のフェイクサーバーのURL
+        """
+        self._base_url = base_url
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._timings: list[ChunkTiming] = []
+
+    def _http(self) -> Any:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            from googleapiclient.http import build_http  # type: ignore
+
+            http = self._local.http = build_http()
+        return http
+
+    @property
+    def timings(self) -> list[ChunkTiming]:
+        """チャンクの送信ごとの記録"""
+        with self._lock:
+            return list(self._timings)
+
+    def clear_timings(self) -> None:
+        """チャンクの送信の記録を消去する"""
+        with self._lock:
+            self._timings.clear()
+
+    def close(self) -> None:
+        """PooledHttp と同じく、YoutubeUploader.close() から呼ばれる (何もしない)"""
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> tuple[Any, bytes]:
+        """httplib2.Http.request() と同じ形式で、フェイクサーバーへ送信する"""
+        uri = GOOGLE_API_HOST.sub(self._base_url, uri)
+        content_range = (headers or {}).get("Content-Range", "")
+        if method != "PUT" or not content_range or content_range.startswith("bytes */"):
+            return self._http().request(uri, method, body, headers, **kwargs)
+
+        nbytes = int((headers or {}).get("Content-Length", 0))
+        started = time.perf_counter()
+        status = None
+        try:
+            response, content = self._http().request(
+                uri, method, body, headers, **kwargs
+            )
+            status = response.status
+            return response, content
+        finally:
+            timing = ChunkTiming(
+                nbytes=nbytes, seconds=time.perf_counter() - started, status=status
+            )
+            with self._lock:
+                self._timings.append(timing)
+
+
+def attach(uploader: YoutubeUploader, http: FakeYoutubeHttp) -> None:
+    """connect() の代わりに、アップローダーのAPIサービスをフェイクサーバーへ向ける
+
+    upload_many() のワーカースレッドのサービスも同じクライアントで構築される。
+
+    Args:
+        uploader (YoutubeUploader): 接続していないアップローダー
+        http (FakeYoutubeHttp): FakeYoutubeServer.http() で作成したクライアント
+    """
+    uploader._http = http  # type: ignore[assignment]
+    uploader._youtube_service = uploader._build_service()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="応答の遅延秒数")
+    parser.add_argument("--bandwidth", type=float, help="受信帯域 (バイト/秒)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    conditions = ServerConditions(
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        disconnect_rate=args.disconnect_rate,
+        seed=args.seed,
+    )
+    with FakeYoutubeServer(conditions, args.host, args.port) as server:
+        print(f"{server.url} で待ち受けています (Ctrl+C で終了)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(server.stats.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""大量の YoutubeConfig を検証する速度のベンチマーク
+
+1件ずつ YoutubeConfig を作る場合と、validate_many() でまとめて検証する場合、
+メタデータだけを VideoMetadata で検証する場合を比較する。
+1秒あたりに検証できる設定の数を extra_info の configs_per_s に記録する。
+
+    python -m pytest benchmarks/test_config_validation.py --benchmark-only
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pydantic import ValidationError  # noqa: E402
+
+from youtube_uploader import VideoMetadata, YoutubeConfig, validate_many  # noqa: E402
+
+# 1回の測定で検証する行の数
+ROWS = 5000
+
+# 動画のデータ (すべての行で同じバッファを共有する)
+VIDEO_BYTES = memoryview(bytearray(1024 * 1024))
+
+PAYLOAD_FIELDS = ("video_bytes", "video_path", "video_mimetype")
+
+
+def make_rows(invalid_every: int | None = None) -> list[dict[str, Any]]:
+    """マニフェストを模した行を作る (invalid_every 行ごとに不正な行を含める)"""
+    publish_at = datetime.fromisoformat("2026-01-01T00:00:00+09:00")
+    rows = []
+    for index in range(ROWS):
+        row: dict[str, Any] = {
+            "video_bytes": VIDEO_BYTES,
+            "video_mimetype": "video/mp4",
+            "title": f"video {index}",
+            "description": "説明文" * 20,
+            "tags": ["benchmark", f"tag{index % 10}"],
+            "privacy_status": "private",
+            "publish_at": publish_at + timedelta(hours=index),
+        }
+        if invalid_every and index % invalid_every == 0:
+            row["privacy_status"] = "public"
+        rows.append(row)
+    return rows
+
+
+def validate_one_by_one(rows: list[dict[str, Any]]) -> list[YoutubeConfig]:
+    """1件ずつ YoutubeConfig を作り、成功したものを返す"""
+    configs = []
+    for row in rows:
+        try:
+            configs.append(YoutubeConfig(**row))
+        except ValidationError:
+            continue
+    return configs
+
+
+def record(benchmark: Any) -> None:
+    benchmark.extra_info["rows"] = ROWS
+    benchmark.extra_info["configs_per_s"] = ROWS / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("invalid_every", [None, 100], ids=["valid", "1%invalid"])
+def test_validate_one_by_one(benchmark: Any, invalid_every: int | None):
+    benchmark.group = (
+        f"validation ({'valid' if invalid_every is None else '1%invalid'})"
+    )
+    rows = make_rows(invalid_every)
+    configs = benchmark(validate_one_by_one, rows)
+    assert len(configs) == ROWS - (ROWS // invalid_every if invalid_every else 0)
+    record(benchmark)
+
+
+@pytest.mark.parametrize("invalid_every", [None, 100], ids=["valid", "1%invalid"])
+def test_validate_many(benchmark: Any, invalid_every: int | None):
+    benchmark.group = (
+        f"validation ({'valid' if invalid_every is None else '1%invalid'})"
+    )
+    rows = make_rows(invalid_every)
+    result = benchmark(validate_many, rows)
+    assert len(result.valid) + len(result.failed_indices) == ROWS
+    record(benchmark)
+
+
+@pytest.mark.parametrize("invalid_every", [None, 100], ids=["valid", "1%invalid"])
+def test_validate_many_metadata_only(benchmark: Any, invalid_every: int | None):
+    benchmark.group = (
+        f"validation ({'valid' if invalid_every is None else '1%invalid'})"
+    )
+    rows = [
+        {k: v for k, v in row.items() if k not in PAYLOAD_FIELDS}
+        for row in make_rows(invalid_every)
+    ]
+    result = benchmark(validate_many, rows, VideoMetadata)
+    assert len(result.valid) + len(result.failed_indices) == ROWS
+    record(benchmark)
@@ -0,0 +1,119 @@
+"""youtube_uploader の起動時間の回帰ベンチマーク
+
+`python -X importtime` の出力から、youtube_uploader の読み込みにかかった
+時間 (依存パッケージを含む累計) を測定し、決められた予算に収まることを確認する。
+Google の API クライアントなどの重いモジュールが、インポートしただけで
+読み込まれていないことも確認する。
+
+    python -m pytest benchmarks/test_import_time.py
+    python benchmarks/test_import_time.py  # 測定結果を表示する
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# 測定のばらつきを抑えるため、複数回測定した最小値を使う
+REPEAT = 5
+
+# パッケージのみをインポートする場合の予算 (ミリ秒)
+PACKAGE_BUDGET_MS = 50.0
+
+# アップローダーと設定のクラスを参照する場合の予算 (ミリ秒)
+# pydantic の読み込み (約 150ms) を含み、API クライアントは含まない
+UPLOADER_BUDGET_MS = 400.0
+
+# connect() やアップロードの実行時まで読み込まれないはずのモジュール
+HEAVY_MODULES = (
+    "googleapiclient.discovery",
+    "googleapiclient.http",
+    "google_auth_oauthlib",
+    "google.auth.transport.requests",
+    "httplib2",
+    "requests",
+    "aiohttp",
+    "PIL",
+)
+
+IMPORT_PACKAGE = "import youtube_uploader"
+IMPORT_UPLOADER = "from youtube_uploader import YoutubeUploader, YoutubeConfig"
+
+
+def measure_import_ms(code: str) -> float:
+    """新しいプロセスでコードを実行し、インポートにかかった時間を返す
+
+    インタープリターの起動時に読み込まれるモジュール (site まで) を除き、
+    最上位のインポートの累計時間を合計する。
+
+    Args:
+        code (str): 測定するインポート文
+
+    Returns:
+        float: インポートにかかった時間 (ミリ秒)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # 最上位のインポートは、モジュール名の前の空白が1つだけになる
+        if name[1:].startswith(" "):
+            continue
+        if not started:
+            started = name.strip() == "site"
+            continue
+        total_us += int(cumulative)
+    return total_us / 1000
+
+
+def best_import_ms(code: str) -> float:
+    """REPEAT 回測定したインポート時間の最小値を返す"""
+    return min(measure_import_ms(code) for _ in range(REPEAT))
+
+
+def loaded_heavy_modules(code: str) -> list[str]:
+    """コードを実行した後に読み込まれている、重いモジュールの一覧を返す"""
+    check = (
+        f"{code}\nimport sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+@pytest.mark.parametrize(
+    ("code", "budget_ms"),
+    [(IMPORT_PACKAGE, PACKAGE_BUDGET_MS), (IMPORT_UPLOADER, UPLOADER_BUDGET_MS)],
+)
+def test_cold_import_within_budget(code: str, budget_ms: float):
+    elapsed_ms = best_import_ms(code)
+    assert elapsed_ms <= budget_ms, (
+        f"`{code}` に {elapsed_ms:.1f}ms かかりました (予算: {budget_ms:.0f}ms)"
+    )
+
+
+@pytest.mark.parametrize("code", [IMPORT_PACKAGE, IMPORT_UPLOADER])
+def test_heavy_modules_deferred(code: str):
+    assert loaded_heavy_modules(code) == []
+
+
+if __name__ == "__main__":
+    for code, budget_ms in (
+        (IMPORT_PACKAGE, PACKAGE_BUDGET_MS),
+        (IMPORT_UPLOADER, UPLOADER_BUDGET_MS),
+    ):
+        elapsed_ms = best_import_ms(code)
+        heavy = loaded_heavy_modules(code)
+        print(f"{code}: {elapsed_ms:.1f}ms (予算: {budget_ms:.0f}ms)")
+        if heavy:
+            print(f"  読み込まれた重いモジュール: {', '.join(heavy)}")
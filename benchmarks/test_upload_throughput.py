@@ -0,0 +1,194 @@
+"""YoutubeUploader.upload_video のスループットのベンチマーク
+
+ローカルのフェイクサーバー (fake_youtube.py) に対してアップロードを行い、
+チャンクサイズ・ペイロードのサイズ・通信状況ごとに次の値を記録する。
+値は pytest-benchmark の extra_info に保存され、--benchmark-json などで比較できる。
+
+- mb_per_s: 1回のアップロードのスループット (MB/s、平均時間から計算)
+- peak_rss_mib: アップロード中のRSSの増加量の最大値 (MiB)
+- chunk_p50_ms / chunk_p95_ms / chunk_max_ms: チャンクの送信からレスポンスまでの時間
+- chunks / retries: 送信したチャンクの数と再試行の回数
+
+    python -m pytest benchmarks/test_upload_throughput.py --benchmark-only
+"""
+
+import resource
+import statistics
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fake_youtube import (  # noqa: E402
+    FakeYoutubeHttp,
+    FakeYoutubeServer,
+    ServerConditions,
+    attach,
+)
+
+from youtube_uploader import (  # noqa: E402
+    BandwidthLimiter,
+    RetryPolicy,
+    YoutubeConfig,
+    YoutubeUploader,
+)
+
+MiB = 1024 * 1024
+
+# 各ケースの測定回数
+ROUNDS = 3
+
+# 通信状況ごとのケース (チャンクサイズとペイロードは固定)
+CONDITIONS = {
+    "loopback": ServerConditions(),
+    "wan": ServerConditions(latency=0.02, bandwidth=50 * MiB),
+    "flaky": ServerConditions(error_rate=0.1, seed=1),
+}
+
+# 受信途中の切断 (ServerConditions.disconnect_rate) は、httplib2 が読み込み済みの
+# ストリームで同じリクエストを送り直し、ソケットのタイムアウトまで待つことがあるため、
+# 測定値が安定せず、既定のケースには含めない
+
+
+class RssSampler:
+    """バックグラウンドのスレッドで、実行中のRSSの最大値を記録する
+
+    /proc/self/statm を読めない環境では、プロセス全体の ru_maxrss を使う。
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.baseline = 0
+        self.peak = 0
+
+    @staticmethod
+    def current() -> int:
+        """現在のRSS (バイト)"""
+        try:
+            with open("/proc/self/statm") as f:
+                pages = int(f.read().split()[1])
+            return pages * resource.getpagesize()
+        except OSError:
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # macOS はバイト、Linux は KiB 単位
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.peak = max(self.peak, self.current())
+
+    def __enter__(self) -> "RssSampler":
+        self.baseline = self.peak = self.current()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        assert self._thread is not None
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+    @property
+    def growth_mib(self) -> float:
+        """測定開始時からのRSSの増加量の最大値 (MiB)"""
+        return (self.peak - self.baseline) / MiB
+
+
+def make_uploader(
+    server: FakeYoutubeServer, auth_dir: Path
+) -> tuple[YoutubeUploader, FakeYoutubeHttp]:
+    """フェイクサーバーに接続したアップローダーを作成する"""
+    uploader = YoutubeUploader(
+        auth_dir,
+        deduplicate=False,
+        retry_policy=RetryPolicy(max_attempts=10, backoff_base=0.01, backoff_cap=0.1),
+        # プロセス共有の帯域制限の影響を受けないよう、専用の (無制限の) 制限を使う
+        bandwidth=BandwidthLimiter(),
+    )
+    http = server.http()
+    attach(uploader, http)
+    return uploader, http
+
+
+def run_upload_benchmark(
+    benchmark: Any,
+    server: FakeYoutubeServer,
+    auth_dir: Path,
+    video: Path,
+    chunksize: int,
+) -> None:
+    """アップロードを ROUNDS 回測定し、スループットなどを extra_info に記録する"""
+    uploader, http = make_uploader(server, auth_dir)
+    config = YoutubeConfig(
+        video_path=video, video_mimetype="video/mp4", title="benchmark"
+    )
+    samplers: list[RssSampler] = []
+
+    def upload() -> dict:
+        with RssSampler() as sampler:
+            response = uploader.upload_video(config, chunksize=chunksize)
+        samplers.append(sampler)
+        return response
+
+    response = benchmark.pedantic(upload, rounds=ROUNDS, iterations=1)
+    assert response["id"] in server.videos
+
+    payload = video.stat().st_size
+    latencies = sorted(timing.seconds * 1000 for timing in http.timings)
+    benchmark.extra_info.update(
+        {
+            "payload_mib": payload / MiB,
+            "chunksize": chunksize,
+            "conditions": server.conditions.model_dump(),
+            "mb_per_s": payload / benchmark.stats.stats.mean / 1_000_000,
+            "peak_rss_mib": max(sampler.growth_mib for sampler in samplers),
+            "chunks": len(latencies) / ROUNDS,
+            "chunk_p50_ms": statistics.median(latencies),
+            "chunk_p95_ms": latencies[int(len(latencies) * 0.95)],
+            "chunk_max_ms": latencies[-1],
+            "retries": uploader.retry_stats.retries,
+        }
+    )
+
+
+@pytest.mark.parametrize("payload_mib", [8, 64])
+@pytest.mark.parametrize(
+    "chunksize",
+    [256 * 1024, 1 * MiB, 8 * MiB, -1],
+    ids=["256KiB", "1MiB", "8MiB", "single"],
+)
+def test_upload_throughput(
+    benchmark: Any,
+    fake_server: FakeYoutubeServer,
+    video_files: dict[int, Path],
+    tmp_path: Path,
+    payload_mib: int,
+    chunksize: int,
+):
+    benchmark.group = f"payload {payload_mib}MiB"
+    run_upload_benchmark(
+        benchmark, fake_server, tmp_path, video_files[payload_mib], chunksize
+    )
+
+
+@pytest.mark.parametrize("name", list(CONDITIONS))
+def test_upload_conditions(
+    benchmark: Any,
+    fake_server: FakeYoutubeServer,
+    video_files: dict[int, Path],
+    tmp_path: Path,
+    name: str,
+):
+    benchmark.group = "conditions (32MiB, 4MiB chunks)"
+    fake_server.reset(CONDITIONS[name])
+    run_upload_benchmark(benchmark, fake_server, tmp_path, video_files[32], 4 * MiB)
+    if CONDITIONS[name].error_rate > 0:
+        assert fake_server.stats.injected_errors > 0
@@ -63,8 +63,12 @@ except AuthError as e:
 # -----------------------------------------------------------
 
 try:
-    # ファイルを読み込み、Configに渡す
-    video_bytes, video_mimetype = get_file_data(VIDEO_FILE_PATH)
+    # 動画はパスだけを渡し、アップロード時にチャンク単位で読み出す
+    if not VIDEO_FILE_PATH.exists():
+        raise FileNotFoundError(f"ファイルが見つかりません: {VIDEO_FILE_PATH}")
+    video_mimetype, _ = mimetypes.guess_type(VIDEO_FILE_PATH.as_posix())
+    if not video_mimetype:
+        raise ValueError(f"MIMEタイプを推定できませんでした: {VIDEO_FILE_PATH}")
 
     # サムネイルデータは任意
     thumbnail_bytes, thumbnail_mimetype = None, None
@@ -73,7 +77,7 @@ try:
 
     # アップロード設定オブジェクトの作成
     config = YoutubeConfig(
-        video_bytes=video_bytes,
+        video_path=VIDEO_FILE_PATH,
         video_mimetype=video_mimetype,
         title="【自動投稿】マイ作品の試作 - 予約デモ",
         description="Pythonスクリプトによる自動アップロード。",
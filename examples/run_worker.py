@@ -0,0 +1,69 @@
+"""ジョブキューに動画を投入し、ワーカーでアップロードするサンプルスクリプト
+
+投入したジョブは SQLite のファイルに保存されるため、途中でプロセスが
+終了しても、再度このスクリプトを実行すれば残りのジョブから処理を続ける。
+"""
+
+import logging
+import mimetypes
+import signal
+from pathlib import Path
+
+from youtube_uploader import (
+    AuthError,
+    JobQueue,
+    UploadWorker,
+    YoutubeConfig,
+    YoutubeUploader,
+)
+
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+# 置き換えてください
+TARGET_ACCOUNT_NAME = Path("~/.secrets/youtube-uploader/test-channel")
+
+QUEUE_PATH = TARGET_ACCOUNT_NAME / "jobs.sqlite3"
+VIDEO_DIR = Path("./test_assets/videos")
+
+# -----------------------------------------------------------
+# 1. ジョブの投入 (キューが空の場合のみ)
+# -----------------------------------------------------------
+
+queue = JobQueue(QUEUE_PATH)
+
+if not any(queue.counts().values()):
+    for video_path in sorted(VIDEO_DIR.glob("*.mp4")):
+        video_mimetype, _ = mimetypes.guess_type(video_path.as_posix())
+        queue.enqueue(
+            YoutubeConfig(
+                video_path=video_path,
+                video_mimetype=video_mimetype or "video/mp4",
+                title=video_path.stem,
+                privacy_status="private",
+            )
+        )
+
+# -----------------------------------------------------------
+# 2. ワーカーの実行
+# -----------------------------------------------------------
+
+try:
+    uploader = YoutubeUploader(TARGET_ACCOUNT_NAME)
+    uploader.connect()
+except (FileNotFoundError, AuthError) as e:
+    logger.critical(f"❌ 認証に失敗しました: {e}")
+    exit(1)
+
+worker = UploadWorker(uploader, queue, concurrency=2)
+
+# Ctrl+C / SIGTERM では、実行中のアップロードを終えてから停止する
+signal.signal(signal.SIGINT, lambda *_: worker.stop())
+signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+
+worker.run(drain=True)
+
+for job in queue.dead_letters():
+    logger.error(
+        f"❌ ジョブ {job.id} '{job.config.title}' は失敗しました: {job.last_error}"
+    )
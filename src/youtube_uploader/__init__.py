@@ -4,18 +4,122 @@
 
 推奨インポート方法:
     from youtube_uploader import YoutubeUploader, YoutubeConfig, AuthError, UploadError
+
+Note:
+    起動時間を短くするため、例外以外の公開オブジェクトは最初に参照された時点で
+    読み込まれます。Google の API クライアントは connect() やアップロードの
+    実行時まで読み込まれないため、設定の検証だけを行う CLI などは軽量に動作します。
 """
 
-from .exceptions import AuthError, UploadError, YoutubeUploaderError
-from .models import YoutubeConfig
-from .youtube import YoutubeUploader
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import (
+    AuthError,
+    QuotaExceededError,
+    UploadError,
+    YoutubeUploaderError,
+)
+
+# __all__ は _LAZY_ATTRIBUTES から生成するため、型チェッカー向けに
+# 公開オブジェクトを明示的に再エクスポートする (`X as X`)
+if TYPE_CHECKING:
+    from .async_youtube import AsyncYoutubeUploader as AsyncYoutubeUploader
+    from .bandwidth import (
+        BandwidthLimiter as BandwidthLimiter,
+        bandwidth_limiter as bandwidth_limiter,
+    )
+    from .instrumentation import (
+        Instrumentation as Instrumentation,
+        OpenTelemetryInstrumentation as OpenTelemetryInstrumentation,
+        PrometheusInstrumentation as PrometheusInstrumentation,
+    )
+    from .jobs import Job as Job, JobQueue as JobQueue, UploadWorker as UploadWorker
+    from .models import (
+        BatchCallResult as BatchCallResult,
+        BulkValidationResult as BulkValidationResult,
+        PlaylistAddition as PlaylistAddition,
+        PostUploadActions as PostUploadActions,
+        RowError as RowError,
+        ThumbnailResult as ThumbnailResult,
+        UploadResult as UploadResult,
+        VideoLocalization as VideoLocalization,
+        VideoMetadata as VideoMetadata,
+        VideoUpdate as VideoUpdate,
+        YoutubeConfig as YoutubeConfig,
+        validate_many as validate_many,
+    )
+    from .pool import ChannelPool as ChannelPool
+    from .progress import UploadProgress as UploadProgress
+    from .quota import QuotaLedger as QuotaLedger
+    from .refresh import TokenRefresher as TokenRefresher
+    from .retry import RetryPolicy as RetryPolicy, RetryStats as RetryStats
+    from .thumbnails import ThumbnailProcessor as ThumbnailProcessor
+    from .token_store import TokenStore as TokenStore
+    from .transport import TransportConfig as TransportConfig
+    from .youtube import (
+        MANAGE_SCOPES as MANAGE_SCOPES,
+        YoutubeUploader as YoutubeUploader,
+    )
 
 __version__ = "5.0.1"
 
+# 遅延して読み込む公開オブジェクトと、その定義モジュール
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "YoutubeUploader": ".youtube",
+    "MANAGE_SCOPES": ".youtube",
+    "AsyncYoutubeUploader": ".async_youtube",
+    "ChannelPool": ".pool",
+    "JobQueue": ".jobs",
+    "Job": ".jobs",
+    "UploadWorker": ".jobs",
+    "YoutubeConfig": ".models",
+    "UploadResult": ".models",
+    "ThumbnailResult": ".models",
+    "VideoMetadata": ".models",
+    "validate_many": ".models",
+    "BulkValidationResult": ".models",
+    "RowError": ".models",
+    "VideoLocalization": ".models",
+    "PlaylistAddition": ".models",
+    "PostUploadActions": ".models",
+    "VideoUpdate": ".models",
+    "BatchCallResult": ".models",
+    "ThumbnailProcessor": ".thumbnails",
+    "TransportConfig": ".transport",
+    "UploadProgress": ".progress",
+    "RetryPolicy": ".retry",
+    "RetryStats": ".retry",
+    "QuotaLedger": ".quota",
+    "TokenRefresher": ".refresh",
+    "TokenStore": ".token_store",
+    "BandwidthLimiter": ".bandwidth",
+    "bandwidth_limiter": ".bandwidth",
+    "Instrumentation": ".instrumentation",
+    "OpenTelemetryInstrumentation": ".instrumentation",
+    "PrometheusInstrumentation": ".instrumentation",
+}
+
+# 遅延して読み込むオブジェクトと例外をすべて公開する
 __all__ = [
-    "YoutubeUploader",
-    "YoutubeConfig",
+    *_LAZY_ATTRIBUTES,
     "AuthError",
     "UploadError",
+    "QuotaExceededError",
     "YoutubeUploaderError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """公開オブジェクトを、最初に参照された時点で読み込む"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # 2回目以降は通常の属性として参照させる
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,897 @@
+"""YouTube Uploader (asyncio版)
+
+aiohttp を使って再開可能アップロード (resumable upload) のプロトコルを
+直接扱うため、アップロード中もイベントループをブロックしない。
+1つのイベントループ上で、多数のアップロードやサムネイルの設定を
+スレッドを増やさずに同時に実行できる。
+
+Note:
+    利用には aiohttp が必要です。
+    poetry install --extras async
+"""
+
+import asyncio
+import io
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+from googleapiclient.errors import HttpError, ResumableUploadError  # type: ignore
+
+from .bandwidth import BandwidthLimiter, BandwidthShare
+from .chunking import CHUNK_GRANULARITY, AdaptiveChunkSizer, ChunkSize
+from .dedup import ContentHasher, UploadKey
+from .exceptions import AuthError, UploadError
+from .instrumentation import (
+    METRIC_BYTES_SENT,
+    METRIC_RETRIES,
+    METRIC_UPLOAD_THROUGHPUT,
+    SPAN_CHUNK,
+    SPAN_START_SESSION,
+    SPAN_THUMBNAIL,
+    SPAN_UPLOAD,
+    Instrumentation,
+)
+from .media import BufferReader, ObservedStream, open_video_stream
+from .models import ThumbnailResult, UploadResult, YoutubeConfig
+from .progress import ProgressTracker, UploadProgress
+from .quota import QUOTA_COSTS, QuotaLedger, upload_calls
+from .retry import (
+    RetryEvent,
+    RetryPolicy,
+    RetryStats,
+    call_with_retry_async,
+    retry_reason,
+)
+from .sessions import UploadSession, config_fingerprint
+from .thumbnails import ThumbnailProcessor
+from .youtube import YoutubeUploader, _QuotaReservation
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp は任意の依存関係
+    aiohttp = None  # type: ignore[assignment]
+
+# 再開可能アップロードのエンドポイント
+UPLOAD_BASE_URL = "https://www.googleapis.com/upload/youtube/v3"
+
+# チャンクサイズは256KiBの倍数である必要がある
+DEFAULT_CHUNKSIZE = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+
+class AsyncYoutubeUploader:
+    """YoutubeUploader の asyncio 版
+
+    認証 (token.json の読み込みやブラウザ認証) は YoutubeUploader と共通で、
+    connect() 時に一度だけスレッドで実行する。アップロード本体は aiohttp で
+    非同期に送信する。
+
+    Examples:
+        async with AsyncYoutubeUploader(Path("~/secrets/my_account")) as uploader:
+            responses = await asyncio.gather(
+                *(uploader.upload_video(config) for config in configs)
+            )
+
+    Methods:
+        - connect(): YouTube APIへの認証と接続を確立します
+        - upload_video(config: YoutubeConfig): 指定された設定で動画をアップロードします
+        - resume_upload(config: YoutubeConfig): 中断されたアップロードを再開します
+        - upload_many(configs): 複数の動画を並行してアップロードします
+        - close(): HTTPセッションを閉じます
+    """
+
+    def __init__(
+        self,
+        auth_path: Path,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float = 300.0,
+        upload_base_url: str = UPLOAD_BASE_URL,
+        quota_ledger: QuotaLedger | None = None,
+        thumbnail_processor: ThumbnailProcessor | None = None,
+        bandwidth: BandwidthLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        token_refresh_margin: float | None = None,
+        scopes: Iterable[str] | None = None,
+        deduplicate: bool = False,
+    ):
+        """
+        Args:
+            auth_path (Path): 利用する client_secret.jsonが入っているディレクトリのパス
+            retry_policy (RetryPolicy | None, optional): 一時的なエラーに対する
+                再試行ポリシー
+            timeout (float, optional): ソケットの読み込みタイムアウト秒数
+            upload_base_url (str, optional): アップロード用エンドポイントのベースURL
+            quota_ledger (QuotaLedger | None, optional): クォータの消費量の台帳
+                (Noneの場合は token.json と同じディレクトリのものを使う)
+            thumbnail_processor (ThumbnailProcessor | None, optional):
+                動画の送信前にサムネイルを検証・正規化する処理
+            bandwidth (BandwidthLimiter | None, optional): 送信帯域の制限
+                Noneの場合はプロセス内で共有の bandwidth_limiter を使う
+            instrumentation (Instrumentation | None, optional): 段階ごとの
+                所要時間とメトリクスの通知先。Noneの場合は計測しない
+            token_refresh_margin (float | None, optional): 指定すると、
+                アクセストークンを有効期限のこの秒数前にバックグラウンドで
+                リフレッシュする (YoutubeUploader と同じ)
+            scopes (Iterable[str] | None, optional): 認証で要求するスコープ
+                (再生リストへの追加や翻訳の設定には MANAGE_SCOPES が必要)
+            deduplicate (bool, optional): アップロード済みの動画を記録し、
+                同じ内容とメタデータの動画はアップロードせずに記録済みの
+                レスポンスを返すかどうか (YoutubeUploader と同じ)
+
+        Raises:
+            ImportError: aiohttp がインストールされていない場合
+            ValueError: token_refresh_margin が負の場合
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncYoutubeUploader を利用するには aiohttp が必要です。"
+                "`poetry install --extras async` を実行してください。"
+            )
+
+        self._sync_uploader = YoutubeUploader(
+            auth_path,
+            retry_policy=retry_policy,
+            quota_ledger=quota_ledger,
+            thumbnail_processor=thumbnail_processor,
+            bandwidth=bandwidth,
+            instrumentation=instrumentation,
+            token_refresh_margin=token_refresh_margin,
+            scopes=scopes,
+            deduplicate=deduplicate,
+        )
+        self._instrumentation = self._sync_uploader.instrumentation
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._timeout = timeout
+        self._upload_base_url = upload_base_url.rstrip("/")
+
+        self._credentials: Any = None
+        self._session: Any = None
+        self._refresh_lock: asyncio.Lock | None = None
+
+    async def __aenter__(self) -> "AsyncYoutubeUploader":
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """このインスタンスでの再試行回数と待機時間の累計 (監視用のスナップショット)"""
+        return self._retry_stats.model_copy(deep=True)
+
+    async def connect(self) -> None:
+        """認証情報をロードし、アップロード用のHTTPセッションを開く
+
+        Raises:
+            AuthError: 認証に失敗した場合
+        """
+        if self._session is not None:
+            logger.info("既にYouTube APIへの接続が完了しています。")
+            return
+
+        # token.json の読み込みやブラウザ認証は同期処理のため、
+        # イベントループを止めないよう一度だけスレッドで実行する
+        await asyncio.to_thread(self._sync_uploader.connect)
+        self._credentials = self._sync_uploader.credentials
+        if self._credentials is None:
+            raise AuthError("認証情報を取得できませんでした。")
+
+        self._refresh_lock = asyncio.Lock()
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=self._timeout)
+        )
+        logger.info("YouTube APIへの非同期接続が完了しました。")
+
+    async def close(self) -> None:
+        """HTTPセッションと、同期版のアップローダーの接続を閉じる"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._sync_uploader.close()
+
+    async def upload_video(
+        self,
+        config: YoutubeConfig,
+        progress_callback: Callable[[float], None] | None = None,
+        chunksize: ChunkSize = DEFAULT_CHUNKSIZE,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
+    ) -> dict:
+        """動画をYouTubeにアップロードする
+
+        YoutubeUploader と同じく、アップロードセッションのURIと送信済み
+        バイト数を保存するため、中断した場合は resume_upload() (同期版の
+        resume_upload() も可) で続きから再開できる。
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+            progress_callback (Callable[[float], None] | None, optional):
+                アップロード進捗を通知するコールバック関数
+                引数には進捗率（0.0 から 1.0）が渡される
+            chunksize (ChunkSize, optional):
+                アップロードのチャンクサイズ（バイト単位、256KiBの倍数）
+                メモリ使用量はアップロード1件あたりこのサイズに収まる
+                "auto" を指定すると、実測スループットに合わせて自動調整する
+            on_progress (Callable[[UploadProgress], None] | None, optional):
+                送信バイト数・スループット・残り時間などを含む進捗イベントを
+                受け取るコールバック関数 (チャンクの完了ごとに通知される)
+            progress_interval (float, optional): on_progress を呼び出す最小間隔 (秒)
+
+        Returns:
+            dict : APIのレスポンス辞書
+
+        Raises:
+            QuotaExceededError: クォータが不足している場合 (動画の送信前に判定)
+            UploadError: アップロード中にAPIエラーが発生した場合
+            AuthError: APIに接続されていない場合
+        """
+        tracker = ProgressTracker(
+            config.title, on_progress, progress_callback, progress_interval
+        )
+        return await self._upload_one(config, tracker, chunksize, resume=False)
+
+    async def resume_upload(
+        self,
+        config: YoutubeConfig,
+        progress_callback: Callable[[float], None] | None = None,
+        chunksize: ChunkSize = DEFAULT_CHUNKSIZE,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
+    ) -> dict:
+        """保存済みのセッションから、中断された動画のアップロードを再開する
+
+        サーバに受信済みのバイト数を問い合わせ、その続きから送信する。
+        保存済みのセッションがない場合や、セッションの有効期限が切れている
+        場合は、最初からアップロードする。
+
+        Args:
+            config (YoutubeConfig): 中断時と同じアップロード設定情報
+            progress_callback (Callable[[float], None] | None, optional):
+                アップロード進捗を通知するコールバック関数
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、256KiBの倍数、または "auto"）
+            on_progress (Callable[[UploadProgress], None] | None, optional):
+                進捗イベントを受け取るコールバック関数
+            progress_interval (float, optional): on_progress を呼び出す最小間隔 (秒)
+
+        Returns:
+            dict : APIのレスポンス辞書
+
+        Raises:
+            QuotaExceededError: クォータが不足している場合 (動画の送信前に判定)
+            UploadError: アップロード中にAPIエラーが発生した場合
+            AuthError: APIに接続されていない場合
+        """
+        logger.info(f"動画 '{config.title}' のアップロードの再開を試みます...")
+        tracker = ProgressTracker(
+            config.title, on_progress, progress_callback, progress_interval
+        )
+        return await self._upload_one(config, tracker, chunksize, resume=True)
+
+    async def _upload_one(
+        self,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        resume: bool,
+    ) -> dict:
+        """1件の動画とサムネイルをアップロードし、再生リストと翻訳を適用する"""
+        uploaded, key = await asyncio.to_thread(
+            self._sync_uploader.find_uploaded, config
+        )
+        if uploaded is not None:
+            # 前回の実行で適用前に終了していた操作があれば適用する
+            await asyncio.to_thread(
+                self._apply_actions_in_thread,
+                [
+                    (
+                        UploadResult(
+                            index=0,
+                            title=config.title,
+                            response=uploaded,
+                            duplicate=True,
+                        ),
+                        config,
+                    )
+                ],
+            )
+            return uploaded
+
+        config = await asyncio.to_thread(self._sync_uploader.prepare_thumbnail, config)
+        response = await self._upload(config, tracker, chunksize, key, resume)
+        await self._upload_thumbnail(response["id"], config, tracker)
+        await asyncio.to_thread(
+            self._apply_actions_in_thread,
+            [(UploadResult(index=0, title=config.title, response=response), config)],
+        )
+        return response
+
+    async def _upload(
+        self,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        key: UploadKey | None = None,
+        resume: bool = False,
+    ) -> dict:
+        """クォータを確保し、動画ソースを開いてアップロードする (サムネイルを除く)
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker): 進捗の集計と通知
+            chunksize (ChunkSize): チャンクサイズ（バイト単位、または "auto"）
+            key (UploadKey | None, optional): アップロード後にインデックスへ
+                記録するためのキー
+            resume (bool, optional): 保存済みのセッションから再開するかどうか
+
+        Returns:
+            dict : APIのレスポンス辞書
+        """
+        self._require_session()
+        if chunksize != "auto" and (
+            chunksize <= 0 or chunksize % CHUNK_GRANULARITY != 0
+        ):
+            raise ValueError(
+                "chunksize は256KiBの倍数、または 'auto' を指定してください。"
+            )
+
+        fingerprint, session = await asyncio.to_thread(
+            self._load_session, config, resume
+        )
+
+        # --- 送信前のクォータ確認 ---
+        # 保存済みのセッションから再開する場合、videos.insert は消費済み
+        calls = upload_calls(config)
+        if session is not None:
+            calls.pop("videos.insert")
+        await asyncio.to_thread(self._sync_uploader.reserve_quota, calls)
+        # 送信前に失敗した場合は、呼び出さなかったメソッドの分を返却する
+        reservation = _QuotaReservation(calls)
+
+        logger.info(f"動画 '{config.title}' のアップロードを開始します...")
+        body = YoutubeUploader.build_body(config)
+
+        try:
+            with (
+                self._instrumentation.phase(
+                    SPAN_UPLOAD, {"chunksize": str(chunksize), "resume": resume}
+                ),
+                open_video_stream(config) as stream,
+                self._sync_uploader.bandwidth.transfer() as share,
+            ):
+                # 送信のための読み込みに合わせて、内容のハッシュを計算する
+                hasher = (
+                    ContentHasher()
+                    if key is not None and key.content_hash is None
+                    else None
+                )
+                if hasher is not None:
+                    stream = ObservedStream(stream, [hasher])  # type: ignore[assignment]
+                response = await self._insert_video(
+                    body,
+                    stream,
+                    config,
+                    tracker,
+                    chunksize,
+                    share,
+                    fingerprint=fingerprint,
+                    session=session,
+                    reservation=reservation,
+                )
+        except FileNotFoundError:
+            await asyncio.to_thread(
+                self._sync_uploader.refund_quota, reservation.unused()
+            )
+            raise
+        except OSError as e:
+            await asyncio.to_thread(
+                self._sync_uploader.refund_quota, reservation.unused()
+            )
+            logger.error(f"動画ファイルの読み込み中にエラーが発生しました: {e}")
+            raise UploadError(f"動画ファイルを開けませんでした: {e}") from e
+        except Exception:
+            await asyncio.to_thread(
+                self._sync_uploader.refund_quota, reservation.unused()
+            )
+            raise
+
+        if key is not None:
+            content_hash = (
+                hasher.hexdigest(key.size) if hasher is not None else key.content_hash
+            )
+            await asyncio.to_thread(
+                self._sync_uploader.record_upload, key, config, content_hash, response
+            )
+        return response
+
+    async def upload_many(
+        self,
+        configs: Iterable[YoutubeConfig],
+        max_concurrency: int = 16,
+        chunksize: ChunkSize = DEFAULT_CHUNKSIZE,
+    ) -> list[UploadResult]:
+        """複数の動画を同じイベントループ上で並行してアップロードする
+
+        サムネイルは動画の送信枠を解放してからアップロードするため、
+        次の動画の送信と重なって実行される。結果は UploadResult.thumbnail に
+        格納される。再生リストへの追加と翻訳の設定は、すべての動画の
+        アップロード後にバッチリクエストにまとめて実行し、UploadResult.actions に
+        格納する。
+
+        Args:
+            configs (Iterable[YoutubeConfig]): アップロード設定情報のリスト
+            max_concurrency (int, optional): 同時にアップロードする最大数
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、または "auto"）
+
+        Returns:
+            list[UploadResult]: 入力と同じ順序に並んだ、1件ごとの結果
+        """
+        configs = list(configs)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(index: int, config: YoutubeConfig) -> UploadResult:
+            tracker = ProgressTracker(config.title, log_level=logging.DEBUG)
+            async with semaphore:
+                try:
+                    uploaded, key = await asyncio.to_thread(
+                        self._sync_uploader.find_uploaded, config
+                    )
+                    if uploaded is not None:
+                        return UploadResult(
+                            index=index,
+                            title=config.title,
+                            response=uploaded,
+                            duplicate=True,
+                            thumbnail=ThumbnailResult(
+                                video_id=uploaded["id"], status="skipped"
+                            ),
+                        )
+                    config = await asyncio.to_thread(
+                        self._sync_uploader.prepare_thumbnail, config
+                    )
+                    response = await self._upload(config, tracker, chunksize, key)
+                except Exception as e:
+                    return UploadResult(index=index, title=config.title, error=e)
+
+            thumbnail = await self._upload_thumbnail(response["id"], config, tracker)
+            return UploadResult(
+                index=index, title=config.title, response=response, thumbnail=thumbnail
+            )
+
+        results = list(
+            await asyncio.gather(
+                *(run(index, config) for index, config in enumerate(configs))
+            )
+        )
+        await asyncio.to_thread(
+            self._apply_actions_in_thread, list(zip(results, configs, strict=True))
+        )
+        return results
+
+    def _apply_actions_in_thread(
+        self, uploads: list[tuple[UploadResult, YoutubeConfig]]
+    ) -> None:
+        """スレッドで、再生リストへの追加と翻訳をバッチリクエストで適用する"""
+        # アップロード済みの動画には、インデックスに記録された適用待ちの操作を適用する
+        has_index = self._sync_uploader.upload_index is not None
+        if not any(
+            config.has_post_upload_actions or (result.duplicate and has_index)
+            for result, config in uploads
+        ):
+            return
+        # googleapiclient のサービスはスレッドセーフではないため、
+        # 実行するスレッド専用のサービスを使う
+        self._sync_uploader.ensure_thread_service()
+        self._sync_uploader.apply_post_upload_actions(uploads)
+
+    def _load_session(
+        self, config: YoutubeConfig, resume: bool
+    ) -> tuple[str | None, UploadSession | None]:
+        """スレッドで、設定のフィンガープリントと保存済みのセッションを取得する
+
+        Returns:
+            tuple[str | None, UploadSession | None]: (フィンガープリント,
+                再開するセッション)。セッションを保存しない場合は (None, None)
+        """
+        store = self._sync_uploader.session_store
+        if store is None:
+            return None, None
+        fingerprint = config_fingerprint(config)
+        return fingerprint, store.load(fingerprint) if resume else None
+
+    def _require_session(self) -> None:
+        """接続済みであることを確認する
+
+        Raises:
+            AuthError: APIに接続されていない場合
+        """
+        if self._session is None:
+            raise AuthError(
+                "YouTube APIに接続されていません。"
+                "connect() メソッドを呼び出してください。"
+            )
+
+    def _on_retry(self, event: RetryEvent, error: BaseException) -> None:
+        """再試行を累計に記録し、ログに出力する"""
+        self._retry_stats.record(event, error)
+        self._instrumentation.add(
+            METRIC_RETRIES, 1, {"reason": retry_reason(event, error)}
+        )
+        logger.warning(
+            f"一時的なエラーのため {event.delay:.1f} 秒後に再試行します "
+            f"({event.retry_number}/{self._retry_policy.max_attempts - 1}回目): "
+            f"{event.error}"
+        )
+
+    async def _auth_headers(self) -> dict[str, str]:
+        """有効なアクセストークンを含む認証ヘッダーを返す"""
+        assert self._refresh_lock is not None
+        async with self._refresh_lock:
+            if not self._credentials.valid:
+                logger.info("認証情報が期限切れのため、リフレッシュします。")
+                # 同期版と同じく、token.json のロックの中で読み直してから
+                # リフレッシュし、新しいトークンを保存する
+                await asyncio.to_thread(self._sync_uploader.refresh_credentials)
+        return {"Authorization": f"Bearer {self._credentials.token}"}
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[Any, bytes]:
+        """認証付きのHTTPリクエストを送信する
+
+        googleapiclient と同じエラー処理を使えるよう、レスポンスは
+        httplib2.Response 形式に変換して返す。
+
+        Returns:
+            tuple[httplib2.Response, bytes]: (レスポンス, ボディ)
+
+        Raises:
+            ConnectionError: 接続が切断されるなど、通信に失敗した場合
+        """
+        import httplib2  # type: ignore
+
+        request_headers = await self._auth_headers()
+        request_headers.update(headers or {})
+
+        try:
+            async with self._session.request(
+                method, url, data=data, headers=request_headers
+            ) as resp:
+                content = await resp.read()
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            # 再試行ポリシーで扱えるよう、標準の例外に変換する
+            raise ConnectionError(f"{method} {url} の通信に失敗しました: {e}") from e
+
+        info = {key.lower(): value for key, value in resp.headers.items()}
+        info["status"] = str(resp.status)
+        return httplib2.Response(info), content
+
+    async def _insert_video(
+        self,
+        body: dict[str, Any],
+        stream: BinaryIO,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        bandwidth_share: BandwidthShare | None = None,
+        fingerprint: str | None = None,
+        session: UploadSession | None = None,
+        reservation: _QuotaReservation | None = None,
+    ) -> dict:
+        """再開可能アップロードのセッションを開始し、チャンク単位で送信する
+
+        fingerprint を指定した場合は、YoutubeUploader と同じストアに
+        セッションURIと送信済みバイト数を保存する。session を指定した場合は、
+        サーバに受信済みのバイト数を問い合わせてから続きを送信する。
+        reservation を指定した場合は、送信を始めたメソッドを記録する。
+        """
+        total = stream.seek(0, io.SEEK_END)
+        stream.seek(0)
+        sizer = AdaptiveChunkSizer() if chunksize == "auto" else None
+        next_size = sizer.chunksize if sizer is not None else int(chunksize)
+        chunk_seconds = 0.0
+        bandwidth = self._sync_uploader.bandwidth
+        instrumentation = self._instrumentation
+        store = self._sync_uploader.session_store
+        tracker.begin("video", total)
+
+        def on_retry(event: RetryEvent, error: BaseException) -> None:
+            self._on_retry(event, error)
+            tracker.retried()
+
+        async def start_session() -> str:
+            with instrumentation.phase(SPAN_START_SESSION):
+                return await call_with_retry_async(
+                    lambda: self._start_session(body, config.video_mimetype, total),
+                    self._retry_policy,
+                    on_retry=on_retry,
+                )
+
+        async def save_session(session_uri: str, offset: int) -> UploadSession | None:
+            if store is None or fingerprint is None:
+                return None
+            saved = UploadSession(
+                fingerprint=fingerprint,
+                resumable_uri=session_uri,
+                offset=offset,
+                total_size=total,
+            )
+            await asyncio.to_thread(store.save, saved)
+            return saved
+
+        # ここから先はリクエストを送信するため、失敗してもクォータは返却しない
+        if reservation is not None:
+            reservation.called.add("videos.insert")
+        try:
+            if session is not None:
+                logger.info(
+                    "保存されたセッションからアップロードを再開します "
+                    f"(送信済み: {session.offset}/{session.total_size} バイト)"
+                )
+                session_uri = session.resumable_uri
+            else:
+                # 送信前にセッションURIを保存するため、セッションだけ先に開始する
+                session_uri = await start_session()
+                session = await save_session(session_uri, 0)
+
+            offset = 0
+            # 再開時は、最初にサーバが受信済みのバイト数を問い合わせる
+            resuming = in_error_state = session is not None and session.offset > 0
+
+            async def send_next_chunk() -> dict | None:
+                nonlocal offset, in_error_state, next_size, chunk_seconds
+                try:
+                    if in_error_state:
+                        # 前回の失敗後は、サーバが受信済みのバイト数を問い合わせる
+                        resp, content = await self._request(
+                            "PUT",
+                            session_uri,
+                            headers={"Content-Range": f"bytes */{total}"},
+                        )
+                        next_offset, done = self._process_response(
+                            resp, content, session_uri
+                        )
+                        in_error_state = False
+                        if done is not None:
+                            return done
+                        offset = next_offset
+
+                    data = await self._read_chunk(
+                        stream, offset, bandwidth.cap_chunksize(next_size)
+                    )
+                    if bandwidth.rate is not None:
+                        await asyncio.to_thread(
+                            bandwidth.acquire, len(data), bandwidth_share
+                        )
+                    content_range = (
+                        f"bytes {offset}-{offset + len(data) - 1}/{total}"
+                        if data
+                        else f"bytes */{total}"
+                    )
+                    started = time.monotonic()
+                    with instrumentation.phase(SPAN_CHUNK, {"offset": offset}):
+                        resp, content = await self._request(
+                            "PUT",
+                            session_uri,
+                            data=data,
+                            headers={"Content-Range": content_range},
+                        )
+                        next_offset, done = self._process_response(
+                            resp, content, session_uri
+                        )
+                    chunk_seconds = time.monotonic() - started
+                    instrumentation.add(
+                        METRIC_BYTES_SENT,
+                        (total if done is not None else next_offset) - offset,
+                        {"phase": "video"},
+                    )
+                    if sizer is not None and done is None:
+                        # 実測スループットに合わせて、次のチャンクサイズを調整する
+                        next_size = sizer.record(next_offset - offset, chunk_seconds)
+                    offset = next_offset
+                    return done
+                except Exception:
+                    in_error_state = True
+                    raise
+
+            response = None
+            upload_started = time.monotonic()
+            while response is None:
+                try:
+                    response = await call_with_retry_async(
+                        send_next_chunk, self._retry_policy, on_retry=on_retry
+                    )
+                except HttpError as e:
+                    if not resuming or e.resp.status not in (404, 410):
+                        raise
+                    # セッションの有効期限切れ: 新しいセッションで最初から送り直す
+                    logger.warning(
+                        "保存されたセッションは有効期限が切れています。"
+                        "最初からアップロードします。"
+                    )
+                    resuming = in_error_state = False
+                    offset = 0
+                    await asyncio.to_thread(
+                        self._sync_uploader.record_quota,
+                        {"videos.insert": QUOTA_COSTS["videos.insert"]},
+                    )
+                    session_uri = await start_session()
+                    session = await save_session(session_uri, 0)
+                    continue
+
+                resuming = False
+                if response is None:
+                    # 送信済みバイト数を保存し、中断時に再開できるようにする
+                    if session is not None and store is not None:
+                        session.offset = offset
+                        await asyncio.to_thread(store.save, session)
+                    tracker.chunk_done(offset, chunk_seconds)
+            tracker.finish()
+            upload_seconds = time.monotonic() - upload_started
+            if total > 0 and upload_seconds > 0:
+                instrumentation.record(METRIC_UPLOAD_THROUGHPUT, total / upload_seconds)
+
+            # 送信が完了したセッションは不要になるため削除
+            if store is not None and fingerprint is not None:
+                await asyncio.to_thread(store.delete, fingerprint)
+
+            if "id" in response:
+                video_id = response["id"]
+                video_url = f"https://www.youtube.com/watch?v={video_id}"
+                logger.info(f"動画のアップロードが完了しました: {video_url}")
+                return response
+            else:
+                logger.error(
+                    "動画のアップロードに失敗しました。レスポンスにIDが含まれていません。"
+                )
+                raise UploadError(
+                    "動画のアップロードに失敗しました。レスポンスにIDが含まれていません。"
+                )
+        except UploadError:
+            raise
+
+        except Exception as e:
+            error = await asyncio.to_thread(self._sync_uploader.upload_failure, e)
+            raise error from e
+
+    async def _start_session(
+        self, body: dict[str, Any], mimetype: str, total: int
+    ) -> str:
+        """再開可能アップロードのセッションを開始し、セッションURIを返す
+
+        Raises:
+            ResumableUploadError: セッションの開始に失敗した場合
+        """
+        url = (
+            f"{self._upload_base_url}/videos"
+            f"?uploadType=resumable&part={','.join(body.keys())}"
+        )
+        resp, content = await self._request(
+            "POST",
+            url,
+            data=json.dumps(body).encode(),
+            headers={
+                "Content-Type": "application/json; charset=UTF-8",
+                "X-Upload-Content-Type": mimetype,
+                "X-Upload-Content-Length": str(total),
+            },
+        )
+        if resp.status == 200 and "location" in resp:
+            return resp["location"]
+        raise ResumableUploadError(resp, content)
+
+    @staticmethod
+    def _process_response(
+        resp: Any, content: bytes, uri: str
+    ) -> tuple[int, dict | None]:
+        """チャンク送信のレスポンスを処理する
+
+        Returns:
+            tuple[int, dict | None]: (次に送信するオフセット, 完了時のレスポンス)
+
+        Raises:
+            HttpError: 2xx / 308 以外のレスポンスの場合
+        """
+        if resp.status in (200, 201):
+            return 0, json.loads(content)
+        if resp.status == 308:
+            # "bytes=0-1234" 形式の Range ヘッダーから受信済みのバイト数を得る
+            if "range" in resp:
+                return int(resp["range"].split("-")[1]) + 1, None
+            return 0, None
+        raise HttpError(resp, content, uri=uri)
+
+    @staticmethod
+    async def _read_chunk(stream: BinaryIO, offset: int, size: int) -> bytes:
+        """ストリームの指定位置から1チャンク分を読み出す
+
+        ファイルの読み込みはブロッキング処理のため、スレッドで実行する。
+        """
+
+        def read() -> bytes:
+            stream.seek(offset)
+            return stream.read(size)
+
+        if isinstance(stream, BufferReader):
+            return read()
+        return await asyncio.to_thread(read)
+
+    async def _upload_thumbnail(
+        self,
+        video_id: str,
+        config: YoutubeConfig,
+        tracker: ProgressTracker | None = None,
+    ) -> ThumbnailResult:
+        """指定された動画IDにサムネイル画像をアップロードする
+
+        Args:
+            video_id (str): 対象となるYouTube動画のID
+            config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker | None, optional): 進捗の集計と通知
+
+        Returns:
+            ThumbnailResult: サムネイルのアップロード結果
+        """
+        if config.thumbnail_bytes is None or config.thumbnail_mimetype is None:
+            # データがなければスキップ
+            return ThumbnailResult(video_id=video_id, status="skipped")
+
+        logger.info("サムネイルのアップロードを開始します...")
+        url = f"{self._upload_base_url}/thumbnails/set?videoId={video_id}"
+        thumbnail_bytes = config.thumbnail_bytes
+        mimetype = config.thumbnail_mimetype
+
+        async def send() -> None:
+            resp, content = await self._request(
+                "POST",
+                f"{url}&uploadType=media",
+                data=thumbnail_bytes,
+                headers={"Content-Type": mimetype},
+            )
+            if resp.status not in (200, 201):
+                raise HttpError(resp, content, uri=url)
+
+        def on_retry(event: RetryEvent, error: BaseException) -> None:
+            self._on_retry(event, error)
+            if tracker is not None:
+                tracker.retried()
+
+        try:
+            thumbnail_size = memoryview(thumbnail_bytes).nbytes
+            if tracker is not None:
+                tracker.begin("thumbnail", thumbnail_size)
+            with self._instrumentation.phase(SPAN_THUMBNAIL):
+                await call_with_retry_async(send, self._retry_policy, on_retry=on_retry)
+            self._instrumentation.add(
+                METRIC_BYTES_SENT, thumbnail_size, {"phase": "thumbnail"}
+            )
+            if tracker is not None:
+                tracker.finish()
+            logger.info("サムネイルのアップロードが完了しました。")
+            return ThumbnailResult(video_id=video_id, status="uploaded")
+
+        except Exception as e:
+            # サムネイルアップロード失敗は致命的ではないため、例外を再発生させない
+            return await asyncio.to_thread(
+                self._sync_uploader.thumbnail_failure, video_id, e
+            )
@@ -0,0 +1,232 @@
+"""bandwidth
+
+プロセス内のすべてのアップロードで共有する、送信帯域の制限 (トークンバケット)
+
+動画のデータは送信の直前に読み込まれるため、読み込みの時点で帯域を
+確保することで送信の速度を抑える。YoutubeUploader では HTTP 層が
+小さなブロックごとに読み込みながら送信するため、送信はほぼ一定の速度になる。
+AsyncYoutubeUploader は1チャンクをまとめて読み込んでから送信するため、
+制限中のチャンクサイズを、実行中のアップロード数で上限を等分した量
+(chunk_seconds 秒分) までに制限して、1回の送信で回線を占有する時間を抑える。
+"""
+
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .chunking import CHUNK_GRANULARITY
+
+
+class BandwidthShare:
+    """帯域を共有する1件のアップロード
+
+    これまでに割り当てられたバイト数が少ないアップロードの読み込みから
+    順に帯域を割り当てることで、並列のアップロードの送信量を揃える。
+    """
+
+    __slots__ = ("granted",)
+
+    def __init__(self, granted: int = 0):
+        self.granted = granted
+
+
+class BandwidthLimiter:
+    """複数のアップロードで共有する、スレッドセーフな送信帯域の制限
+
+    待機中の読み込みは、これまでに割り当てられたバイト数が少ない
+    アップロードのものから順に帯域を得る。チャンクサイズも
+    アップロードごとに等分した量までに制限されるため、並列のアップロードは
+    ほぼ同じ帯域を得る。上限は configure() で実行中にも変更できる。
+
+    Examples:
+        from youtube_uploader import bandwidth_limiter
+
+        bandwidth_limiter.configure(2 * 1024 * 1024)  # 2 MiB/s
+        bandwidth_limiter.configure(None)  # 夜間は制限を解除
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        chunk_seconds: float = 2.0,
+    ):
+        """
+        Args:
+            rate (float | None, optional): 送信帯域の上限 (バイト/秒)
+                Noneの場合は制限しない
+            burst (float | None, optional): 待たずに送信できるバイト数
+                Noneの場合は rate の1秒分
+            chunk_seconds (float, optional): 制限中のチャンクサイズを、
+                アップロード1件あたりの帯域で何秒分とするか
+
+        Raises:
+            ValueError: 引数の値が不正な場合
+        """
+        if chunk_seconds <= 0:
+            raise ValueError("chunk_seconds は0より大きい値を指定してください。")
+        self._chunk_seconds = chunk_seconds
+        self._condition = threading.Condition()
+        self._shares: set[BandwidthShare] = set()
+        self._waiters: list[tuple[int, int, BandwidthShare]] = []
+        self._sequence = itertools.count()
+        self._paying = False
+        self._rate: float | None = None
+        self._burst = 0.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.configure(rate, burst)
+
+    @property
+    def rate(self) -> float | None:
+        """送信帯域の上限 (バイト/秒、制限しない場合はNone)"""
+        with self._condition:
+            return self._rate
+
+    @property
+    def active(self) -> int:
+        """帯域を共有している実行中のアップロード数"""
+        with self._condition:
+            return len(self._shares)
+
+    def configure(self, rate: float | None, burst: float | None = None) -> None:
+        """送信帯域の上限を変更する
+
+        待機中の読み込みにも、変更後の上限がすぐに適用される。
+
+        Args:
+            rate (float | None): 送信帯域の上限 (バイト/秒)
+                Noneの場合は制限を解除する
+            burst (float | None, optional): 待たずに送信できるバイト数
+                Noneの場合は rate の1秒分
+
+        Raises:
+            ValueError: 引数の値が不正な場合
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate は0より大きい値を指定してください。")
+        if burst is not None and burst <= 0:
+            raise ValueError("burst は0より大きい値を指定してください。")
+
+        with self._condition:
+            self._refill()
+            was_unlimited = self._rate is None
+            self._rate = rate
+            self._burst = burst if burst is not None else (rate or 0.0)
+            if was_unlimited:
+                self._tokens = self._burst
+            else:
+                self._tokens = min(self._tokens, self._burst)
+            self._condition.notify_all()
+
+    def _refill(self) -> None:
+        """経過時間に応じてトークンを補充する (ロック内で呼ぶ)"""
+        now = time.monotonic()
+        if self._rate is not None:
+            elapsed = now - self._updated
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def acquire(self, nbytes: int, share: BandwidthShare | None = None) -> None:
+        """送信するバイト数の帯域を確保するまで待つ
+
+        確保したバイト数は、上限の速度で送信した場合に要する時間だけ
+        待ってから返す (burst の分は待たずに返す)。
+
+        Args:
+            nbytes (int): 送信するバイト数
+            share (BandwidthShare | None, optional): transfer() で登録した
+                アップロード (Noneの場合は、割り当て順を待つだけの読み込みとする)
+        """
+        # 制限がない場合は、ロックを取らずにすぐ返す
+        if nbytes <= 0 or self._rate is None:
+            return
+        with self._condition:
+            if self._rate is None:
+                return
+            if share is None:
+                share = BandwidthShare(self._virtual_time())
+            entry = (share.granted, next(self._sequence), share)
+            self._waiters.append(entry)
+            paying = False
+            try:
+                # 割り当て済みのバイト数が最も少ない読み込みの順番を待つ
+                while self._rate is not None and (
+                    self._paying or min(self._waiters)[1] != entry[1]
+                ):
+                    self._condition.wait()
+                if self._rate is None:
+                    return
+
+                self._waiters.remove(entry)
+                self._paying = paying = True
+                share.granted += nbytes
+                self._refill()
+                self._tokens -= nbytes
+                while self._rate is not None and self._tokens < 0:
+                    self._condition.wait(-self._tokens / self._rate)
+                    self._refill()
+            finally:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                if paying:
+                    self._paying = False
+                self._condition.notify_all()
+
+    def _virtual_time(self) -> int:
+        """実行中のアップロードに割り当て済みのバイト数の最小値 (ロック内で呼ぶ)"""
+        return min((share.granted for share in self._shares), default=0)
+
+    @contextmanager
+    def transfer(self) -> Iterator[BandwidthShare]:
+        """1件のアップロードを、帯域を共有する実行中のアップロードとして登録する
+
+        途中から加わったアップロードが、先に始まったアップロードの
+        送信量に追いつくまで帯域を独占しないよう、割り当て済みのバイト数は
+        実行中のアップロードの最小値から数え始める。
+
+        Yields:
+            BandwidthShare: acquire() に渡す、このアップロードの割り当て
+        """
+        with self._condition:
+            share = BandwidthShare(self._virtual_time())
+            self._shares.add(share)
+        try:
+            yield share
+        finally:
+            with self._condition:
+                self._shares.discard(share)
+
+    def chunk_limit(self) -> int | None:
+        """アップロード1件あたりのチャンクサイズの上限を返す
+
+        Returns:
+            int | None: 256KiBの倍数に丸めたバイト数 (制限しない場合はNone)
+        """
+        with self._condition:
+            if self._rate is None:
+                return None
+            share = self._rate * self._chunk_seconds / max(len(self._shares), 1)
+        return max(
+            CHUNK_GRANULARITY, int(share) // CHUNK_GRANULARITY * CHUNK_GRANULARITY
+        )
+
+    def cap_chunksize(self, chunksize: int) -> int:
+        """チャンクサイズを、アップロード1件あたりの上限までに制限する
+
+        Args:
+            chunksize (int): 本来のチャンクサイズ (-1 は一括送信)
+
+        Returns:
+            int: 制限後のチャンクサイズ
+        """
+        limit = self.chunk_limit()
+        if limit is None or chunksize == -1:
+            return chunksize
+        return min(chunksize, limit)
+
+
+# プロセス内のすべてのアップローダーで共有する帯域の制限 (デフォルトは無制限)
+bandwidth_limiter = BandwidthLimiter()
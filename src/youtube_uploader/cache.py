@@ -0,0 +1,155 @@
+"""cache
+
+プロセス内で認証情報とAPIのディスカバリードキュメントを共有するためのキャッシュ
+
+短時間で終了するジョブが YoutubeUploader を何度も生成しても、
+token.json の再読み込みやトークンのリフレッシュ、ディスカバリードキュメントの
+解析を毎回行わずに済むようにする。
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+_discovery_lock = threading.Lock()
+_discovery_document: dict[str, Any] | None = None
+
+
+def youtube_discovery_document() -> dict[str, Any]:
+    """パッケージに同梱された YouTube Data API v3 のディスカバリードキュメントを返す
+
+    googleapiclient に同梱の静的ドキュメントを一度だけ解析し、以降は
+    解析済みの辞書を使い回す (ネットワークからの取得も行わない)。
+
+    googleapiclient はリソースの生成時にドキュメントへパラメータを書き足すため、
+    読み込み時にすべてのリソースを一度生成して書き足しを済ませておく。
+    以降の書き足しは同じ値での上書きとなり、スレッド間で共有しても安全になる。
+
+    Returns:
+        dict[str, Any]: 解析済みのディスカバリードキュメント
+    """
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            import httplib2  # type: ignore
+            from googleapiclient import discovery_cache  # type: ignore
+            from googleapiclient.discovery import build_from_document  # type: ignore
+
+            content = discovery_cache.get_static_doc("youtube", "v3")
+            if content is None:
+                raise RuntimeError(
+                    "YouTube Data API のディスカバリードキュメントが見つかりません。"
+                )
+            document = json.loads(content)
+            service = build_from_document(document, http=httplib2.Http())
+            for name in document.get("resources", {}):
+                getattr(service, name)()
+            _discovery_document = document
+        return _discovery_document
+
+
+def build_youtube_service(**kwargs: Any) -> Any:
+    """キャッシュ済みのディスカバリードキュメントから API サービスを構築する
+
+    Args:
+        **kwargs: build_from_document に渡す引数 (credentials, http など)
+
+    Returns:
+        Any: YouTube Data API のサービスオブジェクト
+    """
+    from googleapiclient.discovery import build_from_document  # type: ignore
+
+    return build_from_document(youtube_discovery_document(), **kwargs)
+
+
+class CredentialsCache:
+    """認証ディレクトリごとに認証情報を保持する、スレッドセーフなキャッシュ
+
+    キャッシュした認証情報は、期限切れ (credentials.valid が False) になるか、
+    ttl 秒を過ぎると無効になる。無効になった場合は token.json から読み直され、
+    必要であればリフレッシュされる。
+    """
+
+    def __init__(self, ttl: float = 3600.0):
+        """
+        Args:
+            ttl (float, optional): キャッシュの有効秒数
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[Credentials, float]] = {}
+        self._key_locks: dict[Path, threading.Lock] = {}
+
+    @staticmethod
+    def _key(auth_dir: Path) -> Path:
+        return auth_dir.expanduser().resolve()
+
+    @contextmanager
+    def lock(self, auth_dir: Path) -> Iterator[None]:
+        """認証ディレクトリ単位のロックを取得する
+
+        同じディレクトリに対する読み込みとリフレッシュを1回にまとめるため、
+        キャッシュの確認から保存までをこのロックの中で行う。
+
+        Args:
+            auth_dir (Path): 認証ディレクトリ
+        """
+        key = self._key(auth_dir)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+    def get(self, auth_dir: Path) -> "Credentials | None":
+        """有効な認証情報を返す
+
+        Args:
+            auth_dir (Path): 認証ディレクトリ
+
+        Returns:
+            Credentials | None: 有効な認証情報 (なければNone)
+        """
+        key = self._key(auth_dir)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            credentials, cached_at = entry
+            if time.monotonic() - cached_at > self.ttl or not credentials.valid:
+                del self._entries[key]
+                return None
+            return credentials
+
+    def put(self, auth_dir: Path, credentials: "Credentials") -> None:
+        """認証情報をキャッシュする
+
+        Args:
+            auth_dir (Path): 認証ディレクトリ
+            credentials (Credentials): キャッシュする認証情報
+        """
+        with self._lock:
+            self._entries[self._key(auth_dir)] = (credentials, time.monotonic())
+
+    def invalidate(self, auth_dir: Path | None = None) -> None:
+        """キャッシュを破棄する
+
+        Args:
+            auth_dir (Path | None, optional): 破棄する認証ディレクトリ
+                Noneの場合はすべて破棄する
+        """
+        with self._lock:
+            if auth_dir is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(auth_dir), None)
+
+
+# プロセス全体で共有する認証情報のキャッシュ
+credentials_cache = CredentialsCache()
@@ -0,0 +1,105 @@
+"""chunking
+
+再開可能アップロードのチャンクサイズを、実測スループットに合わせて
+自動調整するためのモジュール
+"""
+
+from typing import Literal
+
+# YouTube の再開可能アップロードでは、最後以外のチャンクは256KiBの倍数である必要がある
+CHUNK_GRANULARITY = 256 * 1024
+
+# チャンクサイズの指定 (バイト数、-1 で一括送信、"auto" で自動調整)
+type ChunkSize = int | Literal["auto"]
+
+
+class AdaptiveChunkSizer:
+    """チャンク1回あたりの送信時間が目標値に近づくよう、チャンクサイズを調整する
+
+    スループットの指数移動平均から「目標秒数で送れるバイト数」を求め、
+    256KiBの倍数に丸めて次のチャンクサイズとする。急激な変化を避けるため、
+    1回の調整での変化は2倍 / 1/2倍までに制限する。
+
+    Examples:
+        sizer = AdaptiveChunkSizer(target_seconds=2.0)
+        size = sizer.chunksize
+        size = sizer.record(sent_bytes=size, elapsed=0.5)  # 速い回線では大きくなる
+    """
+
+    def __init__(
+        self,
+        target_seconds: float = 2.0,
+        initial: int = 4 * CHUNK_GRANULARITY,
+        minimum: int = CHUNK_GRANULARITY,
+        maximum: int = 512 * CHUNK_GRANULARITY,
+        smoothing: float = 0.5,
+    ):
+        """
+        Args:
+            target_seconds (float, optional): チャンク1回あたりの目標送信秒数
+            initial (int, optional): 最初のチャンクサイズ（バイト単位）
+            minimum (int, optional): チャンクサイズの下限（バイト単位）
+            maximum (int, optional): チャンクサイズの上限（バイト単位）
+            smoothing (float, optional): スループットの指数移動平均の係数 (0 から 1)
+                大きいほど直近の計測を重視する
+
+        Raises:
+            ValueError: 引数が不正な場合
+        """
+        if target_seconds <= 0:
+            raise ValueError("target_seconds は正の値を指定してください。")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing は 0 より大きく 1 以下で指定してください。")
+        if minimum < CHUNK_GRANULARITY or minimum > maximum:
+            raise ValueError("minimum と maximum の指定が不正です。")
+
+        self._target_seconds = target_seconds
+        self._minimum = self._align(minimum)
+        self._maximum = self._align(maximum)
+        self._smoothing = smoothing
+        self._chunksize = self._clamp(self._align(initial))
+        self._throughput: float | None = None
+
+    @property
+    def chunksize(self) -> int:
+        """次に使うチャンクサイズ（バイト単位、256KiBの倍数）"""
+        return self._chunksize
+
+    @property
+    def throughput(self) -> float | None:
+        """平滑化したスループット（バイト/秒、未計測の場合はNone）"""
+        return self._throughput
+
+    def record(self, sent_bytes: int, elapsed: float) -> int:
+        """1チャンク分の計測結果を反映し、次のチャンクサイズを返す
+
+        Args:
+            sent_bytes (int): 送信できたバイト数
+            elapsed (float): 送信にかかった秒数
+
+        Returns:
+            int: 次に使うチャンクサイズ（バイト単位）
+        """
+        if sent_bytes <= 0 or elapsed <= 0:
+            return self._chunksize
+
+        measured = sent_bytes / elapsed
+        if self._throughput is None:
+            self._throughput = measured
+        else:
+            self._throughput = (
+                self._smoothing * measured + (1 - self._smoothing) * self._throughput
+            )
+
+        ideal = self._throughput * self._target_seconds
+        bounded = min(max(ideal, self._chunksize / 2), self._chunksize * 2)
+        self._chunksize = self._clamp(self._align(int(bounded)))
+        return self._chunksize
+
+    def _clamp(self, size: int) -> int:
+        return min(max(size, self._minimum), self._maximum)
+
+    @staticmethod
+    def _align(size: int) -> int:
+        """256KiBの倍数に切り捨てる (最小は256KiB)"""
+        return max(CHUNK_GRANULARITY, size // CHUNK_GRANULARITY * CHUNK_GRANULARITY)
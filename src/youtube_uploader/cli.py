@@ -0,0 +1,840 @@
+"""cli
+
+コマンドラインから認証の初期化と、マニフェストに基づく一括アップロードを
+行うためのモジュール
+
+    youtube-auth-init ~/.secrets/youtube-uploader/my-channel
+    youtube-upload manifest.jsonl --auth-dir ~/.secrets/youtube-uploader/my-channel
+
+マニフェストは、1行に1件の動画を記述する JSONL、またはヘッダー付きの CSV。
+列 (キー) は YoutubeConfig のフィールド名に加えて、次のものを指定できる。
+
+- id: 再実行時に完了済みかを判定する識別子 (省略時は動画ファイルの絶対パス)
+- thumbnail_path: サムネイル画像のパス
+
+video_path と thumbnail_path の相対パスはマニフェストのディレクトリを基準にし、
+video_mimetype と thumbnail_mimetype は省略すると拡張子から推定する。
+CSV の tags と playlist_ids は "|" 区切り、localizations は JSON のオブジェクトで
+指定し、空の値は省略したものとして扱う。
+
+再生リストへの追加 (playlist_ids) と翻訳 (localizations) は、アップロードが
+完了した動画の分を BATCH_LIMIT 件ずつのバッチリクエストにまとめて適用し、
+適用後に結果ファイルへ記録する。適用を待つ動画は uploaded として先に記録し、
+適用前に中断された場合は、再実行時に動画を送信せずに操作だけを適用する。
+これらの操作には、MANAGE_SCOPES での認証
+(--scope https://www.googleapis.com/auth/youtube) が必要。
+
+マニフェストは1行ずつ読み込むため、件数が多くてもメモリ使用量は増えない。
+結果は1件ごとに JSONL の結果ファイルへ追記され、再実行時は結果ファイルで
+完了 (done) となっている動画をスキップする。
+"""
+
+import argparse
+import csv
+import json
+import logging
+import mimetypes
+import signal
+import sys
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, TextIO
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .bandwidth import bandwidth_limiter
+from .chunking import ChunkSize
+from .exceptions import AuthError
+from .models import UploadResult, YoutubeConfig
+from .progress import ProgressTracker, UploadProgress
+from .refresh import DEFAULT_REFRESH_MARGIN
+from .transport import TransportConfig
+from .youtube import BATCH_LIMIT, SCOPES, YoutubeUploader
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+# 結果ファイルに記録する状態
+type ItemStatus = Literal["done", "failed", "uploaded"]
+
+# マニフェストの列のうち、YoutubeConfig のフィールドではないもの
+_MANIFEST_ONLY_FIELDS = ("id", "thumbnail_path")
+
+# CSV の tags 列と playlist_ids 列の区切り文字
+CSV_TAG_SEPARATOR = "|"
+
+# CSV で区切り文字で分割する列
+_CSV_LIST_FIELDS = ("tags", "playlist_ids")
+
+
+class ManifestItem(BaseModel):
+    """マニフェストの1行
+
+    Args:
+        line (int): マニフェスト内の行番号 (1始まり、CSV はヘッダーを含む)
+        id (str): 完了済みかを判定する識別子
+        config (YoutubeConfig | None): アップロード設定情報 (不正な行の場合はNone)
+        error (str | None): 行を設定に変換できなかった場合のエラー
+    """
+
+    line: int = Field(..., description="マニフェスト内の行番号")
+    id: str = Field(..., description="完了済みかを判定する識別子")
+    config: YoutubeConfig | None = Field(default=None, description="設定情報")
+    error: str | None = Field(default=None, description="変換時のエラー")
+
+
+class ItemResult(BaseModel):
+    """結果ファイルに1行ずつ記録される、1件のアップロード結果
+
+    Args:
+        id (str): マニフェストの識別子
+        line (int): マニフェスト内の行番号
+        status (ItemStatus): done (完了) / failed (失敗) /
+            uploaded (送信済みで、再生リストへの追加・翻訳の適用待ち)
+        title (str | None): 動画のタイトル
+        video_id (str | None): アップロードされた動画のID
+        duplicate (bool): アップロード済みの動画のため、送信を省略したかどうか
+        thumbnail_error (str | None): サムネイルのアップロードに失敗した場合のエラー
+        action_errors (list[str]): 再生リストへの追加・翻訳の設定に
+            失敗した場合のエラー (動画のアップロードは完了として扱う)
+        error (str | None): 失敗した場合のエラー
+        bytes (int): 動画のバイト数
+        seconds (float): アップロードにかかった秒数
+        finished_at (datetime): 記録した日時 (UTC)
+    """
+
+    id: str = Field(..., description="マニフェストの識別子")
+    line: int = Field(..., description="マニフェスト内の行番号")
+    status: ItemStatus = Field(..., description="結果の状態")
+    title: str | None = Field(default=None, description="動画のタイトル")
+    video_id: str | None = Field(default=None, description="動画のID")
+    duplicate: bool = Field(default=False, description="アップロード済みかどうか")
+    thumbnail_error: str | None = Field(default=None, description="サムネイルの失敗")
+    action_errors: list[str] = Field(
+        default_factory=list, description="アップロード後の操作の失敗"
+    )
+    error: str | None = Field(default=None, description="失敗した場合のエラー")
+    bytes: int = Field(default=0, description="動画のバイト数")
+    seconds: float = Field(default=0.0, description="アップロードにかかった秒数")
+    finished_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="記録した日時"
+    )
+
+
+def _resolve_path(value: Any, base_dir: Path) -> Path:
+    path = Path(value).expanduser()
+    return path if path.is_absolute() else base_dir / path
+
+
+def _guess_mimetype(path: Path) -> str | None:
+    mimetype, _ = mimetypes.guess_type(path.as_posix())
+    return mimetype
+
+
+def _row_identity(
+    line: int, row: dict[str, Any], base_dir: Path
+) -> tuple[str, Path | None]:
+    """行の識別子と動画ファイルの絶対パスを、設定を検証せずに求める"""
+    video_path = (
+        _resolve_path(row["video_path"], base_dir).resolve()
+        if row.get("video_path")
+        else None
+    )
+    return str(row.get("id") or video_path or f"line:{line}"), video_path
+
+
+def _to_item(line: int, row: dict[str, Any], base_dir: Path) -> ManifestItem:
+    """マニフェストの1行を ManifestItem に変換する (不正な行は error に格納)"""
+    item_id, video_path = _row_identity(line, row, base_dir)
+    try:
+        if video_path is None:
+            raise ValueError("video_path が指定されていません。")
+
+        fields = {k: v for k, v in row.items() if k not in _MANIFEST_ONLY_FIELDS}
+        fields["video_path"] = video_path
+        if not fields.get("video_mimetype"):
+            fields["video_mimetype"] = _guess_mimetype(video_path) or "video/mp4"
+
+        if row.get("thumbnail_path"):
+            thumbnail_path = _resolve_path(row["thumbnail_path"], base_dir)
+            fields["thumbnail_bytes"] = thumbnail_path.read_bytes()
+            if not fields.get("thumbnail_mimetype"):
+                fields["thumbnail_mimetype"] = _guess_mimetype(thumbnail_path)
+
+        config = YoutubeConfig.model_validate(fields)
+    except (ValidationError, ValueError, OSError) as e:
+        return ManifestItem(line=line, id=item_id, error=str(e))
+    return ManifestItem(line=line, id=item_id, config=config)
+
+
+def _read_jsonl(f: TextIO) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    for line, text in enumerate(f, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line, f"JSON として解析できません: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield line, "各行は JSON のオブジェクトで指定してください。"
+            continue
+        yield line, row
+
+
+def _read_csv(f: TextIO) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    reader = csv.DictReader(f)
+    for record in reader:
+        row: dict[str, Any] = {k: v for k, v in record.items() if k and v}
+        if not row:
+            continue
+        for field in _CSV_LIST_FIELDS:
+            if field in row:
+                row[field] = [
+                    value.strip()
+                    for value in row[field].split(CSV_TAG_SEPARATOR)
+                    if value.strip()
+                ]
+        if "localizations" in row:
+            try:
+                row["localizations"] = json.loads(row["localizations"])
+            except json.JSONDecodeError as e:
+                yield (
+                    reader.line_num,
+                    f"localizations を JSON として解析できません: {e}",
+                )
+                continue
+        yield reader.line_num, row
+
+
+def _read_rows(path: Path) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """マニフェストの行を読み込む (解析できない行はエラーメッセージを返す)"""
+    reader = _read_csv if path.suffix.lower() == ".csv" else _read_jsonl
+    with path.expanduser().open(encoding="utf-8", newline="") as f:
+        yield from reader(f)
+
+
+def read_manifest(path: Path) -> Iterator[ManifestItem]:
+    """マニフェストを1行ずつ読み込み、ManifestItem を返す
+
+    拡張子が .csv の場合は CSV、それ以外は JSONL として読み込む。
+    不正な行は読み込みを中断せず、error を設定した ManifestItem として返す。
+
+    Args:
+        path (Path): マニフェストのパス
+
+    Yields:
+        ManifestItem: マニフェストの1行
+
+    Raises:
+        OSError: マニフェストを開けない場合
+    """
+    base_dir = path.expanduser().resolve().parent
+    for line, row in _read_rows(path):
+        if isinstance(row, str):
+            yield ManifestItem(line=line, id=f"line:{line}", error=row)
+        else:
+            yield _to_item(line, row, base_dir)
+
+
+def scan_manifest(path: Path) -> Iterator[tuple[str, Path | None]]:
+    """マニフェストを1行ずつ読み込み、識別子と動画ファイルのパスを返す
+
+    read_manifest() と異なり、設定の検証やサムネイルの読み込みを行わないため、
+    アップロードする件数とバイト数を事前に数える用途に使う。
+
+    Args:
+        path (Path): マニフェストのパス
+
+    Yields:
+        tuple[str, Path | None]: 行の識別子と、動画ファイルの絶対パス
+            (video_path がない行や、解析できない行はNone)
+
+    Raises:
+        OSError: マニフェストを開けない場合
+    """
+    base_dir = path.expanduser().resolve().parent
+    for line, row in _read_rows(path):
+        if isinstance(row, str):
+            yield f"line:{line}", None
+        else:
+            yield _row_identity(line, row, base_dir)
+
+
+def _read_results(results_path: Path) -> Iterator[dict[str, Any]]:
+    """結果ファイルの記録を、書き込まれた順に読み込む"""
+    if not results_path.exists():
+        return
+    with results_path.open(encoding="utf-8") as f:
+        for text in f:
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError:
+                # 異常終了で書きかけになった行は無視する
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def load_completed(results_path: Path) -> set[str]:
+    """結果ファイルから、完了済みの識別子を読み込む
+
+    Args:
+        results_path (Path): 結果ファイルのパス
+
+    Returns:
+        set[str]: 完了 (done) として記録された識別子 (ファイルがなければ空)
+    """
+    return {
+        str(record.get("id"))
+        for record in _read_results(results_path)
+        if record.get("status") == "done"
+    }
+
+
+def load_uploaded(results_path: Path) -> dict[str, str]:
+    """結果ファイルから、アップロード後の操作を適用せずに中断された動画を読み込む
+
+    Args:
+        results_path (Path): 結果ファイルのパス
+
+    Returns:
+        dict[str, str]: 送信済み (uploaded) として記録され、完了 (done) の
+            記録がない識別子と、その動画のID
+    """
+    uploaded: dict[str, str] = {}
+    completed: set[str] = set()
+    for record in _read_results(results_path):
+        item_id = str(record.get("id"))
+        if record.get("status") == "uploaded" and record.get("video_id"):
+            uploaded[item_id] = str(record["video_id"])
+        elif record.get("status") == "done":
+            completed.add(item_id)
+    return {
+        item_id: video_id
+        for item_id, video_id in uploaded.items()
+        if item_id not in completed
+    }
+
+
+def _file_size(path: Path | None) -> int:
+    try:
+        return path.stat().st_size if path is not None else 0
+    except OSError:
+        return 0
+
+
+def _video_size(config: YoutubeConfig) -> int:
+    return _file_size(config.video_path)
+
+
+class BatchProgress:
+    """一括アップロード全体の送信バイト数から、スループットと残り時間を集計する
+
+    各アップロードの進捗イベントはワーカースレッドから通知されるため、
+    スレッドセーフに集計する。
+    """
+
+    def __init__(self, total_items: int, total_bytes: int):
+        """
+        Args:
+            total_items (int): アップロードする件数
+            total_bytes (int): アップロードするバイト数の合計
+        """
+        self.total_items = total_items
+        self.total_bytes = total_bytes
+        self.done = 0
+        self.failed = 0
+        self._finished_bytes = 0
+        self._in_flight: dict[str, int] = {}
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def update(self, item_id: str, event: UploadProgress) -> None:
+        """動画の送信バイト数を更新する"""
+        if event.phase != "video":
+            return
+        with self._lock:
+            self._in_flight[item_id] = event.bytes_sent
+
+    def finish(self, item_id: str, size: int, ok: bool, sent: bool = True) -> None:
+        """1件の完了を記録する
+
+        Args:
+            item_id (str): 行の識別子
+            size (int): total_bytes に含めた、この動画のバイト数
+            ok (bool): 成功したかどうか
+            sent (bool, optional): 動画を送信したかどうか。アップロード済みの
+                ため送信しなかった場合は、送信するバイト数の合計から除く
+        """
+        with self._lock:
+            self._in_flight.pop(item_id, None)
+            if sent:
+                self._finished_bytes += size
+            else:
+                self.total_bytes -= size
+            if ok:
+                self.done += 1
+            else:
+                self.failed += 1
+
+    @property
+    def bytes_sent(self) -> int:
+        """送信済み (完了分と送信中の分) のバイト数"""
+        with self._lock:
+            return self._finished_bytes + sum(self._in_flight.values())
+
+    @property
+    def throughput(self) -> float:
+        """開始からの平均スループット (バイト/秒)"""
+        elapsed = time.monotonic() - self._started_at
+        return self.bytes_sent / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """残り時間の推定秒数 (推定できない場合はNone)"""
+        throughput = self.throughput
+        if throughput <= 0:
+            return None
+        return max(self.total_bytes - self.bytes_sent, 0) / throughput
+
+    def summary(self) -> str:
+        """進捗を1行の文字列にする"""
+        eta = self.eta_seconds
+        eta_text = time.strftime("%H:%M:%S", time.gmtime(eta)) if eta else "--:--:--"
+        return (
+            f"[{self.done + self.failed}/{self.total_items}] "
+            f"完了 {self.done} / 失敗 {self.failed} | "
+            f"{self.bytes_sent / 1e6:,.1f}/{self.total_bytes / 1e6:,.1f} MB | "
+            f"{self.throughput / 1e6:.2f} MB/s | 残り {eta_text}"
+        )
+
+
+def run_batch(
+    uploader: YoutubeUploader,
+    manifest: Path,
+    results_path: Path,
+    workers: int = 2,
+    chunksize: ChunkSize = "auto",
+    report_interval: float = 10.0,
+    stop: threading.Event | None = None,
+    out: TextIO | None = None,
+) -> BatchProgress:
+    """マニフェストの動画を並列にアップロードし、結果を結果ファイルに追記する
+
+    結果ファイルで完了済みの動画はスキップする。途中で中断された動画は、
+    保存済みのセッションから送信を再開する。送信済みで再生リストへの追加・
+    翻訳の適用前に中断された動画は、送信せずに操作だけを適用する。
+    マニフェストは2回読み込まれる
+    (1回目は検証せずに残りの件数とバイト数を数え、2回目で設定を検証して
+    アップロードする) が、同時に保持するのは実行中の workers 件分と、
+    再生リストへの追加・翻訳の適用を待つ BATCH_LIMIT 件分のみ。
+
+    Args:
+        uploader (YoutubeUploader): 接続済みのアップローダー
+        manifest (Path): マニフェストのパス
+        results_path (Path): 結果ファイル (JSONL) のパス
+        workers (int, optional): 同時にアップロードする動画の数
+        chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+            （バイト単位、または "auto"）
+        report_interval (float, optional): 進捗を出力する間隔 (秒)
+        stop (threading.Event | None, optional): セットされると新しい動画の
+            アップロードを始めずに、実行中のものを終えて戻る
+        out (TextIO | None, optional): 進捗の出力先 (Noneの場合は標準エラー出力)
+
+    Returns:
+        BatchProgress: 実行した件数・バイト数などの集計
+
+    Raises:
+        ValueError: workers が1未満の場合
+        OSError: マニフェストや結果ファイルを開けない場合
+    """
+    if workers < 1:
+        raise ValueError("workers は1以上を指定してください。")
+    stop = stop or threading.Event()
+    out = out or sys.stderr
+
+    completed = load_completed(results_path)
+    uploaded = load_uploaded(results_path)
+    total_items = total_bytes = skipped = 0
+    # 件数とバイト数だけを数えるため、設定の検証は2回目の読み込みで1回だけ行う
+    for item_id, video_path in scan_manifest(manifest):
+        if item_id in completed:
+            skipped += 1
+            continue
+        total_items += 1
+        # 送信済みの動画は、操作だけを適用するため送信するバイト数に含めない
+        if item_id not in uploaded:
+            total_bytes += _file_size(video_path)
+    logger.info(
+        f"{total_items} 件 ({total_bytes / 1e6:,.1f} MB) を最大 {workers} 並列で"
+        f"アップロードします (完了済みのためスキップ: {skipped} 件)"
+    )
+
+    progress = BatchProgress(total_items, total_bytes)
+
+    def upload(item: ManifestItem) -> UploadResult:
+        assert item.config is not None
+        tracker = ProgressTracker(
+            item.config.title,
+            lambda event: progress.update(item.id, event),
+            min_interval=1.0,
+        )
+        result, _ = uploader.upload_in_worker(
+            item.line, item.config, tracker, chunksize, resume=True
+        )
+        return result
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    in_flight: dict[Future[UploadResult], tuple[ManifestItem, float]] = {}
+    items = (item for item in read_manifest(manifest) if item.id not in completed)
+    reported_at = time.monotonic()
+
+    with (
+        results_path.open("a", encoding="utf-8") as results,
+        ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="youtube-batch"
+        ) as executor,
+    ):
+
+        def write(result: ItemResult) -> None:
+            results.write(result.model_dump_json() + "\n")
+            results.flush()
+
+        def record(item: ManifestItem, result: ItemResult) -> None:
+            write(result)
+            # 前回の実行で送信済みの動画と重複の動画は、何も送信していない
+            size = (
+                _video_size(item.config)
+                if item.config and item.id not in uploaded
+                else 0
+            )
+            progress.finish(
+                item.id, size, result.status == "done", sent=not result.duplicate
+            )
+            if result.status == "failed":
+                logger.error(
+                    f"行 {item.line} ({item.id}) が失敗しました: {result.error}"
+                )
+
+        # 再生リストへの追加・翻訳の適用を待つ動画と、その呼び出しの数
+        awaiting: list[tuple[ManifestItem, UploadResult, float]] = []
+        awaiting_calls = 0
+
+        def flush_actions() -> None:
+            nonlocal awaiting_calls
+            if not awaiting:
+                return
+            uploader.apply_post_upload_actions(
+                (upload_result, item.config)
+                for item, upload_result, _ in awaiting
+                if item.config is not None
+            )
+            for item, upload_result, seconds in awaiting:
+                record(item, _item_result(item, upload_result, seconds))
+            awaiting.clear()
+            awaiting_calls = 0
+
+        def wait_for_actions(
+            item: ManifestItem, upload_result: UploadResult, seconds: float
+        ) -> None:
+            # 完了した動画の操作をためて、まとめて1回のバッチリクエストにする
+            # (アップロード済みの動画は、インデックスに適用待ちの操作がある場合のみ)
+            nonlocal awaiting_calls
+            assert item.config is not None
+            awaiting.append((item, upload_result, seconds))
+            awaiting_calls += _post_upload_call_count(item.config)
+            if awaiting_calls >= BATCH_LIMIT:
+                flush_actions()
+
+        while True:
+            while not stop.is_set() and len(in_flight) < workers:
+                item = next(items, None)
+                if item is None:
+                    break
+                if item.config is None:
+                    record(
+                        item,
+                        ItemResult(
+                            id=item.id,
+                            line=item.line,
+                            status="failed",
+                            error=item.error,
+                        ),
+                    )
+                    continue
+                if item.id in uploaded:
+                    # 前回の実行で送信済みの動画には、操作だけを適用する
+                    wait_for_actions(
+                        item,
+                        UploadResult(
+                            index=item.line,
+                            title=item.config.title,
+                            response={"id": uploaded[item.id]},
+                        ),
+                        0.0,
+                    )
+                    continue
+                in_flight[executor.submit(upload, item)] = (item, time.monotonic())
+
+            if not in_flight:
+                break
+
+            done, _ = wait(
+                in_flight, timeout=report_interval, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                item, started = in_flight.pop(future)
+                assert item.config is not None
+                upload_result = future.result()
+                seconds = time.monotonic() - started
+                if not upload_result.ok or not item.config.has_post_upload_actions:
+                    record(item, _item_result(item, upload_result, seconds))
+                    continue
+                if not upload_result.duplicate:
+                    # 操作の適用前に中断しても再実行で適用できるよう、先に記録する
+                    write(
+                        _item_result(item, upload_result, seconds).model_copy(
+                            update={"status": "uploaded"}
+                        )
+                    )
+                wait_for_actions(item, upload_result, seconds)
+
+            if time.monotonic() - reported_at >= report_interval:
+                print(progress.summary(), file=out, flush=True)
+                reported_at = time.monotonic()
+
+        flush_actions()
+
+    print(progress.summary(), file=out, flush=True)
+    if stop.is_set():
+        logger.warning("中断しました。再実行すると残りの動画から続けます。")
+    return progress
+
+
+def _post_upload_call_count(config: YoutubeConfig) -> int:
+    """アップロード後に実行するAPI呼び出しの数"""
+    return len(config.playlist_ids) + (1 if config.localizations else 0)
+
+
+def _item_result(
+    item: ManifestItem, upload_result: UploadResult, seconds: float
+) -> ItemResult:
+    """アップロード結果を、結果ファイルに記録する ItemResult にする"""
+    assert item.config is not None
+    thumbnail = upload_result.thumbnail
+    return ItemResult(
+        id=item.id,
+        line=item.line,
+        status="done" if upload_result.ok else "failed",
+        title=item.config.title,
+        video_id=upload_result.video_id,
+        duplicate=upload_result.duplicate,
+        thumbnail_error=(
+            str(thumbnail.error) if thumbnail is not None and not thumbnail.ok else None
+        ),
+        action_errors=[
+            f"{action.method} ({action.target}): {action.error}"
+            for action in upload_result.actions
+            if not action.ok
+        ],
+        error=str(upload_result.error) if upload_result.error is not None else None,
+        bytes=_video_size(item.config),
+        seconds=seconds,
+    )
+
+
+def _chunksize(value: str) -> ChunkSize:
+    if value == "auto":
+        return "auto"
+    try:
+        return int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            "バイト数、-1、または auto を指定してください。"
+        ) from e
+
+
+def _scopes(values: list[str] | None) -> list[str] | None:
+    """--scope の指定に、アップロードのスコープを加える (未指定の場合はNone)"""
+    if not values:
+        return None
+    return list(dict.fromkeys([*SCOPES, *values]))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="youtube-upload",
+        description="マニフェスト (JSONL / CSV) に記述した動画を一括でアップロードする",
+    )
+    parser.add_argument("manifest", type=Path, help="マニフェストのパス")
+    parser.add_argument(
+        "--auth-dir",
+        type=Path,
+        required=True,
+        help="client_secret.json と token.json を含むディレクトリ",
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        help="結果ファイル (JSONL) のパス (省略時は <マニフェスト>.results.jsonl)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=2, help="同時にアップロードする動画の数"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=_chunksize,
+        default="auto",
+        help="チャンクサイズ (バイト数、-1 で一括送信、auto で自動調整)",
+    )
+    parser.add_argument(
+        "--max-bandwidth",
+        type=float,
+        help="送信帯域の上限 (MB/s、省略時は無制限)",
+    )
+    parser.add_argument(
+        "--pooled",
+        action="store_true",
+        help="接続プールと keep-alive を共有する HTTP 通信を使う",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="アップロード済みの動画を記録し、同じ動画は送信せずにスキップする",
+    )
+    parser.add_argument(
+        "--scope",
+        dest="scopes",
+        action="append",
+        help="認証で要求するスコープ (複数指定可、省略時はアップロードのみ)。"
+        "playlist_ids と localizations を使う場合は "
+        "https://www.googleapis.com/auth/youtube を追加する",
+    )
+    parser.add_argument(
+        "--token-refresh-margin",
+        type=float,
+        default=DEFAULT_REFRESH_MARGIN,
+        help="アクセストークンを有効期限の何秒前にバックグラウンドでリフレッシュするか",
+    )
+    parser.add_argument(
+        "--report-interval", type=float, default=10.0, help="進捗を出力する間隔 (秒)"
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="ログの出力レベル",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """youtube-upload コマンドのエントリーポイント
+
+    Args:
+        argv (Sequence[str] | None, optional): コマンドライン引数
+            (Noneの場合は sys.argv)
+
+    Returns:
+        int: 終了コード (0: すべて成功、1: 失敗あり、2: 実行できなかった場合)
+    """
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if args.workers < 1:
+        logger.critical("--workers は1以上を指定してください。")
+        return 2
+    if not args.manifest.expanduser().is_file():
+        logger.critical(f"マニフェストが見つかりません: {args.manifest}")
+        return 2
+    results_path = args.results or args.manifest.with_suffix(".results.jsonl")
+
+    if args.max_bandwidth is not None:
+        bandwidth_limiter.configure(args.max_bandwidth * 1e6)
+
+    uploader = YoutubeUploader(
+        args.auth_dir,
+        deduplicate=args.dedup,
+        token_refresh_margin=args.token_refresh_margin,
+        scopes=_scopes(args.scopes),
+        transport=TransportConfig(pool_size=max(args.workers, 10))
+        if args.pooled
+        else None,
+    )
+    try:
+        uploader.connect()
+    except (FileNotFoundError, AuthError) as e:
+        logger.critical(f"認証に失敗しました: {e}")
+        return 2
+
+    # Ctrl+C / SIGTERM では、実行中のアップロードを終えてから停止する
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    try:
+        progress = run_batch(
+            uploader,
+            args.manifest,
+            results_path,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            report_interval=args.report_interval,
+            stop=stop,
+        )
+    except OSError as e:
+        logger.critical(f"マニフェストまたは結果ファイルを開けません: {e}")
+        return 2
+    finally:
+        uploader.close()
+
+    logger.info(f"結果を '{results_path}' に記録しました。")
+    if stop.is_set():
+        return 2
+    return 1 if progress.failed else 0
+
+
+def init_auth_setup(argv: Sequence[str] | None = None) -> int:
+    """youtube-auth-init コマンドのエントリーポイント
+
+    ブラウザで OAuth の認証を行い、client_secret.json と同じディレクトリに
+    token.json を保存する。有効な token.json がある場合は、何もしない。
+
+    Args:
+        argv (Sequence[str] | None, optional): コマンドライン引数
+            (Noneの場合は sys.argv)
+
+    Returns:
+        int: 終了コード (0: 成功、1: 失敗)
+    """
+    parser = argparse.ArgumentParser(
+        prog="youtube-auth-init",
+        description="YouTube API の認証を行い、token.json を保存する",
+    )
+    parser.add_argument(
+        "auth_dir", type=Path, help="client_secret.json を配置したディレクトリ"
+    )
+    parser.add_argument(
+        "--scope",
+        dest="scopes",
+        action="append",
+        help="認証で要求するスコープ (複数指定可、省略時はアップロードのみ)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    try:
+        YoutubeUploader(args.auth_dir, scopes=_scopes(args.scopes)).connect()
+    except (FileNotFoundError, AuthError) as e:
+        logger.critical(f"認証に失敗しました: {e}")
+        return 1
+
+    logger.info(
+        f"認証が完了しました: {args.auth_dir.expanduser().resolve() / 'token.json'}"
+    )
+    return 0
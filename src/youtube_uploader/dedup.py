@@ -0,0 +1,361 @@
+"""dedup
+
+同じ動画を二重にアップロードしないよう、アップロード済みの動画を
+SQLite のインデックスに記録するモジュール
+
+アップロード済みの動画は、メタデータと内容のハッシュで記録する。
+内容のハッシュはアップロード中の読み込みに合わせて逐次計算するため、
+送信のために読んだデータを改めて読み直すことはない。
+送信前の照合は、次の順に行う。
+
+1. video_path の場合、パス・サイズ・更新日時から、以前に計算した
+   内容のハッシュを引く (ファイルは読まない)
+2. 同じメタデータとサイズの動画が記録されている場合だけ、
+   内容のハッシュを計算して照合する
+
+再生リストへの追加と翻訳は、動画と同時に適用待ちとして記録し、適用後に
+記録を削除する。適用前にプロセスが終了した場合は、再実行時にアップロード済みと
+判定された動画に適用する。
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from .media import open_video_stream, source_identity
+from .models import PostUploadActions, YoutubeConfig, upload_metadata
+
+# インデックスを保存するファイル名 (token.json と同じディレクトリに置く)
+DEDUP_FILENAME = "upload_index.sqlite3"
+
+# hash_video() で動画ファイルを読み込む単位
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class UploadKey(BaseModel):
+    """アップロード済みの動画を照合するためのキー
+
+    Args:
+        metadata (str): タイトルや説明文などのメタデータのハッシュ
+        source (str | None): video_path のパス・サイズ・更新日時による識別子
+            (video_bytes の場合はNone)
+        size (int): 動画のバイト数
+        content_hash (str | None): 内容のハッシュ (照合のために計算した場合のみ)
+    """
+
+    metadata: str = Field(..., description="メタデータのハッシュ")
+    source: str | None = Field(default=None, description="動画ファイルの識別子")
+    size: int = Field(..., description="動画のバイト数")
+    content_hash: str | None = Field(default=None, description="内容のハッシュ")
+
+
+def upload_key(config: YoutubeConfig) -> UploadKey:
+    """設定からアップロード済みの動画を照合するためのキーを作る
+
+    動画の内容は読まない。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        UploadKey: 照合用のキー
+
+    Raises:
+        FileNotFoundError: video_path のファイルが存在しない場合
+    """
+    metadata = upload_metadata(config)
+    metadata_hash = hashlib.sha256(
+        json.dumps(metadata, sort_keys=True).encode()
+    ).hexdigest()
+
+    if config.video_path is not None:
+        return UploadKey(
+            metadata=metadata_hash,
+            source=source_identity(config),
+            size=config.video_path.expanduser().stat().st_size,
+        )
+
+    assert config.video_bytes is not None
+    return UploadKey(metadata=metadata_hash, size=memoryview(config.video_bytes).nbytes)
+
+
+def hash_video(config: YoutubeConfig) -> str:
+    """動画の内容全体の SHA-256 を計算する
+
+    照合の候補がある場合や、途中から再開したアップロードを記録する場合など、
+    送信のための読み込みとは別にハッシュが必要な場合にだけ使う。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        str: SHA-256 の16進文字列
+
+    Raises:
+        OSError: 動画ファイルを読み込めない場合
+    """
+    if config.video_bytes is not None:
+        return hashlib.sha256(config.video_bytes).hexdigest()
+
+    digest = hashlib.sha256()
+    with open_video_stream(config) as stream:
+        while block := stream.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ContentHasher:
+    """ストリームの読み込みに合わせて、内容の SHA-256 を逐次計算する
+
+    ObservedStream のフックとして使う。再試行で同じ範囲が読み直された場合は
+    未計算の部分だけを加え、途中から読み始めた場合 (再開時など) は
+    内容の全体を見ていないため、ハッシュは得られない。
+    """
+
+    def __init__(self):
+        self._digest = hashlib.sha256()
+        self._position = 0
+        self._complete = True
+
+    def __call__(self, position: int, data: bytes) -> None:
+        end = position + len(data)
+        if position > self._position:
+            self._complete = False
+        if not self._complete or end <= self._position:
+            return
+        self._digest.update(memoryview(data)[self._position - position :])
+        self._position = end
+
+    def hexdigest(self, size: int) -> str | None:
+        """内容全体のハッシュを返す
+
+        Args:
+            size (int): 内容全体のバイト数
+
+        Returns:
+            str | None: SHA-256 の16進文字列 (全体を読んでいない場合はNone)
+        """
+        if not self._complete or self._position != size:
+            return None
+        return self._digest.hexdigest()
+
+
+class UploadIndex:
+    """アップロード済みの動画を記録する SQLite のインデックス
+
+    スレッドセーフで、同じファイルを複数のプロセスから利用できる。
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): インデックスを保存する SQLite ファイルのパス
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS videos (
+                    metadata TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    video_id TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    uploaded_at TEXT NOT NULL,
+                    PRIMARY KEY (metadata, content_hash)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS videos_by_size ON videos (metadata, size)"
+            )
+            # video_path の識別子から、以前に計算した内容のハッシュを引くための表
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    source TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL
+                )
+                """
+            )
+            # アップロード後の操作のうち、まだ適用していないもの
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pending_actions (
+                    video_id TEXT PRIMARY KEY,
+                    actions TEXT NOT NULL
+                )
+                """
+            )
+
+    @property
+    def path(self) -> Path:
+        """インデックスを保存するファイルのパス"""
+        return self._path
+
+    def lookup(self, key: UploadKey) -> dict | None:
+        """アップロード済みの動画のレスポンスを取得する
+
+        key.content_hash がある場合は内容のハッシュで、ない場合は
+        video_path の識別子から以前に計算したハッシュで照合する。
+
+        Args:
+            key (UploadKey): 照合用のキー
+
+        Returns:
+            dict | None: アップロード時のAPIのレスポンス辞書 (なければNone)
+        """
+        try:
+            with self._lock:
+                if key.content_hash is not None:
+                    row = self._connection.execute(
+                        "SELECT response FROM videos "
+                        "WHERE metadata = ? AND content_hash = ?",
+                        (key.metadata, key.content_hash),
+                    ).fetchone()
+                    if row is not None and key.source is not None:
+                        self._remember_source(key.source, key.content_hash)
+                elif key.source is not None:
+                    row = self._connection.execute(
+                        "SELECT videos.response FROM sources JOIN videos "
+                        "ON videos.content_hash = sources.content_hash "
+                        "WHERE sources.source = ? AND videos.metadata = ?",
+                        (key.source, key.metadata),
+                    ).fetchone()
+                else:
+                    row = None
+        except sqlite3.Error as e:
+            logger.warning(f"アップロード済みの動画を照合できませんでした: {e}")
+            return None
+        return json.loads(row[0]) if row is not None else None
+
+    def has_candidates(self, key: UploadKey) -> bool:
+        """同じメタデータとサイズの動画が記録されているかどうかを返す
+
+        内容のハッシュを計算して照合する必要があるかの判定に使う。
+
+        Args:
+            key (UploadKey): 照合用のキー
+
+        Returns:
+            bool: 候補となる動画が記録されているかどうか
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT 1 FROM videos WHERE metadata = ? AND size = ? LIMIT 1",
+                    (key.metadata, key.size),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"アップロード済みの動画を照合できませんでした: {e}")
+            return False
+        return row is not None
+
+    def record(
+        self,
+        key: UploadKey,
+        content_hash: str,
+        response: dict,
+        actions: PostUploadActions | None = None,
+    ) -> None:
+        """アップロードした動画を記録する
+
+        video_path の場合は、次回からファイルを読まずに照合できるよう、
+        識別子と内容のハッシュの対応も記録する。
+
+        Args:
+            key (UploadKey): 照合用のキー
+            content_hash (str): 動画の内容のハッシュ
+            response (dict): APIのレスポンス辞書
+            actions (PostUploadActions | None, optional): 動画と同時に
+                適用待ちとして記録する、アップロード後の操作
+        """
+        row = (
+            key.metadata,
+            content_hash,
+            key.size,
+            response["id"],
+            json.dumps(response),
+            datetime.now(UTC).isoformat(),
+        )
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?)", row
+                    )
+                    if key.source is not None:
+                        self._remember_source(key.source, content_hash)
+                    if actions is not None:
+                        self._connection.execute(
+                            "INSERT OR REPLACE INTO pending_actions VALUES (?, ?)",
+                            (response["id"], actions.model_dump_json()),
+                        )
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"アップロード済みの動画を記録できませんでした: {e}")
+
+    def pending_actions(self, video_id: str) -> PostUploadActions | None:
+        """動画に適用待ちとして記録された、アップロード後の操作を取得する
+
+        Args:
+            video_id (str): 動画のID
+
+        Returns:
+            PostUploadActions | None: 適用待ちの操作 (なければNone)
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT actions FROM pending_actions WHERE video_id = ?",
+                    (video_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"適用待ちの操作を取得できませんでした: {e}")
+            return None
+        return PostUploadActions.model_validate_json(row[0]) if row else None
+
+    def clear_pending_actions(self, video_ids: Iterable[str]) -> None:
+        """操作を適用した動画の、適用待ちの記録を削除する
+
+        Args:
+            video_ids (Iterable[str]): 操作を適用した動画のID
+        """
+        try:
+            with self._lock:
+                self._connection.executemany(
+                    "DELETE FROM pending_actions WHERE video_id = ?",
+                    ((video_id,) for video_id in video_ids),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"適用待ちの操作の記録を削除できませんでした: {e}")
+
+    def _remember_source(self, source: str, content_hash: str) -> None:
+        """video_path の識別子と内容のハッシュを対応付ける (ロック内で呼ぶ)"""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sources VALUES (?, ?)", (source, content_hash)
+        )
+
+    def close(self) -> None:
+        """データベースとの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
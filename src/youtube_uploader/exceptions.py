@@ -1,3 +1,6 @@
+from datetime import datetime
+
+
 class YoutubeUploaderError(Exception):
     """YouTube Uploader パッケージのエラーの基底クラス"""
 
@@ -14,3 +17,15 @@ class UploadError(YoutubeUploaderError):
     """動画のアップロードリクエスト中に問題が発生した場合の例外"""
 
     pass
+
+
+class QuotaExceededError(UploadError):
+    """YouTube Data API のクォータが不足している場合の例外
+
+    Attributes:
+        resets_at (datetime | None): クォータがリセットされる日時
+    """
+
+    def __init__(self, message: str, resets_at: datetime | None = None):
+        super().__init__(message)
+        self.resets_at = resets_at
@@ -0,0 +1,318 @@
+"""instrumentation
+
+アップロードの段階ごとの所要時間とメトリクスを、外部の計測基盤へ渡すためのモジュール
+
+YoutubeUploader は、接続 (認証情報の読み込み・APIサービスの構築)、
+リクエストの構築、セッションの開始、チャンクの送信、サムネイルの送信の
+各段階を Instrumentation.phase() で囲み、送信バイト数や再試行回数を
+add() / record() で通知する。既定の Instrumentation は何もしないため、
+計測しない場合の負荷はほとんどない。
+
+各段階の所要時間は、段階名 (phase 属性) ごとのヒストグラム
+youtube_uploader.phase.duration に記録される。チャンクごとの待ち時間は
+phase="chunk" のヒストグラムで確認できる。
+
+Note:
+    OpenTelemetry と Prometheus のアダプターの利用には、
+    それぞれ次の追加の依存関係が必要です。
+    poetry install --extras otel
+    poetry install --extras prometheus
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# スパンとメトリクスに付与する属性
+type Attributes = dict[str, str | int | float | bool]
+
+# スパン (段階) の名前
+SPAN_CONNECT = "youtube_uploader.connect"
+SPAN_LOAD_CREDENTIALS = "youtube_uploader.load_credentials"
+SPAN_BUILD_SERVICE = "youtube_uploader.build_service"
+SPAN_UPLOAD = "youtube_uploader.upload"
+SPAN_BUILD_REQUEST = "youtube_uploader.build_request"
+SPAN_START_SESSION = "youtube_uploader.start_session"
+SPAN_CHUNK = "youtube_uploader.chunk"
+SPAN_THUMBNAIL = "youtube_uploader.thumbnail"
+SPAN_REFRESH_TOKEN = "youtube_uploader.refresh_token"
+SPAN_BATCH = "youtube_uploader.batch"
+
+# メトリクスの名前
+METRIC_PHASE_DURATION = "youtube_uploader.phase.duration"
+METRIC_BYTES_SENT = "youtube_uploader.bytes_sent"
+METRIC_UPLOAD_THROUGHPUT = "youtube_uploader.upload.throughput"
+METRIC_RETRIES = "youtube_uploader.retries"
+
+
+class MetricDefinition(BaseModel):
+    """アダプターが計測器を作成するための、メトリクスの定義
+
+    Args:
+        kind (Literal["counter", "histogram"]): メトリクスの種類
+        unit (str): 単位 (UCUM 形式、"s" や "By" など)
+        description (str): メトリクスの説明
+        attributes (tuple[str, ...]): 記録時に付与される属性の名前
+        prometheus_name (str): Prometheus でのメトリクス名
+        buckets (tuple[float, ...] | None): Prometheus のヒストグラムの境界値
+            (Noneの場合は prometheus_client の既定値)
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["counter", "histogram"] = Field(..., description="種類")
+    unit: str = Field(..., description="単位")
+    description: str = Field(..., description="説明")
+    attributes: tuple[str, ...] = Field(default=(), description="属性の名前")
+    prometheus_name: str = Field(..., description="Prometheus でのメトリクス名")
+    buckets: tuple[float, ...] | None = Field(default=None, description="境界値")
+
+
+# 通知されるメトリクスの一覧
+METRICS: dict[str, MetricDefinition] = {
+    METRIC_PHASE_DURATION: MetricDefinition(
+        kind="histogram",
+        unit="s",
+        description="アップロードの段階ごとの所要時間 (phase=chunk はチャンクごと)",
+        attributes=("phase", "outcome"),
+        prometheus_name="youtube_uploader_phase_duration_seconds",
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+    ),
+    METRIC_BYTES_SENT: MetricDefinition(
+        kind="counter",
+        unit="By",
+        description="サーバーが受信を確認したバイト数",
+        attributes=("phase",),
+        prometheus_name="youtube_uploader_sent_bytes",
+    ),
+    METRIC_UPLOAD_THROUGHPUT: MetricDefinition(
+        kind="histogram",
+        unit="By/s",
+        description="動画1件の送信のスループット",
+        prometheus_name="youtube_uploader_upload_throughput_bytes_per_second",
+        buckets=tuple(float(2**n) for n in range(16, 31, 2)),
+    ),
+    METRIC_RETRIES: MetricDefinition(
+        kind="counter",
+        unit="1",
+        description="一時的なエラーによる再試行の回数",
+        attributes=("reason",),
+        prometheus_name="youtube_uploader_retries",
+    ),
+}
+
+
+class Instrumentation:
+    """アップロードの計測を受け取るインターフェース (既定の実装は何もしない)
+
+    計測基盤と連携するには、このクラスを継承して span() / add() / record() を
+    実装する。アップロードのワーカースレッドから呼ばれるため、
+    スレッドセーフに実装すること。
+
+    Examples:
+        class LoggingInstrumentation(Instrumentation):
+            def record(self, name, value, attributes=None):
+                print(name, value, attributes)
+
+        uploader = YoutubeUploader(auth_dir, instrumentation=LoggingInstrumentation())
+    """
+
+    def span(
+        self, name: str, attributes: Attributes | None = None
+    ) -> AbstractContextManager[Any]:
+        """段階の開始から終了までを囲むコンテキストマネージャーを返す
+
+        段階の中で例外が発生した場合は、例外がそのまま伝わる。
+
+        Args:
+            name (str): 段階の名前 (SPAN_* の定数)
+            attributes (Attributes | None, optional): 段階の属性
+        """
+        return nullcontext()
+
+    def add(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        """カウンターに値を加算する
+
+        Args:
+            name (str): メトリクスの名前 (METRICS のキー)
+            value (float): 加算する値
+            attributes (Attributes | None, optional): メトリクスの属性
+        """
+
+    def record(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        """ヒストグラムに値を記録する
+
+        Args:
+            name (str): メトリクスの名前 (METRICS のキー)
+            value (float): 記録する値
+            attributes (Attributes | None, optional): メトリクスの属性
+        """
+
+    @contextmanager
+    def phase(self, name: str, attributes: Attributes | None = None) -> Iterator[None]:
+        """段階を span() で囲み、所要時間と成否をヒストグラムに記録する
+
+        Args:
+            name (str): 段階の名前 (SPAN_* の定数)
+            attributes (Attributes | None, optional): スパンの属性
+        """
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            with self.span(name, attributes):
+                yield
+            outcome = "ok"
+        finally:
+            self.record(
+                METRIC_PHASE_DURATION,
+                time.perf_counter() - started,
+                {"phase": name.removeprefix("youtube_uploader."), "outcome": outcome},
+            )
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """OpenTelemetry のトレースとメトリクスへ計測を送るアダプター
+
+    各段階はスパンとして記録され、呼び出し元のスパンの子になる。
+    エクスポーターの設定は、アプリケーション側の TracerProvider と
+    MeterProvider で行う。
+
+    Examples:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+
+        trace.set_tracer_provider(TracerProvider())
+        uploader = YoutubeUploader(
+            auth_dir, instrumentation=OpenTelemetryInstrumentation()
+        )
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        """
+        Args:
+            tracer_provider (Any, optional): スパンの作成に使う TracerProvider
+                Noneの場合はグローバルに設定されたものを使う
+            meter_provider (Any, optional): メトリクスの作成に使う MeterProvider
+                Noneの場合はグローバルに設定されたものを使う
+
+        Raises:
+            ImportError: opentelemetry-api がインストールされていない場合
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:  # pragma: no cover - 任意の依存関係
+            raise ImportError(
+                "OpenTelemetryInstrumentation を利用するには opentelemetry-api が"
+                "必要です。`poetry install --extras otel` を実行してください。"
+            ) from e
+
+        self._tracer = trace.get_tracer(
+            "youtube_uploader", tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter("youtube_uploader", meter_provider=meter_provider)
+        self._instruments: dict[str, Any] = {}
+        for name, definition in METRICS.items():
+            create = (
+                meter.create_counter
+                if definition.kind == "counter"
+                else meter.create_histogram
+            )
+            self._instruments[name] = create(
+                name, unit=definition.unit, description=definition.description
+            )
+
+    def span(
+        self, name: str, attributes: Attributes | None = None
+    ) -> AbstractContextManager[Any]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def add(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        self._instruments[name].add(value, attributes)
+
+    def record(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        self._instruments[name].record(value, attributes)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """prometheus_client のメトリクスへ計測を送るアダプター
+
+    Prometheus にはスパンがないため、段階ごとの所要時間は
+    youtube_uploader_phase_duration_seconds のヒストグラムとしてのみ記録される。
+    同じレジストリには1つしか作成できないため、プロセスで1つを共有する。
+
+    Examples:
+        from prometheus_client import start_http_server
+
+        start_http_server(9100)
+        instrumentation = PrometheusInstrumentation()
+        uploader = YoutubeUploader(auth_dir, instrumentation=instrumentation)
+    """
+
+    def __init__(self, registry: Any = None):
+        """
+        Args:
+            registry (Any, optional): メトリクスを登録する CollectorRegistry
+                Noneの場合は prometheus_client の既定のレジストリ
+
+        Raises:
+            ImportError: prometheus-client がインストールされていない場合
+        """
+        try:
+            import prometheus_client
+        except ImportError as e:  # pragma: no cover - 任意の依存関係
+            raise ImportError(
+                "PrometheusInstrumentation を利用するには prometheus-client が"
+                "必要です。`poetry install --extras prometheus` を実行してください。"
+            ) from e
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        self._metrics: dict[str, tuple[Any, tuple[str, ...]]] = {}
+        for name, definition in METRICS.items():
+            metric: prometheus_client.Counter | prometheus_client.Histogram
+            if definition.kind == "counter":
+                metric = prometheus_client.Counter(
+                    definition.prometheus_name,
+                    definition.description,
+                    definition.attributes,
+                    registry=registry,
+                )
+            else:
+                metric = prometheus_client.Histogram(
+                    definition.prometheus_name,
+                    definition.description,
+                    definition.attributes,
+                    registry=registry,
+                    buckets=definition.buckets
+                    or prometheus_client.Histogram.DEFAULT_BUCKETS,
+                )
+            self._metrics[name] = (metric, definition.attributes)
+
+    def _child(self, name: str, attributes: Attributes | None) -> Any:
+        """属性の値をラベルとして、メトリクスの子を返す"""
+        metric, labelnames = self._metrics[name]
+        if not labelnames:
+            return metric
+        attributes = attributes or {}
+        return metric.labels(*(str(attributes.get(key, "")) for key in labelnames))
+
+    def add(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        self._child(name, attributes).inc(value)
+
+    def record(
+        self, name: str, value: float, attributes: Attributes | None = None
+    ) -> None:
+        self._child(name, attributes).observe(value)
@@ -0,0 +1,673 @@
+"""jobs
+
+アップロードするジョブを SQLite のキューに永続化し、ワーカーで順に
+処理するためのモジュール
+
+ジョブは少なくとも1回 (at-least-once) 実行される。ワーカーはジョブを
+取り出すと一定時間 (visibility timeout) の間それを占有し、処理中は
+占有を延長し続ける。ワーカーのプロセスが異常終了した場合、占有の期限が
+切れたジョブは再び取り出せるようになる。再実行された動画は、
+保存済みのセッションから送信を再開し、送信済みであればアップロード済みの
+インデックスによってスキップされる。
+
+再生リストへの追加と翻訳があるジョブは、動画の送信が完了した時点で
+レスポンスをキューに記録してから操作を適用し、適用後に完了とする。
+操作の適用前にワーカーが終了した場合、再実行では動画を送信せずに
+操作だけを適用する。
+
+規定の回数を超えて失敗したジョブと、再試行しても成功しないジョブ
+(ファイルが存在しない場合など) は dead (デッドレター) として残され、
+原因を確認した後に requeue() で再投入できる。
+"""
+
+import base64
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .chunking import ChunkSize
+from .exceptions import QuotaExceededError
+from .models import UploadResult, YoutubeConfig
+from .progress import ProgressTracker
+from .youtube import YoutubeUploader
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+type JobStatus = Literal["queued", "running", "done", "dead"]
+
+
+class Job(BaseModel):
+    """キューに保存されたアップロードのジョブ
+
+    Args:
+        id (int): ジョブのID
+        config (YoutubeConfig): アップロード設定情報
+        status (JobStatus): ジョブの状態
+            queued (待機中) / running (実行中) / done (完了) / dead (デッドレター)
+        attempts (int): これまでに取り出された回数
+        lease (str | None): 実行中のワーカーが持つ占有の識別子
+        available_at (datetime): 次に取り出せるようになる日時 (UTC)
+            実行中の場合は占有の期限
+        last_error (str | None): 最後に失敗したときのエラー
+        response (dict | None): 動画の送信が完了した場合のAPIのレスポンス辞書
+        created_at (datetime): 投入された日時 (UTC)
+    """
+
+    id: int = Field(..., description="ジョブのID")
+    config: YoutubeConfig = Field(..., description="アップロード設定情報")
+    status: JobStatus = Field(..., description="ジョブの状態")
+    attempts: int = Field(default=0, description="これまでに取り出された回数")
+    lease: str | None = Field(default=None, description="占有の識別子")
+    available_at: datetime = Field(..., description="次に取り出せる日時")
+    last_error: str | None = Field(default=None, description="最後のエラー")
+    response: dict | None = Field(default=None, description="APIのレスポンス辞書")
+    created_at: datetime = Field(..., description="投入された日時")
+
+
+def _dump_config(config: YoutubeConfig) -> str:
+    """設定をキューに保存する JSON に変換する
+
+    Raises:
+        ValueError: 動画が video_bytes で指定されている場合
+    """
+    if config.video_path is None:
+        raise ValueError(
+            "キューに投入する動画は video_path で指定してください "
+            "(video_bytes は保存できません)。"
+        )
+    spec = config.model_dump(mode="json", exclude={"video_bytes", "thumbnail_bytes"})
+    spec["video_path"] = str(config.video_path.expanduser().resolve())
+    if config.thumbnail_bytes is not None:
+        spec["thumbnail_bytes"] = base64.b64encode(config.thumbnail_bytes).decode()
+    return json.dumps(spec, ensure_ascii=False)
+
+
+def _load_config(spec: str) -> YoutubeConfig:
+    """キューに保存された JSON から設定を復元する"""
+    data = json.loads(spec)
+    if data.get("thumbnail_bytes") is not None:
+        data["thumbnail_bytes"] = base64.b64decode(data["thumbnail_bytes"])
+    return YoutubeConfig.model_validate(data)
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _timestamp(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, UTC)
+
+
+class JobQueue:
+    """アップロードのジョブを保存する SQLite のキュー
+
+    スレッドセーフで、同じファイルを複数のプロセス (ワーカー) から利用できる。
+    ジョブの取り出しはトランザクション内で行うため、同じジョブが
+    同時に2つのワーカーへ渡されることはない。
+
+    Examples:
+        queue = JobQueue(Path("~/.local/state/youtube-uploader/jobs.sqlite3"))
+        queue.enqueue(YoutubeConfig(video_path=Path("video.mp4"), ...))
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        visibility_timeout: float = 600.0,
+        max_attempts: int = 5,
+        retry_delay: float = 60.0,
+    ):
+        """
+        Args:
+            path (Path): キューを保存する SQLite ファイルのパス
+            visibility_timeout (float, optional): 取り出したジョブを占有する秒数
+                ワーカーは処理中にこの期限を延長し続ける
+            max_attempts (int, optional): デッドレターとするまでの最大の実行回数
+            retry_delay (float, optional): 失敗したジョブを再実行するまでの
+                初回の待ち時間 (秒)。失敗するたびに2倍になる
+
+        Raises:
+            ValueError: 引数の値が不正な場合
+        """
+        if visibility_timeout <= 0:
+            raise ValueError("visibility_timeout は0より大きい値を指定してください。")
+        if max_attempts < 1:
+            raise ValueError("max_attempts は1以上を指定してください。")
+
+        self._path = path.expanduser()
+        self._visibility_timeout = visibility_timeout
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._lock = threading.Lock()
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self._path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    spec TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease TEXT,
+                    available_at REAL NOT NULL,
+                    last_error TEXT,
+                    response TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at)"
+            )
+
+    @property
+    def path(self) -> Path:
+        """キューを保存するファイルのパス"""
+        return self._path
+
+    @property
+    def visibility_timeout(self) -> float:
+        """取り出したジョブを占有する秒数"""
+        return self._visibility_timeout
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """書き込みロックを取得したトランザクションを実行する"""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def enqueue(self, config: YoutubeConfig, delay: float = 0.0) -> int:
+        """ジョブをキューに投入する
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報 (video_path で指定する)
+            delay (float, optional): 取り出せるようになるまでの秒数
+
+        Returns:
+            int: 投入したジョブのID
+
+        Raises:
+            ValueError: 動画が video_bytes で指定されている場合
+        """
+        spec = _dump_config(config)
+        now = _now()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO jobs (spec, status, available_at, created_at, updated_at)"
+                " VALUES (?, 'queued', ?, ?, ?)",
+                (spec, now + delay, now, now),
+            )
+        assert cursor.lastrowid is not None
+        logger.info(f"ジョブ {cursor.lastrowid} を投入しました: '{config.title}'")
+        return cursor.lastrowid
+
+    def claim(self) -> Job | None:
+        """取り出せるジョブを1件占有して返す
+
+        待機中のジョブに加え、占有の期限が切れた実行中のジョブ
+        (ワーカーが異常終了した場合など) も取り出す。
+        期限切れのまま最大の実行回数に達したジョブと、保存された内容を
+        読み込めないジョブはデッドレターとする。
+
+        Returns:
+            Job | None: 占有したジョブ (取り出せるジョブがなければNone)
+        """
+        while True:
+            now = _now()
+            lease = uuid.uuid4().hex
+            with self._transaction() as connection:
+                connection.execute(
+                    "UPDATE jobs SET status = 'dead', lease = NULL, updated_at = ?,"
+                    " last_error = 'ワーカーが応答しないまま占有の期限が切れました。'"
+                    " WHERE status = 'running' AND available_at <= ? AND attempts >= ?",
+                    (now, now, self._max_attempts),
+                )
+                row = connection.execute(
+                    "UPDATE jobs SET status = 'running', lease = ?,"
+                    " attempts = attempts + 1, available_at = ?, updated_at = ?"
+                    " WHERE id = ("
+                    "   SELECT id FROM jobs"
+                    "   WHERE status IN ('queued', 'running') AND available_at <= ?"
+                    "   ORDER BY available_at, id LIMIT 1"
+                    " ) RETURNING *",
+                    (lease, now + self._visibility_timeout, now, now),
+                ).fetchone()
+            if row is None:
+                return None
+            try:
+                job = self._to_job(row)
+            except ValueError as e:
+                # 壊れたジョブで他のジョブが止まらないよう、デッドレターとして次へ進む
+                self._bury(row["id"], lease, f"ジョブの内容を読み込めません: {e}")
+                continue
+            break
+
+        if job.attempts > 1:
+            logger.info(f"ジョブ {job.id} を再実行します ({job.attempts} 回目)")
+        return job
+
+    def extend(self, job: Job) -> bool:
+        """実行中のジョブの占有を延長する
+
+        Args:
+            job (Job): claim() で取り出したジョブ
+
+        Returns:
+            bool: 延長できたかどうか (期限切れで他のワーカーに
+                取り出された場合などは False)
+        """
+        now = _now()
+        available_at = now + self._visibility_timeout
+        with self._transaction() as connection:
+            updated = connection.execute(
+                "UPDATE jobs SET available_at = ?, updated_at = ?"
+                " WHERE id = ? AND lease = ? AND status = 'running'",
+                (available_at, now, job.id, job.lease),
+            ).rowcount
+        if updated:
+            job.available_at = _timestamp(available_at)
+        return bool(updated)
+
+    def mark_uploaded(self, job: Job, response: dict) -> None:
+        """アップロード後の操作を適用する前に、動画の送信の完了を記録する
+
+        ジョブは実行中のまま、レスポンスだけを保存する。ワーカーが操作の
+        適用前に終了した場合、再実行では動画を送信せずに操作だけを適用する。
+
+        Args:
+            job (Job): claim() で取り出したジョブ
+            response (dict): APIのレスポンス辞書
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET response = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(response), _now(), job.id),
+            )
+        job.response = response
+
+    def complete(self, job: Job, response: dict) -> None:
+        """ジョブを完了として記録する
+
+        動画の送信は完了しているため、占有の期限が切れていても記録する。
+
+        Args:
+            job (Job): claim() で取り出したジョブ
+            response (dict): APIのレスポンス辞書
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'done', lease = NULL, response = ?,"
+                " last_error = NULL, updated_at = ? WHERE id = ?",
+                (json.dumps(response), _now(), job.id),
+            )
+        job.status = "done"
+        job.lease = None
+        job.response = response
+
+    def fail(self, job: Job, error: str, permanent: bool = False) -> JobStatus:
+        """ジョブの失敗を記録し、再実行を予約するかデッドレターとする
+
+        Args:
+            job (Job): claim() で取り出したジョブ
+            error (str): 失敗の原因
+            permanent (bool, optional): 再実行しても成功しない失敗かどうか
+
+        Returns:
+            JobStatus: 記録後の状態 (queued または dead)
+        """
+        status: JobStatus = (
+            "dead" if permanent or job.attempts >= self._max_attempts else "queued"
+        )
+        now = _now()
+        available_at = now + self._retry_delay * 2 ** max(job.attempts - 1, 0)
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, lease = NULL, available_at = ?,"
+                " last_error = ?, updated_at = ?"
+                " WHERE id = ? AND lease = ? AND status = 'running'",
+                (status, available_at, error, now, job.id, job.lease),
+            )
+        job.status = status
+        job.lease = None
+        job.last_error = error
+        if status == "dead":
+            logger.error(f"ジョブ {job.id} をデッドレターに移しました: {error}")
+        else:
+            logger.warning(
+                f"ジョブ {job.id} は失敗しました。"
+                f"{_timestamp(available_at):%Y-%m-%d %H:%M:%S %Z} 以降に再実行します: "
+                f"{error}"
+            )
+        return status
+
+    def defer(self, job: Job, until: datetime, reason: str | None = None) -> None:
+        """実行回数を数えずに、ジョブを指定日時まで待機させる
+
+        クォータの不足など、ジョブ自体に問題がない場合に使う。
+
+        Args:
+            job (Job): claim() で取り出したジョブ
+            until (datetime): 再び取り出せるようになる日時
+            reason (str | None, optional): 待機させる理由
+        """
+        now = _now()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'queued', lease = NULL,"
+                " attempts = MAX(attempts - 1, 0), available_at = ?,"
+                " last_error = ?, updated_at = ?"
+                " WHERE id = ? AND lease = ? AND status = 'running'",
+                (until.timestamp(), reason, now, job.id, job.lease),
+            )
+        job.status = "queued"
+        job.lease = None
+        logger.info(f"ジョブ {job.id} を {until:%Y-%m-%d %H:%M %Z} まで延期します")
+
+    def _bury(self, job_id: int, lease: str, error: str) -> None:
+        """占有したジョブを、実行せずにデッドレターとする"""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'dead', lease = NULL, last_error = ?,"
+                " updated_at = ? WHERE id = ? AND lease = ?",
+                (error, _now(), job_id, lease),
+            )
+        logger.error(f"ジョブ {job_id} をデッドレターに移しました: {error}")
+
+    def requeue(self, job_id: int) -> bool:
+        """デッドレターのジョブを、実行回数を0に戻して再投入する
+
+        Args:
+            job_id (int): ジョブのID
+
+        Returns:
+            bool: 再投入できたかどうか (デッドレターでなければ False)
+        """
+        now = _now()
+        with self._transaction() as connection:
+            updated = connection.execute(
+                "UPDATE jobs SET status = 'queued', attempts = 0, available_at = ?,"
+                " updated_at = ? WHERE id = ? AND status = 'dead'",
+                (now, now, job_id),
+            ).rowcount
+        return bool(updated)
+
+    def get(self, job_id: int) -> Job | None:
+        """ジョブを取得する
+
+        Args:
+            job_id (int): ジョブのID
+
+        Returns:
+            Job | None: ジョブ (存在しなければNone)
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def dead_letters(self) -> list[Job]:
+        """デッドレターとなったジョブの一覧を返す
+
+        保存された内容を読み込めないジョブは一覧に含めず、
+        ジョブのIDと原因をログに出力する。
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM jobs WHERE status = 'dead' ORDER BY id"
+            ).fetchall()
+        jobs = []
+        for row in rows:
+            try:
+                jobs.append(self._to_job(row))
+            except ValueError as e:
+                logger.error(
+                    f"ジョブ {row['id']} の内容を読み込めません "
+                    f"({row['last_error']}): {e}"
+                )
+        return jobs
+
+    def counts(self) -> dict[str, int]:
+        """状態ごとのジョブの件数を返す"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(("queued", "running", "done", "dead"), 0)
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        """データベースとの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            config=_load_config(row["spec"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            lease=row["lease"],
+            available_at=_timestamp(row["available_at"]),
+            last_error=row["last_error"],
+            response=json.loads(row["response"]) if row["response"] else None,
+            created_at=_timestamp(row["created_at"]),
+        )
+
+
+# 再実行しても成功しない失敗
+_PERMANENT_ERRORS: tuple[type[BaseException], ...] = (
+    FileNotFoundError,
+    ValidationError,
+)
+
+
+class UploadWorker:
+    """JobQueue のジョブを取り出し、並列にアップロードするワーカー
+
+    run() は stop() が呼ばれるまでキューを監視し続ける。停止時は
+    実行中のアップロードが終わるのを待ってから戻る。実行中のジョブの
+    占有は、visibility_timeout の3分の1ごとに延長される。
+
+    Examples:
+        uploader = YoutubeUploader(auth_path)
+        uploader.connect()
+        worker = UploadWorker(uploader, JobQueue(queue_path), concurrency=3)
+        signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+        worker.run()
+    """
+
+    def __init__(
+        self,
+        uploader: YoutubeUploader,
+        queue: JobQueue,
+        concurrency: int = 2,
+        chunksize: ChunkSize = -1,
+        poll_interval: float = 5.0,
+    ):
+        """
+        Args:
+            uploader (YoutubeUploader): 接続済みのアップローダー
+            queue (JobQueue): ジョブを取り出すキュー
+            concurrency (int, optional): 同時にアップロードする動画の数
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、または "auto"）
+            poll_interval (float, optional): キューが空のときに確認する間隔 (秒)
+
+        Raises:
+            ValueError: concurrency が1未満の場合
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency は1以上を指定してください。")
+        self._uploader = uploader
+        self._queue = queue
+        self._concurrency = concurrency
+        self._chunksize = chunksize
+        self._poll_interval = poll_interval
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """ワーカーを停止する (実行中のアップロードは最後まで行う)"""
+        self._stop.set()
+
+    def run(self, drain: bool = False) -> None:
+        """キューのジョブを処理する
+
+        Args:
+            drain (bool, optional): 取り出せるジョブがなくなった時点で
+                終了するかどうか (False の場合は stop() まで待ち続ける)
+        """
+        self._stop.clear()
+        in_flight: dict[Future[None], Job] = {}
+        extend_interval = self._queue.visibility_timeout / 3
+        extended_at = time.monotonic()
+        logger.info(f"ワーカーを開始します (同時実行数: {self._concurrency})")
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="youtube-worker"
+        ) as executor:
+            while in_flight or not self._stop.is_set():
+                exhausted = False
+                while not self._stop.is_set() and len(in_flight) < self._concurrency:
+                    try:
+                        job = self._queue.claim()
+                    except sqlite3.Error as e:
+                        logger.error(f"キューからジョブを取り出せませんでした: {e}")
+                        job = None
+                    if job is None:
+                        exhausted = True
+                        break
+                    in_flight[executor.submit(self._process, job)] = job
+
+                if drain and exhausted and not in_flight:
+                    break
+
+                timeout = min(self._poll_interval, extend_interval)
+                if in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=timeout, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self._finish(future, in_flight.pop(future))
+                else:
+                    self._stop.wait(timeout)
+
+                if time.monotonic() - extended_at >= extend_interval:
+                    self._extend(in_flight.values())
+                    extended_at = time.monotonic()
+
+        logger.info(f"ワーカーを終了しました: {self._queue.counts()}")
+
+    def _finish(self, future: Future[None], job: Job) -> None:
+        """終了したジョブの例外を確認し、予期しない失敗をキューに記録する
+
+        _process() は結果を自分で記録するため、ここで扱うのは記録の前に
+        送出された例外だけである。
+        """
+        try:
+            future.result()
+        except Exception as e:
+            logger.exception(
+                f"ジョブ {job.id} の処理中に予期しないエラーが発生しました"
+            )
+            try:
+                self._queue.fail(job, f"{type(e).__name__}: {e}")
+            except sqlite3.Error as db_error:
+                # 記録できなかったジョブは、占有の期限が切れた後に再実行される
+                logger.error(
+                    f"ジョブ {job.id} の結果を記録できませんでした: {db_error}"
+                )
+
+    def _extend(self, jobs: Any) -> None:
+        """実行中のジョブの占有を延長する"""
+        for job in jobs:
+            try:
+                if not self._queue.extend(job):
+                    logger.warning(
+                        f"ジョブ {job.id} の占有が失われました。"
+                        "他のワーカーが再実行する可能性があります。"
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"ジョブ {job.id} の占有を延長できませんでした: {e}")
+
+    def _process(self, job: Job) -> None:
+        """ワーカースレッドで1件のジョブをアップロードし、結果をキューに記録する"""
+        # 送信済みのジョブや重複の場合も再生リストの操作でAPIを呼び出すため、
+        # 最初にこのワーカースレッド専用のサービスを用意する
+        self._uploader.ensure_thread_service()
+        if job.response is not None:
+            # 前回の実行で送信済みの動画には、アップロード後の操作だけを適用する
+            result = UploadResult(
+                index=job.id, title=job.config.title, response=job.response
+            )
+        else:
+            tracker = ProgressTracker(job.config.title, log_level=logging.DEBUG)
+            # 前回の実行で保存されたセッションがあれば、続きから送信する
+            result, _ = self._uploader.upload_in_worker(
+                job.id, job.config, tracker, self._chunksize, resume=True
+            )
+            if (
+                result.response is not None
+                and not result.duplicate
+                and job.config.has_post_upload_actions
+            ):
+                # 操作の適用前に終了しても再実行で適用できるよう、先に記録する
+                try:
+                    self._queue.mark_uploaded(job, result.response)
+                except sqlite3.Error as e:
+                    logger.error(
+                        f"ジョブ {job.id} の送信の完了を記録できませんでした: {e}"
+                    )
+        # 再生リストへの追加と翻訳は、ジョブごとに1回のバッチリクエストで適用する
+        # (失敗してもジョブは完了とし、ログに記録する)
+        self._uploader.apply_post_upload_actions([(result, job.config)])
+
+        try:
+            if result.ok:
+                assert result.response is not None
+                self._queue.complete(job, result.response)
+                if result.thumbnail is not None and not result.thumbnail.ok:
+                    logger.warning(
+                        f"ジョブ {job.id} のサムネイルのアップロードに失敗しました: "
+                        f"{result.thumbnail.error}"
+                    )
+                return
+
+            error = result.error
+            if isinstance(error, QuotaExceededError) and error.resets_at is not None:
+                self._queue.defer(job, error.resets_at, reason=str(error))
+                return
+            self._queue.fail(
+                job, str(error), permanent=isinstance(error, _PERMANENT_ERRORS)
+            )
+        except sqlite3.Error as e:
+            # 記録できなかったジョブは、占有の期限が切れた後に再実行される
+            logger.error(f"ジョブ {job.id} の結果を記録できませんでした: {e}")
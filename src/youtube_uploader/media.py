@@ -0,0 +1,190 @@
+"""media
+
+YoutubeConfigの動画/サムネイルのソースから、アップロード用のストリームを
+生成するユーティリティを定義するモジュール
+"""
+
+import hashlib
+import io
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import BinaryIO, cast
+
+from .models import YoutubeConfig
+
+# source_identity() で video_bytes から標本を取る範囲の大きさと数
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCK_COUNT = 16
+
+
+class BufferReader(io.RawIOBase):
+    """メモリ上のバッファをコピーせずに読み出すための読み込み専用ストリーム
+
+    bytes / bytearray / memoryview をmemoryview経由で参照するため、
+    ストリームの生成時にペイロード全体が複製されることはない。
+    read() で返されるのは要求された範囲分のbytesのみで、
+    readinto() は呼び出し側のバッファへ直接書き込む。
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        """
+        Args:
+            data (bytes | bytearray | memoryview): 読み出し対象のバッファ
+        """
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"不正なwhenceが指定されました: {whence}")
+        if pos < 0:
+            raise ValueError(f"負の位置にはシークできません: {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        target = memoryview(buffer).cast("B")
+        chunk = self._view[self._pos : self._pos + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._pos += size
+        return size
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(self._pos + size, len(self._view))
+        data = self._view[self._pos : end].tobytes() if end > self._pos else b""
+        self._pos = max(self._pos, end)
+        return data
+
+    def close(self) -> None:
+        # 切り出したビューが残っている場合は解放をGCに任せる
+        with suppress(BufferError):
+            self._view.release()
+        super().close()
+
+
+@contextmanager
+def open_video_stream(config: YoutubeConfig) -> Iterator[BinaryIO]:
+    """設定に応じた動画のストリームを開く
+
+    video_path が指定されている場合はファイルをそのまま開き、
+    MediaIoBaseUpload がチャンク単位で読み出せるようにする。
+    そのため、動画全体をメモリに載せる必要がない。
+    video_bytes が指定されている場合は BufferReader で包み、
+    ペイロードを複製せずに送信する。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Yields:
+        BinaryIO: 先頭にシーク済みの読み込み用ストリーム
+
+    Raises:
+        FileNotFoundError: video_path のファイルが存在しない場合
+    """
+    if config.video_path is not None:
+        with open(config.video_path, "rb") as f:
+            yield f
+        return
+
+    assert config.video_bytes is not None
+    with BufferReader(config.video_bytes) as reader:
+        yield cast(BinaryIO, reader)
+
+
+class ObservedStream(io.RawIOBase):
+    """読み込みのたびにフックを呼び出す、読み込み専用ストリームのラッパー
+
+    HTTP層がチャンクを読み出すたびに、読み出した位置とデータをフックへ渡す。
+    進捗の計測などに使う。
+    """
+
+    def __init__(self, stream: BinaryIO, hooks: list[Callable[[int, bytes], None]]):
+        """
+        Args:
+            stream (BinaryIO): ラップするシーク可能なストリーム
+            hooks (list[Callable[[int, bytes], None]]): 読み込みのたびに
+                (読み出し開始位置, 読み出したデータ) で呼ばれる関数のリスト
+        """
+        super().__init__()
+        self._stream = stream
+        self._hooks = hooks
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def read(self, size: int | None = -1) -> bytes:
+        position = self._stream.tell()
+        data = self._stream.read(-1 if size is None else size)
+        for hook in self._hooks:
+            hook(position, data)
+        return data
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        data = self.read(len(memoryview(buffer)))
+        memoryview(buffer).cast("B")[: len(data)] = data
+        return len(data)
+
+
+def source_identity(config: YoutubeConfig) -> str:
+    """動画ソースを送信前に安価に識別する文字列を返す
+
+    video_path の場合はパス・サイズ・更新日時を使う。video_bytes の場合は
+    内容全体をハッシュせず、サイズと、等間隔に取った SAMPLE_BLOCK_COUNT 個の
+    範囲 (各 SAMPLE_BLOCK_SIZE バイト) のハッシュを使う。小さな動画は
+    全体をハッシュする。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        str: 動画ソースの識別子
+
+    Raises:
+        FileNotFoundError: video_path のファイルが存在しない場合
+    """
+    if config.video_path is not None:
+        path = config.video_path.expanduser().resolve()
+        stat = path.stat()
+        return f"path:{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    assert config.video_bytes is not None
+    view = memoryview(config.video_bytes).cast("B")
+    size = len(view)
+    digest = hashlib.sha256()
+    if size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCK_COUNT:
+        digest.update(view)
+    else:
+        # 最初と最後の範囲を必ず含める
+        for i in range(SAMPLE_BLOCK_COUNT):
+            start = i * (size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCK_COUNT - 1)
+            digest.update(view[start : start + SAMPLE_BLOCK_SIZE])
+    return f"bytes:{size}:{digest.hexdigest()}"
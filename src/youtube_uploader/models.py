@@ -1,40 +1,113 @@
 """YouTube APIへの動画アップロードに必要な設定情報のためのデータモデル"""
 
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Literal
+from functools import cache
+from itertools import batched
+from pathlib import Path
+from typing import Annotated, Any, Literal, overload
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainValidator,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WithJsonSchema,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 
-class YoutubeConfig(BaseModel):
-    """YouTubeへの動画アップロードに必要な設定情報
+def _keep_buffer(v: object) -> bytes | bytearray | memoryview:
+    """バッファプロトコル対応の値をコピーせずにそのまま受け取る"""
+    if isinstance(v, memoryview) and not v.contiguous:
+        raise ValueError("memoryview は連続したバッファである必要があります。")
+    if isinstance(v, bytes | bytearray | memoryview):
+        return v
+    raise ValueError("bytes, bytearray, memoryview のいずれかを指定してください。")
+
+
+# pydanticの bytes 型は bytearray などを bytes に変換 (コピー) してしまうため、
+# 受け取ったバッファをそのまま保持する型を用意する
+BinaryData = Annotated[
+    bytes | bytearray | memoryview,
+    PlainValidator(_keep_buffer),
+    WithJsonSchema({"type": "string", "format": "binary"}),
+]
+
+
+def _check_localizations(
+    localizations: dict[str, "VideoLocalization"], default_language: str | None
+) -> None:
+    """翻訳と動画の言語の組み合わせを検証する"""
+    if localizations and default_language is None:
+        raise ValueError(
+            "localizations を指定する場合は、default_language も指定してください。"
+        )
+
+
+def _check_publish_at(v: datetime | None, privacy_status: str | None) -> Any:
+    """予約投稿日時と公開設定の組み合わせを検証する"""
+    if v is not None and privacy_status != "private":
+        raise ValueError(
+            "予約投稿日時(publish_at)が指定されている場合、"
+            "公開設定(privacy_status)は 'private' である必要があります。"
+        )
+    if v is not None and v.tzinfo is None:
+        raise ValueError(
+            "予約投稿日時(publish_at)にはタイムゾーン情報(tzinfo)が必要です。"
+            "例: datetime.fromisoformat('2025-10-20 02:30:00+09:00')"
+        )
+    return v
+
+
+class VideoLocalization(BaseModel):
+    """動画のタイトルと説明文の翻訳
 
     Args:
-        video_bytes (bytes): アップロードする動画ファイルのバイナリデータ。
-        video_mimetype (str): 動画ファイルのMIMEタイプ (例: 'video/mp4')。
-        title (str): 動画のタイトル
-        description (str, optional): 動画の説明文
-        tags (list[str], optional): 動画のタグリスト
-        category_id (str, optional): 動画のカテゴリID
-        selfDeclaredMadeForKids (bool, optional): 子供向けコンテンツかどうかの自己申告
-            (デフォルトはFalse)
-        privacy_status (str, optional): 動画の公開設定
-        publish_at (datetime | None, optional): 予約投稿日時 (Noneの場合は即時公開)
-            例：2025-10-20 02:30:00+09:00
-        thumbnail_bytes (bytes | None, optional): サムネイルファイルのバイナリデータ
-            (bytes)
-        thumbnail_mimetype (str | None, optional): サムネイルファイルのMIMEタイプ
-            (例: 'image/jpeg')
+        title (str): 翻訳したタイトル
+        description (str, optional): 翻訳した説明文
     """
 
-    # --- 動画本体 ---
-    video_bytes: bytes = Field(
-        ..., description="アップロードする動画ファイルのバイナリデータ (bytes)"
+    title: str = Field(..., description="翻訳したタイトル")
+    description: str = Field(default="", description="翻訳した説明文")
+
+
+# アップロード後にまとめて適用する操作のフィールド
+# (アップロード済みかの照合やセッションの識別には使わない)
+POST_UPLOAD_FIELDS = frozenset({"localizations", "playlist_ids"})
+
+
+class PostUploadActions(BaseModel):
+    """アップロードした動画に適用する操作 (再生リストへの追加・翻訳の設定)
+
+    適用前にプロセスが終了しても再実行時に適用できるよう、
+    アップロードの記録とともに保存する。
+
+    Args:
+        playlist_ids (list[str], optional): 動画を追加する再生リストのID
+        localizations (dict[str, VideoLocalization], optional): 言語コードごとの
+            タイトルと説明文の翻訳
+    """
+
+    playlist_ids: list[str] = Field(
+        default_factory=list, description="動画を追加する再生リストのID"
     )
-    video_mimetype: str = Field(
-        ..., description="動画ファイルのMIMEタイプ (例: 'video/mp4')"
+    localizations: dict[str, VideoLocalization] = Field(
+        default_factory=dict, description="言語コードごとのタイトルと説明文の翻訳"
     )
 
+
+class _VideoMetadataFields(BaseModel):
+    """YoutubeConfig と VideoMetadata に共通する、メタデータのフィールドと検証
+
+    各フィールドの説明は YoutubeConfig を参照。
+    """
+
     # --- メタデータ ---
     title: str = Field(..., description="動画のタイトル")
     description: str = Field(default="", description="動画の説明文")
@@ -51,12 +124,15 @@ class YoutubeConfig(BaseModel):
         default=None, description="予約投稿日時 (Noneの場合は即時公開)"
     )
 
-    # --- サムネイル ---
-    thumbnail_bytes: bytes | None = Field(
-        default=None, description="アップロードするサムネイルのバイナリデータ (bytes)"
+    # --- アップロード後の操作 ---
+    default_language: str | None = Field(
+        default=None, description="タイトルと説明文の言語 (例: 'ja')"
     )
-    thumbnail_mimetype: str | None = Field(
-        default=None, description="サムネイルファイルのMIMEタイプ (例: 'image/jpeg')"
+    localizations: dict[str, VideoLocalization] = Field(
+        default_factory=dict, description="言語コードごとのタイトルと説明文の翻訳"
+    )
+    playlist_ids: list[str] = Field(
+        default_factory=list, description="動画を追加する再生リストのID"
     )
 
     # 予約投稿がprivate以外の場合に警告/エラーを出す
@@ -64,17 +140,67 @@ class YoutubeConfig(BaseModel):
     @classmethod
     def check_privacy_for_scheduled_post(cls, v, info):
         """予約投稿がprivate以外の場合に警告/エラーを出す"""
-        if v is not None and info.data.get("privacy_status") != "private":
-            raise ValueError(
-                "予約投稿日時(publish_at)が指定されている場合、"
-                "公開設定(privacy_status)は 'private' である必要があります。"
-            )
-        if v is not None and v.tzinfo is None:
-            raise ValueError(
-                "予約投稿日時(publish_at)にはタイムゾーン情報(tzinfo)が必要です。"
-                "例: datetime.fromisoformat('2025-10-20 02:30:00+09:00')"
-            )
-        return v
+        return _check_publish_at(v, info.data.get("privacy_status"))
+
+    # 翻訳を設定するには、動画の言語が必要
+    @model_validator(mode="after")
+    def check_localizations(self):
+        """localizations を指定する場合は default_language も必須とする"""
+        _check_localizations(self.localizations, self.default_language)
+        return self
+
+
+class YoutubeConfig(_VideoMetadataFields):
+    """YouTubeへの動画アップロードに必要な設定情報
+
+    Args:
+        video_bytes (BinaryData | None, optional): アップロードする動画ファイルの
+            バイナリデータ。video_path とどちらか一方を指定する。
+            bytes / bytearray / memoryview をコピーせずにそのまま保持する。
+        video_path (Path | None, optional): アップロードする動画ファイルのパス。
+            指定した場合はファイルをチャンク単位で読み出しながら送信するため、
+            動画全体をメモリに読み込まない。
+        video_mimetype (str): 動画ファイルのMIMEタイプ (例: 'video/mp4')。
+        title (str): 動画のタイトル
+        description (str, optional): 動画の説明文
+        tags (list[str], optional): 動画のタグリスト
+        category_id (str, optional): 動画のカテゴリID
+        selfDeclaredMadeForKids (bool, optional): 子供向けコンテンツかどうかの自己申告
+            (デフォルトはFalse)
+        privacy_status (str, optional): 動画の公開設定
+        publish_at (datetime | None, optional): 予約投稿日時 (Noneの場合は即時公開)
+            例：2025-10-20 02:30:00+09:00
+        thumbnail_bytes (BinaryData | None, optional): サムネイルファイルの
+            バイナリデータ (bytes / bytearray / memoryview)
+        thumbnail_mimetype (str | None, optional): サムネイルファイルのMIMEタイプ
+            (例: 'image/jpeg')
+        default_language (str | None, optional): タイトルと説明文の言語
+            (例: 'ja')。localizations を指定する場合は必須
+        localizations (dict[str, VideoLocalization], optional): 言語コードごとの
+            タイトルと説明文の翻訳 (アップロード後に videos.update で設定する)
+        playlist_ids (list[str], optional): アップロード後に動画を追加する
+            再生リストのIDのリスト
+    """
+
+    # --- 動画本体 ---
+    video_bytes: BinaryData | None = Field(
+        default=None, description="アップロードする動画ファイルのバイナリデータ (bytes)"
+    )
+    video_path: Path | None = Field(
+        default=None,
+        description="アップロードする動画ファイルのパス (チャンク単位で読み出して送信)",
+    )
+    video_mimetype: str = Field(
+        ..., description="動画ファイルのMIMEタイプ (例: 'video/mp4')"
+    )
+
+    # --- サムネイル ---
+    thumbnail_bytes: BinaryData | None = Field(
+        default=None, description="アップロードするサムネイルのバイナリデータ (bytes)"
+    )
+    thumbnail_mimetype: str | None = Field(
+        default=None, description="サムネイルファイルのMIMEタイプ (例: 'image/jpeg')"
+    )
 
     # サムネイルバイナリがある場合、mimetypeも必須とする
     @field_validator("thumbnail_mimetype")
@@ -86,3 +212,329 @@ class YoutubeConfig(BaseModel):
                 "thumbnail_bytesが指定されている場合、thumbnail_mimetypeも必須です。"
             )
         return v
+
+    # 動画のソースは video_bytes と video_path のどちらか一方のみとする
+    @model_validator(mode="after")
+    def check_video_source(self):
+        """動画のソースは video_bytes と video_path のどちらか一方のみとする"""
+        if (self.video_bytes is None) == (self.video_path is None):
+            raise ValueError(
+                "video_bytes と video_path のどちらか一方を指定してください。"
+            )
+        return self
+
+    @property
+    def has_post_upload_actions(self) -> bool:
+        """アップロード後に適用する操作 (再生リストへの追加・翻訳) があるかどうか"""
+        return bool(self.localizations or self.playlist_ids)
+
+    @property
+    def post_upload_actions(self) -> PostUploadActions:
+        """アップロード後に適用する操作"""
+        return PostUploadActions(
+            playlist_ids=self.playlist_ids, localizations=self.localizations
+        )
+
+
+def upload_metadata(config: YoutubeConfig) -> dict[str, Any]:
+    """アップロードを識別するためのメタデータを返す
+
+    動画とサムネイルのデータと、アップロード後の操作は含めない。
+    default_language は、追加される前の設定と同じ値になるよう、
+    指定された場合のみ含める。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        dict[str, Any]: JSON に変換できるメタデータ
+    """
+    exclude = {"video_bytes", "video_path", "thumbnail_bytes", *POST_UPLOAD_FIELDS}
+    if config.default_language is None:
+        exclude.add("default_language")
+    return config.model_dump(mode="json", exclude=exclude)
+
+
+class VideoMetadata(_VideoMetadataFields):
+    """動画とサムネイルのデータを含まない、メタデータだけの設定情報
+
+    大量のマニフェストを先に検証しておき、動画のパスやバイナリデータは
+    アップロードの直前に bind() で結び付けるために使う。
+    フィールドと検証は YoutubeConfig と共通。
+
+    Examples:
+        result = validate_many(rows, VideoMetadata)
+        for index, metadata in result.valid.items():
+            config = metadata.bind(video_path=paths[index], video_mimetype="video/mp4")
+    """
+
+    def bind(
+        self,
+        video_mimetype: str,
+        video_path: Path | None = None,
+        video_bytes: bytes | bytearray | memoryview | None = None,
+        thumbnail_bytes: bytes | bytearray | memoryview | None = None,
+        thumbnail_mimetype: str | None = None,
+    ) -> YoutubeConfig:
+        """動画とサムネイルのデータを結び付けた YoutubeConfig を作る
+
+        Args:
+            video_mimetype (str): 動画ファイルのMIMEタイプ
+            video_path (Path | None, optional): アップロードする動画ファイルのパス
+            video_bytes (bytes | bytearray | memoryview | None, optional):
+                アップロードする動画ファイルのバイナリデータ (コピーされない)
+            thumbnail_bytes (bytes | bytearray | memoryview | None, optional):
+                サムネイルファイルのバイナリデータ
+            thumbnail_mimetype (str | None, optional): サムネイルファイルのMIMEタイプ
+
+        Returns:
+            YoutubeConfig: アップロード設定情報
+
+        Raises:
+            ValidationError: 動画やサムネイルの指定が不正な場合
+        """
+        return YoutubeConfig(
+            **dict(self),
+            video_mimetype=video_mimetype,
+            video_path=video_path,
+            video_bytes=video_bytes,
+            thumbnail_bytes=thumbnail_bytes,
+            thumbnail_mimetype=thumbnail_mimetype,
+        )
+
+
+class RowError(BaseModel):
+    """validate_many() で見つかった、1つの行のエラー
+
+    Args:
+        index (int): 入力内での位置
+        field (str | None): エラーのあったフィールド
+            (複数のフィールドにまたがるエラーの場合はNone)
+        message (str): エラーの内容
+        type (str): pydantic のエラーの種類 (例: 'missing')
+    """
+
+    index: int = Field(..., description="入力内での位置")
+    field: str | None = Field(default=None, description="エラーのあったフィールド")
+    message: str = Field(..., description="エラーの内容")
+    type: str = Field(..., description="エラーの種類")
+
+
+class BulkValidationResult[M: BaseModel](BaseModel):
+    """validate_many() の結果
+
+    Args:
+        valid (dict[int, M]): 入力内での位置と、検証に成功した設定
+        errors (list[RowError]): 検証に失敗した行のエラー (1行に複数ありうる)
+    """
+
+    valid: dict[int, M] = Field(default_factory=dict, description="成功した設定")
+    errors: list[RowError] = Field(default_factory=list, description="行のエラー")
+
+    @property
+    def ok(self) -> bool:
+        """すべての行が検証に成功したかどうか"""
+        return not self.errors
+
+    @property
+    def failed_indices(self) -> list[int]:
+        """検証に失敗した行の位置 (昇順)"""
+        return sorted({error.index for error in self.errors})
+
+
+def _capture_errors(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """1行の検証エラーを、リスト全体の失敗にせずに値として返す"""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return e
+
+
+# validate_many() で1回の TypeAdapter の呼び出しにまとめる行数
+VALIDATION_BATCH_SIZE = 1000
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[Annotated[model, WrapValidator(_capture_errors)]])  # type: ignore[valid-type]
+
+
+@overload
+def validate_many(rows: Iterable[Any]) -> BulkValidationResult[YoutubeConfig]: ...
+
+
+@overload
+def validate_many[M: BaseModel](
+    rows: Iterable[Any], model: type[M]
+) -> BulkValidationResult[M]: ...
+
+
+def validate_many(
+    rows: Iterable[Any], model: type[BaseModel] = YoutubeConfig
+) -> BulkValidationResult[Any]:
+    """複数の行をまとめて検証し、すべての行のエラーを位置とともに集める
+
+    行を VALIDATION_BATCH_SIZE 件ずつ読み出し、TypeAdapter でまとめて検証する。
+    入力全体をリストにコピーしないため、ジェネレーターを渡せば入力の行を
+    すべてメモリに保持することはない。エラーのある行があっても検証は
+    最後まで続けられ、1行のエラーで全体が失敗することはない。
+
+    Args:
+        rows (Iterable[Any]): 辞書 (またはモデルのインスタンス) の並び
+        model (type[M], optional): 検証に使うモデル。動画のデータを後から
+            結び付ける場合は VideoMetadata を指定する
+
+    Returns:
+        BulkValidationResult[M]: 検証に成功した設定と、行ごとのエラー
+
+    Examples:
+        result = validate_many(rows)
+        for error in result.errors:
+            print(f"{error.index}行目 {error.field}: {error.message}")
+    """
+    adapter = _list_adapter(model)
+    valid: dict[int, BaseModel] = {}
+    errors: list[RowError] = []
+    validated = (
+        item
+        for chunk in batched(rows, VALIDATION_BATCH_SIZE)
+        for item in adapter.validate_python(chunk)
+    )
+    for index, item in enumerate(validated):
+        if not isinstance(item, ValidationError):
+            valid[index] = item
+            continue
+        errors.extend(
+            RowError(
+                index=index,
+                field=".".join(str(part) for part in error["loc"]) or None,
+                message=error["msg"],
+                type=error["type"],
+            )
+            for error in item.errors(include_url=False, include_input=False)
+        )
+    result_type = BulkValidationResult[model]  # type: ignore[valid-type]
+    return result_type.model_construct(valid=valid, errors=errors)
+
+
+class ThumbnailResult(BaseModel):
+    """サムネイルのアップロード結果
+
+    サムネイルの失敗は動画のアップロードを失敗させないため、
+    結果はこのオブジェクトで通知される。
+
+    Args:
+        video_id (str): 対象となるYouTube動画のID
+        status (Literal["uploaded", "skipped", "failed"]): アップロードの結果
+            サムネイルが指定されていない場合は "skipped"
+        error (Exception | None): 失敗した場合に発生した例外
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    video_id: str = Field(..., description="対象となるYouTube動画のID")
+    status: Literal["uploaded", "skipped", "failed"] = Field(
+        ..., description="アップロードの結果"
+    )
+    error: Exception | None = Field(default=None, description="発生した例外")
+
+    @property
+    def ok(self) -> bool:
+        """失敗していないかどうか (スキップした場合も True)"""
+        return self.status != "failed"
+
+
+class PlaylistAddition(BaseModel):
+    """add_to_playlists() で行う、再生リストへの動画の追加
+
+    Args:
+        video_id (str): 追加する動画のID
+        playlist_id (str): 追加先の再生リストのID
+        position (int | None, optional): 再生リスト内の位置 (Noneの場合は末尾)
+    """
+
+    video_id: str = Field(..., description="追加する動画のID")
+    playlist_id: str = Field(..., description="追加先の再生リストのID")
+    position: int | None = Field(default=None, ge=0, description="再生リスト内の位置")
+
+
+class VideoUpdate(BaseModel):
+    """update_videos() で行う、アップロード済みの動画の更新
+
+    Args:
+        video_id (str): 更新する動画のID
+        localizations (dict[str, VideoLocalization]): 言語コードごとの
+            タイトルと説明文の翻訳 (動画に default_language が設定されている必要がある)
+    """
+
+    video_id: str = Field(..., description="更新する動画のID")
+    localizations: dict[str, VideoLocalization] = Field(
+        ..., description="言語コードごとのタイトルと説明文の翻訳"
+    )
+
+
+class BatchCallResult(BaseModel):
+    """バッチリクエストで実行した1件のAPI呼び出しの結果
+
+    Args:
+        method (str): APIメソッド名 (例: 'playlistItems.insert')
+        video_id (str): 対象の動画のID
+        target (str | None): 呼び出しの対象 (再生リストのIDなど)
+        response (dict | None): 成功した場合のAPIのレスポンス辞書
+        error (Exception | None): 失敗した場合に発生した例外
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    method: str = Field(..., description="APIメソッド名")
+    video_id: str = Field(..., description="対象の動画のID")
+    target: str | None = Field(default=None, description="呼び出しの対象")
+    response: dict | None = Field(default=None, description="APIのレスポンス辞書")
+    error: Exception | None = Field(default=None, description="発生した例外")
+
+    @property
+    def ok(self) -> bool:
+        """呼び出しに成功したかどうか"""
+        return self.error is None
+
+
+class UploadResult(BaseModel):
+    """upload_many() で1件ごとに返されるアップロード結果
+
+    Args:
+        index (int): 入力リスト内での位置
+        title (str): 動画のタイトル
+        response (dict | None): 成功した場合のAPIのレスポンス辞書
+        error (Exception | None): 失敗した場合に発生した例外
+        channel (str | None): アップロードに使ったチャンネル (ChannelPool のみ)
+        thumbnail (ThumbnailResult | None): サムネイルのアップロード結果
+            (動画のアップロードに失敗した場合はNone)
+        duplicate (bool): アップロード済みの動画のため、送信を省略したかどうか
+        actions (list[BatchCallResult]): アップロード後の操作
+            (再生リストへの追加・翻訳の設定) の結果
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(..., description="入力リスト内での位置")
+    title: str = Field(..., description="動画のタイトル")
+    response: dict | None = Field(default=None, description="APIのレスポンス辞書")
+    error: Exception | None = Field(default=None, description="発生した例外")
+    channel: str | None = Field(default=None, description="使用したチャンネル")
+    thumbnail: ThumbnailResult | None = Field(
+        default=None, description="サムネイルのアップロード結果"
+    )
+    duplicate: bool = Field(default=False, description="アップロード済みかどうか")
+    actions: list[BatchCallResult] = Field(
+        default_factory=list, description="アップロード後の操作の結果"
+    )
+
+    @property
+    def ok(self) -> bool:
+        """アップロードに成功したかどうか"""
+        return self.error is None and self.response is not None
+
+    @property
+    def video_id(self) -> str | None:
+        """アップロードされた動画のID (失敗した場合はNone)"""
+        return self.response.get("id") if self.response else None
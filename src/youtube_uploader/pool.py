@@ -0,0 +1,375 @@
+"""pool
+
+複数チャンネルのアップローダーをまとめて管理し、チャンネルごとの
+同時実行数とクォータの残量に応じて、アップロードを振り分けるモジュール
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from .chunking import ChunkSize
+from .exceptions import QuotaExceededError, UploadError
+from .instrumentation import Instrumentation
+from .models import ThumbnailResult, UploadResult, YoutubeConfig
+from .progress import ProgressTracker, UploadProgress
+from .quota import QuotaLedger, estimate_upload_cost, quota_resets_at, upload_calls
+from .retry import RetryPolicy
+from .thumbnails import ThumbnailProcessor
+from .transport import TransportConfig
+from .youtube import YoutubeUploader
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+
+class _Channel:
+    """プール内の1チャンネルの状態"""
+
+    def __init__(self, name: str, uploader: YoutubeUploader):
+        self.name = name
+        self.uploader = uploader
+        self.in_flight = 0
+
+
+class ChannelPool:
+    """複数チャンネルの YoutubeUploader をまとめて扱うプール
+
+    チャンネルは認証ディレクトリ (client_secrets.json と token.json を置く場所) の
+    名前で識別する。upload_many() に渡した動画は、空きのあるチャンネルのうち
+    実行中のアップロードが少なく、クォータの残りが多いものへ順に割り当てられる。
+    クォータの残量は各アップローダーの QuotaLedger で管理される。
+    """
+
+    def __init__(
+        self,
+        auth_paths: Iterable[Path],
+        max_concurrency_per_channel: int = 2,
+        retry_policy: RetryPolicy | None = None,
+        quota_ledger: QuotaLedger | None = None,
+        thumbnail_processor: ThumbnailProcessor | None = None,
+        transport: TransportConfig | None = None,
+        instrumentation: Instrumentation | None = None,
+        token_refresh_margin: float | None = None,
+        scopes: Iterable[str] | None = None,
+        deduplicate: bool = False,
+    ):
+        """
+        Args:
+            auth_paths (Iterable[Path]): チャンネルごとの認証ディレクトリのリスト
+            max_concurrency_per_channel (int, optional): チャンネルごとの同時実行数
+            retry_policy (RetryPolicy | None, optional): 各アップローダーの再試行方針
+            quota_ledger (QuotaLedger | None, optional): 全チャンネルで共有する
+                クォータの台帳 (Noneの場合はチャンネルごとの台帳を使う)
+            thumbnail_processor (ThumbnailProcessor | None, optional):
+                全チャンネルで共有する、サムネイルの検証・正規化の処理
+            transport (TransportConfig | None, optional): 各アップローダーの
+                接続プール付きのHTTP通信の設定 (接続プールはチャンネルごと)
+            instrumentation (Instrumentation | None, optional): 全チャンネルで
+                共有する、段階ごとの所要時間とメトリクスの通知先
+            token_refresh_margin (float | None, optional): 指定すると、各チャンネルの
+                アクセストークンを有効期限のこの秒数前にバックグラウンドで
+                リフレッシュする
+            scopes (Iterable[str] | None, optional): 各チャンネルの認証で
+                要求するスコープ (Noneの場合はアップロードのみ)
+            deduplicate (bool, optional): 各チャンネルでアップロード済みの動画を
+                記録し、同じ内容とメタデータの動画はアップロードせずに
+                記録済みのレスポンスを返すかどうか
+
+        Raises:
+            ValueError: 認証ディレクトリが空、または名前が重複している場合
+        """
+        if max_concurrency_per_channel < 1:
+            raise ValueError("max_concurrency_per_channel は1以上を指定してください。")
+
+        self._channels: dict[str, _Channel] = {}
+        for auth_path in auth_paths:
+            name = auth_path.name
+            if name in self._channels:
+                raise ValueError(f"チャンネル名が重複しています: {name}")
+            self._channels[name] = _Channel(
+                name,
+                YoutubeUploader(
+                    auth_path,
+                    retry_policy,
+                    quota_ledger,
+                    thumbnail_processor,
+                    transport=transport,
+                    instrumentation=instrumentation,
+                    token_refresh_margin=token_refresh_margin,
+                    scopes=scopes,
+                    deduplicate=deduplicate,
+                ),
+            )
+        if not self._channels:
+            raise ValueError("認証ディレクトリを1つ以上指定してください。")
+
+        self._max_concurrency = max_concurrency_per_channel
+        self._condition = threading.Condition()
+
+    @property
+    def channels(self) -> list[str]:
+        """プールに含まれるチャンネル名のリスト"""
+        return list(self._channels)
+
+    def uploader(self, channel: str) -> YoutubeUploader:
+        """チャンネルのアップローダーを返す
+
+        Args:
+            channel (str): チャンネル名
+
+        Returns:
+            YoutubeUploader: チャンネルのアップローダー
+        """
+        return self._channels[channel].uploader
+
+    def close(self) -> None:
+        """すべてのチャンネルのアップローダーを閉じる"""
+        for channel in self._channels.values():
+            channel.uploader.close()
+
+    def remaining_quota(self, channel: str) -> int:
+        """チャンネルに残っているクォータの単位数を返す
+
+        Args:
+            channel (str): チャンネル名
+
+        Returns:
+            int: 残りのクォータ
+        """
+        return self._channels[channel].uploader.remaining_quota()
+
+    def connect(self) -> None:
+        """すべてのチャンネルを YouTube API に接続する
+
+        初回はブラウザでの認証が必要になるため、チャンネルごとに順に接続する。
+
+        Raises:
+            AuthError: 認証に失敗した場合
+        """
+        for channel in self._channels.values():
+            logger.info(f"チャンネル '{channel.name}' に接続します...")
+            channel.uploader.connect()
+
+    def upload_many(
+        self,
+        configs: Iterable[YoutubeConfig],
+        chunksize: ChunkSize = -1,
+        on_progress: Callable[[int, UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
+        pipeline_thumbnails: bool = False,
+    ) -> list[UploadResult]:
+        """複数の動画を、チャンネルに振り分けながら並列にアップロードする
+
+        クォータは動画の送信開始前に見積もり額を確保する。動画の送信前に
+        失敗した場合 (ファイルが見つからない、アップロード済みだった等) は
+        確保した分を返却し、送信を始めた後の失敗では返却しない
+        (APIの呼び出しが行われた可能性があるため)。
+        どのチャンネルでもクォータが足りない動画は、送信せずに
+        QuotaExceededError となる。再生リストへの追加と翻訳の設定は、
+        すべての動画のアップロード後にチャンネルごとのバッチリクエストで
+        実行し、UploadResult.actions に格納する。
+
+        Args:
+            configs (Iterable[YoutubeConfig]): アップロード設定情報のリスト
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、または "auto"）
+            on_progress (Callable[[int, UploadProgress], None] | None, optional):
+                入力リスト内での位置と進捗イベントを受け取るコールバック関数
+            progress_interval (float, optional): on_progress を呼び出す最小間隔 (秒)
+            pipeline_thumbnails (bool, optional): サムネイルをバックグラウンドで
+                アップロードし、チャンネルの枠をすぐに次の動画へ回すかどうか
+
+        Returns:
+            list[UploadResult]: 入力と同じ順序に並んだ、1件ごとの結果
+        """
+        configs = list(configs)
+        results: list[UploadResult | None] = [None] * len(configs)
+        thumbnails: list[Future[ThumbnailResult] | None] = [None] * len(configs)
+        futures: dict[int, Future[None]] = {}
+        max_workers = self._max_concurrency * len(self._channels)
+        logger.info(
+            f"{len(configs)} 件の動画を {len(self._channels)} チャンネルで"
+            "アップロードします..."
+        )
+
+        def run(index: int, config: YoutubeConfig, channel: _Channel) -> None:
+            tracker = ProgressTracker(
+                config.title,
+                (lambda event: on_progress(index, event)) if on_progress else None,
+                min_interval=progress_interval,
+                log_level=logging.DEBUG,
+            )
+            try:
+                result, thumbnails[index] = channel.uploader.upload_in_worker(
+                    index,
+                    config,
+                    tracker,
+                    chunksize,
+                    quota_reserved=True,
+                    thumbnail_executor=thumbnail_executor,
+                )
+                result.channel = channel.name
+                results[index] = result
+            finally:
+                with self._condition:
+                    channel.in_flight -= 1
+                    self._condition.notify_all()
+
+        thumbnail_executor = (
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="youtube-pool-thumbnail"
+            )
+            if pipeline_thumbnails
+            else None
+        )
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="youtube-pool"
+            ) as executor:
+                for index, config in enumerate(configs):
+                    try:
+                        uploaded = self._find_uploaded(index, config)
+                        channel = self._acquire(config) if uploaded is None else None
+                    except Exception as e:
+                        results[index] = UploadResult(
+                            index=index, title=config.title, error=e
+                        )
+                        continue
+                    if uploaded is not None:
+                        results[index] = uploaded
+                        continue
+
+                    if channel is None:
+                        results[index] = UploadResult(
+                            index=index,
+                            title=config.title,
+                            error=QuotaExceededError(
+                                "すべてのチャンネルでクォータが不足しているため、"
+                                f"'{config.title}' をアップロードできません。",
+                                resets_at=quota_resets_at(),
+                            ),
+                        )
+                        continue
+                    futures[index] = executor.submit(run, index, config, channel)
+        finally:
+            if thumbnail_executor is not None:
+                thumbnail_executor.shutdown(wait=True)
+
+        # ワーカーが結果を格納できずに終わった場合も、入力と同じ長さと順序を保つ
+        for index, config in enumerate(configs):
+            if results[index] is None:
+                future = futures.get(index)
+                error = future.exception() if future is not None else None
+                if not isinstance(error, Exception):
+                    # 例外がない場合と Exception 以外 (KeyboardInterrupt など) は
+                    # UploadError とする
+                    message = f"'{config.title}' の結果を取得できませんでした。"
+                    wrapped = UploadError(message)
+                    wrapped.__cause__ = error
+                    error = wrapped
+                results[index] = UploadResult(
+                    index=index, title=config.title, error=error
+                )
+        filled = [result for result in results if result is not None]
+
+        for result, thumbnail in zip(filled, thumbnails, strict=True):
+            YoutubeUploader.attach_thumbnail(result, thumbnail)
+
+        # 再生リストへの追加と翻訳は、チャンネルごとにバッチリクエストにまとめる
+        for name, channel in self._channels.items():
+            channel.uploader.apply_post_upload_actions(
+                (result, config)
+                for result, config in zip(filled, configs, strict=True)
+                if result.channel == name
+            )
+
+        succeeded = sum(result.ok for result in filled)
+        logger.info(
+            f"チャンネルプールでのアップロードが完了しました: 成功 {succeeded} 件 / "
+            f"失敗 {len(filled) - succeeded} 件"
+        )
+        return filled
+
+    def _find_uploaded(self, index: int, config: YoutubeConfig) -> UploadResult | None:
+        """いずれかのチャンネルにアップロード済みの動画であれば、その結果を返す
+
+        再実行したバッチが前回と別のチャンネルに振り分けられても、
+        同じ動画を二重にアップロードしないようにする。
+
+        Args:
+            index (int): 入力リスト内での位置
+            config (YoutubeConfig): アップロード設定情報
+
+        Returns:
+            UploadResult | None: アップロード済みの場合はその結果
+        """
+        for channel in self._channels.values():
+            try:
+                uploaded, _ = channel.uploader.find_uploaded(config)
+            except OSError:
+                # ファイルがない場合などは、アップロード時にエラーとして扱う
+                return None
+            if uploaded is not None:
+                return UploadResult(
+                    index=index,
+                    title=config.title,
+                    response=uploaded,
+                    channel=channel.name,
+                    duplicate=True,
+                    thumbnail=ThumbnailResult(
+                        video_id=uploaded["id"], status="skipped"
+                    ),
+                )
+        return None
+
+    def _acquire(self, config: YoutubeConfig) -> _Channel | None:
+        """同時実行数に空きのあるチャンネルで、クォータを確保する
+
+        空きのあるチャンネルがなければ、実行中のアップロードが終わるまで待つ。
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+
+        Returns:
+            _Channel | None: クォータを確保したチャンネル (どのチャンネルでも
+                クォータが足りない場合はNone)
+        """
+        cost = estimate_upload_cost(config)
+        with self._condition:
+            while True:
+                remaining = {
+                    channel.name: channel.uploader.remaining_quota()
+                    for channel in self._channels.values()
+                }
+                if all(units < cost for units in remaining.values()):
+                    return None
+
+                available = sorted(
+                    (
+                        channel
+                        for channel in self._channels.values()
+                        if channel.in_flight < self._max_concurrency
+                        and remaining[channel.name] >= cost
+                    ),
+                    key=lambda ch: (ch.in_flight, -remaining[ch.name]),
+                )
+                reserve_failed = False
+                for channel in available:
+                    try:
+                        channel.uploader.reserve_quota(upload_calls(config))
+                    except QuotaExceededError:
+                        # 他のプロセスが同じプロジェクトのクォータを消費した場合
+                        reserve_failed = True
+                        continue
+                    channel.in_flight += 1
+                    return channel
+
+                # 確保に失敗した場合は、実行中のアップロードがなく通知が来ない
+                # こともあるため、待たずに残りのクォータを読み直す
+                if reserve_failed:
+                    continue
+                self._condition.wait()
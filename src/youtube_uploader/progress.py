@@ -0,0 +1,197 @@
+"""progress
+
+アップロードの進捗を、送信バイト数・スループット・残り時間などを含む
+構造化されたイベントとして通知するためのモジュール
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+# アップロードの段階
+type UploadPhase = Literal["video", "thumbnail"]
+
+
+class UploadProgress(BaseModel):
+    """アップロードの進捗イベント
+
+    Args:
+        title (str): 動画のタイトル
+        phase (UploadPhase): アップロードの段階 ("video" または "thumbnail")
+        bytes_sent (int): 送信済みのバイト数
+        total_bytes (int): 送信するバイト数の合計
+        progress (float): 進捗率 (0.0 から 1.0)
+        instant_throughput (float): 直前のイベントからのスループット (バイト/秒)
+        smoothed_throughput (float): 平滑化したスループット (バイト/秒)
+        eta_seconds (float | None): 残り時間の推定秒数 (推定できない場合はNone)
+        elapsed_seconds (float): この段階の開始からの経過秒数
+        chunk_index (int): 完了したチャンクの数
+        last_chunk_seconds (float | None): 直前のチャンクの送信にかかった秒数
+        retry_count (int): このアップロードでの再試行回数
+    """
+
+    title: str = Field(..., description="動画のタイトル")
+    phase: UploadPhase = Field(..., description="アップロードの段階")
+    bytes_sent: int = Field(..., description="送信済みのバイト数")
+    total_bytes: int = Field(..., description="送信するバイト数の合計")
+    progress: float = Field(..., description="進捗率 (0.0 から 1.0)")
+    instant_throughput: float = Field(..., description="直近のスループット")
+    smoothed_throughput: float = Field(..., description="平滑化したスループット")
+    eta_seconds: float | None = Field(default=None, description="残り時間の推定")
+    elapsed_seconds: float = Field(..., description="段階の開始からの経過秒数")
+    chunk_index: int = Field(default=0, description="完了したチャンクの数")
+    last_chunk_seconds: float | None = Field(
+        default=None, description="直前のチャンクの送信秒数"
+    )
+    retry_count: int = Field(default=0, description="再試行回数")
+
+
+class ProgressTracker:
+    """1件のアップロードの進捗を集計し、間引きながらイベントを通知する
+
+    送信中は読み込みのたびに update() が呼ばれるが、イベントの通知は
+    min_interval 秒に1回までに制限するため、コールバックが重くても
+    アップロードのループを遅くしない。段階の開始と終了は必ず通知する。
+    """
+
+    def __init__(
+        self,
+        title: str,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+        min_interval: float = 0.5,
+        smoothing: float = 0.3,
+        log_level: int = logging.INFO,
+    ):
+        """
+        Args:
+            title (str): 動画のタイトル
+            on_progress (Callable[[UploadProgress], None] | None, optional):
+                進捗イベントを受け取るコールバック関数
+            progress_callback (Callable[[float], None] | None, optional):
+                チャンク完了ごとに進捗率を受け取る、従来形式のコールバック関数
+            min_interval (float, optional): 進捗イベントを通知する最小間隔 (秒)
+            smoothing (float, optional): スループットの指数移動平均の係数
+            log_level (int, optional): コールバックがない場合に、チャンクごとの
+                進捗を出力するログレベル (複数の動画を同時に送る場合は DEBUG)
+        """
+        self._title = title
+        self._on_progress = on_progress
+        self._progress_callback = progress_callback
+        self._min_interval = min_interval
+        self._smoothing = smoothing
+        self._log_level = log_level
+        self.retry_count = 0
+        self._begin("video", 0)
+
+    def _begin(self, phase: UploadPhase, total_bytes: int) -> None:
+        now = time.monotonic()
+        self._phase: UploadPhase = phase
+        self._total_bytes = total_bytes
+        self._bytes_sent = 0
+        self._started_at = now
+        self._last_emit_at = now
+        self._last_emit_bytes = 0
+        self._smoothed = 0.0
+        self._chunk_index = 0
+        self._last_chunk_seconds: float | None = None
+
+    def begin(self, phase: UploadPhase, total_bytes: int) -> None:
+        """新しい段階を開始し、開始イベントを通知する
+
+        Args:
+            phase (UploadPhase): アップロードの段階
+            total_bytes (int): この段階で送信するバイト数の合計
+        """
+        self._begin(phase, total_bytes)
+        self._emit(time.monotonic())
+
+    def update(self, bytes_sent: int) -> None:
+        """送信済みのバイト数を更新する (通知は間引かれる)
+
+        Args:
+            bytes_sent (int): 送信済みのバイト数
+        """
+        self._bytes_sent = bytes_sent
+        if self._on_progress is None:
+            return
+        now = time.monotonic()
+        if now - self._last_emit_at >= self._min_interval:
+            self._emit(now)
+
+    def chunk_done(self, bytes_sent: int, chunk_seconds: float) -> None:
+        """チャンクの送信完了を記録する
+
+        Args:
+            bytes_sent (int): サーバが受信済みと応答したバイト数
+            chunk_seconds (float): チャンクの送信にかかった秒数
+        """
+        self._chunk_index += 1
+        self._last_chunk_seconds = chunk_seconds
+        self.update(bytes_sent)
+
+        progress = self._progress()
+        if self._progress_callback:
+            self._progress_callback(progress)
+        elif self._on_progress is None:
+            # コールバックが指定されていない場合のみログに出力
+            logger.log(
+                self._log_level,
+                f"'{self._title}' のアップロード進捗: {int(progress * 100)}%",
+            )
+
+    def retried(self) -> None:
+        """再試行を記録する"""
+        self.retry_count += 1
+
+    def finish(self) -> None:
+        """現在の段階の完了イベントを通知する"""
+        self._bytes_sent = self._total_bytes
+        self._emit(time.monotonic())
+
+    def _progress(self) -> float:
+        if self._total_bytes <= 0:
+            return 1.0 if self._bytes_sent else 0.0
+        return min(self._bytes_sent / self._total_bytes, 1.0)
+
+    def _emit(self, now: float) -> None:
+        interval = now - self._last_emit_at
+        sent = self._bytes_sent - self._last_emit_bytes
+        instant = sent / interval if interval > 0 and sent > 0 else 0.0
+        if instant > 0:
+            self._smoothed = (
+                instant
+                if self._smoothed == 0
+                else self._smoothing * instant + (1 - self._smoothing) * self._smoothed
+            )
+        self._last_emit_at = now
+        self._last_emit_bytes = self._bytes_sent
+
+        if self._on_progress is None:
+            return
+
+        remaining = max(self._total_bytes - self._bytes_sent, 0)
+        eta = remaining / self._smoothed if self._smoothed > 0 else None
+        self._on_progress(
+            UploadProgress(
+                title=self._title,
+                phase=self._phase,
+                bytes_sent=self._bytes_sent,
+                total_bytes=self._total_bytes,
+                progress=self._progress(),
+                instant_throughput=instant,
+                smoothed_throughput=self._smoothed,
+                eta_seconds=0.0 if remaining == 0 else eta,
+                elapsed_seconds=now - self._started_at,
+                chunk_index=self._chunk_index,
+                last_chunk_seconds=self._last_chunk_seconds,
+                retry_count=self.retry_count,
+            )
+        )
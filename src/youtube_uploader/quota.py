@@ -0,0 +1,289 @@
+"""quota
+
+YouTube Data API のクォータ消費量を見積もり、ローカルに記録するためのモジュール
+
+クォータはプロジェクト (client_secret.json の project_id) ごとに、
+太平洋時間の0時にリセットされる。QuotaLedger で消費量を記録しておくことで、
+動画を送信する前にクォータの不足を検出できる。
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .exceptions import QuotaExceededError
+from .models import YoutubeConfig
+from .utils import atomic_write_text, file_lock
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# クォータの消費量を保存するファイル名 (token.json と同じディレクトリに置く)
+QUOTA_FILENAME = "quota_ledger.json"
+
+# 1日あたりのデフォルトのクォータ (プロジェクト単位)
+DEFAULT_DAILY_QUOTA = 10_000
+
+# クォータがリセットされるタイムゾーン
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# APIメソッドごとのクォータ消費量
+QUOTA_COSTS: dict[str, int] = {
+    "videos.insert": 1600,
+    "thumbnails.set": 50,
+    "playlistItems.insert": 50,
+    "videos.update": 50,
+}
+
+
+def upload_calls(config: YoutubeConfig) -> dict[str, int]:
+    """1件のアップロードで呼び出すAPIメソッドと、その消費量を返す
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        dict[str, int]: APIメソッド名と消費されるクォータの単位数
+    """
+    calls = {"videos.insert": QUOTA_COSTS["videos.insert"]}
+    if config.thumbnail_bytes is not None:
+        calls["thumbnails.set"] = QUOTA_COSTS["thumbnails.set"]
+    return calls
+
+
+def estimate_upload_cost(config: YoutubeConfig) -> int:
+    """1件のアップロードで消費されるクォータを見積もる
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        int: 消費されるクォータの単位数
+    """
+    return sum(upload_calls(config).values())
+
+
+def project_id_from_client_secrets(path: Path) -> str:
+    """client_secret.json から、クォータを共有するプロジェクトの識別子を取得する
+
+    Args:
+        path (Path): client_secret.json のパス
+
+    Returns:
+        str: project_id (なければ client_id のプロジェクト番号、
+            どちらも取得できない場合はファイルのパス)
+    """
+    try:
+        secrets = json.loads(path.read_text(encoding="utf-8"))
+        client = next(iter(secrets.values()))
+        if project_id := client.get("project_id"):
+            return str(project_id)
+        if client_id := client.get("client_id"):
+            return str(client_id).split("-", 1)[0]
+    except (OSError, ValueError, StopIteration, AttributeError) as e:
+        logger.warning(f"client_secret.json からプロジェクトを特定できません: {e}")
+    return str(path.expanduser().resolve())
+
+
+def quota_today() -> date:
+    """クォータの集計に使う、太平洋時間での今日の日付を返す"""
+    return datetime.now(QUOTA_TIMEZONE).date()
+
+
+def quota_resets_at() -> datetime:
+    """次にクォータがリセットされる日時 (太平洋時間の翌日0時) を返す"""
+    tomorrow = quota_today() + timedelta(days=1)
+    return datetime.combine(tomorrow, time(), tzinfo=QUOTA_TIMEZONE)
+
+
+class QuotaUsage(BaseModel):
+    """保存される1プロジェクト・1日分のクォータの消費量
+
+    Args:
+        day (date): 太平洋時間での日付
+        used (int): 消費したクォータの単位数
+        by_method (dict[str, int]): APIメソッドごとの消費量
+    """
+
+    day: date = Field(..., description="太平洋時間での日付")
+    used: int = Field(default=0, description="消費したクォータの単位数")
+    by_method: dict[str, int] = Field(
+        default_factory=dict, description="APIメソッドごとの消費量"
+    )
+
+
+class QuotaLedger:
+    """プロジェクトごとのクォータの消費量を JSON ファイルに記録する台帳
+
+    同じディレクトリのロックファイルでプロセス間の排他制御を行うため、
+    複数のプロセスが同じ台帳を使っても、残りクォータの確認と記録が
+    混ざることはない。書き込みは一時ファイルからの置き換えで行う。
+    同じプロジェクトを使う複数のチャンネルで1つの台帳を共有すると、
+    プロジェクト全体の消費量を正しく集計できる。
+    """
+
+    def __init__(self, path: Path, daily_quota: int = DEFAULT_DAILY_QUOTA):
+        """
+        Args:
+            path (Path): 消費量を保存する JSON ファイルのパス
+            daily_quota (int, optional): プロジェクトごとの1日あたりのクォータ
+        """
+        self._path = path
+        self._lock_path = path.with_name(f"{path.name}.lock")
+        self._daily_quota = daily_quota
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """消費量を保存するファイルのパス"""
+        return self._path
+
+    @property
+    def daily_quota(self) -> int:
+        """プロジェクトごとの1日あたりのクォータ"""
+        return self._daily_quota
+
+    def _read_all(self) -> dict[str, dict]:
+        if not self._path.exists():
+            return {}
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"クォータの記録を読み込めませんでした: {e}")
+            return {}
+
+    def _write_all(self, ledger: dict[str, dict]) -> None:
+        atomic_write_text(self._path, json.dumps(ledger, indent=2))
+
+    def _usage(self, ledger: dict[str, dict], project: str) -> QuotaUsage:
+        """今日の消費量を返す (日付が変わっていれば0から数え直す)"""
+        today = quota_today()
+        raw = ledger.get(project)
+        if raw is not None:
+            try:
+                usage = QuotaUsage.model_validate(raw)
+                if usage.day == today:
+                    return usage
+            except ValidationError as e:
+                logger.warning(f"保存されたクォータの記録が不正です: {e}")
+        return QuotaUsage(day=today)
+
+    def usage(self, project: str) -> QuotaUsage:
+        """プロジェクトの今日の消費量を返す
+
+        Args:
+            project (str): プロジェクトの識別子
+
+        Returns:
+            QuotaUsage: 今日の消費量
+        """
+        with self._lock:
+            return self._usage(self._read_all(), project)
+
+    def remaining(self, project: str) -> int:
+        """プロジェクトの今日の残りクォータを返す
+
+        Args:
+            project (str): プロジェクトの識別子
+
+        Returns:
+            int: 残りのクォータの単位数
+        """
+        return max(self._daily_quota - self.usage(project).used, 0)
+
+    def reserve(self, project: str, calls: Mapping[str, int]) -> None:
+        """残りクォータを確認し、足りていれば消費量として記録する
+
+        確認と記録を同じロックの中で行うため、並列のアップロードや
+        他のプロセスが同じ残りクォータを二重に使うことはない。
+
+        Args:
+            project (str): プロジェクトの識別子
+            calls (Mapping[str, int]): APIメソッド名と消費するクォータの単位数
+
+        Raises:
+            QuotaExceededError: 残りクォータが足りない場合
+        """
+        required = sum(calls.values())
+        with self._locked():
+            ledger = self._read_all()
+            usage = self._usage(ledger, project)
+            remaining = self._daily_quota - usage.used
+            if remaining < required:
+                resets_at = quota_resets_at()
+                raise QuotaExceededError(
+                    f"クォータが不足しています (必要: {required} / 残り: "
+                    f"{max(remaining, 0)})。{resets_at:%Y-%m-%d %H:%M %Z} に"
+                    "リセットされます。",
+                    resets_at=resets_at,
+                )
+            self._add(usage, calls)
+            ledger[project] = usage.model_dump(mode="json")
+            self._write_all(ledger)
+
+    def record(self, project: str, calls: Mapping[str, int]) -> None:
+        """残りクォータに関わらず、消費量を記録する
+
+        Args:
+            project (str): プロジェクトの識別子
+            calls (Mapping[str, int]): APIメソッド名と消費したクォータの単位数
+        """
+        with self._locked():
+            ledger = self._read_all()
+            usage = self._usage(ledger, project)
+            self._add(usage, calls)
+            ledger[project] = usage.model_dump(mode="json")
+            self._write_all(ledger)
+
+    def exhaust(self, project: str) -> None:
+        """APIからクォータ超過が返された場合に、今日の残りを0として記録する
+
+        Args:
+            project (str): プロジェクトの識別子
+        """
+        with self._locked():
+            ledger = self._read_all()
+            usage = self._usage(ledger, project)
+            usage.used = max(usage.used, self._daily_quota)
+            ledger[project] = usage.model_dump(mode="json")
+            self._write_all(ledger)
+
+    def refund(self, project: str, calls: Mapping[str, int]) -> None:
+        """確保したものの、APIを呼び出さなかった分を返却する
+
+        Args:
+            project (str): プロジェクトの識別子
+            calls (Mapping[str, int]): APIメソッド名と返却するクォータの単位数
+        """
+        if not calls:
+            return
+        with self._locked():
+            ledger = self._read_all()
+            usage = self._usage(ledger, project)
+            for method, units in calls.items():
+                recorded = usage.by_method.pop(method, 0)
+                units = min(units, recorded)
+                usage.used -= units
+                if recorded > units:
+                    usage.by_method[method] = recorded - units
+            ledger[project] = usage.model_dump(mode="json")
+            self._write_all(ledger)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """スレッド間とプロセス間の両方で、台帳の読み書きを排他にする"""
+        with self._lock, file_lock(self._lock_path):
+            yield
+
+    @staticmethod
+    def _add(usage: QuotaUsage, calls: Mapping[str, int]) -> None:
+        for method, units in calls.items():
+            usage.used += units
+            usage.by_method[method] = usage.by_method.get(method, 0) + units
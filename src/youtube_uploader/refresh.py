@@ -0,0 +1,276 @@
+"""refresh
+
+アクセストークンの有効期限が切れる前に、バックグラウンドでリフレッシュするためのモジュール
+
+google-auth は、期限切れのトークンを API リクエストの直前に同期的に
+リフレッシュする。長時間の一括アップロードでは、これがチャンクの送信を
+待たせたり、リフレッシュの失敗がアップロードの失敗になったりする。
+
+TokenRefresher は、有効期限の margin 秒前に専用のスレッドでトークンを
+リフレッシュし、token.json へ原子的に保存する。リフレッシュは認証情報の
+複製に対して行い、成功した場合だけアクセストークンと有効期限を
+共有の認証情報へ入れ替える。他のプロセスが先にリフレッシュしていた場合は、
+token.json のトークンを使う。APIサービスや接続プールは同じ認証情報の
+オブジェクトを参照しているため、構築済みのサービスを作り直さずに
+新しいトークンが使われる。
+
+リフレッシュトークンが更新された場合も共有の認証情報には書き込まず
+(google-auth に公開のセッターがない)、更新後の認証情報を次回の
+リフレッシュ元として保持し、token.json に保存する。
+"""
+
+import copy
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .exceptions import AuthError
+from .instrumentation import SPAN_REFRESH_TOKEN, Instrumentation
+from .token_store import TokenStore, seconds_until_expiry
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+# 有効期限の何秒前にリフレッシュするかの既定値
+# (google-auth が同期的にリフレッシュを始める3分45秒前より早くする)
+DEFAULT_REFRESH_MARGIN = 300.0
+
+
+class TokenRefresher:
+    """アクセストークンを有効期限の前にバックグラウンドでリフレッシュする
+
+    リフレッシュに失敗した場合は、retry_delay 秒から倍々に間隔を空けて
+    再試行する。有効期限までに成功しなかった場合は、google-auth による
+    同期的なリフレッシュに任せる。
+
+    Examples:
+        refresher = TokenRefresher(credentials, token_path, margin=600)
+        refresher.start()
+        ...
+        refresher.stop()
+    """
+
+    def __init__(
+        self,
+        credentials: "Credentials",
+        token_path: Path,
+        margin: float = DEFAULT_REFRESH_MARGIN,
+        retry_delay: float = 30.0,
+        instrumentation: Instrumentation | None = None,
+    ):
+        """
+        Args:
+            credentials (Credentials): リフレッシュする、共有の認証情報
+            token_path (Path): リフレッシュしたトークンを保存する token.json のパス
+            margin (float, optional): 有効期限の何秒前にリフレッシュするか
+            retry_delay (float, optional): リフレッシュに失敗した場合に
+                再試行するまでの初回の待ち時間 (秒)
+            instrumentation (Instrumentation | None, optional): リフレッシュの
+                所要時間の通知先
+
+        Raises:
+            ValueError: 引数の値が不正な場合
+        """
+        if margin < 0:
+            raise ValueError("margin は0以上を指定してください。")
+        if retry_delay <= 0:
+            raise ValueError("retry_delay は0より大きい値を指定してください。")
+        self._credentials = credentials
+        # 次回のリフレッシュに使う、最新のリフレッシュトークンを持つ認証情報
+        self._source = credentials
+        self._store = TokenStore(token_path)
+        self._margin = margin
+        self._retry_delay = retry_delay
+        self._instrumentation = instrumentation or Instrumentation()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_refreshed_at: datetime | None = None
+        self.last_error: Exception | None = None
+
+    @property
+    def credentials(self) -> "Credentials":
+        """リフレッシュの対象の認証情報"""
+        return self._credentials
+
+    @property
+    def running(self) -> bool:
+        """バックグラウンドのスレッドが動作中かどうか"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def seconds_until_refresh(self) -> float:
+        """次にリフレッシュするまでの秒数 (有効期限が不明な場合は0)"""
+        remaining = seconds_until_expiry(self._credentials)
+        if remaining is None:
+            return 0.0
+        return max(remaining - self._margin, 0.0)
+
+    def start(self) -> None:
+        """バックグラウンドでのリフレッシュを開始する (開始済みの場合は何もしない)"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="youtube-token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """バックグラウンドでのリフレッシュを停止する
+
+        Args:
+            timeout (float | None, optional): スレッドの終了を待つ最大秒数
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def refresh_now(self) -> None:
+        """トークンを今すぐリフレッシュし、共有の認証情報と token.json を更新する
+
+        Raises:
+            AuthError: リフレッシュまたは token.json の保存に失敗した場合
+        """
+        from google.auth.transport.requests import Request
+
+        with (
+            self._lock,
+            self._instrumentation.phase(SPAN_REFRESH_TOKEN),
+            self._store.lock(),
+        ):
+            live = self._credentials
+            fresh = self._load_refreshed()
+            refreshed = fresh is None
+            if fresh is None:
+                try:
+                    # 失敗しても共有の認証情報が変わらないよう、複製をリフレッシュする
+                    fresh = copy.copy(self._source)
+                    fresh.refresh(Request())
+                except Exception as e:
+                    raise AuthError(f"トークンのリフレッシュに失敗しました: {e}") from e
+
+            # 他のスレッドは token と expiry を個別に読むが、
+            # 入れ替えの途中でもどちらのトークンも有効期限内のため問題ない
+            live.token = fresh.token
+            live.expiry = fresh.expiry
+            self._source = fresh
+
+            if refreshed:
+                try:
+                    # 更新されたリフレッシュトークンを含めて保存する
+                    self._store.save(fresh)
+                except OSError as e:
+                    raise AuthError(
+                        f"リフレッシュしたトークンを保存できませんでした: {e}"
+                    ) from e
+
+        self.last_refreshed_at = datetime.now(UTC)
+        self.last_error = None
+        if refreshed:
+            logger.info(
+                f"アクセストークンをリフレッシュしました (有効期限: {live.expiry} UTC)"
+            )
+        else:
+            logger.info(
+                "他のプロセスがリフレッシュしたトークンを使用します "
+                f"(有効期限: {live.expiry} UTC)"
+            )
+
+    def _load_refreshed(self) -> "Credentials | None":
+        """他のプロセスがリフレッシュ済みであれば、token.json の認証情報を返す"""
+        stored = self._store.load()
+        if (
+            stored is None
+            or not stored.token
+            or stored.token == self._credentials.token
+        ):
+            return None
+        remaining = seconds_until_expiry(stored)
+        if remaining is None or remaining <= self._margin:
+            return None
+        return stored
+
+    def _run(self) -> None:
+        failures = 0
+        delay = self.seconds_until_refresh()
+        while not self._stop.wait(delay):
+            try:
+                self.refresh_now()
+            except AuthError as e:
+                self.last_error = e
+                failures += 1
+                delay = self._retry_delay * 2 ** (failures - 1)
+                logger.warning(f"{e} - {delay:.0f} 秒後に再試行します。")
+                continue
+
+            failures = 0
+            if self._credentials.expiry is None:
+                logger.warning(
+                    "有効期限のない認証情報のため、"
+                    "バックグラウンドでのリフレッシュを終了します。"
+                )
+                return
+            # 有効期限が margin より短い場合も、連続してリフレッシュしない
+            delay = max(self.seconds_until_refresh(), self._retry_delay)
+
+
+_refreshers_lock = threading.Lock()
+_refreshers: dict[Path, TokenRefresher] = {}
+
+
+def start_token_refresher(
+    credentials: "Credentials",
+    token_path: Path,
+    margin: float = DEFAULT_REFRESH_MARGIN,
+    instrumentation: Instrumentation | None = None,
+) -> TokenRefresher:
+    """token.json ごとに1つのバックグラウンドのリフレッシュを開始する
+
+    同じ token.json の認証情報はプロセス内で共有されるため、同じ認証情報に
+    対して実行中のものがあればそれを返す。認証情報が読み直されていた場合は、
+    古い認証情報のリフレッシュを停止して、新しいものを開始する。
+
+    Args:
+        credentials (Credentials): リフレッシュする認証情報
+        token_path (Path): token.json のパス
+        margin (float, optional): 有効期限の何秒前にリフレッシュするか
+        instrumentation (Instrumentation | None, optional): 所要時間の通知先
+
+    Returns:
+        TokenRefresher: 実行中のリフレッシュ
+    """
+    key = token_path.expanduser().resolve()
+    with _refreshers_lock:
+        refresher = _refreshers.get(key)
+        if refresher is not None and refresher.running:
+            if refresher.credentials is credentials:
+                return refresher
+            refresher.stop(timeout=0)
+        refresher = TokenRefresher(
+            credentials, key, margin=margin, instrumentation=instrumentation
+        )
+        refresher.start()
+        _refreshers[key] = refresher
+        return refresher
+
+
+def stop_token_refreshers(timeout: float | None = None) -> None:
+    """start_token_refresher() で開始したすべてのリフレッシュを停止する
+
+    Args:
+        timeout (float | None, optional): スレッドごとの終了を待つ最大秒数
+    """
+    with _refreshers_lock:
+        refreshers = list(_refreshers.values())
+        _refreshers.clear()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for refresher in refreshers:
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        refresher.stop(remaining)
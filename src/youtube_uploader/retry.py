@@ -0,0 +1,242 @@
+"""retry
+
+アップロード中の一時的なエラーに対する再試行ポリシーを定義するモジュール
+
+指数バックオフ (full jitter) で待機しながら、同じ処理を再実行する。
+再開可能アップロードでは、再試行時にサーバが受信済みのバイト数を
+問い合わせるため、最初から送り直すことはない。
+"""
+
+import asyncio
+import http.client
+import random
+import ssl
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from googleapiclient.errors import HttpError  # type: ignore
+from pydantic import BaseModel, Field
+
+# 再試行の対象とする通信レベルの例外
+# (httplib2.HttpLib2Error も対象とするが、読み込みを遅らせるため
+# is_retryable() の中で判定する)
+RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    ssl.SSLError,
+    http.client.HTTPException,
+)
+
+# RETRYABLE_EXCEPTIONS のサブクラスのうち、再試行しても解決しない例外
+# (証明書の検証エラーは ssl.SSLError のサブクラス)
+NON_RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ssl.SSLCertVerificationError,
+)
+
+
+class RetryPolicy(BaseModel):
+    """一時的なエラーに対する再試行ポリシー
+
+    Args:
+        max_attempts (int, optional): 1回の処理 (1チャンクなど) あたりの最大試行回数
+            (初回を含む)。1の場合は再試行しない。
+        backoff_base (float, optional): バックオフの基準秒数
+        backoff_cap (float, optional): バックオフの上限秒数
+        retryable_statuses (frozenset[int], optional): 再試行するHTTPステータス
+    """
+
+    max_attempts: int = Field(default=5, ge=1, description="最大試行回数 (初回を含む)")
+    backoff_base: float = Field(default=1.0, gt=0, description="バックオフの基準秒数")
+    backoff_cap: float = Field(default=60.0, gt=0, description="バックオフの上限秒数")
+    retryable_statuses: frozenset[int] = Field(
+        default=frozenset({408, 429, 500, 502, 503, 504}),
+        description="再試行するHTTPステータスコード",
+    )
+
+    def compute_delay(self, retry_number: int) -> float:
+        """再試行までの待機秒数を計算する (full jitter)
+
+        Args:
+            retry_number (int): 何回目の再試行か (1始まり)
+
+        Returns:
+            float: 0 から min(cap, base * 2 ** (retry_number - 1)) の一様乱数
+        """
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (retry_number - 1))
+        return random.uniform(0, ceiling)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """例外が再試行の対象かどうかを判定する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            bool: 再試行の対象であればTrue
+        """
+        if isinstance(error, HttpError):
+            return error.resp.status in self.retryable_statuses
+        if isinstance(error, NON_RETRYABLE_EXCEPTIONS):
+            return False
+        if isinstance(error, RETRYABLE_EXCEPTIONS):
+            return True
+        # httplib2 の例外は、httplib2 で通信した場合にしか発生しない
+        httplib2 = sys.modules.get("httplib2")
+        return httplib2 is not None and isinstance(error, httplib2.HttpLib2Error)
+
+
+class RetryEvent(BaseModel):
+    """1回の再試行の記録
+
+    Args:
+        retry_number (int): 何回目の再試行か (1始まり)
+        delay (float): 再試行までに待機した秒数
+        error (str): 再試行の原因となったエラー
+        status (int | None): HTTPステータスコード (通信エラーの場合はNone)
+    """
+
+    retry_number: int = Field(..., description="何回目の再試行か (1始まり)")
+    delay: float = Field(..., description="待機した秒数")
+    error: str = Field(..., description="再試行の原因となったエラー")
+    status: int | None = Field(default=None, description="HTTPステータスコード")
+
+
+class RetryStats(BaseModel):
+    """再試行の累計 (監視用)
+
+    Args:
+        retries (int): 再試行の合計回数
+        total_delay (float): 再試行の待機時間の合計秒数
+        by_status (dict[str, int]): 原因ごとの再試行回数
+            (HTTPステータスコード、または例外クラス名がキー)
+        last_event (RetryEvent | None): 直近の再試行
+    """
+
+    retries: int = Field(default=0, description="再試行の合計回数")
+    total_delay: float = Field(default=0.0, description="待機時間の合計秒数")
+    by_status: dict[str, int] = Field(
+        default_factory=dict, description="原因ごとの再試行回数"
+    )
+    last_event: RetryEvent | None = Field(default=None, description="直近の再試行")
+
+    def record(self, event: RetryEvent, error: BaseException) -> None:
+        """再試行を累計に加える
+
+        Args:
+            event (RetryEvent): 再試行の記録
+            error (BaseException): 再試行の原因となった例外
+        """
+        key = retry_reason(event, error)
+        self.retries += 1
+        self.total_delay += event.delay
+        self.by_status[key] = self.by_status.get(key, 0) + 1
+        self.last_event = event
+
+
+def retry_reason(event: RetryEvent, error: BaseException) -> str:
+    """再試行の原因を、HTTPステータスコードまたは例外クラス名で返す
+
+    Args:
+        event (RetryEvent): 再試行の記録
+        error (BaseException): 再試行の原因となった例外
+
+    Returns:
+        str: "503" や "ConnectionResetError" などの文字列
+    """
+    return str(event.status) if event.status is not None else type(error).__name__
+
+
+def _next_retry(
+    policy: RetryPolicy,
+    attempt: int,
+    error: Exception,
+    on_retry: Callable[[RetryEvent, BaseException], None] | None,
+) -> RetryEvent:
+    """失敗した試行を再試行するかを判定し、再試行する場合はその記録を返す
+
+    call_with_retry() と call_with_retry_async() で共有する。
+
+    Args:
+        policy (RetryPolicy): 再試行ポリシー
+        attempt (int): 失敗した試行が何回目か (1始まり)
+        error (Exception): 発生した例外
+        on_retry (Callable[[RetryEvent, BaseException], None] | None):
+            再試行の直前に呼ばれるコールバック
+
+    Returns:
+        RetryEvent: 再試行の記録 (待機秒数を含む)
+
+    Raises:
+        Exception: 再試行の対象外のエラー、または最大試行回数に達した場合は error
+    """
+    if attempt >= policy.max_attempts or not policy.is_retryable(error):
+        raise error
+    status = error.resp.status if isinstance(error, HttpError) else None
+    event = RetryEvent(
+        retry_number=attempt,
+        delay=policy.compute_delay(attempt),
+        error=str(error),
+        status=status,
+    )
+    if on_retry is not None:
+        on_retry(event, error)
+    return event
+
+
+def call_with_retry[T](
+    func: Callable[[], T],
+    policy: RetryPolicy,
+    on_retry: Callable[[RetryEvent, BaseException], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """ポリシーに従って、一時的なエラーの間は func を再実行する
+
+    Args:
+        func (Callable[[], T]): 実行する処理
+        policy (RetryPolicy): 再試行ポリシー
+        on_retry (Callable[[RetryEvent, BaseException], None] | None, optional):
+            再試行の直前に呼ばれるコールバック
+        sleep (Callable[[float], None], optional): 待機に使う関数
+
+    Returns:
+        T: func の戻り値
+
+    Raises:
+        BaseException: 再試行の対象外のエラー、または最大試行回数に達した場合の
+            最後のエラー
+    """
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            event = _next_retry(policy, attempt, e, on_retry)
+            sleep(event.delay)
+            attempt += 1
+
+
+async def call_with_retry_async[T](
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    on_retry: Callable[[RetryEvent, BaseException], None] | None = None,
+) -> T:
+    """call_with_retry() の asyncio 版 (待機中もイベントループを止めない)
+
+    Args:
+        func (Callable[[], Awaitable[T]]): 実行するコルーチン関数
+        policy (RetryPolicy): 再試行ポリシー
+        on_retry (Callable[[RetryEvent, BaseException], None] | None, optional):
+            再試行の直前に呼ばれるコールバック
+
+    Returns:
+        T: func の戻り値
+    """
+    attempt = 1
+    while True:
+        try:
+            return await func()
+        except Exception as e:
+            event = _next_retry(policy, attempt, e, on_retry)
+            await asyncio.sleep(event.delay)
+            attempt += 1
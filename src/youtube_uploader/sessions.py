@@ -0,0 +1,144 @@
+"""sessions
+
+再開可能アップロード (resumable upload) のセッション情報を
+ローカルに永続化するためのモジュール
+
+プロセスが途中で終了しても、保存されたセッションURIとオフセットから
+resume_upload() でアップロードを再開できる。
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .media import source_identity
+from .models import YoutubeConfig, upload_metadata
+from .utils import atomic_write_text, file_lock
+
+# セッション情報を保存するファイル名 (token.json と同じディレクトリに置く)
+SESSIONS_FILENAME = "upload_sessions.json"
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class UploadSession(BaseModel):
+    """保存される再開可能アップロードのセッション情報
+
+    Args:
+        fingerprint (str): 対象の設定とソースを識別するフィンガープリント
+        resumable_uri (str): YouTube が発行したアップロードセッションのURI
+        offset (int): サーバが受信済みと応答したバイト数
+        total_size (int): 動画全体のバイト数
+        updated_at (datetime): 最終更新日時 (UTC)
+    """
+
+    fingerprint: str = Field(..., description="設定とソースのフィンガープリント")
+    resumable_uri: str = Field(..., description="アップロードセッションのURI")
+    offset: int = Field(default=0, description="サーバが受信済みのバイト数")
+    total_size: int = Field(..., description="動画全体のバイト数")
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="最終更新日時"
+    )
+
+
+def config_fingerprint(config: YoutubeConfig) -> str:
+    """設定のメタデータと動画ソースから、アップロードを識別するハッシュを計算
+
+    動画ソースは source_identity() で識別するため、video_bytes の場合も
+    内容全体はハッシュしない。ファイルが書き換えられた場合は
+    別のアップロードとして扱われる。
+
+    Args:
+        config (YoutubeConfig): アップロード設定情報
+
+    Returns:
+        str: SHA-256 の16進文字列
+    """
+    digest = hashlib.sha256()
+    metadata = upload_metadata(config)
+    digest.update(json.dumps(metadata, sort_keys=True).encode())
+    digest.update(source_identity(config).encode())
+    return digest.hexdigest()
+
+
+class UploadSessionStore:
+    """再開可能アップロードのセッション情報を JSON ファイルに保存するストア
+
+    TokenStore と同様に、同じディレクトリのロックファイルでプロセス間の
+    排他制御を行い、読み込みから書き込みまでの間に他のプロセスの更新が
+    失われないようにする。書き込みは一時ファイルからの置き換えで行う。
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): セッション情報を保存する JSON ファイルのパス
+        """
+        self._path = path
+        self._lock_path = path.with_name(f"{path.name}.lock")
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """セッション情報を保存するファイルのパス"""
+        return self._path
+
+    def _read_all(self) -> dict[str, dict]:
+        if not self._path.exists():
+            return {}
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"セッションファイルを読み込めませんでした: {e}")
+            return {}
+
+    def _write_all(self, sessions: dict[str, dict]) -> None:
+        atomic_write_text(self._path, json.dumps(sessions, indent=2))
+
+    def load(self, fingerprint: str) -> UploadSession | None:
+        """フィンガープリントに対応するセッションを取得する
+
+        Args:
+            fingerprint (str): config_fingerprint() で計算した値
+
+        Returns:
+            UploadSession | None: 保存済みのセッション (なければNone)
+        """
+        with self._lock:
+            raw = self._read_all().get(fingerprint)
+        if raw is None:
+            return None
+        try:
+            return UploadSession.model_validate(raw)
+        except ValidationError as e:
+            logger.warning(f"保存されたセッション情報が不正です: {e}")
+            return None
+
+    def save(self, session: UploadSession) -> None:
+        """セッションを保存 (既存のものは上書き) する
+
+        Args:
+            session (UploadSession): 保存するセッション
+        """
+        session.updated_at = datetime.now(UTC)
+        with self._lock, file_lock(self._lock_path):
+            sessions = self._read_all()
+            sessions[session.fingerprint] = session.model_dump(mode="json")
+            self._write_all(sessions)
+
+    def delete(self, fingerprint: str) -> None:
+        """セッションを削除する
+
+        Args:
+            fingerprint (str): 削除するセッションのフィンガープリント
+        """
+        with self._lock, file_lock(self._lock_path):
+            sessions = self._read_all()
+            if sessions.pop(fingerprint, None) is not None:
+                self._write_all(sessions)
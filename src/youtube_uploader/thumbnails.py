@@ -0,0 +1,277 @@
+"""thumbnails
+
+サムネイル画像を動画の送信前に検証・正規化するためのモジュール
+
+YouTube はサムネイルを 2MB まで、推奨 1280x720 (幅 640 以上) で受け付ける。
+サイズの超過は動画の送信が終わった後の thumbnails().set で初めて
+エラーになるため、送信前に検証し、必要なら JPEG に再エンコードする。
+同じテンプレートのサムネイルを大量の動画で使い回す場合に備え、
+正規化の結果は内容のハッシュをキーにキャッシュする。
+
+Note:
+    JPEG への再エンコードと解像度の検証には Pillow が必要です。
+    poetry install --extras thumbnails
+    Pillow がない場合は、バイト数と MIME タイプの検証のみ行います。
+"""
+
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .exceptions import UploadError
+from .models import YoutubeConfig
+from .utils import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+@cache
+def _load_pillow() -> "ModuleType | None":
+    """Pillow の Image モジュールを読み込む (初回のみ、未インストールならNone)
+
+    Pillow の読み込みには時間がかかるため、最初の正規化の時点で読み込む。
+    """
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - Pillow は任意の依存関係
+        return None
+    return Image
+
+
+# thumbnails().set が受け付ける最大のバイト数
+MAX_THUMBNAIL_BYTES = 2 * 1024 * 1024
+
+# 推奨の最大解像度と、最小の幅
+MAX_THUMBNAIL_SIZE = (1280, 720)
+MIN_THUMBNAIL_WIDTH = 640
+
+# そのまま送信できる MIME タイプ
+ACCEPTED_MIMETYPES = frozenset({"image/jpeg", "image/png"})
+
+# 再エンコードで試す JPEG 品質の下限
+_MIN_JPEG_QUALITY = 40
+
+
+type Thumbnail = tuple[bytes, str]
+
+
+class ThumbnailProcessor:
+    """サムネイルの検証・正規化と、その結果のキャッシュ
+
+    スレッドセーフで、1つのインスタンスを複数のアップローダーで共有できる。
+
+    Examples:
+        processor = ThumbnailProcessor(cache_dir=Path("~/.cache/thumbnails"))
+        uploader = YoutubeUploader(auth_path, thumbnail_processor=processor)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = MAX_THUMBNAIL_BYTES,
+        max_size: tuple[int, int] = MAX_THUMBNAIL_SIZE,
+        min_width: int = MIN_THUMBNAIL_WIDTH,
+        quality: int = 90,
+        cache_size: int = 128,
+        cache_dir: Path | None = None,
+    ):
+        """
+        Args:
+            max_bytes (int, optional): 送信するサムネイルの最大バイト数
+            max_size (tuple[int, int], optional): 最大の解像度 (幅, 高さ)
+                超える場合は縦横比を保って縮小する
+            min_width (int, optional): 受け付ける最小の幅
+            quality (int, optional): 再エンコード時の JPEG 品質の初期値
+                max_bytes に収まるまで品質を下げて再試行する
+            cache_size (int, optional): メモリに保持する正規化結果の件数
+            cache_dir (Path | None, optional): 正規化結果を保存するディレクトリ
+                指定するとプロセスをまたいでキャッシュを再利用できる
+        """
+        self._max_bytes = max_bytes
+        self._max_size = max_size
+        self._min_width = min_width
+        self._quality = quality
+        self._cache_size = cache_size
+        self._cache_dir = cache_dir.expanduser() if cache_dir is not None else None
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, Thumbnail] = OrderedDict()
+        # 不変な bytes は、同じオブジェクトであればハッシュ計算も省略する
+        self._by_identity: dict[int, tuple[bytes, Thumbnail]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def apply(self, config: YoutubeConfig) -> YoutubeConfig:
+        """設定のサムネイルを正規化した設定を返す
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+
+        Returns:
+            YoutubeConfig: サムネイルを正規化した設定 (変更がなければ元の設定)
+
+        Raises:
+            UploadError: サムネイルが条件を満たさず、正規化もできない場合
+        """
+        if config.thumbnail_bytes is None or config.thumbnail_mimetype is None:
+            return config
+
+        data, mimetype = self.process(config.thumbnail_bytes, config.thumbnail_mimetype)
+        if data is config.thumbnail_bytes and mimetype == config.thumbnail_mimetype:
+            return config
+        return config.model_copy(
+            update={"thumbnail_bytes": data, "thumbnail_mimetype": mimetype}
+        )
+
+    def process(self, data: bytes | bytearray | memoryview, mimetype: str) -> Thumbnail:
+        """サムネイルを検証し、必要であれば再エンコードする
+
+        Args:
+            data (bytes | bytearray | memoryview): サムネイル画像のバイナリ
+            mimetype (str): サムネイル画像の MIME タイプ
+
+        Returns:
+            Thumbnail: 送信する (バイナリ, MIME タイプ)
+
+        Raises:
+            UploadError: サムネイルが条件を満たさず、正規化もできない場合
+        """
+        if isinstance(data, bytes):
+            with self._lock:
+                entry = self._by_identity.get(id(data))
+                if entry is not None and entry[0] is data:
+                    self.hits += 1
+                    return entry[1]
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            cached = self._cache.get(digest)
+            if cached is not None:
+                self._cache.move_to_end(digest)
+                self.hits += 1
+                self._remember_identity(data, cached)
+                return cached
+
+        result = self._load_from_disk(digest)
+        if result is None:
+            result = self._normalize(data, mimetype)
+            self._save_to_disk(digest, result)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[digest] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            self._remember_identity(data, result)
+        return result
+
+    def _remember_identity(
+        self, data: bytes | bytearray | memoryview, result: Thumbnail
+    ) -> None:
+        """bytes のオブジェクトと正規化結果を対応付ける (ロック内で呼ぶ)"""
+        if not isinstance(data, bytes):
+            return
+        # オブジェクトへの参照を保持するため、id が再利用されることはない
+        self._by_identity[id(data)] = (data, result)
+        if len(self._by_identity) > self._cache_size:
+            del self._by_identity[next(iter(self._by_identity))]
+
+    def _normalize(
+        self, data: bytes | bytearray | memoryview, mimetype: str
+    ) -> Thumbnail:
+        """サムネイルを検証し、必要であれば JPEG に再エンコードする"""
+        source = bytes(data)
+
+        Image = _load_pillow()
+        if Image is None:
+            if mimetype in ACCEPTED_MIMETYPES and len(source) <= self._max_bytes:
+                return source, mimetype
+            raise UploadError(
+                f"サムネイルは {self._max_bytes} バイト以下の JPEG または PNG である"
+                "必要があります。自動で変換するには Pillow をインストールしてください。"
+                "`poetry install --extras thumbnails`"
+            )
+
+        try:
+            image = Image.open(io.BytesIO(source))
+            image.load()
+        except (OSError, Image.DecompressionBombError) as e:
+            raise UploadError(f"サムネイル画像を読み込めません: {e}") from e
+
+        width, height = image.size
+        if width < self._min_width:
+            raise UploadError(
+                f"サムネイルの幅は {self._min_width}px 以上である必要があります "
+                f"(指定された画像: {width}x{height})"
+            )
+
+        max_width, max_height = self._max_size
+        actual_mimetype = Image.MIME.get(image.format or "", "")
+        if (
+            actual_mimetype in ACCEPTED_MIMETYPES
+            and len(source) <= self._max_bytes
+            and width <= max_width
+            and height <= max_height
+        ):
+            return source, actual_mimetype
+
+        # 縦横比を保ったまま縮小し、バイト数に収まるまで品質を下げて再エンコード
+        image = image.convert("RGB")
+        image.thumbnail(self._max_size, Image.Resampling.LANCZOS)
+        for quality in range(self._quality, _MIN_JPEG_QUALITY - 1, -10):
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=quality, optimize=True)
+            if buffer.tell() <= self._max_bytes:
+                logger.info(
+                    f"サムネイルを JPEG に変換しました ({width}x{height} → "
+                    f"{image.width}x{image.height}, {len(source)} → "
+                    f"{buffer.tell()} バイト, 品質 {quality})"
+                )
+                return buffer.getvalue(), "image/jpeg"
+
+        raise UploadError(
+            f"サムネイルを {self._max_bytes} バイト以下に変換できませんでした。"
+        )
+
+    def _disk_path(self, digest: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        # 設定が異なれば正規化の結果も異なるため、キーに含める
+        max_width, max_height = self._max_size
+        settings = f"{self._max_bytes}-{max_width}x{max_height}-{self._quality}"
+        return self._cache_dir / f"{digest}-{settings}"
+
+    def _load_from_disk(self, digest: str) -> Thumbnail | None:
+        path = self._disk_path(digest)
+        if path is None:
+            return None
+        for suffix, mimetype in ((".jpg", "image/jpeg"), (".png", "image/png")):
+            candidate = path.with_name(path.name + suffix)
+            try:
+                return candidate.read_bytes(), mimetype
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"サムネイルのキャッシュを読み込めませんでした: {e}")
+                return None
+        return None
+
+    def _save_to_disk(self, digest: str, result: Thumbnail) -> None:
+        path = self._disk_path(digest)
+        if path is None:
+            return
+        data, mimetype = result
+        suffix = ".png" if mimetype == "image/png" else ".jpg"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path.with_name(path.name + suffix), data)
+        except OSError as e:
+            logger.warning(f"サムネイルのキャッシュを保存できませんでした: {e}")
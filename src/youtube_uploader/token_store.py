@@ -0,0 +1,149 @@
+"""token_store
+
+token.json を複数のプロセスから安全に読み書きするためのモジュール
+
+同じ認証ディレクトリを複数のワーカープロセスで使う場合、各プロセスが
+同時にトークンをリフレッシュして token.json を書き込むと、書きかけの
+ファイルを他のプロセスが読み、破損したトークンとして再認証に進んでしまう。
+
+TokenStore は、token.json と同じディレクトリのロックファイルでプロセス間の
+排他制御を行い、token.json を一時ファイルへの書き込みと置き換えで更新する。
+ロックの中で token.json を読み直してからリフレッシュするため、
+有効期限ごとのリフレッシュは最初にロックを取得した1プロセスだけが行い、
+他のプロセスはリフレッシュ済みのトークンを読み込む。
+"""
+
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .exceptions import AuthError
+from .utils import atomic_write_text, file_lock
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.INFO)
+
+
+class TokenStore:
+    """token.json の読み込み・保存と、プロセス間のロックを提供する
+
+    Examples:
+        store = TokenStore(Path("~/.secrets/my_account/token.json"))
+        with store.lock():
+            credentials = store.load(SCOPES)
+            if credentials is not None and not credentials.valid:
+                credentials.refresh(Request())
+                store.save(credentials)
+    """
+
+    def __init__(self, path: Path, lock_timeout: float | None = 300.0):
+        """
+        Args:
+            path (Path): token.json のパス
+            lock_timeout (float | None, optional): ロックを待つ最大秒数
+                (初回のブラウザ認証中は他のプロセスが待つため、長めにする)
+                Noneの場合は取得できるまで待ち続ける
+        """
+        self._path = path.expanduser()
+        self._lock_path = self._path.with_name(f"{self._path.name}.lock")
+        self._lock_timeout = lock_timeout
+
+    @property
+    def path(self) -> Path:
+        """token.json のパス"""
+        return self._path
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """token.json を読み込んでから保存するまでを、プロセス間で排他にする
+
+        Raises:
+            AuthError: lock_timeout 秒以内にロックを取得できなかった場合
+        """
+        try:
+            with file_lock(self._lock_path, self._lock_timeout):
+                yield
+        except TimeoutError as e:
+            raise AuthError(
+                f"token.json のロックを {self._lock_timeout} 秒以内に"
+                f"取得できませんでした: {e}"
+            ) from e
+
+    def load(self, scopes: Sequence[str] | None = None) -> "Credentials | None":
+        """token.json から認証情報を読み込む
+
+        Args:
+            scopes (Sequence[str] | None, optional): 認証情報のスコープ
+
+        Returns:
+            Credentials | None: 読み込んだ認証情報
+                (ファイルがない場合や、読み込めない場合はNone)
+        """
+        from google.oauth2.credentials import Credentials
+
+        try:
+            info = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"トークンファイルを読み込めませんでした: {e}")
+            return None
+
+        try:
+            return Credentials.from_authorized_user_info(
+                info, list(scopes) if scopes is not None else None
+            )
+        except (ValueError, TypeError) as e:
+            logger.warning(f"トークンファイルの内容が不正です: {e}")
+            return None
+
+    def save(self, credentials: "Credentials") -> None:
+        """認証情報を token.json に原子的に保存する
+
+        Args:
+            credentials (Credentials): 保存する認証情報
+        """
+        atomic_write_text(self._path, credentials.to_json())
+
+    def delete(self) -> None:
+        """token.json を削除する (ファイルがなければ何もしない)"""
+        self._path.unlink(missing_ok=True)
+
+
+def covers_scopes(credentials: "Credentials", scopes: Sequence[str]) -> bool:
+    """認証情報に、要求するスコープがすべて許可されているかどうか
+
+    Args:
+        credentials (Credentials): 認証情報
+        scopes (Sequence[str]): 要求するスコープ
+
+    Returns:
+        bool: すべて許可されている場合 (許可されたスコープが不明な場合も True)
+    """
+    if credentials.scopes is None:
+        return True
+    return credentials.has_scopes(scopes)
+
+
+def seconds_until_expiry(credentials: "Credentials") -> float | None:
+    """認証情報の有効期限までの秒数を返す
+
+    Args:
+        credentials (Credentials): 認証情報
+
+    Returns:
+        float | None: 有効期限までの秒数 (期限切れの場合は負、不明な場合はNone)
+    """
+    if credentials.expiry is None:
+        return None
+    # google-auth の expiry はタイムゾーン情報のない UTC
+    now = datetime.now(UTC).replace(tzinfo=None)
+    return (credentials.expiry - now).total_seconds()
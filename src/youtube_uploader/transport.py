@@ -0,0 +1,201 @@
+"""transport
+
+googleapiclient の HTTP 通信を、接続プールを持つ requests のセッションで
+行うためのモジュール
+
+デフォルトの httplib2.Http はスレッドごとに接続を持つため、upload_many() の
+ワーカーやサムネイル用のスレッドが増えるたびに TLS の接続を確立し直す。
+PooledHttp は1つの接続プールをすべてのスレッドで共有し、keep-alive の
+接続を使い回すため、小さなチャンクで送信する場合の1チャンクあたりの
+待ち時間を抑えられる。
+"""
+
+import socket
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# requests と google.auth のセッションは、PooledHttp の生成時に読み込む
+if TYPE_CHECKING:
+    import httplib2  # type: ignore
+    from google.auth.credentials import Credentials
+    from requests.adapters import HTTPAdapter
+
+# 接続プールを保持するホストの数 (YouTube Data API はアップロード用と
+# APIリクエスト用のホストのみを使う)
+POOL_CONNECTIONS = 4
+
+
+class TransportConfig(BaseModel):
+    """接続プール付きの HTTP 通信の設定
+
+    Args:
+        pool_size (int, optional): ホストごとに保持する接続の最大数
+            同時にアップロードする動画の数 (サムネイルを含む) 以上を指定する
+        connect_timeout (float, optional): 接続確立のタイムアウト秒数
+        read_timeout (float, optional): ソケットの読み込みタイムアウト秒数
+        send_buffer_size (int | None, optional): ソケットの送信バッファのバイト数
+            (SO_SNDBUF、Noneの場合はOSの既定値)
+        receive_buffer_size (int | None, optional): ソケットの受信バッファの
+            バイト数 (SO_RCVBUF、Noneの場合はOSの既定値)
+        tcp_keepalive (bool, optional): 待機中の接続に TCP keep-alive を送るかどうか
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    pool_size: int = Field(default=10, ge=1, description="ホストごとの最大接続数")
+    connect_timeout: float = Field(default=10.0, gt=0, description="接続のタイムアウト")
+    read_timeout: float = Field(
+        default=300.0, gt=0, description="読み込みのタイムアウト"
+    )
+    send_buffer_size: int | None = Field(
+        default=None, gt=0, description="ソケットの送信バッファのバイト数"
+    )
+    receive_buffer_size: int | None = Field(
+        default=None, gt=0, description="ソケットの受信バッファのバイト数"
+    )
+    tcp_keepalive: bool = Field(default=True, description="TCP keep-alive を送るか")
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        """接続の確立時にソケットへ設定するオプションを返す"""
+        from urllib3.connection import HTTPConnection
+
+        options = list(HTTPConnection.default_socket_options)
+        if self.tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if self.send_buffer_size is not None:
+            options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size))
+        if self.receive_buffer_size is not None:
+            options.append(
+                (socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)
+            )
+        return options
+
+
+@cache
+def _socket_options_adapter() -> "Callable[..., HTTPAdapter]":
+    """ソケットのオプションを設定する HTTPAdapter のサブクラスを返す (初回のみ生成)
+
+    HTTPAdapter は socket_options を受け付けないため、接続プールの生成時に
+    渡すサブクラスを使う。requests は PooledHttp の生成時に読み込む。
+    """
+    from requests.adapters import HTTPAdapter
+
+    class SocketOptionsAdapter(HTTPAdapter):
+        """各接続の確立時に、指定したソケットのオプションを設定するアダプター"""
+
+        __attrs__ = [*HTTPAdapter.__attrs__, "_socket_options"]
+
+        def __init__(self, socket_options: list[tuple[int, int, int]], **kwargs):
+            # init_poolmanager() は HTTPAdapter.__init__ の中で呼ばれる
+            self._socket_options = socket_options
+            super().__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **pool_kwargs) -> None:
+            pool_kwargs.setdefault("socket_options", self._socket_options)
+            super().init_poolmanager(*args, **pool_kwargs)
+
+    return SocketOptionsAdapter
+
+
+class PooledHttp:
+    """httplib2.Http の代わりに googleapiclient へ渡す、接続プール付きのクライアント
+
+    google.auth の AuthorizedSession (requests / urllib3) で通信し、
+    レスポンスを googleapiclient が期待する httplib2.Response に変換する。
+    スレッドセーフで、1つのインスタンスを複数のAPIサービスで共有できる。
+
+    Examples:
+        http = PooledHttp(credentials, TransportConfig(pool_size=8))
+        service = build_youtube_service(http=http)
+    """
+
+    def __init__(
+        self, credentials: "Credentials", config: TransportConfig | None = None
+    ):
+        """
+        Args:
+            credentials (Credentials): リクエストに付与する認証情報
+            config (TransportConfig | None, optional): 接続プールの設定
+        """
+        from google.auth.transport.requests import AuthorizedSession
+
+        self._config = config or TransportConfig()
+        self._session = AuthorizedSession(credentials)
+        # 再試行は RetryPolicy で行うため、urllib3 では再試行しない
+        adapter = _socket_options_adapter()(
+            self._config.socket_options(),
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=self._config.pool_size,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def credentials(self) -> "Credentials":
+        """リクエストに付与する認証情報"""
+        return self._session.credentials
+
+    @property
+    def config(self) -> TransportConfig:
+        """接続プールの設定"""
+        return self._config
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        redirections: int = 5,
+        connection_type: Any = None,
+    ) -> "tuple[httplib2.Response, bytes]":
+        """httplib2.Http.request() と同じ形式でリクエストを送信する
+
+        再開可能アップロードの 308 レスポンスをリダイレクトとして扱わないよう、
+        リダイレクトは追跡しない。
+
+        Args:
+            uri (str): リクエスト先のURI
+            method (str, optional): HTTPメソッド
+            body (Any, optional): リクエストボディ (bytes または読み込み可能な
+                ストリーム。ストリームは送信しながら読み出される)
+            headers (dict[str, str] | None, optional): リクエストヘッダー
+            redirections (int, optional): httplib2 との互換のための引数 (未使用)
+            connection_type (Any, optional): httplib2 との互換のための引数 (未使用)
+
+        Returns:
+            tuple[httplib2.Response, bytes]: レスポンスとその本文
+
+        Raises:
+            TimeoutError: 接続または読み込みがタイムアウトした場合
+            ConnectionError: 接続に失敗した、または切断された場合
+        """
+        import httplib2  # type: ignore
+        import requests
+
+        try:
+            response = self._session.request(
+                method,
+                uri,
+                data=body,
+                headers=headers,
+                timeout=(self._config.connect_timeout, self._config.read_timeout),
+                allow_redirects=False,
+            )
+        # RetryPolicy が一時的なエラーとして判定できる例外に変換する
+        except requests.Timeout as e:
+            raise TimeoutError(f"HTTP通信がタイムアウトしました: {e}") from e
+        except requests.ConnectionError as e:
+            raise ConnectionError(f"HTTP通信に失敗しました: {e}") from e
+
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info["status"] = str(response.status_code)
+        return httplib2.Response(info), response.content
+
+    def close(self) -> None:
+        """接続プールを閉じる"""
+        self._session.close()
@@ -3,7 +3,19 @@
 パッケージの認証ファイルパスや環境変数に関するユーティリティ関数を定義するモジュール
 """
 
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
 
 
 def resolve_auth_paths(base_dir: Path) -> tuple[Path, Path]:
@@ -33,3 +45,104 @@ def resolve_auth_paths(base_dir: Path) -> tuple[Path, Path]:
         )
 
     return client_secrets_path, token_path
+
+
+def resolve_state_path(base_dir: Path, filename: str) -> Path:
+    """認証ディレクトリ内に保存する状態ファイルのパスを決定
+
+    token.json と同じディレクトリに、アカウントごとの状態を保存するために使う。
+
+    Args:
+        base_dir (Path): client_secret.jsonとtoken.jsonを含むディレクトリ。
+        filename (str): 状態ファイルのファイル名
+
+    Returns:
+        Path: 状態ファイルの絶対パス
+    """
+    resolved_dir = base_dir.expanduser().resolve()
+    resolved_dir.mkdir(parents=True, exist_ok=True)
+    return resolved_dir / filename
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """一時ファイルに書き込んでから置き換えることで、ファイルを原子的に更新
+
+    書き込み途中でプロセスが終了しても、壊れたファイルが残らないようにする。
+
+    Args:
+        path (Path): 書き込み先のパス
+        text (str): 書き込む内容
+    """
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """atomic_write_text() のバイナリ版
+
+    Args:
+        path (Path): 書き込み先のパス
+        data (bytes): 書き込む内容
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _try_lock(f: BinaryIO) -> bool:
+    """ロックファイルの排他ロックを待たずに取得し、取得できたかを返す"""
+    try:
+        if sys.platform == "win32":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(f: BinaryIO) -> None:
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(
+    path: Path, timeout: float | None = None, poll_interval: float = 0.05
+) -> Iterator[None]:
+    """ロックファイルを使って、複数のプロセスの間で排他制御を行う
+
+    Linux / macOS では fcntl.flock、Windows では msvcrt.locking を使う。
+    ロックはファイルを開いている間だけ有効なため、プロセスが異常終了しても
+    ロックが残ることはない。ロックファイル自体は削除しない。
+
+    Args:
+        path (Path): ロックファイルのパス (なければ作成する)
+        timeout (float | None, optional): ロックを待つ最大秒数
+            Noneの場合は取得できるまで待ち続ける
+        poll_interval (float, optional): ロックの取得を再試行する間隔 (秒)
+
+    Raises:
+        TimeoutError: timeout 秒以内にロックを取得できなかった場合
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with open(path, "a+b") as f:
+        while not _try_lock(f):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"ロックを取得できませんでした: {path}")
+            time.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            _unlock(f)
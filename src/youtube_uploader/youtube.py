@@ -18,31 +18,129 @@ Note:
     28 サイエンス・テクノロジー
 """
 
-import io
 import logging
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
-from googleapiclient.errors import HttpError  # type: ignore
-from googleapiclient.http import MediaIoBaseUpload  # type: ignore
+from googleapiclient.errors import HttpError, ResumableUploadError  # type: ignore
 
-from .exceptions import AuthError, UploadError
-from .models import YoutubeConfig
-from .utils import resolve_auth_paths
+from .bandwidth import BandwidthLimiter, BandwidthShare, bandwidth_limiter
+from .cache import build_youtube_service, credentials_cache
+from .chunking import AdaptiveChunkSizer, ChunkSize
+from .dedup import (
+    DEDUP_FILENAME,
+    ContentHasher,
+    UploadIndex,
+    UploadKey,
+    hash_video,
+    upload_key,
+)
+from .exceptions import AuthError, QuotaExceededError, UploadError
+from .instrumentation import (
+    METRIC_BYTES_SENT,
+    METRIC_RETRIES,
+    METRIC_UPLOAD_THROUGHPUT,
+    SPAN_BATCH,
+    SPAN_BUILD_REQUEST,
+    SPAN_BUILD_SERVICE,
+    SPAN_CHUNK,
+    SPAN_CONNECT,
+    SPAN_LOAD_CREDENTIALS,
+    SPAN_START_SESSION,
+    SPAN_THUMBNAIL,
+    SPAN_UPLOAD,
+    Instrumentation,
+)
+from .media import BufferReader, ObservedStream, open_video_stream
+from .models import (
+    BatchCallResult,
+    PlaylistAddition,
+    PostUploadActions,
+    ThumbnailResult,
+    UploadResult,
+    VideoUpdate,
+    YoutubeConfig,
+)
+from .progress import ProgressTracker, UploadProgress
+from .quota import (
+    QUOTA_COSTS,
+    QUOTA_FILENAME,
+    QuotaLedger,
+    project_id_from_client_secrets,
+    quota_resets_at,
+    upload_calls,
+)
+from .refresh import TokenRefresher, start_token_refresher
+from .retry import (
+    RetryEvent,
+    RetryPolicy,
+    RetryStats,
+    call_with_retry,
+    retry_reason,
+)
+from .sessions import (
+    SESSIONS_FILENAME,
+    UploadSession,
+    UploadSessionStore,
+    config_fingerprint,
+)
+from .thumbnails import ThumbnailProcessor
+from .token_store import TokenStore, covers_scopes
+from .transport import PooledHttp, TransportConfig
+from .utils import resolve_auth_paths, resolve_state_path
+
+# 認証とメディアの送信に使う Google のクライアントは読み込みに時間がかかるため、
+# connect() やアップロードの実行時に読み込む
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.http import MediaIoBaseUpload  # type: ignore
 
 # YouTube Data APIのスコープ定義
 SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
+# 再生リストへの追加や動画の更新も行う場合のスコープ
+MANAGE_SCOPES = [*SCOPES, "https://www.googleapis.com/auth/youtube"]
+
+# 1回のバッチリクエストにまとめられるAPI呼び出しの上限
+BATCH_LIMIT = 50
+
+# 一時的なエラーで失敗した場合に、バッチリクエストで再送するAPIメソッド
+# (何度実行しても結果が変わらないもの。playlistItems.insert は、失敗と判定した
+# 呼び出しがサーバで実行されていた場合に再生リストへ二重に追加されるため含めない)
+RETRYABLE_BATCH_METHODS = frozenset({"videos.update"})
+
+# バッチ内の1件の呼び出しを表す (メソッド名, 動画ID, 対象, リクエストの引数)
+type _BatchCall = tuple[str, str, str | None, dict[str, Any]]
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 logger.setLevel(logging.INFO)
 
 
+class _QuotaReservation:
+    """1件のアップロードで確保したクォータと、呼び出したAPIメソッドの記録
+
+    送信前に失敗した場合に、呼び出さなかったメソッドの分を台帳へ返却する。
+    """
+
+    def __init__(self, reserved: dict[str, int] | None = None):
+        self.reserved: dict[str, int] = dict(reserved or {})
+        self.called: set[str] = set()
+
+    def unused(self) -> dict[str, int]:
+        """確保したうち、まだ呼び出していないメソッドの分を返す"""
+        return {
+            method: units
+            for method, units in self.reserved.items()
+            if method not in self.called
+        }
+
+
 class YoutubeUploader:
     """YouTube APIを使った認証と動画アップロード処理を担当するコアクラス
 
@@ -51,14 +149,83 @@ class YoutubeUploader:
 
     Methods:
         - connect(): YouTube APIへの認証と接続を確立します
+        - close(): アップロード済みの動画のインデックスと接続プールを閉じます
         - upload_video(config: YoutubeConfig): 指定された設定で動画をアップロードします
+        - resume_upload(config: YoutubeConfig): 中断されたアップロードを再開します
+        - upload_many(configs): 複数の動画を並列にアップロードします
+        - add_to_playlists(additions): 動画をまとめて再生リストに追加します
+        - update_videos(updates): アップロード済みの動画をまとめて更新します
+
+    ChannelPool や UploadWorker、コマンドラインの一括アップロードなど、
+    独自にスレッドや順序を管理する呼び出し元のために、次のメソッドも公開する。
+    これらは upload_many() などの内部でも同じ順序で使われる。
+
+        - find_uploaded(config): アップロード済みの動画を照合します
+        - record_upload(key, config, content_hash, response): アップロードした
+          動画をインデックスに記録します
+        - prepare_thumbnail(config): 送信前にサムネイルを検証・正規化します
+        - reserve_quota(calls) / refund_quota(calls) / record_quota(calls) /
+          exhaust_quota(): クォータの台帳を更新します
+        - is_quota_exceeded(error): APIエラーがクォータ超過かを判定します
+        - build_body(config): videos.insert に渡すメタデータを組み立てます
+        - ensure_thread_service(): 現在のスレッド専用のAPIサービスを用意します
+        - refresh_credentials(): token.json のロックの中で認証情報を
+          リフレッシュします
+        - upload_in_worker(...): 1件をアップロードし、例外を結果に格納します
+        - attach_thumbnail(result, future): サムネイルの結果を格納します
+        - upload_failure(error) / thumbnail_failure(video_id, error):
+          送信中の例外を分類し、送出する例外や結果を返します
+        - apply_post_upload_actions(uploads): 再生リストと翻訳をまとめて適用します
     """
 
-    def __init__(self, auth_path: Path):
+    def __init__(
+        self,
+        auth_path: Path,
+        retry_policy: RetryPolicy | None = None,
+        quota_ledger: QuotaLedger | None = None,
+        thumbnail_processor: ThumbnailProcessor | None = None,
+        deduplicate: bool = False,
+        bandwidth: BandwidthLimiter | None = None,
+        transport: TransportConfig | None = None,
+        instrumentation: Instrumentation | None = None,
+        token_refresh_margin: float | None = None,
+        scopes: Iterable[str] | None = None,
+    ):
         """指定されたディレクトリに基づきYouTube APIへの認証を行う。
 
         Args:
             auth_path (Path): 利用する client_secret.jsonが入っているディレクトリのパス
+            retry_policy (RetryPolicy | None, optional): 一時的なエラー
+                (5xx、接続リセット、タイムアウトなど) に対する再試行ポリシー
+                Noneの場合はデフォルトの RetryPolicy() を使う
+            quota_ledger (QuotaLedger | None, optional): クォータの消費量の台帳
+                Noneの場合は token.json と同じディレクトリの quota_ledger.json を使う
+                同じプロジェクトの複数チャンネルでは、1つの台帳を共有する
+            thumbnail_processor (ThumbnailProcessor | None, optional):
+                動画の送信前にサムネイルを検証・正規化する処理
+                Noneの場合はサムネイルをそのまま送信する
+            deduplicate (bool, optional): アップロード済みの動画を記録し、
+                同じ内容とメタデータの動画はアップロードせずに記録済みの
+                レスポンスを返すかどうか (デフォルトは無効)
+            bandwidth (BandwidthLimiter | None, optional): 送信帯域の制限
+                Noneの場合はプロセス内で共有の bandwidth_limiter を使う
+            transport (TransportConfig | None, optional): 接続プール付きの
+                HTTP通信の設定。指定するとすべてのスレッドで1つの接続プールを
+                共有する。Noneの場合はスレッドごとの httplib2 の接続を使う
+            instrumentation (Instrumentation | None, optional): 段階ごとの
+                所要時間とメトリクスの通知先。Noneの場合は計測しない
+            token_refresh_margin (float | None, optional): 指定すると、
+                connect() 後にアクセストークンを有効期限のこの秒数前に
+                バックグラウンドでリフレッシュし、token.json を更新する
+                (アップロード中に同期的なリフレッシュで待たされなくなる)。
+                Noneの場合は google-auth がリクエストの直前にリフレッシュする
+            scopes (Iterable[str] | None, optional): 認証で要求するスコープ
+                Noneの場合は SCOPES (アップロードのみ) を使う。再生リストへの
+                追加や翻訳の設定を行う場合は MANAGE_SCOPES を指定する
+                (token.json のスコープが足りない場合は再認証する)
+
+        Raises:
+            ValueError: token_refresh_margin が負の場合
 
         Examples:
             uploader = YoutubeUploader(Path("~/secrets/my_account"))
@@ -70,12 +237,230 @@ class YoutubeUploader:
         """
         # 認証状態とファイルパスを格納するフィールド
         self._youtube_service: Any = None
+        self._credentials: Credentials | None = None
         self._auth_path = auth_path
 
+        # upload_many() のワーカースレッドごとのAPIサービス
+        # (googleapiclient のサービスはスレッドセーフではないため)
+        self._local = threading.local()
+
         # 内部で利用するパスのフィールドを初期化
         self._client_secrets_json_path: Path | None = None
         self._token_json_path: Path | None = None
 
+        # 再開可能アップロードのセッション情報のストア (connect() 時に設定)
+        self._session_store: UploadSessionStore | None = None
+
+        # 再試行ポリシーと、監視用の再試行の累計
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._retry_lock = threading.Lock()
+
+        # クォータの消費量の台帳と、クォータを共有するプロジェクト (connect() 時に設定)
+        self._quota_ledger = quota_ledger
+        self._project_id: str | None = None
+
+        # 送信前のサムネイルの検証・正規化
+        self._thumbnail_processor = thumbnail_processor
+
+        # アップロード済みの動画のインデックス (connect() 時に設定)
+        self._deduplicate = deduplicate
+        self._upload_index: UploadIndex | None = None
+
+        # 送信帯域の制限 (同じインスタンスを使うアップロードで帯域を共有する)
+        self._bandwidth = bandwidth or bandwidth_limiter
+
+        # 接続プール付きのHTTPクライアント (connect() 時に設定)
+        self._transport = transport
+        self._http: PooledHttp | None = None
+
+        # 段階ごとの所要時間とメトリクスの通知先
+        self._instrumentation = instrumentation or Instrumentation()
+
+        # アクセストークンのバックグラウンドでのリフレッシュ (connect() 時に開始)
+        if token_refresh_margin is not None and token_refresh_margin < 0:
+            raise ValueError("token_refresh_margin は0以上を指定してください。")
+        self._token_refresh_margin = token_refresh_margin
+        self._token_refresher: TokenRefresher | None = None
+        # バックグラウンドでリフレッシュしない場合に、refresh_credentials() で使う
+        self._on_demand_refresher: TokenRefresher | None = None
+
+        # 認証で要求するスコープ
+        self._scopes = list(scopes) if scopes is not None else SCOPES
+
+    @property
+    def credentials(self) -> "Credentials | None":
+        """connect() で読み込んだ、共有の認証情報 (未接続の場合はNone)"""
+        return self._credentials
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """段階ごとの所要時間とメトリクスの通知先"""
+        return self._instrumentation
+
+    @property
+    def bandwidth(self) -> BandwidthLimiter:
+        """このインスタンスのアップロードが共有する送信帯域の制限"""
+        return self._bandwidth
+
+    @property
+    def upload_index(self) -> UploadIndex | None:
+        """アップロード済みの動画のインデックス (無効な場合や connect() 前はNone)"""
+        return self._upload_index
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """このインスタンスでの再試行回数と待機時間の累計 (監視用のスナップショット)"""
+        with self._retry_lock:
+            return self._retry_stats.model_copy(deep=True)
+
+    def _on_retry(self, event: RetryEvent, error: BaseException) -> None:
+        """再試行を累計に記録し、ログに出力する"""
+        with self._retry_lock:
+            self._retry_stats.record(event, error)
+        self._instrumentation.add(
+            METRIC_RETRIES, 1, {"reason": retry_reason(event, error)}
+        )
+        logger.warning(
+            f"一時的なエラーのため {event.delay:.1f} 秒後に再試行します "
+            f"({event.retry_number}/{self._retry_policy.max_attempts - 1}回目): "
+            f"{event.error}"
+        )
+
+    def _with_retry(
+        self, func: Callable[[], Any], tracker: ProgressTracker | None = None
+    ) -> Any:
+        """再試行ポリシーに従って func を実行する
+
+        Args:
+            func (Callable[[], Any]): 実行する処理
+            tracker (ProgressTracker | None, optional): 再試行回数を記録する進捗
+        """
+
+        def on_retry(event: RetryEvent, error: BaseException) -> None:
+            self._on_retry(event, error)
+            if tracker is not None:
+                tracker.retried()
+
+        return call_with_retry(func, self._retry_policy, on_retry=on_retry)
+
+    @property
+    def token_refresher(self) -> TokenRefresher | None:
+        """トークンのバックグラウンドでのリフレッシュ (無効な場合はNone)"""
+        return self._token_refresher
+
+    def refresh_credentials(self) -> None:
+        """共有の認証情報を、token.json のロックの中でリフレッシュする
+
+        ロックの中で token.json を読み直し、他のプロセスがリフレッシュ済みで
+        あればそのトークンを使う。自分でリフレッシュした場合は token.json に
+        保存する。バックグラウンドでのリフレッシュが有効な場合は、同じ
+        TokenRefresher を使うため、そのスレッドと同時にはリフレッシュしない。
+
+        Raises:
+            AuthError: APIに接続されていない場合や、リフレッシュに失敗した場合
+        """
+        if self._credentials is None or self._token_json_path is None:
+            raise AuthError(
+                "YouTube APIに接続されていません。"
+                "connect() メソッドを呼び出してください。"
+            )
+        for refresher in (self._token_refresher, self._on_demand_refresher):
+            if refresher is not None and refresher.credentials is self._credentials:
+                break
+        else:
+            refresher = TokenRefresher(
+                self._credentials,
+                self._token_json_path,
+                instrumentation=self._instrumentation,
+            )
+            self._on_demand_refresher = refresher
+        refresher.refresh_now()
+
+    @property
+    def session_store(self) -> UploadSessionStore | None:
+        """再開可能アップロードのセッションの保存先 (connect() 前はNone)"""
+        return self._session_store
+
+    @property
+    def quota_ledger(self) -> QuotaLedger | None:
+        """クォータの消費量の台帳 (connect() 前で未指定の場合はNone)"""
+        return self._quota_ledger
+
+    def remaining_quota(self) -> int:
+        """このチャンネルのプロジェクトに今日残っているクォータを返す
+
+        Returns:
+            int: 残りのクォータの単位数
+
+        Raises:
+            AuthError: APIに接続されていない場合
+        """
+        if self._quota_ledger is None or self._project_id is None:
+            raise AuthError(
+                "YouTube APIに接続されていません。"
+                "connect() メソッドを呼び出してください。"
+            )
+        return self._quota_ledger.remaining(self._project_id)
+
+    def reserve_quota(self, calls: dict[str, int]) -> None:
+        """動画を送信する前に、必要なクォータを確保する
+
+        確保した分は、upload_in_worker(quota_reserved=True) の送信では
+        改めて確保されない。その場合、動画の送信前に失敗した分は
+        upload_in_worker() が返却する。
+
+        Args:
+            calls (dict[str, int]): APIメソッド名と消費するクォータの単位数
+
+        Raises:
+            QuotaExceededError: 残りクォータが足りない場合
+        """
+        if self._quota_ledger is None or self._project_id is None or not calls:
+            return
+        self._quota_ledger.reserve(self._project_id, calls)
+
+    def refund_quota(self, calls: dict[str, int]) -> None:
+        """確保したものの、APIを呼び出さなかった分のクォータを返却する
+
+        Args:
+            calls (dict[str, int]): APIメソッド名と返却するクォータの単位数
+        """
+        if self._quota_ledger is None or self._project_id is None or not calls:
+            return
+        self._quota_ledger.refund(self._project_id, calls)
+
+    def record_quota(self, calls: dict[str, int]) -> None:
+        """確保済みの分とは別に消費したクォータを記録する
+
+        保存済みのセッションの有効期限が切れ、videos.insert を
+        やり直した場合などに使う。残りが足りなくても例外は送出しない。
+
+        Args:
+            calls (dict[str, int]): APIメソッド名と消費したクォータの単位数
+        """
+        if self._quota_ledger is None or self._project_id is None:
+            return
+        self._quota_ledger.record(self._project_id, calls)
+
+    def exhaust_quota(self) -> None:
+        """APIからクォータ超過が返された場合に、今日の残りを0として記録する"""
+        if self._quota_ledger is None or self._project_id is None:
+            return
+        self._quota_ledger.exhaust(self._project_id)
+
+    @staticmethod
+    def is_quota_exceeded(error: HttpError) -> bool:
+        """APIエラーがクォータ超過によるものかどうか
+
+        Args:
+            error (HttpError): APIエラー
+
+        Returns:
+            bool: 403 の quotaExceeded の場合はTrue
+        """
+        return error.resp.status == 403 and b"quotaExceeded" in (error.content or b"")
+
     def connect(self) -> None:
         """指定パスに基づき認証情報をロードし、APIサービスをインスタンスに設定する
 
@@ -86,6 +471,11 @@ class YoutubeUploader:
             logger.info("既にYouTube APIへの接続が完了しています。")
             return
 
+        with self._instrumentation.phase(SPAN_CONNECT):
+            self._connect()
+
+    def _connect(self) -> None:
+        """認証情報をロードし、APIサービスと接続時の状態を設定する"""
         try:
             # ユーティリティ関数でパスを解決し、ファイルが存在するかチェック
             (client_secrets_json_path, token_json_path) = resolve_auth_paths(
@@ -102,110 +492,880 @@ class YoutubeUploader:
         self._client_secrets_json_path = client_secrets_json_path
         self._token_json_path = token_json_path
 
-        credentials = None
-        # 既存のトークンファイルをチェック
-        if self._token_json_path.exists():
-            try:
-                credentials = Credentials.from_authorized_user_file(
-                    str(self._token_json_path), SCOPES
-                )
-            except Exception as e:
-                logger.warning(
-                    f"トークンファイルの読み込み中にエラーが発生しました: {e} - "
-                    "再認証を試みます。"
-                )
-                # 警告ログを出した上で、credentialsをNoneに戻し、再認証フローに流す
-                credentials = None
+        # 同じ token.json を使う他のインスタンスが取得済みであれば、
+        # 読み込みとリフレッシュを省略してキャッシュを使う
+        with (
+            self._instrumentation.phase(SPAN_LOAD_CREDENTIALS),
+            credentials_cache.lock(self._token_json_path),
+        ):
+            credentials = credentials_cache.get(self._token_json_path)
+            if credentials is None or not covers_scopes(credentials, self._scopes):
+                credentials = self._load_credentials()
+                credentials_cache.put(self._token_json_path, credentials)
+            else:
+                logger.info("キャッシュ済みの認証情報を使用します。")
 
-        # 認証情報が存在しない、または有効でない場合
-        if not credentials or not credentials.valid:
-            # 期限切れでリフレッシュ可能な場合
-            if credentials and credentials.expired and credentials.refresh_token:
-                logger.info("認証情報が期限切れのため、リフレッシュします。")
+        # 認証済みのAPIクライアントを構築して設定
+        try:
+            if self._transport is not None:
+                self._http = PooledHttp(credentials, self._transport)
+            self._credentials = credentials
+            self._youtube_service = self._build_service()
+        except Exception as e:
+            # APIサービス構築失敗時にAuthErrorを発生
+            raise AuthError(f"YouTube APIサービスへの接続に失敗しました: {e}") from e
 
-                try:
-                    credentials.refresh(Request())
-                except Exception as e:
-                    # リフレッシュトークンが無効な場合は、token.jsonを削除して再認証
-                    logger.warning(
-                        f"トークンのリフレッシュに失敗しました: {e}\n"
-                        "古いtoken.jsonを削除して、再認証を試みます。"
-                    )
-                    if self._token_json_path.exists():
-                        self._token_json_path.unlink()
-                    # credentialsをNoneにして、次のelseブロックで新規認証フローを実行
-                    credentials = None
+        if self._token_refresh_margin is not None:
+            self._token_refresher = start_token_refresher(
+                credentials,
+                token_json_path,
+                margin=self._token_refresh_margin,
+                instrumentation=self._instrumentation,
+            )
+
+        self._session_store = UploadSessionStore(
+            resolve_state_path(self._auth_path, SESSIONS_FILENAME)
+        )
+        self._project_id = project_id_from_client_secrets(client_secrets_json_path)
+        if self._quota_ledger is None:
+            self._quota_ledger = QuotaLedger(
+                resolve_state_path(self._auth_path, QUOTA_FILENAME)
+            )
+        if self._deduplicate:
+            if self._upload_index is not None:
+                self._upload_index.close()
+            self._upload_index = UploadIndex(
+                resolve_state_path(self._auth_path, DEDUP_FILENAME)
+            )
 
-            # 初回またはトークンが無効な場合
+        logger.info("YouTube APIへの接続が完了しました。")
+
+    def close(self) -> None:
+        """アップロード済みの動画のインデックスと、接続プールを閉じる
+
+        再び connect() するまで、アップロード済みの照合と記録は行わない。
+        """
+        if self._upload_index is not None:
+            self._upload_index.close()
+            self._upload_index = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _load_credentials(self) -> "Credentials":
+        """token.json から認証情報を読み込み、必要に応じてリフレッシュ・再認証する
+
+        同じ認証ディレクトリを使う他のプロセスと token.json のロックを共有し、
+        ロックの中で読み込みからリフレッシュ・保存までを行う。先にロックを
+        取得したプロセスがリフレッシュした場合は、そのトークンを読み込むだけになる。
+
+        Returns:
+            Credentials: 有効な認証情報
+
+        Raises:
+            AuthError: 認証に失敗した場合
+        """
+        from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+
+        assert self._token_json_path is not None
+        assert self._client_secrets_json_path is not None
+
+        store = TokenStore(self._token_json_path)
+        with store.lock():
+            # 既存のトークンファイルをチェック (読み込めない場合は再認証フローに流す)
+            credentials = store.load()
+            if credentials is not None and not covers_scopes(credentials, self._scopes):
+                logger.info("token.json のスコープが不足しているため、再認証します。")
+                credentials = None
+
+            # 認証情報が存在しない、または有効でない場合
             if not credentials or not credentials.valid:
-                logger.info("認証が必要です。ブラウザを開いてログインしてください。")
+                # 期限切れでリフレッシュ可能な場合
+                if credentials and credentials.expired and credentials.refresh_token:
+                    logger.info("認証情報が期限切れのため、リフレッシュします。")
 
-                if not self._client_secrets_json_path.exists():
-                    # 認証ファイル自体がない場合はここで例外を発生
-                    raise FileNotFoundError(
-                        f"クライアントシークレットファイルが見つかりません: "
-                        f"{self._client_secrets_json_path}"
-                    )
+                    try:
+                        credentials.refresh(Request())
+                    except RefreshError as e:
+                        # リフレッシュトークンが無効な場合は、token.jsonを削除して再認証
+                        logger.warning(
+                            f"トークンのリフレッシュに失敗しました: {e}\n"
+                            "古いtoken.jsonを削除して、再認証を試みます。"
+                        )
+                        store.delete()
+                        # credentialsをNoneにして、次のブロックで新規認証フローを実行
+                        credentials = None
+                    except Exception as e:
+                        # 通信エラーなどでは、有効なリフレッシュトークンを残しておく
+                        raise AuthError(
+                            f"トークンのリフレッシュ中にエラーが発生しました: {e}"
+                        ) from e
 
-                try:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        str(self._client_secrets_json_path), SCOPES
+                # 初回またはトークンが無効な場合
+                if not credentials or not credentials.valid:
+                    logger.info(
+                        "認証が必要です。ブラウザを開いてログインしてください。"
                     )
-                    credentials = flow.run_local_server(port=0)
-                except Exception as e:
-                    # ブラウザ認証フロー失敗時にAuthErrorを発生
-                    raise AuthError(
-                        f"ブラウザ認証フローでエラーが発生しました: {e}"
-                    ) from e
-
-            # 新しい許可証をtoken.jsonに保存
-            with open(self._token_json_path, "w") as token:
-                token.write(credentials.to_json())
-            logger.info(f"新しい認証情報を '{self._token_json_path}' に保存しました。")
 
-        # 認証済みのAPIクライアントを構築して設定
-        try:
-            self._youtube_service = build("youtube", "v3", credentials=credentials)
-        except Exception as e:
-            # APIサービス構築失敗時にAuthErrorを発生
-            raise AuthError(f"YouTube APIサービスへの接続に失敗しました: {e}") from e
+                    if not self._client_secrets_json_path.exists():
+                        # 認証ファイル自体がない場合はここで例外を発生
+                        raise FileNotFoundError(
+                            f"クライアントシークレットファイルが見つかりません: "
+                            f"{self._client_secrets_json_path}"
+                        )
 
-        logger.info("YouTube APIへの接続が完了しました。")
+                    try:
+                        flow = InstalledAppFlow.from_client_secrets_file(
+                            str(self._client_secrets_json_path), self._scopes
+                        )
+                        credentials = flow.run_local_server(port=0)
+                    except Exception as e:
+                        # ブラウザ認証フロー失敗時にAuthErrorを発生
+                        raise AuthError(
+                            f"ブラウザ認証フローでエラーが発生しました: {e}"
+                        ) from e
+
+                # 新しい許可証をtoken.jsonに保存
+                store.save(credentials)
+                logger.info(
+                    f"新しい認証情報を '{self._token_json_path}' に保存しました。"
+                )
+
+        return credentials
 
     def upload_video(
         self,
         config: YoutubeConfig,
         progress_callback: Callable[[float], None] | None = None,
-        chunksize: int = -1,
+        chunksize: ChunkSize = -1,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
     ) -> dict:
         """動画をYouTubeにアップロードする
 
+        connect() 済みの場合、アップロードセッションのURIと送信済みバイト数は
+        token.json と同じディレクトリの upload_sessions.json に保存される。
+        途中でプロセスが終了した場合は resume_upload() で再開できる。
+        また、同じ内容とメタデータの動画がアップロード済みの場合は、
+        送信せずに記録済みのレスポンスを返す (deduplicate=True の場合)。
+        config に再生リストや翻訳が指定されている場合は、アップロード後に
+        1回のバッチリクエストで適用する (失敗してもアップロードは失敗にしない)。
+        アップロード済みの動画でも、前回の実行で適用前に終了していた操作は適用する。
+
         Args:
             config (YoutubeConfig): アップロード設定情報
             progress_callback (Callable[[float], None] | None, optional):
                 アップロード進捗を通知するコールバック関数
                 引数には進捗率（0.0 から 1.0）が渡される
-            chunksize (int, optional):
+            chunksize (ChunkSize, optional):
                 アップロードのチャンクサイズ（バイト単位）
                 デフォルトは-1（全体を一度にアップロード、最速だが進捗表示なし）
                 進捗を表示したい場合は10 * 1024 * 1024などの値を指定
+                "auto" を指定すると、チャンクごとのスループットを計測し、
+                1チャンクの送信が約2秒になるよう256KiB単位で自動調整する
+                (進捗表示と回線速度に近い転送速度を両立できる)
+                config.video_path を指定した場合は、どちらの値でも
+                ファイルを少しずつ読み出して送信するため、メモリ使用量は
+                動画サイズに比例しない
+            on_progress (Callable[[UploadProgress], None] | None, optional):
+                送信バイト数・スループット・残り時間などを含む進捗イベントを
+                受け取るコールバック関数。チャンクの途中でも通知されるため、
+                chunksize=-1 でも進捗を表示できる
+            progress_interval (float, optional):
+                on_progress を呼び出す最小間隔 (秒)。コールバックが重くても
+                アップロードが遅くならないよう、通知を間引く
+
+        Returns:
+            dict : APIのレスポンス辞書
+
+        Raises:
+            QuotaExceededError: クォータが不足している場合 (動画の送信前に判定)
+            UploadError: アップロード中にAPIエラーが発生した場合
+            AuthError: APIに接続されていない場合
+        """
+        self._require_service()
+        logger.info(f"動画 '{config.title}' のアップロードを開始します...")
+        uploaded, key = self.find_uploaded(config)
+        if uploaded is not None:
+            self._apply_actions_for(config, uploaded, duplicate=True)
+            return uploaded
+
+        config = self.prepare_thumbnail(config)
+        tracker = ProgressTracker(
+            config.title, on_progress, progress_callback, progress_interval
+        )
+        response = self._upload(config, tracker, chunksize, resume=False, key=key)
+        self._upload_thumbnail(response["id"], config, tracker)
+        self._apply_actions_for(config, response)
+        return response
+
+    def resume_upload(
+        self,
+        config: YoutubeConfig,
+        progress_callback: Callable[[float], None] | None = None,
+        chunksize: ChunkSize = -1,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
+    ) -> dict:
+        """保存済みのセッションから、中断された動画のアップロードを再開する
+
+        サーバに受信済みのバイト数を問い合わせ、その続きから送信する。
+        保存済みのセッションがない場合や、セッションの有効期限が切れている
+        場合は、最初からアップロードする。
+
+        Args:
+            config (YoutubeConfig): 中断時と同じアップロード設定情報
+            progress_callback (Callable[[float], None] | None, optional):
+                アップロード進捗を通知するコールバック関数
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、または "auto"）
+            on_progress (Callable[[UploadProgress], None] | None, optional):
+                進捗イベントを受け取るコールバック関数
+            progress_interval (float, optional): on_progress を呼び出す最小間隔 (秒)
 
         Returns:
             dict : APIのレスポンス辞書
 
         Raises:
+            QuotaExceededError: クォータが不足している場合 (動画の送信前に判定)
             UploadError: アップロード中にAPIエラーが発生した場合
             AuthError: APIに接続されていない場合
         """
+        self._require_service()
+        logger.info(f"動画 '{config.title}' のアップロードの再開を試みます...")
+        uploaded, key = self.find_uploaded(config)
+        if uploaded is not None:
+            self._apply_actions_for(config, uploaded, duplicate=True)
+            return uploaded
+
+        config = self.prepare_thumbnail(config)
+        tracker = ProgressTracker(
+            config.title, on_progress, progress_callback, progress_interval
+        )
+        response = self._upload(config, tracker, chunksize, resume=True, key=key)
+        self._upload_thumbnail(response["id"], config, tracker)
+        self._apply_actions_for(config, response)
+        return response
+
+    def upload_many(
+        self,
+        configs: Iterable[YoutubeConfig],
+        max_workers: int = 4,
+        progress_callback: Callable[[int, float], None] | None = None,
+        chunksize: ChunkSize = -1,
+        on_progress: Callable[[int, UploadProgress], None] | None = None,
+        progress_interval: float = 0.5,
+        pipeline_thumbnails: bool = False,
+    ) -> list[UploadResult]:
+        """複数の動画を並列にアップロードする
+
+        ワーカーごとに、共有の認証情報から専用のHTTP接続とAPIサービスを
+        構築するため、回線帯域が許す限り同時にアップロードできる。
+        1件の失敗で全体が中断されることはなく、エラーは結果に格納される。
+        サムネイルの結果は UploadResult.thumbnail に格納される。
+        再生リストへの追加と翻訳の設定は、すべての動画のアップロード後に
+        BATCH_LIMIT 件ずつのバッチリクエストにまとめて実行し、結果を
+        UploadResult.actions に格納する (アップロード済みでスキップした動画は、
+        適用待ちの操作がインデックスに記録されている場合のみ)。
+
+        Args:
+            configs (Iterable[YoutubeConfig]): アップロード設定情報のリスト
+            max_workers (int, optional): 同時にアップロードする最大数
+            progress_callback (Callable[[int, float], None] | None, optional):
+                アップロード進捗を通知するコールバック関数
+                引数には入力リスト内での位置と進捗率（0.0 から 1.0）が渡される
+            chunksize (ChunkSize, optional): アップロードのチャンクサイズ
+                （バイト単位、または "auto"）
+            on_progress (Callable[[int, UploadProgress], None] | None, optional):
+                入力リスト内での位置と進捗イベントを受け取るコールバック関数
+            progress_interval (float, optional): on_progress を呼び出す最小間隔 (秒)
+            pipeline_thumbnails (bool, optional): サムネイルをバックグラウンドで
+                アップロードし、ワーカーはすぐに次の動画の送信を始めるかどうか
+
+        Returns:
+            list[UploadResult]: 入力と同じ順序に並んだ、1件ごとの結果
+
+        Raises:
+            AuthError: APIに接続されていない場合
+        """
+        self._require_service()
+        if self._credentials is None:
+            raise AuthError(
+                "並列アップロードには認証情報が必要です。"
+                "connect() メソッドを呼び出してください。"
+            )
+
+        configs = list(configs)
+        logger.info(
+            f"{len(configs)} 件の動画を最大 {max_workers} 並列でアップロードします..."
+        )
+
+        def run(
+            index: int, config: YoutubeConfig
+        ) -> tuple[UploadResult, Future[ThumbnailResult] | None]:
+            tracker = ProgressTracker(
+                config.title,
+                (lambda event: on_progress(index, event)) if on_progress else None,
+                (
+                    (lambda progress: progress_callback(index, progress))
+                    if progress_callback
+                    else None
+                ),
+                progress_interval,
+                log_level=logging.DEBUG,
+            )
+            return self.upload_in_worker(
+                index, config, tracker, chunksize, thumbnail_executor=thumbnail_executor
+            )
+
+        thumbnail_executor = (
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="youtube-thumbnail"
+            )
+            if pipeline_thumbnails
+            else None
+        )
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="youtube-upload"
+            ) as executor:
+                futures = [
+                    executor.submit(run, index, config)
+                    for index, config in enumerate(configs)
+                ]
+                outcomes = [future.result() for future in futures]
+        finally:
+            if thumbnail_executor is not None:
+                thumbnail_executor.shutdown(wait=True)
+
+        results = [
+            self.attach_thumbnail(result, thumbnail) for result, thumbnail in outcomes
+        ]
+        self.apply_post_upload_actions(zip(results, configs, strict=True))
+
+        succeeded = sum(result.ok for result in results)
+        logger.info(
+            f"並列アップロードが完了しました: 成功 {succeeded} 件 / "
+            f"失敗 {len(results) - succeeded} 件"
+        )
+        return results
+
+    def upload_in_worker(
+        self,
+        index: int,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        quota_reserved: bool = False,
+        thumbnail_executor: Executor | None = None,
+        resume: bool = False,
+    ) -> tuple[UploadResult, Future[ThumbnailResult] | None]:
+        """ワーカースレッドで1件の動画をアップロードし、結果を返す
+
+        upload_many()、ChannelPool、UploadWorker などが、自分で管理する
+        ワーカースレッドから呼び出すためのメソッド。スレッドごとに専用の
+        APIサービスを構築して使い回す。アップロード済みの照合、サムネイルの
+        正規化、動画とサムネイルの送信を行うが、再生リストへの追加と翻訳は
+        行わない (呼び出し元が apply_post_upload_actions() でまとめて適用する)。
+
+        Args:
+            index (int): 入力リスト内での位置
+            config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker): 進捗の通知先
+            chunksize (ChunkSize): アップロードのチャンクサイズ
+            quota_reserved (bool, optional): 呼び出し元でクォータを確保済みかどうか
+            thumbnail_executor (Executor | None, optional): サムネイルを
+                バックグラウンドでアップロードする場合の実行先
+            resume (bool, optional): 保存済みのセッションがあれば、そこから
+                再開するかどうか
+
+        Returns:
+            tuple[UploadResult, Future[ThumbnailResult] | None]:
+                アップロード結果 (例外は結果に格納される) と、
+                バックグラウンドで実行中のサムネイルの結果
+        """
+        # 呼び出し元で確保したクォータは、送信前に失敗した場合に返却する
+        reservation = (
+            _QuotaReservation(upload_calls(config)) if quota_reserved else None
+        )
+        try:
+            # 重複の場合も、続けてアップロード後の操作でAPIを呼び出すことがある
+            self.ensure_thread_service()
+            uploaded, key = self.find_uploaded(config)
+            if uploaded is not None:
+                if reservation is not None:
+                    self.refund_quota(reservation.unused())
+                result = UploadResult(
+                    index=index,
+                    title=config.title,
+                    response=uploaded,
+                    duplicate=True,
+                    thumbnail=ThumbnailResult(
+                        video_id=uploaded["id"], status="skipped"
+                    ),
+                )
+                return result, None
+
+            config = self.prepare_thumbnail(config)
+            response = self._upload(
+                config,
+                tracker,
+                chunksize,
+                resume=resume,
+                quota_reserved=quota_reserved,
+                key=key,
+                reservation=reservation,
+            )
+        except Exception as e:
+            if reservation is not None:
+                self.refund_quota(reservation.unused())
+            return UploadResult(index=index, title=config.title, error=e), None
+
+        result = UploadResult(index=index, title=config.title, response=response)
+        if thumbnail_executor is not None:
+            future = thumbnail_executor.submit(
+                self._thumbnail_in_worker, response["id"], config, tracker
+            )
+            return result, future
+
+        result.thumbnail = self._upload_thumbnail(response["id"], config, tracker)
+        return result, None
+
+    def _thumbnail_in_worker(
+        self, video_id: str, config: YoutubeConfig, tracker: ProgressTracker
+    ) -> ThumbnailResult:
+        """バックグラウンドのスレッドでサムネイルをアップロードする"""
+        try:
+            self.ensure_thread_service()
+        except Exception as e:
+            logger.error(f"サムネイル用のAPIサービスを構築できませんでした: {e}")
+            return ThumbnailResult(video_id=video_id, status="failed", error=e)
+        return self._upload_thumbnail(video_id, config, tracker)
+
+    @staticmethod
+    def attach_thumbnail(
+        result: UploadResult, thumbnail: Future[ThumbnailResult] | None
+    ) -> UploadResult:
+        """バックグラウンドで実行したサムネイルの結果を、アップロード結果に格納する
+
+        Args:
+            result (UploadResult): upload_in_worker() が返したアップロード結果
+            thumbnail (Future[ThumbnailResult] | None): upload_in_worker() が
+                返した、バックグラウンドで実行中のサムネイルの結果
+
+        Returns:
+            UploadResult: サムネイルの結果を格納した result
+        """
+        if thumbnail is not None:
+            result.thumbnail = thumbnail.result()
+        return result
+
+    def add_to_playlists(
+        self, additions: Iterable[PlaylistAddition]
+    ) -> list[BatchCallResult]:
+        """複数の動画を再生リストに追加する
+
+        playlistItems.insert を BATCH_LIMIT 件ずつ1回のバッチリクエストに
+        まとめて送信する。1件の失敗で全体が中断されることはなく、
+        エラーは結果に格納される。MANAGE_SCOPES での認証が必要。
+
+        Args:
+            additions (Iterable[PlaylistAddition]): 追加する動画と再生リスト
+
+        Returns:
+            list[BatchCallResult]: 入力と同じ順序に並んだ、1件ごとの結果
+
+        Raises:
+            AuthError: APIに接続されていない場合
+
+        Examples:
+            uploader.add_to_playlists(
+                PlaylistAddition(video_id=video_id, playlist_id="PLxxxx")
+                for video_id in video_ids
+            )
+        """
+        self._require_service()
+        return self._execute_batch(
+            [self._playlist_call(addition) for addition in additions]
+        )
+
+    def update_videos(self, updates: Iterable[VideoUpdate]) -> list[BatchCallResult]:
+        """アップロード済みの複数の動画に、タイトルと説明文の翻訳を設定する
+
+        videos.update を BATCH_LIMIT 件ずつ1回のバッチリクエストにまとめて
+        送信する。動画には言語 (snippet.defaultLanguage) が設定されている
+        必要がある。MANAGE_SCOPES での認証が必要。
+
+        Args:
+            updates (Iterable[VideoUpdate]): 更新する動画と翻訳
+
+        Returns:
+            list[BatchCallResult]: 入力と同じ順序に並んだ、1件ごとの結果
+
+        Raises:
+            AuthError: APIに接続されていない場合
+        """
+        self._require_service()
+        return self._execute_batch([self._update_call(update) for update in updates])
+
+    def apply_post_upload_actions(
+        self, uploads: Iterable[tuple[UploadResult, YoutubeConfig]]
+    ) -> None:
+        """アップロードした動画の再生リストへの追加と翻訳を、まとめて適用する
+
+        upload_in_worker() の結果をためておき、まとめて呼び出すことで、
+        複数の動画の操作を BATCH_LIMIT 件ずつのバッチリクエストにする。
+        アップロード済みでスキップした動画には、インデックスに適用待ちとして
+        記録された操作 (前回の実行で適用前に終了した場合) だけを適用する。
+        適用待ちの記録は、クォータ不足で送信しなかった場合を除き、
+        呼び出しの成否にかかわらず削除する。呼び出したスレッドのAPIサービスを使う。
+
+        Args:
+            uploads (Iterable[tuple[UploadResult, YoutubeConfig]]): アップロード
+                結果と設定の組。結果の actions に、適用した結果を追加する
+                (失敗した動画は除く)
+        """
+        calls: list[_BatchCall] = []
+        owners: list[UploadResult] = []
+        for result, config in uploads:
+            if not result.ok or result.response is None:
+                continue
+            video_id = result.response["id"]
+            actions = self._actions_to_apply(video_id, config, result.duplicate)
+            if actions is None:
+                continue
+            for call in self._post_upload_calls(video_id, actions):
+                calls.append(call)
+                owners.append(result)
+
+        applied: set[str] = set()
+        unsent: set[str] = set()
+        for owner, outcome in zip(owners, self._execute_batch(calls), strict=True):
+            owner.actions.append(outcome)
+            applied.add(outcome.video_id)
+            if isinstance(outcome.error, QuotaExceededError):
+                unsent.add(outcome.video_id)
+        if self._upload_index is not None and applied:
+            self._upload_index.clear_pending_actions(applied - unsent)
+
+    def _actions_to_apply(
+        self, video_id: str, config: YoutubeConfig, duplicate: bool
+    ) -> PostUploadActions | None:
+        """動画に適用する、アップロード後の操作を返す (なければNone)"""
+        if not duplicate:
+            return (
+                config.post_upload_actions if config.has_post_upload_actions else None
+            )
+        if self._upload_index is None:
+            return None
+        return self._upload_index.pending_actions(video_id)
+
+    def _apply_actions_for(
+        self, config: YoutubeConfig, response: dict, duplicate: bool = False
+    ) -> None:
+        """1件の動画に、アップロード後の操作を適用する"""
+        self.apply_post_upload_actions(
+            [
+                (
+                    UploadResult(
+                        index=0,
+                        title=config.title,
+                        response=response,
+                        duplicate=duplicate,
+                    ),
+                    config,
+                )
+            ]
+        )
+
+    def _post_upload_calls(
+        self, video_id: str, actions: PostUploadActions
+    ) -> list[_BatchCall]:
+        """アップロード後に実行するAPI呼び出しを返す"""
+        calls = [
+            self._playlist_call(
+                PlaylistAddition(video_id=video_id, playlist_id=playlist_id)
+            )
+            for playlist_id in actions.playlist_ids
+        ]
+        if actions.localizations:
+            calls.append(
+                self._update_call(
+                    VideoUpdate(video_id=video_id, localizations=actions.localizations)
+                )
+            )
+        return calls
+
+    @staticmethod
+    def _playlist_call(addition: PlaylistAddition) -> _BatchCall:
+        """再生リストへの追加を、playlistItems.insert の呼び出しにする"""
+        snippet: dict[str, Any] = {
+            "playlistId": addition.playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": addition.video_id},
+        }
+        if addition.position is not None:
+            snippet["position"] = addition.position
+        return (
+            "playlistItems.insert",
+            addition.video_id,
+            addition.playlist_id,
+            {"part": "snippet", "body": {"snippet": snippet}},
+        )
+
+    @staticmethod
+    def _update_call(update: VideoUpdate) -> _BatchCall:
+        """動画の翻訳の設定を、videos.update の呼び出しにする"""
+        localizations = {
+            language: localization.model_dump()
+            for language, localization in update.localizations.items()
+        }
+        return (
+            "videos.update",
+            update.video_id,
+            ",".join(update.localizations),
+            {
+                "part": "localizations",
+                "body": {"id": update.video_id, "localizations": localizations},
+            },
+        )
+
+    def _execute_batch(self, calls: list[_BatchCall]) -> list[BatchCallResult]:
+        """API呼び出しを BATCH_LIMIT 件ずつ、バッチリクエストにまとめて実行する
+
+        バッチリクエストごとに必要なクォータを確保する。
+        クォータが不足した場合は、残りの呼び出しを送信せずに失敗とする。
+
+        Args:
+            calls (list[_BatchCall]): 実行するAPI呼び出し
+
+        Returns:
+            list[BatchCallResult]: calls と同じ順序に並んだ、1件ごとの結果
+        """
+        results: list[BatchCallResult] = []
+        for start in range(0, len(calls), BATCH_LIMIT):
+            chunk = calls[start : start + BATCH_LIMIT]
+            units: dict[str, int] = {}
+            for method, *_ in chunk:
+                units[method] = units.get(method, 0) + QUOTA_COSTS[method]
+            try:
+                self.reserve_quota(units)
+            except QuotaExceededError as e:
+                logger.error(f"{len(calls) - start} 件のAPI呼び出しを中止します: {e}")
+                results.extend(
+                    BatchCallResult(
+                        method=method, video_id=video_id, target=target, error=e
+                    )
+                    for method, video_id, target, _ in calls[start:]
+                )
+                break
+            results.extend(self._execute_chunk(chunk))
+
+        if calls:
+            failed = [result for result in results if not result.ok]
+            for result in failed:
+                logger.error(
+                    f"{result.method} ({result.video_id}, {result.target}) に"
+                    f"失敗しました: {result.error}"
+                )
+            logger.info(
+                f"{len(calls)} 件のAPI呼び出しをバッチリクエストで実行しました: "
+                f"成功 {len(calls) - len(failed)} 件 / 失敗 {len(failed)} 件"
+            )
+        return results
+
+    def _execute_chunk(self, chunk: list[_BatchCall]) -> list[BatchCallResult]:
+        """1回のバッチリクエストで実行し、一時的なエラーの呼び出しだけを再送する
+
+        再送するのは RETRYABLE_BATCH_METHODS の呼び出しだけで、
+        playlistItems.insert は一時的なエラーでも再送せずに失敗とする。
+
+        Args:
+            chunk (list[_BatchCall]): BATCH_LIMIT 件以下のAPI呼び出し
+
+        Returns:
+            list[BatchCallResult]: chunk と同じ順序に並んだ、1件ごとの結果
+        """
+        outcomes: list[tuple[dict | None, Exception | None]] = [(None, None)] * len(
+            chunk
+        )
+        pending = list(range(len(chunk)))
+
+        def send() -> None:
+            nonlocal pending
+            try:
+                with self._instrumentation.phase(SPAN_BATCH, {"calls": len(pending)}):
+                    sent = self._send_batch([chunk[index] for index in pending])
+            except Exception as e:
+                # バッチリクエスト自体の失敗は、送信した呼び出しすべての失敗とする
+                sent = [(None, e)] * len(pending)
+            for index, outcome in zip(pending, sent, strict=True):
+                outcomes[index] = outcome
+            pending = [
+                index
+                for index in pending
+                if (error := outcomes[index][1]) is not None
+                and chunk[index][0] in RETRYABLE_BATCH_METHODS
+                and self._retry_policy.is_retryable(error)
+            ]
+            if pending:
+                # 一時的なエラーで失敗した呼び出しだけを、次のバッチリクエストで再送する
+                error = outcomes[pending[0]][1]
+                assert error is not None
+                raise error
+
+        # 再試行しても失敗した呼び出しには、最後の例外が格納されている
+        with suppress(Exception):
+            self._with_retry(send)
+
+        results = []
+        for (method, video_id, target, _), (response, error) in zip(
+            chunk, outcomes, strict=True
+        ):
+            if isinstance(error, HttpError) and self.is_quota_exceeded(error):
+                self.exhaust_quota()
+            results.append(
+                BatchCallResult(
+                    method=method,
+                    video_id=video_id,
+                    target=target,
+                    response=response,
+                    error=error,
+                )
+            )
+        return results
+
+    def _send_batch(
+        self, calls: list[_BatchCall]
+    ) -> list[tuple[dict | None, Exception | None]]:
+        """API呼び出しを1回のバッチリクエストで送信する
+
+        Args:
+            calls (list[_BatchCall]): BATCH_LIMIT 件以下のAPI呼び出し
+
+        Returns:
+            list[tuple[dict | None, Exception | None]]: calls と同じ順序に並んだ、
+                呼び出しごとのレスポンスと例外
+
+        Raises:
+            HttpError: バッチリクエスト自体が失敗した場合
+        """
+        outcomes: list[tuple[dict | None, Exception | None]] = [(None, None)] * len(
+            calls
+        )
+
+        def callback(request_id: str, response: Any, exception: Exception) -> None:
+            outcomes[int(request_id)] = (response, exception)
+
+        service = self._service()
+        batch = service.new_batch_http_request(callback=callback)
+        for index, (method, _, _, kwargs) in enumerate(calls):
+            resource, verb = method.split(".")
+            request = getattr(getattr(service, resource)(), verb)(**kwargs)
+            batch.add(request, request_id=str(index))
+        batch.execute()
+        return outcomes
+
+    def find_uploaded(
+        self, config: YoutubeConfig
+    ) -> tuple[dict | None, UploadKey | None]:
+        """同じ内容とメタデータの動画がアップロード済みか照合する
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+
+        Returns:
+            tuple[dict | None, UploadKey | None]: アップロード済みの場合は
+                そのときのレスポンス辞書と、照合に使ったキー
+                (インデックスを使わない場合はどちらもNone)
+        """
+        if self._upload_index is None:
+            return None, None
+
+        key = upload_key(config)
+        uploaded = self._upload_index.lookup(key)
+        if uploaded is None and self._upload_index.has_candidates(key):
+            # 同じメタデータとサイズの動画がある場合だけ、内容を読んで照合する
+            key = key.model_copy(update={"content_hash": hash_video(config)})
+            uploaded = self._upload_index.lookup(key)
+        if uploaded is not None:
+            logger.info(
+                f"動画 '{config.title}' はアップロード済みのため、スキップします: "
+                f"https://www.youtube.com/watch?v={uploaded['id']}"
+            )
+        return uploaded, key
+
+    def prepare_thumbnail(self, config: YoutubeConfig) -> YoutubeConfig:
+        """動画の送信前に、サムネイルを検証・正規化する
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+
+        Returns:
+            YoutubeConfig: サムネイルを正規化した設定
+
+        Raises:
+            UploadError: サムネイルが条件を満たさず、正規化もできない場合
+        """
+        if self._thumbnail_processor is None:
+            return config
+        return self._thumbnail_processor.apply(config)
+
+    def ensure_thread_service(self) -> None:
+        """現在のスレッド専用のAPIサービスがなければ構築する
+
+        googleapiclient のサービスはスレッドセーフではないため、
+        connect() したスレッド以外からAPIを呼び出す前に実行する。
+        """
+        if getattr(self._local, "service", None) is None:
+            self._local.service = self._build_service()
+
+    def _build_service(self) -> Any:
+        """共有の認証情報から、専用のHTTP接続を持つAPIサービスを構築する
+
+        接続プールを使う場合は、すべてのサービスで同じプールを共有する。
+
+        Returns:
+            Any: YouTube Data API のサービスオブジェクト
+        """
+        with self._instrumentation.phase(SPAN_BUILD_SERVICE):
+            if self._http is not None:
+                return build_youtube_service(http=self._http)
+            return build_youtube_service(credentials=self._credentials)
+
+    def _service(self) -> Any:
+        """現在のスレッドで使うAPIサービスを返す
+
+        upload_many() のワーカースレッドでは専用のサービスを、
+        それ以外では connect() で構築したサービスを返す。
+        """
+        return getattr(self._local, "service", None) or self._youtube_service
+
+    def _require_service(self) -> None:
+        """APIに接続済みであることを確認する
+
+        Raises:
+            AuthError: APIに接続されていない場合
+        """
         if self._youtube_service is None:
             raise AuthError(
                 "YouTube APIに接続されていません。"
                 "connect() メソッドを呼び出してください。"
             )
 
-        logger.info(f"動画 '{config.title}' のアップロードを開始します...")
+    @staticmethod
+    def build_body(config: YoutubeConfig) -> dict[str, Any]:
+        """設定情報から videos().insert に渡すメタデータを組み立てる
+
+        AsyncYoutubeUploader も同じメタデータを送信するために使う。
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
 
-        # 動画のメタデータを設定
+        Returns:
+            dict[str, Any]: 動画のメタデータ
+        """
         body: dict[str, Any] = {
             "snippet": {
                 "title": config.title,
@@ -223,41 +1383,320 @@ class YoutubeUploader:
         if config.publish_at:
             body["status"]["publishAt"] = config.publish_at.isoformat()
 
-        # MediaIoBaseUploadは、io.BytesIOを受け取る
+        # 翻訳を設定するには、アップロード時に動画の言語を設定しておく
+        if config.default_language:
+            body["snippet"]["defaultLanguage"] = config.default_language
+
+        return body
+
+    def _upload(
+        self,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        resume: bool,
+        quota_reserved: bool = False,
+        key: UploadKey | None = None,
+        reservation: _QuotaReservation | None = None,
+    ) -> dict:
+        """動画ソースを開き、アップロードを実行する
+
+        自分で確保したクォータは、動画の送信前に失敗した場合に返却する。
+        呼び出し元から reservation を受け取った場合は、返却も呼び出し元が行う。
+
+        Args:
+            config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker): 進捗の集計と通知
+            chunksize (ChunkSize): チャンクサイズ（バイト単位、または "auto"）
+            resume (bool): 保存済みのセッションから再開するかどうか
+            quota_reserved (bool, optional): 呼び出し元でクォータを確保済みかどうか
+            key (UploadKey | None, optional): アップロード後にインデックスへ
+                記録するためのキー
+            reservation (_QuotaReservation | None, optional): 呼び出し元で
+                確保したクォータの記録
+
+        Returns:
+            dict : APIのレスポンス辞書
+        """
+        body = self.build_body(config)
+        owned = reservation is None
+        if reservation is None:
+            reservation = _QuotaReservation()
+
+        try:
+            with (
+                self._instrumentation.phase(
+                    SPAN_UPLOAD, {"chunksize": str(chunksize), "resume": resume}
+                ),
+                open_video_stream(config) as stream,
+                self._bandwidth.transfer() as share,
+            ):
+                # 送信のための読み込みに合わせて、内容のハッシュを計算する
+                hasher = (
+                    ContentHasher()
+                    if key is not None and key.content_hash is None
+                    else None
+                )
+                if hasher is not None:
+                    stream = ObservedStream(stream, [hasher])  # type: ignore[assignment]
+                response = self._insert_video(
+                    body,
+                    stream,
+                    config,
+                    tracker,
+                    chunksize,
+                    resume,
+                    quota_reserved,
+                    reservation=reservation,
+                    bandwidth_share=share,
+                )
+        except FileNotFoundError:
+            if owned:
+                self.refund_quota(reservation.unused())
+            raise
+        except OSError as e:
+            if owned:
+                self.refund_quota(reservation.unused())
+            logger.error(f"動画ファイルの読み込み中にエラーが発生しました: {e}")
+            raise UploadError(f"動画ファイルを開けませんでした: {e}") from e
+        except Exception:
+            if owned:
+                self.refund_quota(reservation.unused())
+            raise
+
+        if key is not None:
+            content_hash = (
+                hasher.hexdigest(key.size) if hasher is not None else key.content_hash
+            )
+            self.record_upload(key, config, content_hash, response)
+        return response
+
+    def record_upload(
+        self,
+        key: UploadKey,
+        config: YoutubeConfig,
+        content_hash: str | None,
+        response: dict,
+    ) -> None:
+        """アップロードした動画をインデックスに記録する
+
+        途中から再開した場合など、送信中に内容全体のハッシュを計算できなかった
+        場合に限り、動画を読み直してハッシュを計算する。
+        AsyncYoutubeUploader と共通の処理。
+
+        Args:
+            key (UploadKey): find_uploaded() で作った照合用のキー
+            config (YoutubeConfig): アップロード設定情報
+            content_hash (str | None): 送信中に計算した内容のハッシュ
+            response (dict): APIのレスポンス辞書
+        """
+        if self._upload_index is None:
+            return
+        if content_hash is None:
+            try:
+                content_hash = hash_video(config)
+            except OSError as e:
+                logger.warning(f"アップロードした動画を記録できませんでした: {e}")
+                return
+        actions = config.post_upload_actions if config.has_post_upload_actions else None
+        self._upload_index.record(key, content_hash, response, actions)
+
+    def _insert_video(
+        self,
+        body: dict[str, Any],
+        stream: BinaryIO,
+        config: YoutubeConfig,
+        tracker: ProgressTracker,
+        chunksize: ChunkSize,
+        resume: bool,
+        quota_reserved: bool = False,
+        reservation: _QuotaReservation | None = None,
+        bandwidth_share: BandwidthShare | None = None,
+    ) -> dict:
+        """ストリームから動画を読み出し、videos().insert でアップロードする
+
+        Args:
+            body (dict[str, Any]): 動画のメタデータ
+            stream (BinaryIO): 動画データの読み込み用ストリーム
+            config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker): 進捗の集計と通知
+            chunksize (ChunkSize): チャンクサイズ（バイト単位、または "auto"）
+            resume (bool): 保存済みのセッションから再開するかどうか
+            quota_reserved (bool, optional): 呼び出し元でクォータを確保済みかどうか
+            reservation (_QuotaReservation | None, optional): 確保したクォータと
+                呼び出したAPIメソッドの記録先
+            bandwidth_share (BandwidthShare | None, optional): 送信帯域を
+                共有するための、このアップロードの割り当て
+
+        Returns:
+            dict : APIのレスポンス辞書
+
+        Raises:
+            QuotaExceededError: クォータが不足している場合 (動画の送信前に判定)
+            UploadError: アップロード中にAPIエラーが発生した場合
+        """
+        store = self._session_store
+        fingerprint = config_fingerprint(config) if store is not None else None
+        session: UploadSession | None = None
+        if resume and store is not None and fingerprint is not None:
+            session = store.load(fingerprint)
+
+        # --- 送信前のクォータ確認 ---
+        # 保存済みのセッションから再開する場合、videos.insert は消費済み
+        if not quota_reserved:
+            calls = upload_calls(config)
+            if session is not None:
+                calls.pop("videos.insert")
+            self.reserve_quota(calls)
+            if reservation is not None:
+                reservation.reserved = calls
+
+        from googleapiclient.http import MediaIoBaseUpload  # type: ignore
+
+        # MediaIoBaseUploadは、シーク可能なストリームを受け取り
+        # next_chunk() のたびに必要な範囲だけを読み出す
+        sizer = AdaptiveChunkSizer() if chunksize == "auto" else None
+        # HTTP層が送信のために読み出すたびに (8KiBごと)、帯域を確保し
+        # 送信位置を進捗に反映する
+        observed = ObservedStream(
+            stream,
+            [
+                lambda position, data: self._bandwidth.acquire(
+                    len(data), bandwidth_share
+                ),
+                lambda position, data: tracker.update(position + len(data)),
+            ],
+        )
         media = MediaIoBaseUpload(
-            io.BytesIO(config.video_bytes),
-            chunksize=chunksize,
+            observed,
+            chunksize=sizer.chunksize if sizer is not None else chunksize,
             resumable=True,
             mimetype=config.video_mimetype,
         )
+        # chunksize=-1 のまま途中から再開すると、googleapiclient が送信範囲
+        # (Content-Range) を誤って計算するため、全体を1チャンクとして扱う
+        if chunksize == -1 and media.size():
+            media._chunksize = media.size()
+
+        tracker.begin("video", media.size())
+
+        def with_retry(func: Callable[[], Any]) -> Any:
+            return self._with_retry(func, tracker)
+
+        instrumentation = self._instrumentation
+
+        def start_session() -> None:
+            with instrumentation.phase(SPAN_START_SESSION):
+                with_retry(lambda: self._start_resumable_session(request, media))
+
+        def send_chunk() -> tuple[Any, Any]:
+            with instrumentation.phase(
+                SPAN_CHUNK, {"offset": request.resumable_progress}
+            ):
+                return self._next_chunk(request)
 
         try:
             # APIへの挿入リクエストを構築
-            request = self._youtube_service.videos().insert(
-                part=",".join(body.keys()), body=body, media_body=media
-            )
+            with instrumentation.phase(SPAN_BUILD_REQUEST):
+                request = (
+                    self._service()
+                    .videos()
+                    .insert(part=",".join(body.keys()), body=body, media_body=media)
+                )
+
+            # ここから先はリクエストを送信するため、失敗してもクォータは返却しない
+            if reservation is not None:
+                reservation.called.add("videos.insert")
+            if store is not None and fingerprint is not None:
+                if session is not None:
+                    logger.info(
+                        "保存されたセッションからアップロードを再開します "
+                        f"(送信済み: {session.offset}/{session.total_size} バイト)"
+                    )
+                    request.resumable_uri = session.resumable_uri
+                    # 次の next_chunk() で、サーバが受信済みのバイト数を問い合わせる
+                    request._in_error_state = True
+                else:
+                    # 送信前にセッションURIを保存するため、セッションだけ先に開始する
+                    start_session()
+                    session = UploadSession(
+                        fingerprint=fingerprint,
+                        resumable_uri=request.resumable_uri,
+                        total_size=media.size(),
+                    )
+                    store.save(session)
 
             # チャンクアップロードの実行
+            resuming = resume and session is not None
             response = None
+            bytes_sent = 0
+            upload_started = time.monotonic()
             while response is None:
-                status, response = request.next_chunk()
+                sent_before = request.resumable_progress
+                started = time.monotonic()
+                try:
+                    # 一時的なエラーは再試行し、サーバが受信済みのバイトから再開する
+                    status, response = with_retry(send_chunk)
+                except HttpError as e:
+                    if not resuming or e.resp.status not in (404, 410):
+                        raise
+                    # セッションの有効期限切れ: 新しいセッションで最初から送り直す
+                    logger.warning(
+                        "保存されたセッションは有効期限が切れています。"
+                        "最初からアップロードします。"
+                    )
+                    resuming = False
+                    request.resumable_uri = None
+                    request.resumable_progress = 0
+                    request._in_error_state = False
+                    self.record_quota({"videos.insert": QUOTA_COSTS["videos.insert"]})
+                    if store is not None and session is not None:
+                        start_session()
+                        session.resumable_uri = request.resumable_uri
+                        session.offset = 0
+                        store.save(session)
+                    continue
+
+                chunk_seconds = time.monotonic() - started
+                if not resuming:
+                    # 再開直後のチャンクは、以前のプロセスで送信した分を含むため数えない
+                    sent = (
+                        media.size()
+                        if response is not None
+                        else request.resumable_progress
+                    ) - sent_before
+                    bytes_sent += sent
+                    instrumentation.add(METRIC_BYTES_SENT, sent, {"phase": "video"})
+                if sizer is not None and status and not resuming:
+                    # 実測スループットに合わせて、次のチャンクサイズを調整する
+                    media._chunksize = sizer.record(
+                        request.resumable_progress - sent_before, chunk_seconds
+                    )
+
+                resuming = False
                 if status:
-                    progress = status.progress()  # 進捗率を取得 (0.0 から 1.0)
+                    # 送信済みバイト数を保存し、中断時に再開できるようにする
+                    if store is not None and session is not None:
+                        session.offset = request.resumable_progress
+                        store.save(session)
+
+                    # --- 進捗を通知する ---
+                    tracker.chunk_done(request.resumable_progress, chunk_seconds)
 
-                    # --- 進捗コールバックを呼び出す ---
-                    if progress_callback:
-                        progress_callback(progress)
-                    else:
-                        # コールバックが指定されていない場合のみログに出力
-                        logger.info(f"アップロード進捗: {int(progress * 100)}%")
+            tracker.finish()
+            upload_seconds = time.monotonic() - upload_started
+            if bytes_sent > 0 and upload_seconds > 0:
+                instrumentation.record(
+                    METRIC_UPLOAD_THROUGHPUT, bytes_sent / upload_seconds
+                )
+
+            # 送信が完了したセッションは不要になるため削除
+            if store is not None and fingerprint is not None:
+                store.delete(fingerprint)
 
             # 結果の検証と戻り値
             if "id" in response:
                 video_id = response["id"]
-
-                # サムネイルのアップロード処理
-                self._upload_thumbnail(video_id, config)
-
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
                 logger.info(f"動画のアップロードが完了しました: {video_url}")
                 return response
@@ -272,53 +1711,169 @@ class YoutubeUploader:
             raise
 
         except Exception as e:
-            logger.error(f"動画のアップロード中にエラーが発生しました: {e}")
-            raise UploadError(
-                f"動画のアップロード中に予期せぬエラーが発生しました: {e}"
-            ) from e
+            raise self.upload_failure(e) from e
+
+    def upload_failure(self, error: Exception) -> UploadError:
+        """動画の送信中の例外を分類してログに出力し、送出する例外を返す
+
+        クォータ超過の場合は、台帳に今日の残りを0として記録する
+        (台帳の記録とAPIの実際の消費量がずれている場合)。
+        AsyncYoutubeUploader と共通の処理。
+
+        Args:
+            error (Exception): 発生した例外
+
+        Returns:
+            UploadError: クォータ超過の場合は QuotaExceededError、
+                それ以外は UploadError
+        """
+        if isinstance(error, HttpError) and self.is_quota_exceeded(error):
+            self.exhaust_quota()
+            logger.error(f"APIのクォータを超過しました: {error}")
+            return QuotaExceededError(
+                f"APIのクォータを超過しました: {error}", resets_at=quota_resets_at()
+            )
+        logger.error(f"動画のアップロード中にエラーが発生しました: {error}")
+        return UploadError(
+            f"動画のアップロード中に予期せぬエラーが発生しました: {error}"
+        )
+
+    @staticmethod
+    def _next_chunk(request: Any) -> tuple[Any, Any]:
+        """次のチャンクを送信する
+
+        通信レベルの例外では googleapiclient がエラー状態にならない場合があるため、
+        セッション開始後の失敗は必ずエラー状態にし、再試行時にサーバへ
+        受信済みのバイト数を問い合わせるようにする。
+
+        Args:
+            request (Any): videos().insert で構築したリクエスト
+
+        Returns:
+            tuple[Any, Any]: (進捗ステータス, 完了時のレスポンス)
+        """
+        try:
+            return request.next_chunk()
+        except Exception:
+            if request.resumable_uri is not None:
+                request._in_error_state = True
+            raise
+
+    @staticmethod
+    def _start_resumable_session(request: Any, media: "MediaIoBaseUpload") -> None:
+        """再開可能アップロードのセッションを開始し、URIを request に設定する
+
+        next_chunk() は最初のチャンクの送信と同時にセッションを開始するため、
+        送信前にセッションURIを保存できるよう、開始リクエストだけを先に送る。
+
+        Args:
+            request (Any): videos().insert で構築したリクエスト
+            media (MediaIoBaseUpload): アップロードするメディア
+
+        Raises:
+            ResumableUploadError: セッションの開始に失敗した場合
+        """
+        headers = dict(request.headers)
+        headers["X-Upload-Content-Type"] = media.mimetype()
+        headers["X-Upload-Content-Length"] = str(media.size())
+        headers["content-length"] = str(request.body_size)
 
-    def _upload_thumbnail(self, video_id: str, config: YoutubeConfig) -> None:
+        resp, content = request.http.request(
+            request.uri, method=request.method, body=request.body, headers=headers
+        )
+        if resp.status == 200 and "location" in resp:
+            request.resumable_uri = resp["location"]
+        else:
+            raise ResumableUploadError(resp, content)
+
+    def _upload_thumbnail(
+        self,
+        video_id: str,
+        config: YoutubeConfig,
+        tracker: ProgressTracker | None = None,
+    ) -> ThumbnailResult:
         """指定された動画IDにサムネイル画像をアップロードする
 
+        サムネイルの失敗は致命的ではないため、例外は送出せず結果に格納する。
+
         Args:
             video_id (str): 対象となるYouTube動画のID
             config (YoutubeConfig): アップロード設定情報
+            tracker (ProgressTracker | None, optional): 進捗の集計と通知
+
+        Returns:
+            ThumbnailResult: サムネイルのアップロード結果
         """
         if config.thumbnail_bytes is None or config.thumbnail_mimetype is None:
-            return  # データがなければスキップ
+            # データがなければスキップ
+            return ThumbnailResult(video_id=video_id, status="skipped")
 
         logger.info("サムネイルのアップロードを開始します...")
 
+        from googleapiclient.http import MediaIoBaseUpload  # type: ignore
+
         media = MediaIoBaseUpload(
-            io.BytesIO(config.thumbnail_bytes),
+            BufferReader(config.thumbnail_bytes),
             chunksize=-1,
             resumable=True,
             mimetype=config.thumbnail_mimetype,
         )
 
         try:
-            self._youtube_service.thumbnails().set(
-                videoId=video_id, media_body=media
-            ).execute()
+            request = (
+                self._service().thumbnails().set(videoId=video_id, media_body=media)
+            )
+            thumbnail_size = memoryview(config.thumbnail_bytes).nbytes
+            if tracker is not None:
+                tracker.begin("thumbnail", thumbnail_size)
+            with self._instrumentation.phase(SPAN_THUMBNAIL):
+                self._with_retry(request.execute, tracker)
+            self._instrumentation.add(
+                METRIC_BYTES_SENT, thumbnail_size, {"phase": "thumbnail"}
+            )
+            if tracker is not None:
+                tracker.finish()
 
             logger.info("サムネイルのアップロードが完了しました。")
+            return ThumbnailResult(video_id=video_id, status="uploaded")
 
-        except HttpError as e:
+        except Exception as e:
+            # サムネイルアップロード失敗は致命的ではないため、例外を再発生させない
+            return self.thumbnail_failure(video_id, e)
+
+    def thumbnail_failure(self, video_id: str, error: Exception) -> ThumbnailResult:
+        """サムネイルのアップロードの失敗を分類してログに出力し、結果を返す
+
+        クォータ超過の場合は、台帳に今日の残りを0として記録する。
+        AsyncYoutubeUploader と共通の処理。
+
+        Args:
+            video_id (str): 対象となるYouTube動画のID
+            error (Exception): 発生した例外
+
+        Returns:
+            ThumbnailResult: 失敗したサムネイルの結果
+        """
+        if isinstance(error, HttpError):
+            if self.is_quota_exceeded(error):
+                self.exhaust_quota()
+                logger.error(
+                    f"サムネイルのアップロードでクォータを超過しました: {error}"
+                )
             # --- 権限がない可能性の処理 ---
-            if e.resp.status == 403:  # 403 Forbidden は権限がない可能性が高い
+            elif error.resp.status == 403:  # 403 Forbidden は権限がない可能性が高い
                 logger.critical(
                     "❌ サムネイルアップロード権限エラー: "
                     "YouTubeアカウントが電話番号で認証されていない可能性があります。"
                 )
-                logger.critical(f"詳細なAPIエラーメッセージ: {e.content.decode()}")
+                logger.critical(f"詳細なAPIエラーメッセージ: {error.content.decode()}")
             else:
-                # その他のAPIエラーはUploadErrorとして再発生させる
                 logger.error(
-                    f"サムネイルアップロード中に予期せぬAPIエラーが発生しました: {e}"
+                    "サムネイルアップロード中に予期せぬAPIエラーが発生しました: "
+                    f"{error}"
                 )
-                # サムネイルアップロード失敗は致命的ではないため、例外を再発生させない
-                pass
-        except Exception as e:
-            logger.error(f"サムネイルアップロード中に予期せぬエラーが発生しました: {e}")
-            # サムネイルアップロード失敗は致命的ではないため、例外を再発生させない
-            pass
+        else:
+            logger.error(
+                f"サムネイルアップロード中に予期せぬエラーが発生しました: {error}"
+            )
+        return ThumbnailResult(video_id=video_id, status="failed", error=error)
@@ -0,0 +1,88 @@
+"""テスト全体で共有するフィクスチャ"""
+
+import json
+import sys
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# ベンチマーク用のフェイクサーバーを、ユニットテストでも使う
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from fake_youtube import FakeYoutubeServer, attach  # noqa: E402
+
+from youtube_uploader import YoutubeConfig, YoutubeUploader  # noqa: E402
+from youtube_uploader.youtube import MANAGE_SCOPES  # noqa: E402
+
+
+def write_auth_files(
+    auth_path: Path, project_id: str = "test-project", expires_in: float = 3600
+) -> Path:
+    """client_secret.json と、有効期限内の token.json を作成する
+
+    Returns:
+        Path: 作成した認証ディレクトリ
+    """
+    auth_path.mkdir(parents=True, exist_ok=True)
+    client = {
+        "client_id": "1234-test.apps.googleusercontent.com",
+        "client_secret": "secret",
+        "project_id": project_id,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    (auth_path / "client_secret.json").write_text(json.dumps({"installed": client}))
+    expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
+    token = {
+        "token": "access-token",
+        "refresh_token": "refresh-token",
+        "client_id": client["client_id"],
+        "client_secret": client["client_secret"],
+        "token_uri": client["token_uri"],
+        "scopes": MANAGE_SCOPES,
+        "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    }
+    (auth_path / "token.json").write_text(json.dumps(token))
+    return auth_path
+
+
+def connect_fake(uploader: YoutubeUploader, server: FakeYoutubeServer) -> None:
+    """認証情報を読み込んで接続し、APIの送信先をフェイクサーバーに向ける"""
+    uploader.connect()
+    attach(uploader, server.http())
+
+
+@pytest.fixture(scope="session")
+def fake_youtube() -> Iterator[FakeYoutubeServer]:
+    """セッション全体で共有するフェイクサーバー"""
+    with FakeYoutubeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_server(fake_youtube: FakeYoutubeServer) -> FakeYoutubeServer:
+    """テストごとに状態と通信状況をリセットしたフェイクサーバー"""
+    fake_youtube.reset()
+    return fake_youtube
+
+
+@pytest.fixture
+def fake_uploader(
+    tmp_path: Path, fake_server: FakeYoutubeServer
+) -> Iterator[YoutubeUploader]:
+    """フェイクサーバーに接続済みのアップローダー"""
+    uploader = YoutubeUploader(write_auth_files(tmp_path / "auth"))
+    connect_fake(uploader, fake_server)
+    yield uploader
+
+
+def make_config(title: str = "テスト動画", size: int = 1024, **kwargs) -> YoutubeConfig:
+    """指定したサイズのダミー動画を送信する設定を作る
+
+    video_bytes / video_path を指定した場合は、その動画を送信する。
+    """
+    if "video_bytes" not in kwargs and "video_path" not in kwargs:
+        kwargs["video_bytes"] = bytes(size)
+    return YoutubeConfig(video_mimetype="video/mp4", title=title, **kwargs)
@@ -0,0 +1,273 @@
+"""async_youtube.py (AsyncYoutubeUploader) のユニットテスト"""
+
+import asyncio
+import logging
+import subprocess
+import sys
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fake_youtube import FakeYoutubeServer
+from google.oauth2.credentials import Credentials
+
+from youtube_uploader import (
+    Instrumentation,
+    TokenStore,
+    UploadError,
+    YoutubeUploader,
+)
+from youtube_uploader.instrumentation import SPAN_UPLOAD
+from youtube_uploader.quota import QUOTA_COSTS
+from youtube_uploader.sessions import config_fingerprint
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+pytest.importorskip("aiohttp")
+
+from youtube_uploader.async_youtube import AsyncYoutubeUploader  # noqa: E402
+
+CHUNK_SIZE = 256 * 1024
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def auth_path(tmp_path):
+    return write_auth_files(tmp_path / "auth")
+
+
+def run_async(auth_path, server: FakeYoutubeServer, scenario):  # type: ignore[no-untyped-def]
+    """フェイクサーバーに接続した AsyncYoutubeUploader でシナリオを実行する"""
+
+    async def main():
+        uploader = AsyncYoutubeUploader(
+            auth_path, upload_base_url=f"{server.url}/upload/youtube/v3"
+        )
+        async with uploader:
+            return await scenario(uploader)
+
+    return asyncio.run(main())
+
+
+# ----------------------------------------------------------------------
+# 1. アップロード
+# ----------------------------------------------------------------------
+
+
+def test_upload_video_with_thumbnail(auth_path, fake_server):
+    """動画とサムネイルがチャンク単位でアップロードされること"""
+    config = make_config(
+        size=CHUNK_SIZE * 3,
+        thumbnail_bytes=b"\xff\xd8" + bytes(100),
+        thumbnail_mimetype="image/jpeg",
+    )
+
+    response = run_async(
+        auth_path,
+        fake_server,
+        lambda uploader: uploader.upload_video(config, chunksize=CHUNK_SIZE),
+    )
+
+    assert response["id"] in fake_server.videos
+    assert fake_server.stats.chunks == 3
+    assert fake_server.thumbnails == {response["id"]: 102}
+
+
+def test_upload_many_logs_chunks_at_debug(auth_path, fake_server, caplog):
+    """upload_many() の結果が入力と同じ順序で、チャンクごとの進捗は DEBUG であること"""
+    configs = [make_config(f"video {i}", size=CHUNK_SIZE * 2) for i in range(3)]
+
+    with caplog.at_level(logging.INFO, logger="youtube_uploader"):
+        results = run_async(
+            auth_path,
+            fake_server,
+            lambda uploader: uploader.upload_many(configs, chunksize=CHUNK_SIZE),
+        )
+
+    assert [result.title for result in results] == [c.title for c in configs]
+    assert all(result.ok for result in results)
+    assert not any("進捗" in record.getMessage() for record in caplog.records)
+
+
+def test_upload_fails_with_upload_error(auth_path, fake_server):
+    """再試行の対象外のエラーは、同期版と同じく UploadError になること"""
+    fake_server.conditions = fake_server.conditions.model_copy(
+        update={"error_rate": 1.0, "error_status": 400}
+    )
+
+    with pytest.raises(UploadError):
+        run_async(
+            auth_path,
+            fake_server,
+            lambda uploader: uploader.upload_video(
+                make_config(size=CHUNK_SIZE), chunksize=CHUNK_SIZE
+            ),
+        )
+
+
+def test_failed_upload_refunds_unsent_quota(auth_path, fake_server):
+    """送信を始めた後に失敗した場合は、サムネイルの分だけを返却すること"""
+    fake_server.conditions = fake_server.conditions.model_copy(
+        update={"error_rate": 1.0, "error_status": 400}
+    )
+    config = make_config(
+        size=CHUNK_SIZE,
+        thumbnail_bytes=b"\xff\xd8\xff",
+        thumbnail_mimetype="image/jpeg",
+    )
+
+    with pytest.raises(UploadError):
+        run_async(
+            auth_path,
+            fake_server,
+            lambda uploader: uploader.upload_video(config, chunksize=CHUNK_SIZE),
+        )
+
+    # 台帳は同じ認証情報の同期版と共有される
+    uploader = YoutubeUploader(auth_path)
+    connect_fake(uploader, fake_server)
+    usage = uploader.quota_ledger.usage("test-project")
+    assert usage.by_method == {"videos.insert": QUOTA_COSTS["videos.insert"]}
+
+
+# ----------------------------------------------------------------------
+# 2. セッションの保存と再開
+# ----------------------------------------------------------------------
+
+
+def test_interrupted_upload_is_resumable(auth_path, fake_server):
+    """中断したアップロードのセッションが保存され、続きから再開できること"""
+    size = CHUNK_SIZE * 4
+    config = make_config(size=size)
+
+    def interrupt(progress: float) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises((UploadError, KeyboardInterrupt)):
+        run_async(
+            auth_path,
+            fake_server,
+            lambda uploader: uploader.upload_video(
+                config, progress_callback=interrupt, chunksize=CHUNK_SIZE
+            ),
+        )
+    assert fake_server.stats.bytes_received == CHUNK_SIZE
+
+    # 非同期版で保存したセッションは、同期版の resume_upload() でも再開できる
+    uploader = YoutubeUploader(auth_path, deduplicate=False)
+    connect_fake(uploader, fake_server)
+    saved = uploader.session_store.load(config_fingerprint(config))
+    assert saved is not None and saved.offset == CHUNK_SIZE
+
+    response = run_async(
+        auth_path,
+        fake_server,
+        lambda uploader: uploader.resume_upload(config, chunksize=CHUNK_SIZE),
+    )
+
+    assert response["id"] in fake_server.videos
+    assert fake_server.stats.sessions == 1
+    assert fake_server.stats.bytes_received == size
+    assert uploader.session_store.load(config_fingerprint(config)) is None
+
+
+def test_resumed_upload_is_reported_as_resume(auth_path, fake_server):
+    """resume_upload() のアップロードの段階は、再開として計測されること"""
+    spans: list[tuple[str, dict]] = []
+
+    class Recording(Instrumentation):
+        def span(self, name, attributes=None):
+            spans.append((name, dict(attributes or {})))
+            return super().span(name, attributes)
+
+    async def main():
+        uploader = AsyncYoutubeUploader(
+            auth_path,
+            upload_base_url=f"{fake_server.url}/upload/youtube/v3",
+            instrumentation=Recording(),
+        )
+        async with uploader:
+            await uploader.upload_video(make_config("A"), chunksize=CHUNK_SIZE)
+            await uploader.resume_upload(make_config("B"), chunksize=CHUNK_SIZE)
+
+    asyncio.run(main())
+
+    assert [attrs["resume"] for name, attrs in spans if name == SPAN_UPLOAD] == [
+        False,
+        True,
+    ]
+
+
+# ----------------------------------------------------------------------
+# 3. トークンのリフレッシュ
+# ----------------------------------------------------------------------
+
+
+def test_expired_token_is_refreshed_and_saved(auth_path, fake_server, monkeypatch):
+    """期限切れのトークンは token.json のロックの中でリフレッシュし、保存すること"""
+    refreshed: list[str] = []
+
+    def refresh(credentials, request):
+        refreshed.append(credentials.refresh_token)
+        credentials.token = "refreshed"
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+
+    async def scenario(uploader):
+        credentials = uploader._sync_uploader.credentials
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None)
+        await uploader.upload_video(make_config(size=CHUNK_SIZE))
+        return credentials
+
+    credentials = run_async(auth_path, fake_server, scenario)
+
+    assert refreshed == ["refresh-token"]
+    assert credentials.token == "refreshed"
+    assert TokenStore(auth_path / "token.json").load().token == "refreshed"
+
+
+def test_token_refreshed_by_another_process_is_used(
+    auth_path, fake_server, monkeypatch
+):
+    """他のプロセスがリフレッシュ済みの場合は、token.json のトークンを使うこと"""
+
+    def refresh(credentials, request):
+        raise AssertionError("リフレッシュは不要です")
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+    store = TokenStore(auth_path / "token.json")
+
+    async def scenario(uploader):
+        credentials = uploader._sync_uploader.credentials
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None)
+        # 別のプロセスがリフレッシュして保存したトークン
+        other = store.load()
+        other.token = "refreshed-by-other"
+        other.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+        store.save(other)
+        await uploader.upload_video(make_config(size=CHUNK_SIZE))
+        return credentials
+
+    credentials = run_async(auth_path, fake_server, scenario)
+
+    assert credentials.token == "refreshed-by-other"
+
+
+# ----------------------------------------------------------------------
+# 4. 遅延インポート
+# ----------------------------------------------------------------------
+
+
+def test_import_does_not_load_http_clients():
+    """モジュールのインポートで httplib2 や requests が読み込まれないこと"""
+    code = (
+        "import sys, youtube_uploader.async_youtube;"
+        "print(sorted({'httplib2', 'requests'} & set(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "[]"
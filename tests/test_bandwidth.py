@@ -0,0 +1,149 @@
+"""bandwidth.py (BandwidthLimiter) による送信帯域の制限のテスト"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer
+
+from youtube_uploader import BandwidthLimiter, YoutubeUploader
+from youtube_uploader.bandwidth import BandwidthShare
+from youtube_uploader.chunking import CHUNK_GRANULARITY
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+KIB = 1024
+
+# ----------------------------------------------------------------------
+# 1. トークンバケット
+# ----------------------------------------------------------------------
+
+
+def test_unlimited_acquire_returns_immediately():
+    """制限がない場合は待たずに返ること"""
+    limiter = BandwidthLimiter()
+
+    started = time.monotonic()
+    limiter.acquire(1024 * 1024 * 1024)
+
+    assert time.monotonic() - started < 0.05
+    assert limiter.rate is None
+
+
+def test_acquire_waits_beyond_burst():
+    """burst を超えた分は、上限の速度で送信する時間だけ待つこと"""
+    limiter = BandwidthLimiter(rate=1000 * KIB, burst=100 * KIB)
+
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire(100 * KIB)
+
+    # 最初の 100KiB は burst で待たず、残りの 200KiB に 0.2秒かかる
+    assert 0.18 <= time.monotonic() - started < 1.0
+
+
+def test_configure_releases_waiting_reader():
+    """待機中の読み込みは、制限を解除するとすぐに返ること"""
+    limiter = BandwidthLimiter(rate=10 * KIB, burst=KIB)
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(1000 * KIB), done.set()))
+    thread.start()
+    time.sleep(0.05)
+
+    limiter.configure(None)
+
+    assert done.wait(timeout=2)
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"rate": 0}, {"rate": 10, "burst": -1}, {"chunk_seconds": 0}],
+    ids=["rate", "burst", "chunk_seconds"],
+)
+def test_invalid_arguments_raise_value_error(kwargs):
+    """0以下の上限などは ValueError になること"""
+    with pytest.raises(ValueError):
+        BandwidthLimiter(**kwargs)
+
+
+# ----------------------------------------------------------------------
+# 2. 並列のアップロードでの帯域の共有
+# ----------------------------------------------------------------------
+
+
+def test_late_transfer_starts_from_current_minimum():
+    """途中から加わったアップロードは、実行中の最小の送信量から数え始めること"""
+    limiter = BandwidthLimiter(rate=1000 * KIB)
+
+    with limiter.transfer() as first:
+        first.granted = 500 * KIB
+        with limiter.transfer() as second:
+            assert second.granted == 500 * KIB
+            assert limiter.active == 2
+
+    assert limiter.active == 0
+
+
+def test_waiting_readers_are_served_least_granted_first():
+    """待機中の読み込みは、割り当て済みのバイト数が少ない順に帯域を得ること"""
+    limiter = BandwidthLimiter(rate=1000 * KIB, burst=10 * KIB)
+    ahead = BandwidthShare(granted=800 * KIB)
+    behind = BandwidthShare(granted=0)
+    order: list[str] = []
+
+    # 1件目が帯域を待っている間に、2件の読み込みを並べる
+    blocker = threading.Thread(target=limiter.acquire, args=(100 * KIB,))
+    blocker.start()
+    time.sleep(0.02)
+    threads = [
+        threading.Thread(
+            target=lambda name=name, share=share: (
+                limiter.acquire(10 * KIB, share),
+                order.append(name),
+            )
+        )
+        for name, share in (("ahead", ahead), ("behind", behind))
+    ]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in [blocker, *threads]:
+        thread.join(timeout=5)
+
+    assert order == ["behind", "ahead"]
+
+
+def test_chunk_limit_is_divided_among_transfers():
+    """チャンクサイズの上限は、実行中のアップロード数で等分されること"""
+    limiter = BandwidthLimiter(rate=2 * 1024 * KIB, chunk_seconds=2.0)
+
+    with limiter.transfer(), limiter.transfer():
+        assert limiter.chunk_limit() == 2 * 1024 * KIB
+        assert limiter.cap_chunksize(8 * 1024 * KIB) == 2 * 1024 * KIB
+        assert limiter.cap_chunksize(-1) == -1
+
+    limiter.configure(10 * KIB)
+    assert limiter.chunk_limit() == CHUNK_GRANULARITY
+    limiter.configure(None)
+    assert limiter.chunk_limit() is None
+
+
+# ----------------------------------------------------------------------
+# 3. アップロードへの適用
+# ----------------------------------------------------------------------
+
+
+def test_upload_is_throttled(tmp_path: Path, fake_server: FakeYoutubeServer):
+    """アップローダーに渡した制限で、動画の送信速度が抑えられること"""
+    limiter = BandwidthLimiter(rate=1024 * KIB, burst=64 * KIB)
+    uploader = YoutubeUploader(write_auth_files(tmp_path / "auth"), bandwidth=limiter)
+    connect_fake(uploader, fake_server)
+
+    started = time.monotonic()
+    uploader.upload_video(make_config(size=512 * KIB))
+
+    # 512KiB のうち burst を除いた 448KiB に、約0.44秒かかる
+    assert time.monotonic() - started >= 0.4
+    assert len(fake_server.videos) == 1
@@ -0,0 +1,246 @@
+"""バッチリクエスト (再生リストへの追加と翻訳の設定) のテスト"""
+
+from pathlib import Path
+
+import httplib2
+import pytest
+from fake_youtube import FakeYoutubeServer, ServerConditions
+from googleapiclient.errors import HttpError  # type: ignore
+
+import youtube_uploader.youtube as youtube_module
+from youtube_uploader import (
+    PlaylistAddition,
+    QuotaExceededError,
+    RetryPolicy,
+    VideoLocalization,
+    VideoUpdate,
+    YoutubeUploader,
+)
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+FAST_RETRY = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_cap=0.001)
+
+
+def http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": str(status)}), b"")
+
+
+@pytest.fixture
+def uploader(tmp_path: Path, fake_server: FakeYoutubeServer) -> YoutubeUploader:
+    """すぐに再試行する、フェイクサーバーに接続済みのアップローダー"""
+    uploader = YoutubeUploader(
+        write_auth_files(tmp_path / "auth"), retry_policy=FAST_RETRY
+    )
+    connect_fake(uploader, fake_server)
+    return uploader
+
+
+def upload(uploader: YoutubeUploader, title: str, **kwargs) -> str:
+    """動画をアップロードし、その動画のIDを返す"""
+    return uploader.upload_video(make_config(title, **kwargs))["id"]
+
+
+def localization_update(video_id: str) -> VideoUpdate:
+    return VideoUpdate(
+        video_id=video_id, localizations={"en": VideoLocalization(title="Video")}
+    )
+
+
+class ScriptedBatch:
+    """_send_batch() の代わりに、呼び出しごとに決められた結果を返す
+
+    script には、送信されたAPIメソッド名から結果を返す関数を、
+    バッチリクエストの順に指定する (例外を返すとバッチ全体が失敗する)。
+    """
+
+    def __init__(self, *script):
+        self.script = list(script)
+        # バッチリクエストごとに送信されたAPIメソッド名
+        self.sent: list[list[str]] = []
+
+    def __call__(self, calls):
+        methods = [method for method, *_ in calls]
+        self.sent.append(methods)
+        outcome = self.script.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return [outcome(method) for method in methods]
+
+
+# ----------------------------------------------------------------------
+# 1. add_to_playlists() と update_videos()
+# ----------------------------------------------------------------------
+
+
+def test_add_to_playlists_sends_one_batch(uploader, fake_server):
+    """再生リストへの追加は、1回のバッチリクエストで入力の順に実行されること"""
+    first, second = upload(uploader, "A"), upload(uploader, "B")
+
+    results = uploader.add_to_playlists(
+        [
+            PlaylistAddition(video_id=first, playlist_id="PL1"),
+            PlaylistAddition(video_id=second, playlist_id="PL1", position=0),
+            PlaylistAddition(video_id="missing", playlist_id="PL2"),
+        ]
+    )
+
+    assert [(result.video_id, result.ok) for result in results] == [
+        (first, True),
+        (second, True),
+        ("missing", False),
+    ]
+    assert results[2].error.resp.status == 404
+    assert fake_server.playlists == {"PL1": [second, first]}
+    assert (fake_server.stats.batches, fake_server.stats.batch_calls) == (1, 3)
+
+
+def test_update_videos_sets_localizations(uploader, fake_server):
+    """翻訳は言語が設定された動画に適用され、失敗した動画は結果に格納されること"""
+    with_language = upload(uploader, "A", default_language="ja")
+    without_language = upload(uploader, "B")
+
+    results = uploader.update_videos(
+        [localization_update(with_language), localization_update(without_language)]
+    )
+
+    assert [result.ok for result in results] == [True, False]
+    assert results[0].target == "en"
+    assert fake_server.videos[with_language]["localizations"] == {
+        "en": {"title": "Video", "description": ""}
+    }
+    assert results[1].error.resp.status == 400
+
+
+def test_calls_are_split_by_batch_limit(uploader, fake_server, monkeypatch):
+    """BATCH_LIMIT 件を超える呼び出しは、複数のバッチリクエストに分けること"""
+    monkeypatch.setattr(youtube_module, "BATCH_LIMIT", 2)
+    video_id = upload(uploader, "A")
+
+    results = uploader.add_to_playlists(
+        PlaylistAddition(video_id=video_id, playlist_id=f"PL{i}") for i in range(5)
+    )
+
+    assert [result.target for result in results] == [f"PL{i}" for i in range(5)]
+    assert (fake_server.stats.batches, fake_server.stats.batch_calls) == (3, 5)
+
+
+def test_calls_without_quota_are_not_sent(uploader, fake_server):
+    """クォータが不足している場合は、送信せずに QuotaExceededError とすること"""
+    video_id = upload(uploader, "A")
+    uploader.exhaust_quota()
+
+    [result] = uploader.add_to_playlists(
+        [PlaylistAddition(video_id=video_id, playlist_id="PL1")]
+    )
+
+    assert isinstance(result.error, QuotaExceededError)
+    assert fake_server.stats.batches == 0
+
+
+# ----------------------------------------------------------------------
+# 2. 一時的なエラーの再送
+# ----------------------------------------------------------------------
+
+
+def test_only_idempotent_calls_are_retried(uploader, fake_server):
+    """一時的なエラーでは videos.update だけを再送し、追加は再送しないこと"""
+    video_id = upload(uploader, "A", default_language="ja")
+    fake_server.conditions = ServerConditions(error_rate=1.0)
+
+    insert, update = uploader._execute_batch(
+        [
+            uploader._playlist_call(
+                PlaylistAddition(video_id=video_id, playlist_id="PL1")
+            ),
+            uploader._update_call(localization_update(video_id)),
+        ]
+    )
+
+    assert insert.error.resp.status == update.error.resp.status == 503
+    # 初回は2件、再試行では videos.update の1件だけを送信する
+    stats = fake_server.stats
+    assert (stats.batches, stats.batch_calls) == (FAST_RETRY.max_attempts, 4)
+    assert fake_server.playlists == {}
+
+
+def test_failed_update_succeeds_on_retry(uploader, monkeypatch):
+    """再送した videos.update が成功した場合は、成功として返すこと"""
+    batch = ScriptedBatch(
+        lambda method: (None, http_error(503)),
+        lambda method: ({"id": "V1"}, None),
+    )
+    monkeypatch.setattr(uploader, "_send_batch", batch)
+    calls = [
+        uploader._playlist_call(PlaylistAddition(video_id="V1", playlist_id="PL1")),
+        uploader._update_call(localization_update("V1")),
+    ]
+
+    insert, update = uploader._execute_batch(calls)
+
+    assert batch.sent == [["playlistItems.insert", "videos.update"], ["videos.update"]]
+    assert not insert.ok
+    assert update.ok and update.response == {"id": "V1"}
+
+
+def test_failed_batch_request_does_not_resend_insert(uploader, monkeypatch):
+    """バッチリクエスト自体が失敗した場合も、追加の呼び出しは再送しないこと"""
+    batch = ScriptedBatch(
+        ConnectionResetError("接続が切断されました"),
+        lambda method: ({"id": "V1"}, None),
+    )
+    monkeypatch.setattr(uploader, "_send_batch", batch)
+    calls = [
+        uploader._playlist_call(PlaylistAddition(video_id="V1", playlist_id="PL1")),
+        uploader._update_call(localization_update("V1")),
+    ]
+
+    insert, update = uploader._execute_batch(calls)
+
+    assert batch.sent == [["playlistItems.insert", "videos.update"], ["videos.update"]]
+    assert isinstance(insert.error, ConnectionResetError)
+    assert update.ok
+
+
+def test_permanent_errors_are_not_retried(uploader, monkeypatch):
+    """再試行の対象外のエラーでは、videos.update も再送しないこと"""
+    batch = ScriptedBatch(lambda method: (None, http_error(400)))
+    monkeypatch.setattr(uploader, "_send_batch", batch)
+
+    [update] = uploader._execute_batch(
+        [uploader._update_call(localization_update("V1"))]
+    )
+
+    assert len(batch.sent) == 1
+    assert update.error.resp.status == 400
+
+
+# ----------------------------------------------------------------------
+# 3. _send_batch()
+# ----------------------------------------------------------------------
+
+
+def test_send_batch_returns_outcomes_in_order(uploader, fake_server):
+    """1回のバッチリクエストの結果を、呼び出しと同じ順に返すこと"""
+    video_id = upload(uploader, "A")
+
+    outcomes = uploader._send_batch(
+        [
+            uploader._playlist_call(
+                PlaylistAddition(video_id="missing", playlist_id="PL1")
+            ),
+            uploader._playlist_call(
+                PlaylistAddition(video_id=video_id, playlist_id="PL1")
+            ),
+        ]
+    )
+
+    [(missing, missing_error), (added, added_error)] = outcomes
+    assert missing is None and missing_error.resp.status == 404
+    assert added_error is None
+    assert added["snippet"]["resourceId"]["videoId"] == video_id
+    assert fake_server.stats.batches == 1
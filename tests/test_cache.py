@@ -0,0 +1,89 @@
+"""cache.py (認証情報とディスカバリードキュメントのキャッシュ) のユニットテスト"""
+
+from unittest.mock import MagicMock
+
+from youtube_uploader import YoutubeUploader
+from youtube_uploader.cache import (
+    CredentialsCache,
+    build_youtube_service,
+    credentials_cache,
+    youtube_discovery_document,
+)
+from youtube_uploader.token_store import TokenStore
+
+from .conftest import write_auth_files
+
+
+def valid_credentials(valid: bool = True) -> MagicMock:
+    credentials = MagicMock()
+    credentials.valid = valid
+    return credentials
+
+
+def test_cache_returns_credentials_until_ttl(tmp_path, monkeypatch):
+    """ttl 秒を過ぎるまでは、同じ認証情報が返されること"""
+    now = [1000.0]
+    monkeypatch.setattr("youtube_uploader.cache.time.monotonic", lambda: now[0])
+    cache = CredentialsCache(ttl=60)
+    credentials = valid_credentials()
+    cache.put(tmp_path / "token.json", credentials)
+
+    # 同じファイルを別の表記で指定しても同じエントリになる
+    assert cache.get(tmp_path / "." / "token.json") is credentials
+    now[0] += 61
+    assert cache.get(tmp_path / "token.json") is None
+
+
+def test_cache_drops_invalid_credentials(tmp_path):
+    """期限切れの認証情報は返されないこと"""
+    cache = CredentialsCache()
+    credentials = valid_credentials()
+    cache.put(tmp_path / "token.json", credentials)
+
+    credentials.valid = False
+    assert cache.get(tmp_path / "token.json") is None
+
+
+def test_invalidate(tmp_path):
+    """指定したエントリ、またはすべてのエントリを破棄できること"""
+    cache = CredentialsCache()
+    cache.put(tmp_path / "a", valid_credentials())
+    cache.put(tmp_path / "b", valid_credentials())
+
+    cache.invalidate(tmp_path / "a")
+    assert cache.get(tmp_path / "a") is None
+    assert cache.get(tmp_path / "b") is not None
+    cache.invalidate()
+    assert cache.get(tmp_path / "b") is None
+
+
+def test_discovery_document_is_parsed_once():
+    """ディスカバリードキュメントは一度だけ解析され、使い回されること"""
+    first = youtube_discovery_document()
+
+    assert youtube_discovery_document() is first
+    assert "videos" in first["resources"]
+    service = build_youtube_service(http=MagicMock())
+    assert hasattr(service.videos(), "insert")
+
+
+def test_second_uploader_reuses_cached_credentials(tmp_path, monkeypatch):
+    """同じ認証ディレクトリの2つ目のインスタンスは token.json を読み直さないこと"""
+    auth_path = write_auth_files(tmp_path / "auth")
+    loads = []
+    original = TokenStore.load
+
+    def load(self, *args, **kwargs):
+        loads.append(self.path)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(TokenStore, "load", load)
+
+    first = YoutubeUploader(auth_path, deduplicate=False)
+    first.connect()
+    second = YoutubeUploader(auth_path, deduplicate=False)
+    second.connect()
+
+    assert len(loads) == 1
+    assert second.credentials is first.credentials
+    credentials_cache.invalidate()
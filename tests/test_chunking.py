@@ -0,0 +1,77 @@
+"""chunking.py (AdaptiveChunkSizer) と chunksize="auto" のユニットテスト"""
+
+import pytest
+
+from youtube_uploader.chunking import CHUNK_GRANULARITY, AdaptiveChunkSizer
+
+from .conftest import make_config
+
+MiB = 1024 * 1024
+
+
+def test_sizer_grows_on_fast_links():
+    """目標秒数より速く送れた場合は、最大2倍ずつ大きくなること"""
+    sizer = AdaptiveChunkSizer(target_seconds=2.0, initial=MiB)
+
+    assert sizer.record(MiB, 0.1) == 2 * MiB
+    assert sizer.record(2 * MiB, 0.1) == 4 * MiB
+    assert sizer.throughput is not None
+
+
+def test_sizer_shrinks_on_slow_links():
+    """目標秒数より遅い場合は、最大1/2ずつ小さくなること"""
+    sizer = AdaptiveChunkSizer(target_seconds=1.0, initial=4 * MiB)
+
+    assert sizer.record(4 * MiB, 40.0) == 2 * MiB
+    assert sizer.record(2 * MiB, 40.0) == MiB
+
+
+def test_sizer_converges_to_target():
+    """一定のスループットでは、目標秒数で送れるサイズに収束すること"""
+    throughput = 3 * MiB
+    sizer = AdaptiveChunkSizer(target_seconds=2.0, initial=CHUNK_GRANULARITY)
+
+    size = sizer.chunksize
+    for _ in range(20):
+        size = sizer.record(size, size / throughput)
+
+    assert size == 6 * MiB
+
+
+def test_sizer_respects_bounds_and_granularity():
+    """チャンクサイズが常に256KiBの倍数で、上限と下限の間に収まること"""
+    sizer = AdaptiveChunkSizer(initial=MiB, minimum=CHUNK_GRANULARITY, maximum=2 * MiB)
+
+    for sent, elapsed in [(MiB, 0.001), (MiB, 0.001), (1000, 100.0), (1000, 100.0)]:
+        size = sizer.record(sent, elapsed)
+        assert size % CHUNK_GRANULARITY == 0
+        assert CHUNK_GRANULARITY <= size <= 2 * MiB
+
+    # 計測できなかったチャンクは無視される
+    assert sizer.record(0, 1.0) == sizer.chunksize
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"target_seconds": 0},
+        {"smoothing": 0},
+        {"minimum": 1024},
+        {"minimum": 4 * MiB, "maximum": MiB},
+    ],
+)
+def test_sizer_rejects_invalid_arguments(kwargs):
+    """不正な引数は ValueError になること"""
+    with pytest.raises(ValueError):
+        AdaptiveChunkSizer(**kwargs)
+
+
+def test_auto_chunksize_uploads_in_aligned_chunks(fake_uploader, fake_server):
+    """chunksize="auto" のアップロードが、256KiBの倍数のチャンクで完了すること"""
+    size = 3 * MiB + 1234
+
+    response = fake_uploader.upload_video(make_config(size=size), chunksize="auto")
+
+    assert response["id"] in fake_server.videos
+    assert fake_server.stats.bytes_received == size
+    assert fake_server.stats.chunks > 1
@@ -0,0 +1,272 @@
+"""cli.py (マニフェストの読み込みと一括アップロード) のテスト"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import youtube_uploader.cli as cli_module
+from youtube_uploader import YoutubeUploader
+from youtube_uploader.cli import (
+    load_completed,
+    load_uploaded,
+    main,
+    read_manifest,
+    run_batch,
+)
+
+from .conftest import connect_fake, write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+def write_jsonl(path: Path, rows: list[dict | str]) -> Path:
+    """行のリストを JSONL のマニフェストとして書き込む (文字列はそのまま書く)"""
+    lines = [row if isinstance(row, str) else json.dumps(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def write_video(path: Path, size: int = 2048) -> Path:
+    path.write_bytes(bytes(size))
+    return path
+
+
+def read_results(path: Path) -> list[dict]:
+    return [json.loads(text) for text in path.read_text(encoding="utf-8").splitlines()]
+
+
+def batch(uploader, manifest: Path, results: Path, **kwargs):
+    """進捗の出力を捨てて run_batch() を実行する"""
+    return run_batch(
+        uploader, manifest, results, report_interval=60, out=io.StringIO(), **kwargs
+    )
+
+
+# ----------------------------------------------------------------------
+# 1. マニフェストの読み込み
+# ----------------------------------------------------------------------
+
+
+def test_jsonl_rows_are_converted_to_configs(tmp_path: Path):
+    """相対パスはマニフェストのディレクトリを基準にし、MIME タイプを推定すること"""
+    write_video(tmp_path / "a.mov")
+    (tmp_path / "a.png").write_bytes(b"\x89PNG")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl",
+        [{"video_path": "a.mov", "title": "A", "thumbnail_path": "a.png"}],
+    )
+
+    [item] = read_manifest(manifest)
+
+    assert item.id == str((tmp_path / "a.mov").resolve())
+    assert item.config.video_mimetype == "video/quicktime"
+    assert item.config.thumbnail_bytes == b"\x89PNG"
+    assert item.config.thumbnail_mimetype == "image/png"
+
+
+def test_csv_list_columns_are_split(tmp_path: Path):
+    """CSV の tags と playlist_ids は "|" で分割され、空の値は省略されること"""
+    write_video(tmp_path / "a.mp4")
+    manifest = tmp_path / "m.csv"
+    manifest.write_text(
+        "id,video_path,title,tags,playlist_ids,description\n"
+        "first,a.mp4,A,cat| dog ,PL1|PL2,\n",
+        encoding="utf-8",
+    )
+
+    [item] = read_manifest(manifest)
+
+    assert item.id == "first"
+    assert item.config.tags == ["cat", "dog"]
+    assert item.config.playlist_ids == ["PL1", "PL2"]
+
+
+def test_invalid_rows_are_reported_without_stopping(tmp_path: Path):
+    """不正な行は読み込みを中断せず、エラーとして返されること"""
+    write_video(tmp_path / "a.mp4")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl",
+        [
+            "{not json",
+            {"title": "no video"},
+            {"id": "bad", "video_path": "a.mp4", "privacy_status": "secret"},
+            {"video_path": "a.mp4", "title": "ok"},
+        ],
+    )
+
+    items = list(read_manifest(manifest))
+
+    assert [item.id for item in items[:3]] == ["line:1", "line:2", "bad"]
+    assert all(item.error and item.config is None for item in items[:3])
+    assert items[3].config is not None
+
+
+def test_counting_pass_does_not_validate_rows(tmp_path, fake_uploader, monkeypatch):
+    """件数を数える1回目の読み込みでは、設定の検証とサムネイルの読み込みをしないこと"""
+    write_video(tmp_path / "a.mp4")
+    (tmp_path / "a.jpg").write_bytes(b"\xff\xd8")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl",
+        [
+            {
+                "id": str(i),
+                "video_path": "a.mp4",
+                "title": f"video {i}",
+                "thumbnail_path": "a.jpg",
+            }
+            for i in range(3)
+        ],
+    )
+    converted: list[int] = []
+    original = cli_module._to_item
+
+    def counting_to_item(line, row, base_dir):
+        converted.append(line)
+        return original(line, row, base_dir)
+
+    monkeypatch.setattr(cli_module, "_to_item", counting_to_item)
+
+    progress = batch(fake_uploader, manifest, tmp_path / "r.jsonl")
+
+    assert converted == [1, 2, 3]
+    assert (progress.total_items, progress.total_bytes) == (3, 3 * 2048)
+
+
+# ----------------------------------------------------------------------
+# 2. 一括アップロード
+# ----------------------------------------------------------------------
+
+
+def test_run_batch_records_results_and_skips_completed(
+    tmp_path, fake_uploader, fake_server
+):
+    """結果ファイルに1件ずつ記録され、再実行時は完了済みの動画をスキップすること"""
+    for name in ("a", "b"):
+        write_video(tmp_path / f"{name}.mp4")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl",
+        [
+            {"video_path": "a.mp4", "title": "A"},
+            {"video_path": "missing.mp4", "title": "missing"},
+            {"id": "broken"},
+        ],
+    )
+    results = tmp_path / "r.jsonl"
+
+    first = batch(fake_uploader, manifest, results, workers=2)
+
+    assert (first.done, first.failed) == (1, 2)
+    statuses = {record["line"]: record["status"] for record in read_results(results)}
+    assert statuses == {1: "done", 2: "failed", 3: "failed"}
+    assert len(fake_server.videos) == 1
+
+    # 失敗した行を直して再実行すると、完了済みの動画は送信しない
+    write_jsonl(
+        manifest,
+        [
+            {"video_path": "a.mp4", "title": "A"},
+            {"video_path": "b.mp4", "title": "B"},
+        ],
+    )
+    second = batch(fake_uploader, manifest, results)
+
+    assert (second.total_items, second.done) == (1, 1)
+    assert len(fake_server.videos) == 2
+    assert len(load_completed(results)) == 2
+
+
+def test_interrupted_actions_are_applied_on_rerun(
+    tmp_path, fake_uploader, fake_server, monkeypatch
+):
+    """操作の適用前に中断された動画は、再実行時に送信せず操作だけを適用すること"""
+    write_video(tmp_path / "a.mp4")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl",
+        [{"id": "a", "video_path": "a.mp4", "title": "A", "playlist_ids": ["PL1"]}],
+    )
+    results = tmp_path / "r.jsonl"
+
+    def interrupted(uploads):
+        raise RuntimeError("中断")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(fake_uploader, "apply_post_upload_actions", interrupted)
+        with pytest.raises(RuntimeError):
+            batch(fake_uploader, manifest, results)
+    [video_id] = fake_server.videos
+    assert load_uploaded(results) == {"a": video_id}
+    assert load_completed(results) == set()
+
+    progress = batch(fake_uploader, manifest, results)
+
+    assert progress.done == 1
+    # 操作だけを適用した動画は、送信したバイト数に含めない
+    assert (progress.total_bytes, progress.bytes_sent) == (0, 0)
+    assert len(fake_server.videos) == 1
+    assert fake_server.playlists == {"PL1": [video_id]}
+    assert [record["status"] for record in read_results(results)] == [
+        "uploaded",
+        "done",
+    ]
+    assert load_uploaded(results) == {}
+
+
+def test_duplicates_are_not_counted_as_sent(tmp_path, fake_server):
+    """アップロード済みの動画と照合された行は、送信したバイト数に含めないこと"""
+    uploader = YoutubeUploader(write_auth_files(tmp_path / "auth"), deduplicate=True)
+    connect_fake(uploader, fake_server)
+    write_video(tmp_path / "a.mp4")
+    manifest = write_jsonl(
+        tmp_path / "m.jsonl", [{"video_path": "a.mp4", "title": "A"}]
+    )
+    batch(uploader, manifest, tmp_path / "first.jsonl")
+
+    progress = batch(uploader, manifest, tmp_path / "second.jsonl")
+
+    [record] = read_results(tmp_path / "second.jsonl")
+    assert record["duplicate"]
+    assert progress.done == 1
+    assert (progress.total_bytes, progress.bytes_sent) == (0, 0)
+    uploader.close()
+
+
+def test_load_completed_ignores_partial_lines(tmp_path: Path):
+    """異常終了で書きかけになった行は無視されること"""
+    results = tmp_path / "r.jsonl"
+    results.write_text(
+        '{"id": "a", "status": "done"}\n{"id": "b", "status": "failed"}\n{"id": "c',
+        encoding="utf-8",
+    )
+
+    assert load_completed(results) == {"a"}
+    assert load_completed(tmp_path / "missing.jsonl") == set()
+
+
+# ----------------------------------------------------------------------
+# 3. コマンドライン
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["missing.jsonl"], ["m.jsonl", "--workers", "0"]],
+    ids=["missing-manifest", "workers"],
+)
+def test_main_rejects_invalid_arguments(tmp_path: Path, monkeypatch, args):
+    """マニフェストがない場合や、不正な引数では終了コード 2 を返すこと"""
+    monkeypatch.chdir(tmp_path)
+    write_jsonl(tmp_path / "m.jsonl", [])
+
+    assert main([*args, "--auth-dir", str(tmp_path / "auth")]) == 2
+
+
+def test_main_fails_without_client_secret(tmp_path: Path):
+    """認証情報がない場合は、アップロードせずに終了コード 2 を返すこと"""
+    manifest = write_jsonl(tmp_path / "m.jsonl", [])
+
+    assert main([str(manifest), "--auth-dir", str(tmp_path / "auth")]) == 2
+    assert not (tmp_path / "m.results.jsonl").exists()
@@ -0,0 +1,265 @@
+"""dedup.py (UploadIndex) による、アップロード済みの動画の照合のテスト"""
+
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer
+
+import youtube_uploader.youtube as youtube_module
+from youtube_uploader import QuotaExceededError, YoutubeUploader
+from youtube_uploader.dedup import ContentHasher, hash_video, upload_key
+from youtube_uploader.progress import ProgressTracker
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def dedup_uploader(tmp_path: Path, fake_server: FakeYoutubeServer):
+    """アップロード済みの照合を有効にした、接続済みのアップローダー"""
+    uploader = YoutubeUploader(write_auth_files(tmp_path / "auth"), deduplicate=True)
+    connect_fake(uploader, fake_server)
+    yield uploader
+    uploader.close()
+
+
+@pytest.fixture
+def hash_calls(monkeypatch) -> list:
+    """送信とは別に動画を読んでハッシュを計算した回数を記録する"""
+    calls: list = []
+
+    def counting_hash_video(config):
+        calls.append(config.title)
+        return hash_video(config)
+
+    monkeypatch.setattr(youtube_module, "hash_video", counting_hash_video)
+    return calls
+
+
+def write_video(path: Path, data: bytes) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+# ----------------------------------------------------------------------
+# 1. デフォルトの動作
+# ----------------------------------------------------------------------
+
+
+def test_deduplicate_is_disabled_by_default(fake_uploader, fake_server):
+    """デフォルトでは照合せず、同じ動画も送信されること"""
+    fake_uploader.upload_video(make_config())
+    fake_uploader.upload_video(make_config())
+
+    assert fake_uploader.upload_index is None
+    assert len(fake_server.videos) == 2
+
+
+# ----------------------------------------------------------------------
+# 2. video_bytes の照合
+# ----------------------------------------------------------------------
+
+
+def test_same_bytes_are_uploaded_once(dedup_uploader, fake_server, hash_calls):
+    """同じ内容とメタデータの video_bytes は、2回目を送信しないこと"""
+    first = dedup_uploader.upload_video(make_config(size=4096))
+    # 候補がないため、送信とは別にハッシュを計算しない
+    assert hash_calls == []
+
+    second = dedup_uploader.upload_video(make_config(size=4096))
+
+    assert second == first
+    assert len(fake_server.videos) == 1
+    assert len(hash_calls) == 1
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"title": "別のタイトル"},
+        {"video_bytes": b"\x01" * 4096},
+    ],
+    ids=["metadata", "content"],
+)
+def test_different_upload_is_not_skipped(dedup_uploader, fake_server, changed):
+    """メタデータか内容が異なれば、別の動画として送信されること"""
+    dedup_uploader.upload_video(make_config(size=4096))
+
+    dedup_uploader.upload_video(make_config(**{"size": 4096, **changed}))
+
+    assert len(fake_server.videos) == 2
+
+
+# ----------------------------------------------------------------------
+# 3. video_path の照合
+# ----------------------------------------------------------------------
+
+
+def test_same_file_is_matched_without_reading(
+    tmp_path, dedup_uploader, fake_server, hash_calls
+):
+    """同じファイルは、内容を読み直さずにアップロード済みと判定されること"""
+    path = write_video(tmp_path / "video.mp4", b"\x02" * 4096)
+    dedup_uploader.upload_video(make_config(video_path=path))
+
+    results = dedup_uploader.upload_many([make_config(video_path=path)])
+
+    assert results[0].duplicate
+    assert hash_calls == []
+    assert len(fake_server.videos) == 1
+
+
+def test_copied_file_is_matched_by_content(
+    tmp_path, dedup_uploader, fake_server, hash_calls
+):
+    """別のパスにコピーした同じ内容のファイルも、ハッシュで照合されること"""
+    original = write_video(tmp_path / "video.mp4", b"\x03" * 4096)
+    copy = tmp_path / "copy.mp4"
+    shutil.copyfile(original, copy)
+    dedup_uploader.upload_video(make_config(video_path=original))
+
+    # 2件を順に照合させるため、1並列でアップロードする
+    results = dedup_uploader.upload_many(
+        [make_config(video_path=copy), make_config(video_path=copy)], max_workers=1
+    )
+
+    assert all(result.duplicate for result in results)
+    assert len(fake_server.videos) == 1
+    # 2回目はパスと内容のハッシュの対応から、読まずに照合できる
+    assert len(hash_calls) == 1
+
+
+def test_bytes_and_file_with_same_content_match(tmp_path, dedup_uploader, fake_server):
+    """video_bytes でアップロードした動画と同じ内容のファイルも照合されること"""
+    data = b"\x04" * 4096
+    dedup_uploader.upload_video(make_config(video_bytes=data))
+
+    results = dedup_uploader.upload_many(
+        [make_config(video_path=write_video(tmp_path / "video.mp4", data))]
+    )
+
+    assert results[0].duplicate
+    assert len(fake_server.videos) == 1
+
+
+# ----------------------------------------------------------------------
+# 4. ハッシュの記録と接続の終了
+# ----------------------------------------------------------------------
+
+
+def test_record_upload_hashes_when_stream_was_partial(tmp_path, dedup_uploader):
+    """送信中にハッシュを計算できなかった場合は、読み直して記録すること"""
+    config = make_config(size=2048)
+    key = upload_key(config)
+
+    dedup_uploader.record_upload(key, config, None, {"id": "resumed"})
+
+    matched = key.model_copy(update={"content_hash": hash_video(config)})
+    assert dedup_uploader.upload_index.lookup(matched) == {"id": "resumed"}
+
+
+def test_content_hasher_requires_whole_stream():
+    """途中から読み始めた場合は、ハッシュが得られないこと"""
+    complete = ContentHasher()
+    complete(0, b"ab")
+    complete(0, b"ab")  # 再試行による読み直し
+    complete(2, b"cd")
+    partial = ContentHasher()
+    partial(2, b"cd")
+
+    assert complete.hexdigest(4) == hash_video(make_config(video_bytes=b"abcd"))
+    assert partial.hexdigest(4) is None
+
+
+def test_close_releases_the_index(dedup_uploader):
+    """close() でインデックスの接続が閉じられ、照合が無効になること"""
+    index = dedup_uploader.upload_index
+
+    dedup_uploader.close()
+
+    assert dedup_uploader.upload_index is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        index._connection.execute("SELECT 1")
+
+
+# ----------------------------------------------------------------------
+# 5. 適用待ちのアップロード後の操作
+# ----------------------------------------------------------------------
+
+
+class Interrupted(Exception):
+    """操作の送信前にプロセスが終了したことを表す"""
+
+
+def test_interrupted_actions_are_applied_to_duplicate(
+    dedup_uploader, fake_server, monkeypatch
+):
+    """操作の送信前に中断された場合は、アップロード済みの照合後に適用されること"""
+    config = make_config(playlist_ids=["PL1"])
+
+    def interrupted(calls):
+        raise Interrupted
+
+    with monkeypatch.context() as patch:
+        patch.setattr(dedup_uploader, "_execute_batch", interrupted)
+        with pytest.raises(Interrupted):
+            dedup_uploader.upload_video(config)
+    [video_id] = fake_server.videos
+    index = dedup_uploader.upload_index
+    assert index.pending_actions(video_id).playlist_ids == ["PL1"]
+
+    assert dedup_uploader.upload_video(config)["id"] == video_id
+    assert fake_server.playlists == {"PL1": [video_id]}
+    assert index.pending_actions(video_id) is None
+
+    # 適用済みの操作は、再び実行しない
+    [result] = dedup_uploader.upload_many([config])
+    assert result.duplicate and result.actions == []
+    assert fake_server.playlists == {"PL1": [video_id]}
+
+
+def test_actions_without_quota_stay_pending(dedup_uploader, fake_server, monkeypatch):
+    """クォータ不足で送信しなかった操作は、適用待ちのまま残ること"""
+    config = make_config(playlist_ids=["PL1"])
+    reserve_quota = dedup_uploader.reserve_quota
+
+    def no_quota_for_playlists(calls):
+        if "playlistItems.insert" in calls:
+            raise QuotaExceededError("クォータが不足しています")
+        reserve_quota(calls)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(dedup_uploader, "reserve_quota", no_quota_for_playlists)
+        video_id = dedup_uploader.upload_video(config)["id"]
+    assert fake_server.playlists == {}
+    assert dedup_uploader.upload_index.pending_actions(video_id) is not None
+
+    [result] = dedup_uploader.upload_many([config])
+
+    assert result.duplicate and [action.ok for action in result.actions] == [True]
+    assert fake_server.playlists == {"PL1": [video_id]}
+
+
+def test_duplicate_in_worker_uses_thread_service(dedup_uploader, fake_server):
+    """重複の場合も、ワーカースレッドの操作には専用のサービスを使うこと"""
+    config = make_config(playlist_ids=["PL1"])
+    dedup_uploader.upload_video(config)
+    outcome: list = []
+
+    def worker() -> None:
+        tracker = ProgressTracker(config.title)
+        result, _ = dedup_uploader.upload_in_worker(0, config, tracker, 1024 * 1024)
+        outcome.append(result.duplicate)
+        outcome.append(dedup_uploader._service() is dedup_uploader._youtube_service)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert outcome == [True, False]
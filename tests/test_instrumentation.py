@@ -0,0 +1,234 @@
+"""instrumentation.py (段階ごとの計測とアダプター) のテスト"""
+
+import threading
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer, ServerConditions
+
+from youtube_uploader import (
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+    RetryPolicy,
+    YoutubeUploader,
+)
+from youtube_uploader.chunking import CHUNK_GRANULARITY
+from youtube_uploader.instrumentation import (
+    METRIC_BYTES_SENT,
+    METRIC_PHASE_DURATION,
+    METRIC_RETRIES,
+    METRIC_UPLOAD_THROUGHPUT,
+    SPAN_BUILD_REQUEST,
+    SPAN_CHUNK,
+    SPAN_CONNECT,
+    SPAN_UPLOAD,
+)
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+
+class RecordingInstrumentation(Instrumentation):
+    """通知されたスパンとメトリクスを記録する計測"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans: list[tuple[str, dict]] = []
+        self.metrics: list[tuple[str, float, dict]] = []
+
+    def span(self, name, attributes=None):
+        with self.lock:
+            self.spans.append((name, dict(attributes or {})))
+        return super().span(name, attributes)
+
+    def add(self, name, value, attributes=None):
+        with self.lock:
+            self.metrics.append((name, value, dict(attributes or {})))
+
+    def record(self, name, value, attributes=None):
+        with self.lock:
+            self.metrics.append((name, value, dict(attributes or {})))
+
+    def values(self, name: str) -> list[tuple[float, dict]]:
+        """指定したメトリクスに通知された値と属性の一覧"""
+        return [
+            (value, attrs) for metric, value, attrs in self.metrics if metric == name
+        ]
+
+    def phases(self) -> list[tuple[str, str]]:
+        """所要時間が記録された段階と、その成否の一覧"""
+        return [
+            (attrs["phase"], attrs["outcome"])
+            for _, attrs in self.values(METRIC_PHASE_DURATION)
+        ]
+
+
+@pytest.fixture
+def recording() -> RecordingInstrumentation:
+    return RecordingInstrumentation()
+
+
+def make_uploader(
+    tmp_path: Path,
+    server: FakeYoutubeServer,
+    instrumentation: Instrumentation,
+    **kwargs,
+) -> YoutubeUploader:
+    """計測を指定して、フェイクサーバーに接続したアップローダーを作る"""
+    uploader = YoutubeUploader(
+        write_auth_files(tmp_path / "auth"), instrumentation=instrumentation, **kwargs
+    )
+    connect_fake(uploader, server)
+    return uploader
+
+
+# ----------------------------------------------------------------------
+# 1. phase()
+# ----------------------------------------------------------------------
+
+
+def test_phase_records_duration_and_outcome(recording):
+    """段階の所要時間が、成否とともにヒストグラムに記録されること"""
+    with recording.phase(SPAN_CONNECT):
+        pass
+    with pytest.raises(RuntimeError), recording.phase(SPAN_CHUNK, {"offset": 0}):
+        raise RuntimeError("送信に失敗")
+
+    assert recording.phases() == [("connect", "ok"), ("chunk", "error")]
+    assert recording.spans == [(SPAN_CONNECT, {}), (SPAN_CHUNK, {"offset": 0})]
+    assert all(value >= 0 for value, _ in recording.values(METRIC_PHASE_DURATION))
+
+
+def test_default_instrumentation_does_nothing():
+    """既定の Instrumentation は、例外を伝える以外に何もしないこと"""
+    instrumentation = Instrumentation()
+
+    with instrumentation.phase(SPAN_UPLOAD):
+        instrumentation.add(METRIC_BYTES_SENT, 1)
+        instrumentation.record(METRIC_UPLOAD_THROUGHPUT, 1.0)
+    with pytest.raises(ValueError), instrumentation.phase(SPAN_UPLOAD):
+        raise ValueError
+
+
+# ----------------------------------------------------------------------
+# 2. アップロードの計測
+# ----------------------------------------------------------------------
+
+
+def test_upload_reports_phases_and_bytes(tmp_path, fake_server, recording):
+    """アップロードの各段階と、チャンクごとの送信バイト数が通知されること"""
+    uploader = make_uploader(tmp_path, fake_server, recording)
+    size = 4 * CHUNK_GRANULARITY
+
+    uploader.upload_video(make_config(size=size), chunksize=CHUNK_GRANULARITY)
+
+    phases = recording.phases()
+    assert ("connect", "ok") in phases
+    assert ("build_request", "ok") in phases
+    assert ("upload", "ok") in phases
+    assert phases.count(("chunk", "ok")) == 4
+    chunk_offsets = [
+        attrs["offset"] for name, attrs in recording.spans if name == SPAN_CHUNK
+    ]
+    assert chunk_offsets == [i * CHUNK_GRANULARITY for i in range(4)]
+    assert [name for name, _ in recording.spans].count(SPAN_BUILD_REQUEST) == 1
+
+    sent = recording.values(METRIC_BYTES_SENT)
+    assert sum(value for value, _ in sent) == size
+    assert all(attrs == {"phase": "video"} for _, attrs in sent)
+    [(throughput, _)] = recording.values(METRIC_UPLOAD_THROUGHPUT)
+    assert throughput > 0
+
+
+def test_retries_are_counted_by_reason(tmp_path, fake_server, recording):
+    """一時的なエラーによる再試行が、原因ごとに通知されること"""
+    fake_server.conditions = ServerConditions(error_rate=0.5, error_status=503, seed=1)
+    uploader = make_uploader(
+        tmp_path,
+        fake_server,
+        recording,
+        retry_policy=RetryPolicy(
+            max_attempts=20, backoff_base=0.001, backoff_cap=0.001
+        ),
+    )
+
+    uploader.upload_video(
+        make_config(size=4 * CHUNK_GRANULARITY), chunksize=CHUNK_GRANULARITY
+    )
+
+    retries = recording.values(METRIC_RETRIES)
+    assert fake_server.stats.injected_errors > 0
+    assert len(retries) == uploader.retry_stats.retries > 0
+    assert {attrs["reason"] for _, attrs in retries} == {"503"}
+    assert ("chunk", "error") in recording.phases()
+
+
+# ----------------------------------------------------------------------
+# 3. 計測基盤のアダプター (任意の依存関係)
+# ----------------------------------------------------------------------
+
+
+def test_opentelemetry_adapter_exports_spans_and_metrics():
+    """OpenTelemetry のスパンと、段階ごとのヒストグラムが記録されること"""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    instrumentation = OpenTelemetryInstrumentation(
+        tracer_provider=tracer_provider,
+        meter_provider=MeterProvider(metric_readers=[reader]),
+    )
+
+    with instrumentation.phase(SPAN_CHUNK, {"offset": 0}):
+        instrumentation.add(METRIC_BYTES_SENT, 100, {"phase": "video"})
+
+    [span] = exporter.get_finished_spans()
+    assert span.name == SPAN_CHUNK
+    assert span.attributes["offset"] == 0
+    metrics = {
+        metric.name
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert metrics == {METRIC_PHASE_DURATION, METRIC_BYTES_SENT}
+
+
+def test_prometheus_adapter_labels_metrics():
+    """Prometheus のメトリクスに、属性がラベルとして付与されること"""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    instrumentation = PrometheusInstrumentation(registry=registry)
+
+    with instrumentation.phase(SPAN_CHUNK):
+        instrumentation.add(METRIC_BYTES_SENT, 100, {"phase": "video"})
+    instrumentation.record(METRIC_UPLOAD_THROUGHPUT, 1024.0)
+
+    assert (
+        registry.get_sample_value(
+            "youtube_uploader_sent_bytes_total", {"phase": "video"}
+        )
+        == 100
+    )
+    assert (
+        registry.get_sample_value(
+            "youtube_uploader_phase_duration_seconds_count",
+            {"phase": "chunk", "outcome": "ok"},
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "youtube_uploader_upload_throughput_bytes_per_second_count"
+        )
+        == 1
+    )
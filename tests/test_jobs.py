@@ -0,0 +1,219 @@
+"""jobs.py (JobQueue / UploadWorker) のユニットテスト"""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from youtube_uploader import JobQueue, QuotaExceededError, UploadWorker
+
+from .conftest import make_config
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def queue(tmp_path: Path):
+    """再実行までの待ち時間をなくしたキュー"""
+    queue = JobQueue(tmp_path / "jobs.sqlite3", max_attempts=2, retry_delay=0.0)
+    yield queue
+    queue.close()
+
+
+def video_config(tmp_path: Path, name: str = "video", size: int = 2048):
+    """ファイルに保存したダミー動画の設定を作る"""
+    path = tmp_path / f"{name}.mp4"
+    path.write_bytes(bytes(size))
+    return make_config(name, video_path=path)
+
+
+def insert_corrupt_job(queue: JobQueue) -> None:
+    """設定として読み込めない内容のジョブを直接書き込む"""
+    with sqlite3.connect(queue.path) as connection:
+        connection.execute(
+            "INSERT INTO jobs (spec, status, available_at, created_at, updated_at)"
+            " VALUES (?, 'queued', 0, 0, 0)",
+            ('{"title": ""}',),
+        )
+
+
+# ----------------------------------------------------------------------
+# 1. キューの状態遷移
+# ----------------------------------------------------------------------
+
+
+def test_claimed_job_is_not_claimed_twice(tmp_path, queue):
+    """占有中のジョブは、他のワーカーから取り出されないこと"""
+    job_id = queue.enqueue(video_config(tmp_path))
+
+    job = queue.claim()
+
+    assert job is not None and job.id == job_id
+    assert job.status == "running" and job.attempts == 1
+    assert queue.claim() is None
+
+
+def test_failed_job_is_retried_then_dead_lettered(tmp_path, queue):
+    """失敗したジョブは再実行され、最大回数に達するとデッドレターになること"""
+    queue.enqueue(video_config(tmp_path))
+
+    assert queue.fail(queue.claim(), "一時的なエラー") == "queued"
+    assert queue.fail(queue.claim(), "一時的なエラー") == "dead"
+
+    [dead] = queue.dead_letters()
+    assert dead.last_error == "一時的なエラー"
+    assert queue.requeue(dead.id)
+    assert queue.claim().attempts == 1
+
+
+def test_deferred_job_does_not_count_as_attempt(tmp_path, queue):
+    """延期したジョブは、実行回数を数えずに指定日時まで待機すること"""
+    queue.enqueue(video_config(tmp_path))
+    job = queue.claim()
+
+    queue.defer(job, datetime.now(UTC) + timedelta(hours=1), reason="quota")
+
+    assert queue.claim() is None
+    assert queue.get(job.id).attempts == 0
+
+
+def test_corrupt_job_is_dead_lettered_on_claim(tmp_path, queue):
+    """読み込めないジョブはデッドレターになり、次のジョブが取り出されること"""
+    insert_corrupt_job(queue)
+    job_id = queue.enqueue(video_config(tmp_path))
+
+    job = queue.claim()
+
+    assert job is not None and job.id == job_id
+    assert queue.counts()["dead"] == 1
+    # 内容を読み込めないデッドレターは、一覧に含めない
+    assert queue.dead_letters() == []
+
+
+def test_video_bytes_cannot_be_enqueued(queue):
+    """video_bytes の動画はキューに保存できないこと"""
+    with pytest.raises(ValueError):
+        queue.enqueue(make_config())
+
+
+# ----------------------------------------------------------------------
+# 2. ワーカー
+# ----------------------------------------------------------------------
+
+
+def test_worker_uploads_queued_jobs(tmp_path, queue, fake_uploader, fake_server):
+    """ワーカーがキューのジョブをアップロードし、完了として記録すること"""
+    ids = [queue.enqueue(video_config(tmp_path, f"video {i}")) for i in range(3)]
+
+    UploadWorker(fake_uploader, queue, concurrency=2).run(drain=True)
+
+    assert queue.counts()["done"] == 3
+    video_ids = {queue.get(job_id).response["id"] for job_id in ids}
+    assert video_ids == set(fake_server.videos)
+
+
+def test_worker_dead_letters_missing_files(tmp_path, queue, fake_uploader):
+    """動画ファイルが存在しないジョブは、再実行せずにデッドレターになること"""
+    config = video_config(tmp_path)
+    job_id = queue.enqueue(config)
+    config.video_path.unlink()
+
+    UploadWorker(fake_uploader, queue).run(drain=True)
+
+    job = queue.get(job_id)
+    assert job.status == "dead" and job.attempts == 1
+
+
+def test_worker_defers_jobs_when_quota_is_exceeded(
+    tmp_path, queue, fake_uploader, monkeypatch
+):
+    """クォータが不足した場合、ジョブはリセットの日時まで延期されること"""
+    resets_at = datetime.now(UTC) + timedelta(hours=3)
+
+    def exceeded(calls):
+        raise QuotaExceededError("クォータが不足しています", resets_at=resets_at)
+
+    monkeypatch.setattr(fake_uploader, "reserve_quota", exceeded)
+    job_id = queue.enqueue(video_config(tmp_path))
+
+    UploadWorker(fake_uploader, queue).run(drain=True)
+
+    job = queue.get(job_id)
+    assert job.status == "queued" and job.attempts == 0
+    assert job.available_at == resets_at
+
+
+def test_worker_survives_unexpected_errors(tmp_path, queue, fake_uploader, monkeypatch):
+    """ジョブの処理中の予期しない例外で、ワーカーが止まらないこと"""
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("worker crashed")
+
+    monkeypatch.setattr(fake_uploader, "upload_in_worker", crash)
+    insert_corrupt_job(queue)
+    job_id = queue.enqueue(video_config(tmp_path))
+
+    UploadWorker(fake_uploader, queue).run(drain=True)
+
+    job = queue.get(job_id)
+    assert job.status == "dead" and job.attempts == 2
+    assert "RuntimeError: worker crashed" in job.last_error
+
+
+def test_worker_applies_actions_without_reuploading(
+    tmp_path, queue, fake_uploader, fake_server, monkeypatch
+):
+    """操作の適用前に中断されたジョブは、再実行時に操作だけを適用すること"""
+    apply = fake_uploader.apply_post_upload_actions
+    applied: list[int] = []
+
+    def interrupted_once(uploads):
+        applied.append(len(applied))
+        if len(applied) == 1:
+            raise RuntimeError("worker crashed")
+        apply(uploads)
+
+    monkeypatch.setattr(fake_uploader, "apply_post_upload_actions", interrupted_once)
+    config = video_config(tmp_path).model_copy(update={"playlist_ids": ["PL1"]})
+    job_id = queue.enqueue(config)
+
+    UploadWorker(fake_uploader, queue).run(drain=True)
+
+    job = queue.get(job_id)
+    assert job.status == "done" and job.attempts == 2
+    [video_id] = fake_server.videos
+    assert job.response["id"] == video_id
+    assert fake_server.playlists == {"PL1": [video_id]}
+
+
+def test_worker_applies_actions_on_its_own_service(
+    tmp_path, queue, fake_uploader, fake_server, monkeypatch
+):
+    """送信済みのジョブの操作も、ワーカースレッド専用のサービスで適用すること"""
+    config = video_config(tmp_path)
+    response = fake_uploader.upload_video(config)
+    job_id = queue.enqueue(config.model_copy(update={"playlist_ids": ["PL1"]}))
+    # 前回の実行が、送信を記録した後に終了した状態にする
+    job = queue.claim()
+    queue.mark_uploaded(job, response)
+    queue.fail(job, "worker crashed")
+
+    apply = fake_uploader.apply_post_upload_actions
+    shared_service: list[bool] = []
+
+    def record_service(uploads):
+        shared_service.append(
+            fake_uploader._service() is fake_uploader._youtube_service
+        )
+        apply(uploads)
+
+    monkeypatch.setattr(fake_uploader, "apply_post_upload_actions", record_service)
+
+    UploadWorker(fake_uploader, queue).run(drain=True)
+
+    assert queue.get(job_id).status == "done"
+    assert shared_service == [False]
+    assert fake_server.playlists == {"PL1": [response["id"]]}
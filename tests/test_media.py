@@ -0,0 +1,105 @@
+"""media.py とアップロード経路のメモリ使用量に関するユニットテスト"""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import httplib2  # type: ignore
+import pytest
+from googleapiclient.discovery import build  # type: ignore
+
+from youtube_uploader import YoutubeConfig, YoutubeUploader
+from youtube_uploader.media import BufferReader
+
+PAYLOAD_SIZE = 32 * 1024 * 1024
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+class DrainingHttp:
+    """http.client と同様にボディを8KiBずつ読み捨てる、再開可能アップロードの偽サーバ"""
+
+    def __init__(self):
+        self.received = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        headers = headers or {}
+        if method == "POST":
+            return httplib2.Response({"status": "200", "location": "http://up/1"}), b""
+
+        if hasattr(body, "read"):
+            while block := body.read(8192):
+                self.received += len(block)
+        elif body:
+            self.received += len(body)
+
+        total = int(headers["Content-Range"].rsplit("/", 1)[1])
+        if self.received < total:
+            response = {"status": "308", "range": f"bytes=0-{self.received - 1}"}
+            return httplib2.Response(response), b""
+        return httplib2.Response({"status": "200"}), json.dumps({"id": "VID"}).encode()
+
+
+@pytest.fixture
+def uploader_with_fake_http():
+    """偽のHTTPトランスポートで接続済みのUploaderを返す"""
+    http = DrainingHttp()
+    uploader = YoutubeUploader(Path("dummy_auth_dir"))
+    uploader._youtube_service = build("youtube", "v3", http=http, static_discovery=True)
+    return uploader, http
+
+
+# ----------------------------------------------------------------------
+# 1. BufferReader のテスト
+# ----------------------------------------------------------------------
+
+
+def test_buffer_reader_reads_and_seeks():
+    """BufferReader がファイルと同様に読み出し・シークできること"""
+    reader = BufferReader(bytearray(b"0123456789"))
+
+    assert reader.read(3) == b"012"
+    assert reader.seek(0, 2) == 10
+    assert reader.read() == b""
+    reader.seek(5)
+    buf = bytearray(10)
+    assert reader.readinto(buf) == 5
+    assert bytes(buf[:5]) == b"56789"
+
+
+def test_config_keeps_buffer_without_copy():
+    """bytearray / memoryview を渡しても YoutubeConfig がコピーしないこと"""
+    payload = bytearray(1024)
+    config = YoutubeConfig(video_bytes=payload, video_mimetype="video/mp4", title="t")
+
+    assert config.video_bytes is payload
+
+
+# ----------------------------------------------------------------------
+# 2. アップロード経路のピークメモリのテスト
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("chunksize", [-1, CHUNK_SIZE])
+def test_upload_peak_memory_stays_near_payload(uploader_with_fake_http, chunksize):
+    """アップロード中の追加アロケーションがペイロードに比べて十分小さいこと"""
+    uploader, http = uploader_with_fake_http
+    payload = bytearray(PAYLOAD_SIZE)
+
+    tracemalloc.start()
+    try:
+        config = YoutubeConfig(
+            video_bytes=payload, video_mimetype="video/mp4", title="t"
+        )
+        response = uploader.upload_video(config, chunksize=chunksize)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert response == {"id": "VID"}
+    assert http.received == PAYLOAD_SIZE
+    # ペイロード自体は計測前に確保済みのため、ピークは追加分のみ (1x 付近を維持)
+    assert peak < PAYLOAD_SIZE * 0.1
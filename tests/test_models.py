@@ -0,0 +1,134 @@
+"""models.py (設定のモデルと validate_many) のテスト"""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+import youtube_uploader.models as models_module
+from youtube_uploader import VideoMetadata, YoutubeConfig, validate_many
+
+
+def metadata_row(index: int, **kwargs) -> dict:
+    return {"title": f"動画 {index}", **kwargs}
+
+
+def config_row(index: int, **kwargs) -> dict:
+    return {"video_bytes": b"\x00", "video_mimetype": "video/mp4"} | metadata_row(
+        index, **kwargs
+    )
+
+
+# ----------------------------------------------------------------------
+# 1. 共通のメタデータ
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("model", [YoutubeConfig, VideoMetadata])
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"publish_at": datetime(2030, 1, 1).astimezone(), "privacy_status": "public"},
+        {"publish_at": datetime(2030, 1, 1), "privacy_status": "private"},
+        {"localizations": {"en": {"title": "Video"}}},
+    ],
+    ids=["public-schedule", "naive-schedule", "no-language"],
+)
+def test_metadata_rules_are_shared(model, fields):
+    """予約投稿と翻訳の検証は、YoutubeConfig と VideoMetadata で同じであること"""
+    with pytest.raises(ValidationError):
+        model.model_validate(config_row(0, **fields))
+
+
+def test_metadata_fields_match_config():
+    """VideoMetadata のフィールドは、YoutubeConfig から動画のデータを除いたもの"""
+    media_fields = {
+        "video_bytes",
+        "video_path",
+        "video_mimetype",
+        "thumbnail_bytes",
+        "thumbnail_mimetype",
+    }
+
+    assert set(VideoMetadata.model_fields) == (
+        set(YoutubeConfig.model_fields) - media_fields
+    )
+
+
+def test_bind_creates_config():
+    """bind() で動画のデータを結び付けた YoutubeConfig が作られること"""
+    data = bytearray(b"\x00" * 16)
+    metadata = VideoMetadata(title="A", tags=["x"], playlist_ids=["PL1"])
+
+    config = metadata.bind("video/mp4", video_bytes=data)
+
+    assert isinstance(config, YoutubeConfig)
+    assert config.video_bytes is data
+    assert (config.tags, config.playlist_ids) == (["x"], ["PL1"])
+    with pytest.raises(ValidationError):
+        metadata.bind("video/mp4")
+
+
+# ----------------------------------------------------------------------
+# 2. validate_many()
+# ----------------------------------------------------------------------
+
+
+def test_validate_many_collects_every_row_error():
+    """エラーのある行があっても最後まで検証し、行とフィールドを報告すること"""
+    rows = [config_row(0), {"video_mimetype": "video/mp4"}, config_row(2)]
+    rows[1]["video_bytes"] = b"\x00"
+    rows.append(config_row(3, privacy_status="secret"))
+
+    result = validate_many(rows)
+
+    assert sorted(result.valid) == [0, 2]
+    assert result.failed_indices == [1, 3]
+    assert {(error.index, error.field) for error in result.errors} == {
+        (1, "title"),
+        (3, "privacy_status"),
+    }
+    assert not result.ok
+
+
+def test_validate_many_reads_rows_in_batches(monkeypatch):
+    """入力をリストにせず、決められた行数ずつ読み出して検証すること"""
+    monkeypatch.setattr(models_module, "VALIDATION_BATCH_SIZE", 10)
+    pulled: list[int] = []
+    # 各バッチの行数と、その時点までに入力から読み出された行数
+    calls: list[tuple[int, int]] = []
+    adapter = models_module._list_adapter(VideoMetadata)
+
+    class RecordingAdapter:
+        def validate_python(self, chunk):
+            calls.append((len(chunk), len(pulled)))
+            return adapter.validate_python(chunk)
+
+    monkeypatch.setattr(
+        models_module, "_list_adapter", lambda model: RecordingAdapter()
+    )
+
+    def rows():
+        for index in range(25):
+            pulled.append(index)
+            yield metadata_row(
+                index, privacy_status="secret" if index == 17 else "private"
+            )
+
+    result = validate_many(rows(), VideoMetadata)
+
+    assert calls == [(10, 10), (10, 20), (5, 25)]
+    assert len(result.valid) == 24
+    # バッチをまたいでも、入力内での位置が保たれる
+    assert result.failed_indices == [17]
+    assert result.valid[24].title == "動画 24"
+
+
+def test_validate_many_accepts_model_instances():
+    """検証済みのモデルのインスタンスも、そのまま受け付けること"""
+    metadata = VideoMetadata(title="A")
+
+    result = validate_many([metadata, metadata_row(1)], VideoMetadata)
+
+    assert result.ok
+    assert result.valid[0] == metadata
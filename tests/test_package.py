@@ -0,0 +1,91 @@
+"""パッケージの公開オブジェクト (__all__ と遅延インポート) のテスト"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import youtube_uploader
+
+# ----------------------------------------------------------------------
+# 1. 公開オブジェクト
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("name", youtube_uploader.__all__)
+def test_every_exported_name_resolves(name: str):
+    """__all__ のすべての名前が、パッケージから参照できること"""
+    assert getattr(youtube_uploader, name) is not None
+
+
+def test_all_has_no_duplicates():
+    """__all__ に同じ名前が重複していないこと"""
+    assert len(youtube_uploader.__all__) == len(set(youtube_uploader.__all__))
+
+
+def test_type_checking_imports_match_lazy_attributes():
+    """型チェック用のインポートと、遅延して読み込む名前の一覧が一致すること"""
+    tree = ast.parse(Path(youtube_uploader.__file__).read_text(encoding="utf-8"))
+    [type_checking] = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    ]
+    imported = {
+        f".{node.module}": {alias.name for alias in node.names}
+        for node in type_checking.body
+        if isinstance(node, ast.ImportFrom)
+    }
+
+    lazy: dict[str, set[str]] = {}
+    for name, module in youtube_uploader._LAZY_ATTRIBUTES.items():
+        lazy.setdefault(module, set()).add(name)
+
+    assert imported == lazy
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """存在しない名前の参照は AttributeError になること"""
+    with pytest.raises(AttributeError):
+        youtube_uploader.NoSuchUploader  # noqa: B018
+
+
+# ----------------------------------------------------------------------
+# 2. 遅延インポート
+# ----------------------------------------------------------------------
+
+
+def run_isolated(code: str) -> str:
+    """新しいプロセスでコードを実行し、標準出力を返す"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_models_do_not_load_the_api_client():
+    """設定のクラスを参照しても、API クライアントは読み込まれないこと"""
+    output = run_isolated(
+        "import sys\n"
+        "import youtube_uploader\n"
+        "assert 'youtube_uploader.models' not in sys.modules\n"
+        "youtube_uploader.YoutubeConfig\n"
+        "print('youtube_uploader.models' in sys.modules,"
+        " 'googleapiclient.discovery' in sys.modules)"
+    )
+
+    assert output == "True False"
+
+
+def test_resolved_attribute_is_cached():
+    """一度読み込んだオブジェクトは、モジュールの属性として保持されること"""
+    output = run_isolated(
+        "import youtube_uploader\n"
+        "before = 'YoutubeUploader' in vars(youtube_uploader)\n"
+        "youtube_uploader.YoutubeUploader\n"
+        "print(before, 'YoutubeUploader' in vars(youtube_uploader))"
+    )
+
+    assert output == "False True"
@@ -0,0 +1,130 @@
+"""pool.py (ChannelPool) のユニットテスト"""
+
+import threading
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer
+
+from youtube_uploader import ChannelPool, QuotaExceededError, QuotaLedger
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def pool(tmp_path: Path, fake_server: FakeYoutubeServer) -> ChannelPool:
+    """フェイクサーバーに接続済みの2チャンネルのプール"""
+    auth_paths = [
+        write_auth_files(tmp_path / "channel_a", project_id="project-a"),
+        write_auth_files(tmp_path / "channel_b", project_id="project-b"),
+    ]
+    pool = ChannelPool(auth_paths, max_concurrency_per_channel=1)
+    for channel in pool.channels:
+        connect_fake(pool.uploader(channel), fake_server)
+    return pool
+
+
+# ----------------------------------------------------------------------
+# 1. 振り分けと結果の順序
+# ----------------------------------------------------------------------
+
+
+def test_upload_many_distributes_across_channels(pool, fake_server):
+    """動画が両方のチャンネルに振り分けられ、入力と同じ順序で返ること"""
+    configs = [make_config(f"video {i}") for i in range(4)]
+
+    results = pool.upload_many(configs)
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert all(result.ok for result in results)
+    assert {result.channel for result in results} == {"channel_a", "channel_b"}
+    assert len(fake_server.videos) == 4
+
+
+def test_upload_many_keeps_slot_when_worker_raises(pool, monkeypatch):
+    """ワーカーが例外で終わっても、その位置に失敗の結果が入ること"""
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("worker crashed")
+
+    for channel in pool.channels:
+        monkeypatch.setattr(pool.uploader(channel), "upload_in_worker", crash)
+
+    results = pool.upload_many([make_config("a"), make_config("b")])
+
+    assert len(results) == 2
+    assert [result.title for result in results] == ["a", "b"]
+    assert all(isinstance(result.error, RuntimeError) for result in results)
+
+
+def test_upload_many_keeps_slot_when_lookup_fails(pool, monkeypatch):
+    """アップロード済みの照合が失敗しても、他の動画は続けてアップロードされること"""
+    calls = []
+    original = pool.uploader("channel_a").find_uploaded
+
+    def find_uploaded(config):
+        calls.append(config.title)
+        if config.title == "broken":
+            raise ValueError("broken index")
+        return original(config)
+
+    monkeypatch.setattr(pool.uploader("channel_a"), "find_uploaded", find_uploaded)
+
+    results = pool.upload_many([make_config("broken"), make_config("ok")])
+
+    assert isinstance(results[0].error, ValueError)
+    assert results[1].ok
+
+
+# ----------------------------------------------------------------------
+# 2. クォータ
+# ----------------------------------------------------------------------
+
+
+def test_upload_many_reports_quota_exhaustion(tmp_path, fake_server):
+    """どのチャンネルでもクォータが足りない動画は送信されないこと"""
+    ledger = QuotaLedger(tmp_path / "quota.json", daily_quota=2000)
+    pool = ChannelPool([write_auth_files(tmp_path / "channel")], quota_ledger=ledger)
+    connect_fake(pool.uploader("channel"), fake_server)
+
+    results = pool.upload_many([make_config("first"), make_config("second")])
+
+    assert results[0].ok
+    assert isinstance(results[1].error, QuotaExceededError)
+    assert len(fake_server.videos) == 1
+
+
+def test_upload_many_returns_when_reserve_fails_with_nothing_in_flight(
+    tmp_path, fake_server, monkeypatch
+):
+    """他のプロセスがクォータを消費して確保に失敗しても、待ち続けないこと"""
+    path = tmp_path / "quota.json"
+    pool = ChannelPool(
+        [write_auth_files(tmp_path / "channel")],
+        quota_ledger=QuotaLedger(path, daily_quota=2000),
+    )
+    uploader = pool.uploader("channel")
+    connect_fake(uploader, fake_server)
+    reserve_quota = uploader.reserve_quota
+
+    def reserve_after_other_process(calls):
+        # 残りを確認してから確保するまでの間に、別のプロセスが消費する
+        QuotaLedger(path, daily_quota=2000).record("test-project", {"other": 1000})
+        reserve_quota(calls)
+
+    monkeypatch.setattr(uploader, "reserve_quota", reserve_after_other_process)
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.extend(pool.upload_many([make_config()])), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    [result] = results
+    assert isinstance(result.error, QuotaExceededError)
+    assert fake_server.videos == {}
@@ -0,0 +1,77 @@
+"""progress.py (ProgressTracker) のユニットテスト"""
+
+import logging
+
+from youtube_uploader import UploadProgress
+from youtube_uploader.progress import ProgressTracker
+
+from .conftest import make_config
+
+
+def test_tracker_emits_begin_chunk_and_finish_events(monkeypatch):
+    """段階の開始と完了は必ず通知され、途中のイベントは間引かれること"""
+    now = [100.0]
+    monkeypatch.setattr("youtube_uploader.progress.time.monotonic", lambda: now[0])
+    events: list[UploadProgress] = []
+    tracker = ProgressTracker("t", events.append, min_interval=1.0)
+
+    tracker.begin("video", 1000)
+    now[0] += 0.5
+    tracker.update(100)  # 最小間隔に満たないため通知されない
+    now[0] += 0.5
+    tracker.chunk_done(500, 1.0)
+    tracker.retried()
+    now[0] += 1.0
+    tracker.finish()
+
+    assert [event.bytes_sent for event in events] == [0, 500, 1000]
+    begin, chunk, finish = events
+    assert begin.phase == "video" and begin.progress == 0.0
+    assert chunk.chunk_index == 1
+    assert chunk.instant_throughput == 500.0
+    assert chunk.eta_seconds == 1.0
+    assert finish.progress == 1.0
+    assert finish.eta_seconds == 0.0
+    assert finish.retry_count == 1
+
+
+def test_tracker_calls_legacy_callback_per_chunk():
+    """従来形式のコールバックには、チャンクごとに進捗率が渡されること"""
+    progress: list[float] = []
+    tracker = ProgressTracker("t", progress_callback=progress.append)
+    tracker.begin("video", 400)
+
+    tracker.chunk_done(100, 0.1)
+    tracker.chunk_done(400, 0.1)
+
+    assert progress == [0.25, 1.0]
+
+
+def test_tracker_logs_without_callbacks(caplog):
+    """コールバックがない場合は、指定したログレベルで進捗を出力すること"""
+    tracker = ProgressTracker("t", log_level=logging.DEBUG)
+    tracker.begin("video", 100)
+
+    with caplog.at_level(logging.DEBUG, logger="youtube_uploader.progress"):
+        tracker.chunk_done(50, 0.1)
+
+    assert [record.levelno for record in caplog.records] == [logging.DEBUG]
+    assert "50%" in caplog.records[0].getMessage()
+
+
+def test_upload_video_reports_video_and_thumbnail_phases(fake_uploader):
+    """動画とサムネイルの段階ごとに、開始と完了のイベントが届くこと"""
+    events: list[UploadProgress] = []
+    config = make_config(
+        size=4096,
+        thumbnail_bytes=b"\xff\xd8" + bytes(10),
+        thumbnail_mimetype="image/jpeg",
+    )
+
+    fake_uploader.upload_video(config, on_progress=events.append, progress_interval=0)
+
+    phases = [event.phase for event in events]
+    assert phases[0] == "video" and phases[-1] == "thumbnail"
+    video = [event for event in events if event.phase == "video"]
+    assert video[-1].bytes_sent == video[-1].total_bytes == 4096
+    assert all(event.title == config.title for event in events)
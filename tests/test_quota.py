@@ -0,0 +1,144 @@
+"""quota.py (QuotaLedger) と、アップロード時のクォータの確保・返却のテスト"""
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+from fake_youtube import FakeYoutubeServer, ServerConditions
+
+from youtube_uploader import ChannelPool, QuotaExceededError, QuotaLedger, UploadError
+from youtube_uploader.quota import QUOTA_COSTS, estimate_upload_cost, upload_calls
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+PROJECT = "test-project"
+
+# ----------------------------------------------------------------------
+# 1. 消費量の見積もり
+# ----------------------------------------------------------------------
+
+
+def test_upload_calls_include_thumbnail_only_when_set():
+    """サムネイルがある場合だけ thumbnails.set が見積もりに含まれること"""
+    assert upload_calls(make_config()) == {"videos.insert": 1600}
+
+    config = make_config(thumbnail_bytes=b"\xff\xd8\xff")
+    assert upload_calls(config) == {"videos.insert": 1600, "thumbnails.set": 50}
+    assert estimate_upload_cost(config) == 1650
+
+
+# ----------------------------------------------------------------------
+# 2. 台帳の記録と返却
+# ----------------------------------------------------------------------
+
+
+def test_reserve_records_usage_and_rejects_overdraft(tmp_path: Path):
+    """確保した分が記録され、残りを超える確保は QuotaExceededError になること"""
+    ledger = QuotaLedger(tmp_path / "quota.json", daily_quota=2000)
+
+    ledger.reserve(PROJECT, {"videos.insert": 1600})
+
+    assert ledger.remaining(PROJECT) == 400
+    with pytest.raises(QuotaExceededError) as excinfo:
+        ledger.reserve(PROJECT, {"videos.insert": 1600})
+    assert excinfo.value.resets_at is not None
+    assert ledger.remaining(PROJECT) == 400
+
+
+def test_refund_is_capped_by_recorded_usage(tmp_path: Path):
+    """返却は記録済みの消費量を上限とし、0になったメソッドは消えること"""
+    ledger = QuotaLedger(tmp_path / "quota.json")
+    ledger.reserve(PROJECT, {"videos.insert": 1600, "thumbnails.set": 50})
+
+    ledger.refund(PROJECT, {"thumbnails.set": 50, "videos.update": 50})
+
+    usage = ledger.usage(PROJECT)
+    assert usage.used == 1600
+    assert usage.by_method == {"videos.insert": 1600}
+
+
+def test_exhaust_leaves_no_remaining_quota(tmp_path: Path):
+    """APIからクォータ超過が返された後は、残りが0になること"""
+    ledger = QuotaLedger(tmp_path / "quota.json")
+    ledger.record(PROJECT, {"videos.update": 50})
+
+    ledger.exhaust(PROJECT)
+
+    assert ledger.remaining(PROJECT) == 0
+
+
+def _reserve_in_process(path: str, count: int) -> None:
+    ledger = QuotaLedger(Path(path), daily_quota=1_000_000)
+    for _ in range(count):
+        ledger.reserve(PROJECT, {"videos.update": 50})
+
+
+def test_concurrent_processes_do_not_lose_updates(tmp_path: Path):
+    """複数のプロセスが同じ台帳へ同時に記録しても、消費量が失われないこと"""
+    path = tmp_path / "quota.json"
+    processes = [
+        multiprocessing.get_context("spawn").Process(
+            target=_reserve_in_process, args=(str(path), 20)
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    usage = QuotaLedger(path).usage(PROJECT)
+    assert usage.used == 4 * 20 * 50
+    assert path.with_name("quota.json.lock").exists()
+
+
+# ----------------------------------------------------------------------
+# 3. アップロード時の確保と返却
+# ----------------------------------------------------------------------
+
+
+def test_upload_refunds_quota_when_video_is_missing(tmp_path, fake_uploader):
+    """動画ファイルが見つからず送信しなかった場合、確保した分が返却されること"""
+    before = fake_uploader.remaining_quota()
+    config = make_config(
+        video_path=tmp_path / "missing.mp4", thumbnail_bytes=b"\xff\xd8\xff"
+    )
+
+    with pytest.raises(FileNotFoundError):
+        fake_uploader.upload_video(config)
+
+    assert fake_uploader.remaining_quota() == before
+
+
+def test_upload_keeps_quota_after_sending(fake_uploader, fake_server):
+    """送信を始めた後に失敗した場合は、videos.insert の分を返却しないこと"""
+    fake_server.conditions = ServerConditions(error_rate=1.0, error_status=400)
+    before = fake_uploader.remaining_quota()
+
+    with pytest.raises(UploadError):
+        fake_uploader.upload_video(make_config(thumbnail_bytes=b"\xff\xd8\xff"))
+
+    usage = fake_uploader.quota_ledger.usage(PROJECT)
+    assert usage.by_method == {"videos.insert": QUOTA_COSTS["videos.insert"]}
+    assert fake_uploader.remaining_quota() == before - QUOTA_COSTS["videos.insert"]
+
+
+def test_pool_refunds_quota_for_unsent_uploads(
+    tmp_path: Path, fake_server: FakeYoutubeServer
+):
+    """プールが確保した分も、送信前の失敗では返却されること"""
+    ledger = QuotaLedger(tmp_path / "quota.json")
+    pool = ChannelPool(
+        [write_auth_files(tmp_path / "channel_a", project_id=PROJECT)],
+        quota_ledger=ledger,
+    )
+    connect_fake(pool.uploader("channel_a"), fake_server)
+
+    results = pool.upload_many(
+        [make_config("ok"), make_config("missing", video_path=tmp_path / "x.mp4")]
+    )
+
+    assert results[0].ok
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert ledger.usage(PROJECT).used == QUOTA_COSTS["videos.insert"]
@@ -0,0 +1,195 @@
+"""refresh.py (TokenRefresher) による、トークンのリフレッシュのテスト"""
+
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from youtube_uploader import AuthError, TokenRefresher, TokenStore
+from youtube_uploader.refresh import start_token_refresher, stop_token_refreshers
+
+from .conftest import write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+class FakeGrant:
+    """Credentials.refresh() の代わりに、トークンエンドポイントの応答を再現する"""
+
+    def __init__(self, rotate: bool = False, fail: bool = False):
+        self.rotate = rotate
+        self.fail = fail
+        # リフレッシュに使われたリフレッシュトークン
+        self.used: list[str] = []
+
+    def __call__(self, credentials: Credentials, request) -> None:
+        self.used.append(credentials.refresh_token)
+        if self.fail:
+            raise RuntimeError("invalid_grant")
+        number = len(self.used)
+        credentials.token = f"refreshed-{number}"
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+        if self.rotate:
+            # google-auth はトークンエンドポイントの応答で内部の値を更新する
+            credentials._refresh_token = f"rotated-{number}"
+
+
+@pytest.fixture
+def grant(monkeypatch) -> FakeGrant:
+    grant = FakeGrant()
+    monkeypatch.setattr(
+        Credentials, "refresh", lambda self, request: grant(self, request)
+    )
+    return grant
+
+
+@pytest.fixture
+def token_path(tmp_path: Path) -> Path:
+    return write_auth_files(tmp_path / "auth", expires_in=60) / "token.json"
+
+
+@pytest.fixture
+def live(token_path: Path) -> Credentials:
+    """APIサービスなどが共有している想定の認証情報"""
+    return TokenStore(token_path).load()
+
+
+def stored_token(token_path: Path) -> dict:
+    return json.loads(token_path.read_text(encoding="utf-8"))
+
+
+# ----------------------------------------------------------------------
+# 1. refresh_now()
+# ----------------------------------------------------------------------
+
+
+def test_refresh_updates_shared_credentials_and_token_file(grant, token_path, live):
+    """リフレッシュしたトークンが、共有の認証情報と token.json に反映されること"""
+    refresher = TokenRefresher(live, token_path)
+
+    refresher.refresh_now()
+
+    assert live.token == "refreshed-1"
+    assert live.expiry > datetime.now(UTC).replace(tzinfo=None)
+    assert stored_token(token_path)["token"] == "refreshed-1"
+    assert refresher.last_refreshed_at is not None
+
+
+def test_rotated_refresh_token_is_saved_and_reused(grant, token_path, live):
+    """更新されたリフレッシュトークンは保存され、次回のリフレッシュに使われること"""
+    grant.rotate = True
+    refresher = TokenRefresher(live, token_path)
+
+    refresher.refresh_now()
+    refresher.refresh_now()
+
+    assert grant.used == ["refresh-token", "rotated-1"]
+    assert stored_token(token_path)["refresh_token"] == "rotated-2"
+    assert live.token == "refreshed-2"
+
+
+def test_failed_refresh_keeps_shared_credentials(grant, token_path, live):
+    """リフレッシュに失敗した場合は AuthError になり、共有の認証情報は変わらないこと"""
+    grant.fail = True
+    before = (live.token, live.expiry)
+
+    with pytest.raises(AuthError):
+        TokenRefresher(live, token_path).refresh_now()
+
+    assert (live.token, live.expiry) == before
+    assert stored_token(token_path)["token"] == "access-token"
+
+
+def test_token_refreshed_by_another_process_is_adopted(grant, token_path, live):
+    """他のプロセスがリフレッシュ済みの場合は、token.json のトークンを使うこと"""
+    info = stored_token(token_path)
+    info["token"] = "from-other-process"
+    info["refresh_token"] = "re-authorized"
+    info["expiry"] = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+    token_path.write_text(json.dumps(info), encoding="utf-8")
+    refresher = TokenRefresher(live, token_path)
+
+    refresher.refresh_now()
+
+    assert grant.used == []
+    assert live.token == "from-other-process"
+
+    # 以降のリフレッシュには、token.json のリフレッシュトークンを使う
+    refresher.refresh_now()
+    assert grant.used == ["re-authorized"]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"margin": -1}, {"retry_delay": 0}], ids=["margin", "retry_delay"]
+)
+def test_invalid_arguments_raise_value_error(token_path, live, kwargs):
+    """負の margin や、0以下の retry_delay は ValueError になること"""
+    with pytest.raises(ValueError):
+        TokenRefresher(live, token_path, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# 2. バックグラウンドのスレッド
+# ----------------------------------------------------------------------
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_background_refresh_runs_before_expiry(grant, token_path, live):
+    """有効期限の margin 秒前になると、スレッドでリフレッシュされること"""
+    # 有効期限の60秒前より早くリフレッシュするため、すぐにリフレッシュされる
+    refresher = TokenRefresher(live, token_path, margin=120)
+
+    refresher.start()
+    try:
+        assert wait_until(lambda: live.token == "refreshed-1")
+        assert refresher.running
+        # 新しい有効期限までは、続けてリフレッシュしない
+        time.sleep(0.1)
+        assert len(grant.used) == 1
+    finally:
+        refresher.stop(timeout=5)
+    assert not refresher.running
+
+
+def test_background_refresh_retries_after_failure(grant, token_path, live):
+    """失敗した場合は last_error を記録し、retry_delay 秒後に再試行すること"""
+    grant.fail = True
+    refresher = TokenRefresher(live, token_path, margin=120, retry_delay=0.05)
+
+    refresher.start()
+    try:
+        assert wait_until(lambda: len(grant.used) >= 2)
+        assert isinstance(refresher.last_error, AuthError)
+        grant.fail = False
+        assert wait_until(lambda: refresher.last_error is None)
+    finally:
+        refresher.stop(timeout=5)
+
+
+def test_one_refresher_per_token_file(grant, token_path, live):
+    """同じ token.json と認証情報には、実行中のリフレッシュを使い回すこと"""
+    try:
+        first = start_token_refresher(live, token_path, margin=0)
+        assert start_token_refresher(live, token_path, margin=0) is first
+
+        # 認証情報が読み直された場合は、新しい認証情報のリフレッシュに切り替える
+        reloaded = TokenStore(token_path).load()
+        second = start_token_refresher(reloaded, token_path, margin=0)
+        assert second is not first
+        assert second.credentials is reloaded
+    finally:
+        stop_token_refreshers(timeout=5)
+    assert not second.running
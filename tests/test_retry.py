@@ -0,0 +1,250 @@
+"""retry.py と、アップロード中の再試行・再開のユニットテスト"""
+
+import asyncio
+import json
+import ssl
+
+import httplib2  # type: ignore
+import pytest
+from fake_youtube import attach
+from googleapiclient.errors import HttpError  # type: ignore
+
+from youtube_uploader import RetryPolicy, UploadError, YoutubeUploader
+from youtube_uploader.retry import call_with_retry, call_with_retry_async
+from youtube_uploader.sessions import UploadSession, config_fingerprint
+
+from .conftest import make_config, write_auth_files
+
+CHUNK_SIZE = 256 * 1024
+PAYLOAD_SIZE = CHUNK_SIZE * 4
+
+# 待機せずに再試行するポリシー
+FAST_POLICY = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_cap=0.001)
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+def http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": str(status)}), b"")
+
+
+class ScriptedHttp:
+    """チャンクの送信ごとに、指定した障害を起こす再開可能アップロードの偽サーバ
+
+    failures には、何回目のチャンクの送信 (1始まり) で何を起こすかを指定する。
+    "reset" は接続のリセット、数値はそのHTTPステータスの応答を返す。
+    """
+
+    def __init__(self, failures: dict[int, str | int] | None = None):
+        self.failures = failures or {}
+        self.expired_uris: set[str] = set()
+        self.received = 0
+        self.puts = 0
+        self.status_queries = 0
+        self.sessions = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        headers = headers or {}
+        if method == "POST":
+            self.sessions += 1
+            self.received = 0
+            location = f"http://up/{self.sessions}"
+            return httplib2.Response({"status": "200", "location": location}), b""
+
+        if uri in self.expired_uris:
+            return httplib2.Response({"status": "404"}), b""
+
+        content_range = headers["Content-Range"]
+        total = int(content_range.rsplit("/", 1)[1])
+        if content_range.startswith("bytes */"):
+            self.status_queries += 1
+            return self._incomplete(total)
+
+        self.puts += 1
+        failure = self.failures.get(self.puts)
+        if failure == "reset":
+            raise ConnectionResetError("connection reset by peer")
+        if failure is not None:
+            return httplib2.Response({"status": str(failure)}), b""
+
+        data = body.read() if hasattr(body, "read") else body
+        self.received += len(data)
+        if self.received < total:
+            return self._incomplete(total)
+        return httplib2.Response({"status": "200"}), json.dumps({"id": "VID"}).encode()
+
+    def _incomplete(self, total: int):
+        response = {"status": "308"}
+        if self.received:
+            response["range"] = f"bytes=0-{self.received - 1}"
+        return httplib2.Response(response), b""
+
+
+@pytest.fixture
+def scripted(tmp_path):
+    """ScriptedHttp に接続した、待機せずに再試行するアップローダーを作る"""
+
+    def connect(failures: dict[int, str | int] | None = None):
+        http = ScriptedHttp(failures)
+        uploader = YoutubeUploader(
+            write_auth_files(tmp_path / "auth"), FAST_POLICY, deduplicate=False
+        )
+        uploader.connect()
+        attach(uploader, http)
+        return uploader, http
+
+    return connect
+
+
+# ----------------------------------------------------------------------
+# 1. 再試行の判定
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("error", "retryable"),
+    [
+        (http_error(503), True),
+        (http_error(429), True),
+        (http_error(400), False),
+        (ConnectionResetError(), True),
+        (TimeoutError(), True),
+        (ssl.SSLError(), True),
+        (ssl.SSLCertVerificationError(), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, retryable):
+    """一時的なエラーだけが再試行の対象になること"""
+    assert RetryPolicy().is_retryable(error) is retryable
+
+
+def test_call_with_retry_retries_until_success():
+    """一時的なエラーの間は再実行し、待機秒数がコールバックに渡されること"""
+    errors = [ConnectionResetError(), http_error(503)]
+    events = []
+    sleeps = []
+
+    def func():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    result = call_with_retry(
+        func,
+        RetryPolicy(max_attempts=3, backoff_base=1.0, backoff_cap=4.0),
+        on_retry=lambda event, error: events.append(event),
+        sleep=sleeps.append,
+    )
+
+    assert result == "ok"
+    assert [event.retry_number for event in events] == [1, 2]
+    assert [event.status for event in events] == [None, 503]
+    assert sleeps == [event.delay for event in events]
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_call_with_retry_gives_up():
+    """最大試行回数に達するか、対象外のエラーでは例外がそのまま送出されること"""
+    calls = []
+
+    def failing(error):
+        def func():
+            calls.append(error)
+            raise error
+
+        return func
+
+    with pytest.raises(ConnectionResetError):
+        call_with_retry(
+            failing(ConnectionResetError()), FAST_POLICY, sleep=lambda delay: None
+        )
+    assert len(calls) == FAST_POLICY.max_attempts
+
+    calls.clear()
+    with pytest.raises(ssl.SSLCertVerificationError):
+        call_with_retry(failing(ssl.SSLCertVerificationError()), FAST_POLICY)
+    assert len(calls) == 1
+
+
+def test_call_with_retry_async():
+    """asyncio 版も同じ判定で再試行すること"""
+    errors = [http_error(502)]
+    events = []
+
+    async def func():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    result = asyncio.run(
+        call_with_retry_async(
+            func, FAST_POLICY, on_retry=lambda event, error: events.append(event)
+        )
+    )
+
+    assert result == "ok"
+    assert [event.status for event in events] == [502]
+
+
+# ----------------------------------------------------------------------
+# 2. チャンクの送信ループでの再試行
+# ----------------------------------------------------------------------
+
+
+def test_upload_retries_5xx_and_connection_reset(scripted):
+    """5xx と接続リセットの後、受信済みのバイトの続きから送信を再開すること"""
+    uploader, http = scripted({2: 503, 4: "reset"})
+
+    response = uploader.upload_video(
+        make_config(size=PAYLOAD_SIZE), chunksize=CHUNK_SIZE
+    )
+
+    assert response == {"id": "VID"}
+    assert http.received == PAYLOAD_SIZE
+    assert http.sessions == 1
+    # 失敗のたびに、サーバが受信済みのバイト数を問い合わせる
+    assert http.status_queries == 2
+    assert uploader.retry_stats.by_status == {"503": 1, "ConnectionResetError": 1}
+
+
+def test_upload_fails_on_non_retryable_status(scripted):
+    """再試行の対象外のステータスでは、すぐに UploadError になること"""
+    uploader, http = scripted({1: 400})
+
+    with pytest.raises(UploadError):
+        uploader.upload_video(make_config(size=PAYLOAD_SIZE), chunksize=CHUNK_SIZE)
+    assert http.puts == 1
+    assert uploader.retry_stats.retries == 0
+
+
+def test_upload_gives_up_after_max_attempts(scripted):
+    """同じチャンクが失敗し続けると、最大試行回数で諦めること"""
+    uploader, http = scripted({1: 503, 2: 503, 3: 503})
+
+    with pytest.raises(UploadError):
+        uploader.upload_video(make_config(size=PAYLOAD_SIZE), chunksize=CHUNK_SIZE)
+    assert http.puts == FAST_POLICY.max_attempts
+
+
+def test_resume_restarts_expired_session(scripted):
+    """保存済みのセッションが期限切れの場合、新しいセッションで最初から送ること"""
+    uploader, http = scripted()
+    config = make_config(size=PAYLOAD_SIZE)
+    http.expired_uris.add("http://up/expired")
+    uploader.session_store.save(
+        UploadSession(
+            fingerprint=config_fingerprint(config),
+            resumable_uri="http://up/expired",
+            offset=CHUNK_SIZE,
+            total_size=PAYLOAD_SIZE,
+        )
+    )
+
+    response = uploader.resume_upload(config, chunksize=CHUNK_SIZE)
+
+    assert response == {"id": "VID"}
+    assert http.sessions == 1
+    assert http.received == PAYLOAD_SIZE
@@ -0,0 +1,142 @@
+"""sessions.py と、保存したセッションからの再開のユニットテスト"""
+
+import threading
+
+import pytest
+
+from youtube_uploader import UploadError
+from youtube_uploader.media import SAMPLE_BLOCK_COUNT, SAMPLE_BLOCK_SIZE
+from youtube_uploader.sessions import (
+    UploadSession,
+    UploadSessionStore,
+    config_fingerprint,
+)
+
+from .conftest import make_config
+
+CHUNK_SIZE = 256 * 1024
+
+# ----------------------------------------------------------------------
+# 1. UploadSessionStore のテスト
+# ----------------------------------------------------------------------
+
+
+def test_store_round_trip(tmp_path):
+    """保存したセッションを読み込み、削除できること"""
+    store = UploadSessionStore(tmp_path / "sessions.json")
+    store.save(
+        UploadSession(fingerprint="f", resumable_uri="http://up/1", total_size=9)
+    )
+
+    loaded = store.load("f")
+    assert loaded is not None
+    assert loaded.resumable_uri == "http://up/1"
+
+    store.delete("f")
+    assert store.load("f") is None
+
+
+def test_store_keeps_concurrent_writers(tmp_path):
+    """別々のストア (別プロセス相当) から同時に保存しても、更新が失われないこと"""
+    path = tmp_path / "sessions.json"
+
+    def save(worker: int) -> None:
+        store = UploadSessionStore(path)
+        for i in range(20):
+            store.save(
+                UploadSession(
+                    fingerprint=f"{worker}-{i}", resumable_uri="u", total_size=1
+                )
+            )
+
+    threads = [threading.Thread(target=save, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = UploadSessionStore(path)
+    assert all(
+        store.load(f"{worker}-{i}") is not None
+        for worker in range(4)
+        for i in range(20)
+    )
+    assert (tmp_path / "sessions.json.lock").exists()
+
+
+def test_store_ignores_corrupt_file(tmp_path):
+    """壊れたファイルは空のストアとして扱われること"""
+    path = tmp_path / "sessions.json"
+    path.write_text("{broken")
+
+    assert UploadSessionStore(path).load("f") is None
+
+
+# ----------------------------------------------------------------------
+# 2. config_fingerprint のテスト
+# ----------------------------------------------------------------------
+
+
+def test_fingerprint_depends_on_metadata_and_content():
+    """メタデータや内容が変われば、フィンガープリントも変わること"""
+    payload = bytearray(1024)
+    base = config_fingerprint(make_config("a", video_bytes=payload))
+
+    assert config_fingerprint(make_config("a", video_bytes=bytes(payload))) == base
+    assert config_fingerprint(make_config("b", video_bytes=payload)) != base
+    payload[0] = 1
+    assert config_fingerprint(make_config("a", video_bytes=payload)) != base
+
+
+def test_fingerprint_samples_large_payloads():
+    """大きな動画は標本の範囲だけがフィンガープリントに使われること"""
+    size = SAMPLE_BLOCK_SIZE * SAMPLE_BLOCK_COUNT * 4
+    payload = bytearray(size)
+    base = config_fingerprint(make_config(video_bytes=payload))
+
+    # 最初と最後の範囲は必ず標本に含まれる
+    payload[-1] = 1
+    assert config_fingerprint(make_config(video_bytes=payload)) != base
+    payload[-1] = 0
+    # 標本の間の範囲は読まれない
+    payload[SAMPLE_BLOCK_SIZE + 1] = 1
+    assert config_fingerprint(make_config(video_bytes=payload)) == base
+
+
+def test_fingerprint_uses_file_stat(tmp_path):
+    """video_path の場合は、ファイルの更新で別のフィンガープリントになること"""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"0" * 10)
+    config = make_config(video_path=path)
+    base = config_fingerprint(config)
+
+    path.write_bytes(b"1" * 11)
+    assert config_fingerprint(config) != base
+
+
+# ----------------------------------------------------------------------
+# 3. 中断したアップロードの再開
+# ----------------------------------------------------------------------
+
+
+def test_resume_upload_continues_from_saved_offset(fake_uploader, fake_server):
+    """中断したアップロードが、受信済みのバイトの続きから再開されること"""
+    size = CHUNK_SIZE * 4
+    config = make_config(size=size)
+
+    def interrupt(progress: float) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises((UploadError, KeyboardInterrupt)):
+        fake_uploader.upload_video(
+            config, progress_callback=interrupt, chunksize=CHUNK_SIZE
+        )
+    assert fake_server.stats.bytes_received == CHUNK_SIZE
+    assert fake_server.videos == {}
+
+    response = fake_uploader.resume_upload(config, chunksize=CHUNK_SIZE)
+
+    assert response["id"] in fake_server.videos
+    assert fake_server.stats.sessions == 1
+    assert fake_server.stats.bytes_received == size
+    assert fake_uploader.session_store.load(config_fingerprint(config)) is None
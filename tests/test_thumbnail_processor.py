@@ -0,0 +1,122 @@
+"""thumbnails.py (ThumbnailProcessor) による、サムネイルの検証と正規化のテスト"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from youtube_uploader import ThumbnailProcessor, UploadError, YoutubeUploader
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def encode(size: tuple[int, int], format: str = "JPEG") -> bytes:
+    """指定した解像度の画像をエンコードする"""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+# ----------------------------------------------------------------------
+# 1. 検証と正規化
+# ----------------------------------------------------------------------
+
+
+def test_valid_thumbnail_is_sent_unchanged():
+    """条件を満たすサムネイルは、再エンコードせずにそのまま使われること"""
+    data = encode((1280, 720))
+
+    assert ThumbnailProcessor().process(data, "image/jpeg") == (data, "image/jpeg")
+
+
+def test_large_thumbnail_is_resized_to_jpeg():
+    """推奨の解像度を超える PNG は、縮小した JPEG に変換されること"""
+    data, mimetype = ThumbnailProcessor().process(
+        encode((2560, 1440), "PNG"), "image/png"
+    )
+
+    assert mimetype == "image/jpeg"
+    assert Image.open(io.BytesIO(data)).size == (1280, 720)
+
+
+def test_mislabeled_mimetype_is_corrected():
+    """MIME タイプの指定が誤っていても、実際の形式で送信されること"""
+    data = encode((800, 450), "PNG")
+
+    assert ThumbnailProcessor().process(data, "image/jpeg") == (data, "image/png")
+
+
+@pytest.mark.parametrize(
+    "data", [encode((320, 180)), b"not an image"], ids=["narrow", "broken"]
+)
+def test_invalid_thumbnail_raises_upload_error(data: bytes):
+    """幅が足りない画像や、読み込めないデータは UploadError になること"""
+    with pytest.raises(UploadError):
+        ThumbnailProcessor().process(data, "image/jpeg")
+
+
+def test_apply_returns_same_config_when_unchanged():
+    """正規化で変更がなければ、元の設定オブジェクトが返ること"""
+    config = make_config(
+        thumbnail_bytes=encode((1280, 720)), thumbnail_mimetype="image/jpeg"
+    )
+
+    without_thumbnail = make_config()
+
+    assert ThumbnailProcessor().apply(config) is config
+    assert ThumbnailProcessor().apply(without_thumbnail) is without_thumbnail
+
+
+# ----------------------------------------------------------------------
+# 2. キャッシュ
+# ----------------------------------------------------------------------
+
+
+def test_same_thumbnail_is_normalized_once():
+    """同じ内容のサムネイルは、2回目以降キャッシュから返ること"""
+    processor = ThumbnailProcessor()
+    data = encode((2560, 1440), "PNG")
+
+    first = processor.process(data, "image/png")
+    second = processor.process(bytes(bytearray(data)), "image/png")
+
+    assert first == second
+    assert (processor.hits, processor.misses) == (1, 1)
+
+
+def test_disk_cache_is_shared_between_processors(tmp_path: Path, monkeypatch):
+    """cache_dir を指定すると、別のインスタンスでも正規化結果を再利用すること"""
+    data = encode((2560, 1440), "PNG")
+    expected = ThumbnailProcessor(cache_dir=tmp_path).process(data, "image/png")
+
+    processor = ThumbnailProcessor(cache_dir=tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("キャッシュがあれば再エンコードしない")
+
+    monkeypatch.setattr(processor, "_normalize", fail)
+    assert processor.process(data, "image/png") == expected
+
+
+# ----------------------------------------------------------------------
+# 3. アップロード前の検証
+# ----------------------------------------------------------------------
+
+
+def test_invalid_thumbnail_fails_before_video_is_sent(tmp_path: Path, fake_server):
+    """サムネイルが不正な場合、動画を送信する前に失敗すること"""
+    uploader = YoutubeUploader(
+        write_auth_files(tmp_path / "auth"), thumbnail_processor=ThumbnailProcessor()
+    )
+    connect_fake(uploader, fake_server)
+    config = make_config(
+        thumbnail_bytes=encode((320, 180)), thumbnail_mimetype="image/jpeg"
+    )
+
+    results = uploader.upload_many([config])
+
+    assert isinstance(results[0].error, UploadError)
+    assert fake_server.videos == {}
+    assert fake_server.stats.sessions == 0
@@ -0,0 +1,112 @@
+"""サムネイルのアップロード (ThumbnailResult とパイプライン化) のユニットテスト"""
+
+import threading
+import time
+from pathlib import Path
+
+from fake_youtube import FakeYoutubeServer
+
+from youtube_uploader import ChannelPool
+
+from .conftest import connect_fake, make_config, write_auth_files
+
+THUMBNAIL = b"\xff\xd8" + bytes(100)
+
+
+def make_thumbnail_config(title: str):
+    """サムネイル付きの動画を送信する設定を作る"""
+    return make_config(
+        title, thumbnail_bytes=THUMBNAIL, thumbnail_mimetype="image/jpeg"
+    )
+
+
+# ----------------------------------------------------------------------
+# 1. ThumbnailResult
+# ----------------------------------------------------------------------
+
+
+def test_thumbnail_is_skipped_without_data(fake_uploader):
+    """サムネイルが指定されていない場合は "skipped" になること"""
+    results = fake_uploader.upload_many([make_config("no thumbnail")])
+
+    assert results[0].thumbnail.status == "skipped"
+    assert results[0].thumbnail.ok
+
+
+def test_thumbnail_failure_is_reported_as_result(fake_uploader):
+    """サムネイルの失敗は例外にならず、"failed" の結果に格納されること"""
+    result = fake_uploader._upload_thumbnail("missing", make_thumbnail_config("x"))
+
+    assert result.status == "failed"
+    assert result.error is not None
+    assert not result.ok
+
+
+# ----------------------------------------------------------------------
+# 2. パイプライン化 (pipeline_thumbnails=True)
+# ----------------------------------------------------------------------
+
+
+def test_pipelined_thumbnails_run_in_background(
+    fake_uploader, fake_server, monkeypatch
+):
+    """サムネイルが専用のスレッドで送信され、結果が UploadResult に入ること"""
+    threads: list[str] = []
+    original = fake_uploader._upload_thumbnail
+
+    def upload_thumbnail(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fake_uploader, "_upload_thumbnail", upload_thumbnail)
+    configs = [make_thumbnail_config(f"video {i}") for i in range(3)]
+
+    results = fake_uploader.upload_many(
+        configs, max_workers=2, pipeline_thumbnails=True
+    )
+
+    assert all(result.thumbnail.status == "uploaded" for result in results)
+    assert set(fake_server.thumbnails) == {result.video_id for result in results}
+    assert threads and all(name.startswith("youtube-thumbnail") for name in threads)
+
+
+def test_pipelined_thumbnail_frees_the_upload_worker(
+    fake_uploader, fake_server, monkeypatch
+):
+    """サムネイルの送信中に、同じワーカーが次の動画のアップロードを始めること"""
+    overlapped = threading.Event()
+    original = fake_uploader._upload_thumbnail
+
+    def slow_thumbnail(video_id, *args, **kwargs):
+        # 2本目の動画が登録されるまで、1本目のサムネイルの送信を終えない
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if len(fake_server.videos) == 2:
+                overlapped.set()
+                break
+            time.sleep(0.01)
+        return original(video_id, *args, **kwargs)
+
+    monkeypatch.setattr(fake_uploader, "_upload_thumbnail", slow_thumbnail)
+    configs = [make_thumbnail_config("first"), make_config("second")]
+
+    results = fake_uploader.upload_many(
+        configs, max_workers=1, pipeline_thumbnails=True
+    )
+
+    assert all(result.ok for result in results)
+    assert overlapped.is_set()
+
+
+def test_pool_pipelines_thumbnails(tmp_path: Path, fake_server: FakeYoutubeServer):
+    """ChannelPool でも、パイプライン化したサムネイルが送信されること"""
+    pool = ChannelPool([write_auth_files(tmp_path / "channel_a")])
+    connect_fake(pool.uploader("channel_a"), fake_server)
+
+    results = pool.upload_many(
+        [make_thumbnail_config("a"), make_thumbnail_config("b")],
+        pipeline_thumbnails=True,
+    )
+
+    assert [result.thumbnail.status for result in results] == ["uploaded"] * 2
+    assert len(fake_server.thumbnails) == 2
@@ -0,0 +1,168 @@
+"""token_store.py (TokenStore) による、token.json の共有のテスト"""
+
+import json
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from youtube_uploader import AuthError, TokenStore, YoutubeUploader
+from youtube_uploader.token_store import covers_scopes, seconds_until_expiry
+from youtube_uploader.utils import resolve_auth_paths
+from youtube_uploader.youtube import MANAGE_SCOPES, SCOPES
+
+from .conftest import write_auth_files
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def auth_dir(tmp_path: Path) -> Path:
+    return write_auth_files(tmp_path / "auth")
+
+
+@pytest.fixture
+def store(auth_dir: Path) -> TokenStore:
+    return TokenStore(auth_dir / "token.json", lock_timeout=0.2)
+
+
+def expire_token(auth_dir: Path) -> None:
+    """token.json のアクセストークンを期限切れにする"""
+    path = auth_dir / "token.json"
+    info = json.loads(path.read_text(encoding="utf-8"))
+    info["expiry"] = (datetime.now(UTC) - timedelta(minutes=5)).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+    path.write_text(json.dumps(info), encoding="utf-8")
+
+
+def make_uploader(auth_dir: Path) -> YoutubeUploader:
+    """connect() と同じように、認証ファイルのパスを設定したアップローダーを作る"""
+    uploader = YoutubeUploader(auth_dir)
+    (
+        uploader._client_secrets_json_path,
+        uploader._token_json_path,
+    ) = resolve_auth_paths(auth_dir)
+    return uploader
+
+
+# ----------------------------------------------------------------------
+# 1. 読み込みと保存
+# ----------------------------------------------------------------------
+
+
+def test_saved_credentials_are_loaded(store: TokenStore):
+    """保存した認証情報が読み込め、一時ファイルが残らないこと"""
+    credentials = store.load()
+    credentials.token = "new-token"
+
+    store.save(credentials)
+
+    assert store.load().token == "new-token"
+    assert sorted(path.name for path in store.path.parent.iterdir()) == [
+        "client_secret.json",
+        "token.json",
+    ]
+
+
+@pytest.mark.parametrize(
+    "content", ["{broken", '{"token": "x"}'], ids=["json", "fields"]
+)
+def test_unreadable_token_file_loads_as_none(store: TokenStore, content: str):
+    """壊れた token.json や、必要な項目のない token.json は None になること"""
+    store.path.write_text(content, encoding="utf-8")
+
+    assert store.load() is None
+
+
+def test_missing_token_file_loads_as_none(tmp_path: Path):
+    """token.json がない場合は None になり、delete() も失敗しないこと"""
+    store = TokenStore(tmp_path / "token.json")
+
+    assert store.load() is None
+    store.delete()
+
+
+def test_scopes_and_expiry_helpers(store: TokenStore):
+    """スコープの判定と、有効期限までの秒数が求められること"""
+    credentials = store.load()
+
+    assert covers_scopes(credentials, SCOPES)
+    assert covers_scopes(credentials, MANAGE_SCOPES)
+    assert not covers_scopes(credentials, ["https://example.com/other"])
+    assert 3500 < seconds_until_expiry(credentials) <= 3600
+    assert seconds_until_expiry(Credentials(token="x")) is None
+
+
+# ----------------------------------------------------------------------
+# 2. プロセス間のロック
+# ----------------------------------------------------------------------
+
+
+def test_lock_times_out_with_auth_error(store: TokenStore):
+    """他がロックを保持している間は、lock_timeout 秒で AuthError になること"""
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with TokenStore(store.path).lock():
+            locked.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    try:
+        assert locked.wait(5)
+        with pytest.raises(AuthError), store.lock():
+            pass
+    finally:
+        release.set()
+        holder.join()
+
+    with store.lock():
+        pass
+
+
+def test_expired_token_is_refreshed_once(auth_dir: Path, monkeypatch):
+    """同時に接続しても、期限切れのトークンのリフレッシュは1回だけ行われること"""
+    expire_token(auth_dir)
+    refreshed: list[str] = []
+
+    def refresh(credentials: Credentials, request) -> None:
+        refreshed.append(credentials.token)
+        credentials.token = "refreshed"
+        credentials.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+    loaded: list[Credentials] = []
+    uploaders = [make_uploader(auth_dir) for _ in range(4)]
+    threads = [
+        threading.Thread(target=lambda u=u: loaded.append(u._load_credentials()))
+        for u in uploaders
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert refreshed == ["access-token"]
+    assert [credentials.token for credentials in loaded] == ["refreshed"] * 4
+    assert TokenStore(auth_dir / "token.json").load().token == "refreshed"
+
+
+def test_refresh_network_error_keeps_token_file(auth_dir: Path, monkeypatch):
+    """通信エラーでリフレッシュに失敗した場合は、token.json を残して AuthError になる"""
+    expire_token(auth_dir)
+
+    def refresh(credentials: Credentials, request) -> None:
+        raise ConnectionError("network is unreachable")
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+
+    with pytest.raises(AuthError):
+        make_uploader(auth_dir)._load_credentials()
+    assert TokenStore(auth_dir / "token.json").load() is not None
@@ -0,0 +1,110 @@
+"""transport.py (PooledHttp) による、接続プール付きの HTTP 通信のテスト"""
+
+import json
+import socket
+
+import pytest
+from fake_youtube import FakeYoutubeServer, ServerConditions
+from google.oauth2.credentials import Credentials
+
+from youtube_uploader.transport import POOL_CONNECTIONS, PooledHttp, TransportConfig
+
+# ----------------------------------------------------------------------
+# フィクスチャ (テストの準備)
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def http():
+    """ソケットのオプションと接続数を指定したクライアント"""
+    http = PooledHttp(
+        Credentials(token="test-token"),
+        TransportConfig(pool_size=3, send_buffer_size=256 * 1024, read_timeout=0.5),
+    )
+    yield http
+    http.close()
+
+
+def start_session(http: PooledHttp, server: FakeYoutubeServer, size: int = 10) -> str:
+    """再開可能アップロードのセッションを開始し、セッションURIを返す"""
+    response, _ = http.request(
+        f"{server.url}/upload/youtube/v3/videos?uploadType=resumable",
+        method="POST",
+        body=json.dumps({"snippet": {"title": "テスト動画"}}).encode(),
+        headers={
+            "Content-Type": "application/json",
+            "X-Upload-Content-Length": str(size),
+        },
+    )
+    assert response.status == 200
+    return response["location"]
+
+
+# ----------------------------------------------------------------------
+# 1. アダプターの設定
+# ----------------------------------------------------------------------
+
+
+def test_adapter_is_built_with_pool_settings(http):
+    """マウントしたアダプターに、接続数・ソケットのオプション・再試行なしが設定されること"""
+    adapter = http._session.get_adapter("https://www.googleapis.com")
+    kwargs = adapter.poolmanager.connection_pool_kw
+
+    assert adapter._pool_connections == POOL_CONNECTIONS
+    assert adapter._pool_maxsize == kwargs["maxsize"] == 3
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in kwargs["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024) in kwargs["socket_options"]
+    assert adapter.max_retries.total == 0
+    assert http._session.get_adapter("http://127.0.0.1") is adapter
+
+
+# ----------------------------------------------------------------------
+# 2. リクエスト
+# ----------------------------------------------------------------------
+
+
+def test_resumable_308_is_not_followed(http, fake_server: FakeYoutubeServer):
+    """再開可能アップロードの 308 は、リダイレクトとして追跡せずに返すこと"""
+    session_uri = start_session(http, fake_server)
+
+    response, _ = http.request(
+        session_uri, method="PUT", body=b"", headers={"Content-Range": "bytes */10"}
+    )
+
+    assert response.status == 308
+    assert "range" not in response
+
+
+def test_connections_are_reused(http, fake_server: FakeYoutubeServer):
+    """連続したリクエストで、keep-alive の接続が使い回されること"""
+    for _ in range(3):
+        start_session(http, fake_server)
+
+    pools = http._session.get_adapter(fake_server.url).poolmanager.pools
+    [key] = pools.keys()
+
+    assert fake_server.stats.sessions == 3
+    assert pools[key].num_connections == 1
+
+
+# ----------------------------------------------------------------------
+# 3. 例外の変換
+# ----------------------------------------------------------------------
+
+
+def test_read_timeout_raises_timeout_error(http, fake_server: FakeYoutubeServer):
+    """読み込みがタイムアウトした場合は TimeoutError になること"""
+    fake_server.conditions = ServerConditions(latency=1.0)
+
+    with pytest.raises(TimeoutError):
+        start_session(http, fake_server)
+
+
+def test_refused_connection_raises_connection_error(http):
+    """接続できない場合は ConnectionError になること"""
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+
+    with pytest.raises(ConnectionError):
+        http.request(f"http://127.0.0.1:{port}/youtube/v3/videos")
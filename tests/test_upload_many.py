@@ -0,0 +1,85 @@
+"""upload_many() による複数動画の並列アップロードのユニットテスト"""
+
+import threading
+
+from fake_youtube import ServerConditions
+
+from youtube_uploader import UploadProgress
+
+from .conftest import make_config
+
+
+def test_upload_many_returns_results_in_input_order(fake_uploader, fake_server):
+    """すべての動画がアップロードされ、入力と同じ順序で結果が返ること"""
+    configs = [make_config(f"video {i}") for i in range(6)]
+
+    results = fake_uploader.upload_many(configs, max_workers=3)
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.title for result in results] == [c.title for c in configs]
+    assert all(result.ok for result in results)
+    titles = {video["snippet"]["title"] for video in fake_server.videos.values()}
+    assert titles == {config.title for config in configs}
+    assert {result.video_id for result in results} == set(fake_server.videos)
+
+
+def test_upload_many_runs_in_parallel(fake_uploader, fake_server, monkeypatch):
+    """max_workers 件までの動画が同時にアップロードされること"""
+    fake_server.reset(ServerConditions(latency=0.05))
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    original = fake_uploader.upload_in_worker
+
+    def upload_in_worker(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            return original(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(fake_uploader, "upload_in_worker", upload_in_worker)
+
+    results = fake_uploader.upload_many([make_config(str(i)) for i in range(4)], 4)
+
+    assert all(result.ok for result in results)
+    assert peak > 1
+
+
+def test_upload_many_isolates_failures(fake_uploader, fake_server, tmp_path):
+    """1件の失敗で他の動画のアップロードが中断されないこと"""
+    configs = [
+        make_config("ok 1"),
+        make_config("missing", video_path=tmp_path / "missing.mp4"),
+        make_config("ok 2"),
+    ]
+
+    results = fake_uploader.upload_many(configs, max_workers=2)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert len(fake_server.videos) == 2
+
+
+def test_upload_many_reports_progress_per_index(fake_uploader):
+    """進捗イベントが入力リスト内の位置とともに通知されること"""
+    events: dict[int, list[UploadProgress]] = {}
+    lock = threading.Lock()
+
+    def on_progress(index: int, event: UploadProgress) -> None:
+        with lock:
+            events.setdefault(index, []).append(event)
+
+    fake_uploader.upload_many(
+        [make_config("a", size=4096), make_config("b", size=8192)],
+        on_progress=on_progress,
+        progress_interval=0,
+    )
+
+    assert set(events) == {0, 1}
+    assert events[0][-1].bytes_sent == 4096
+    assert events[1][-1].bytes_sent == 8192